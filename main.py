@@ -1,6 +1,7 @@
 import sys
 import os
 import logging
+import multiprocessing
 import traceback
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
@@ -114,4 +115,6 @@ def main() -> int:
         raise
 
 if __name__ == "__main__":
+    # PyInstaller one-file 빌드에서 spawn 프로세스 풀(페이지 렌더 등) 자식 부트스트랩
+    multiprocessing.freeze_support()
     sys.exit(main())
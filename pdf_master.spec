@@ -115,6 +115,7 @@ hiddenimports += [
     'locale',       # i18n 언어 감지
     'datetime',     # Undo 타임스탬프
     'dataclasses',  # UndoManager ActionRecord
+    'sqlite3',      # 디스크 썸네일 캐시 인덱스 파일
     'src.core.i18n',  # Explicitly include i18n for dynamic imports in widgets
     'src.core.optional_deps',  # Centralized optional fitz/keyring boundary
     'src.core.path_utils',  # Shared normalized path/resource helper used across settings/AI/UI
@@ -133,6 +134,8 @@ hiddenimports += [
     # 2026-08-05 Quality Track B surfaces (also covered via collect_submodules below)
     'src.ui.contracts',  # Monkeypatch contract SSOT (import-light)
     'src.ui.thumbnail.pixmap_lru',  # Thumbnail pixmap LRU
+    'src.ui.thumbnail.disk_cache',  # Thumbnail disk cache Qt encode/decode adapter
+    'src.ui.thumbnail.render_service',  # Keep-alive thumbnail render service
     'src.core.worker_ops.ai.temp_acl',
     'src.core.worker_ops.ai.prepare',
     'src.core.worker_ops.ai.handlers',
@@ -145,6 +148,15 @@ hiddenimports += [
     'src.core.temp_cleanup',
     'src.core.path_utils',
     'src.core.pdf_validation',
+    'src.core.process_pool',  # spawn 프로세스 풀 공용 헬퍼
+    'src.core.render_pool',  # convert_to_img 병렬 렌더 자식 작업
+    'src.core.image_pool',  # 압축 이미지 재인코딩 자식 작업
+    'src.core.thumbnail_cache',  # 세션 간 디스크 썸네일 캐시 (sqlite3)
+    'src.core.undo_chunk_store',  # undo 스냅샷 중복 제거 청크 저장소
+    'src.core.text_layer_cache',  # 작업 간 공유 페이지 텍스트 레이어 캐시 (sqlite3)
+    'src.core.library_index',  # 라이브러리 전문 역색인 (sqlite3)
+    'src.core.ocr_pipeline',  # 선택적·병렬 OCR + 결과 캐시 (sqlite3)
+    'src.core.blank_pages',  # 빈 페이지 판별 (싼 신호 우선, 구간 병렬)
 ]
 for package_name in [
     'src.core.worker_ops',
@@ -0,0 +1,88 @@
+"""페이지 부분집합 출력 벤치마크 — 페이지별 insert_pdf 루프 vs 구간 병합 복사기.
+
+사용: python scripts/bench_page_subset.py [--pages 3000] [--repeat 3]
+모든 페이지가 같은 폰트·이미지를 공유하는 합성 문서로 빈 페이지 제거형(10쪽마다 1쪽 제외),
+전체 유지, 역순, 무작위 순서를 비교한다. 출력 크기는 graft map 공유 여부에 따른 중복 객체를 보여 준다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.core.optional_deps import fitz  # noqa: E402
+from src.core.worker_ops._pdf_helpers import build_page_subset  # noqa: E402
+
+
+def _make_source(pages: int):
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 400, 300), False)
+    pix.clear_with(200)
+    logo = pix.tobytes("png")
+    doc = fitz.open()
+    for index in range(pages):
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((72, 72), f"Page {index + 1} — shared resources", fontname="helv", fontsize=12)
+        page.insert_image(fitz.Rect(72, 100, 272, 250), stream=logo)
+    # 저장 후 다시 열어 실제 파일 입력과 같은 상태에서 잰다
+    data = doc.tobytes(garbage=3, deflate=True)
+    doc.close()
+    return fitz.open("pdf", data)
+
+
+def _legacy_subset(source, indices):
+    out = fitz.open()
+    for index in indices:
+        out.insert_pdf(source, from_page=index, to_page=index)
+    return out
+
+
+def _measure(builder, source, indices, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        out = builder(source, indices)
+        best = min(best, time.perf_counter() - started)
+        size = len(out.tobytes())
+        out.close()
+    return best, size
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    source = _make_source(args.pages)
+    total = len(source)
+    shuffled = list(range(total))
+    random.Random(0).shuffle(shuffled)
+    scenarios = {
+        "drop every 10th": [i for i in range(total) if i % 10 != 9],
+        "keep all": list(range(total)),
+        "reverse": list(range(total - 1, -1, -1)),
+        "shuffled": shuffled,
+    }
+    print(f"source: {total} pages, best of {args.repeat}")
+    print(f"{'scenario':<18}{'per-page s':>12}{'coalesced s':>13}{'speedup':>9}{'per-page MB':>13}{'coalesced MB':>14}")
+    for name, indices in scenarios.items():
+        legacy_s, legacy_size = _measure(_legacy_subset, source, indices, args.repeat)
+        new_s, new_size = _measure(build_page_subset, source, indices, args.repeat)
+        print(
+            f"{name:<18}{legacy_s:>12.2f}{new_s:>13.2f}{legacy_s / max(new_s, 1e-9):>8.1f}x"
+            f"{legacy_size / 1e6:>13.1f}{new_size / 1e6:>14.1f}"
+        )
+    source.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
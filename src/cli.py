@@ -0,0 +1,292 @@
+"""PDF Master 헤드리스 CLI — Qt 없이 OPERATION_SPECS 작업을 실행한다.
+
+사용 예:
+    python -m src.cli metadata_update --set file_path=in.pdf --set output_path=out.pdf \\
+        --json metadata='{"title": "Report"}'
+    python -m src.cli --jobs jobs.ndjson
+    python -m src.cli --list-modes
+
+작업 목록은 JSON 배열(또는 {"jobs": [...]}) 이나 NDJSON(한 줄에 하나)이며,
+각 항목은 {"mode": "...", "kwargs": {...}} 형태다. 진행률·결과는 stdout 에 NDJSON 이벤트로 출력한다.
+종료 코드: 0 전부 성공, 1 실패 포함, 2 인자 오류, 130 취소.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Any, Iterable, TextIO
+
+from .core.headless_worker import HeadlessResult, run_headless
+from .core.perf import TELEMETRY, set_telemetry_enabled
+from .core.worker_runtime import OPERATION_SPECS
+
+logger = logging.getLogger(__name__)
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_CANCELLED = 130
+
+# 취소 요청 후 워커 스레드가 다음 검사 지점에 도달하기를 기다리는 간격
+_JOIN_POLL_SECONDS = 0.2
+
+
+class JobSpecError(ValueError):
+    """작업 목록·인자 형식 오류"""
+
+
+class _OutputClosed(Exception):
+    """stdout 소비자가 먼저 닫힘 (`| head` 등)"""
+
+
+def _parse_assignment(raw: str, *, as_json: bool) -> tuple[str, Any]:
+    key, sep, value = raw.partition("=")
+    key = key.strip().replace("-", "_")
+    if not sep or not key:
+        raise JobSpecError(f"expected key=value, got {raw!r}")
+    if not as_json:
+        return key, value
+    try:
+        return key, json.loads(value)
+    except json.JSONDecodeError as exc:
+        raise JobSpecError(f"invalid JSON for {key}: {exc}") from exc
+
+
+def _load_json_text(raw: str) -> Any:
+    """'@경로' 면 파일을 읽는다 (쉘 인용 회피용)."""
+    if raw.startswith("@"):
+        with open(raw[1:], "r", encoding="utf-8") as handle:
+            raw = handle.read()
+    return json.loads(raw)
+
+
+def _normalize_job(entry: Any, where: str) -> tuple[str, dict[str, Any]]:
+    if not isinstance(entry, dict):
+        raise JobSpecError(f"{where}: job must be an object")
+    mode = entry.get("mode")
+    kwargs = entry.get("kwargs", {})
+    if not isinstance(mode, str) or mode not in OPERATION_SPECS:
+        raise JobSpecError(f"{where}: unknown mode {mode!r}")
+    if not isinstance(kwargs, dict):
+        raise JobSpecError(f"{where}: kwargs must be an object")
+    return mode, dict(kwargs)
+
+
+def parse_job_lines(lines: Iterable[str], source: str = "<jobs>") -> list[tuple[str, dict[str, Any]]]:
+    """JSON 배열/객체 또는 NDJSON 텍스트를 (mode, kwargs) 목록으로 해석한다."""
+    text = "".join(lines)
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        entries = json.loads(stripped)
+        return [_normalize_job(entry, f"{source}[{index}]") for index, entry in enumerate(entries)]
+    if stripped.startswith("{"):
+        try:
+            document = json.loads(stripped)
+        except json.JSONDecodeError:
+            document = None  # 여러 줄 NDJSON
+        if isinstance(document, dict):
+            if isinstance(document.get("jobs"), list):
+                return [
+                    _normalize_job(entry, f"{source}.jobs[{index}]")
+                    for index, entry in enumerate(document["jobs"])
+                ]
+            return [_normalize_job(document, source)]
+    jobs: list[tuple[str, dict[str, Any]]] = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise JobSpecError(f"{source}:{line_no}: {exc}") from exc
+        jobs.append(_normalize_job(entry, f"{source}:{line_no}"))
+    return jobs
+
+
+def load_jobs(path: str) -> list[tuple[str, dict[str, Any]]]:
+    if path == "-":
+        return parse_job_lines(sys.stdin, "<stdin>")
+    with open(path, "r", encoding="utf-8") as handle:
+        return parse_job_lines(handle, path)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Run PDF Master operations without the GUI.",
+    )
+    parser.add_argument("mode", nargs="?", help="operation mode (see --list-modes)")
+    parser.add_argument("--kwargs", dest="kwargs_json", help="kwargs as a JSON object, or @file.json")
+    parser.add_argument("--set", dest="str_args", action="append", default=[], metavar="KEY=VALUE",
+                        help="string kwarg (repeatable)")
+    parser.add_argument("--json", dest="json_args", action="append", default=[], metavar="KEY=JSON",
+                        help="JSON-typed kwarg, e.g. --json angle=90 (repeatable)")
+    parser.add_argument("--jobs", help="JSON or NDJSON job list file ('-' for stdin)")
+    parser.add_argument("--fail-fast", action="store_true", help="stop the job list at the first failure")
+    parser.add_argument("--no-progress", action="store_true", help="do not emit progress events")
+    parser.add_argument("--trace", metavar="PATH", help="record telemetry and write a Chrome trace JSON to PATH")
+    parser.add_argument("--list-modes", action="store_true", help="print available modes as NDJSON and exit")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log to stderr at INFO level")
+    return parser
+
+
+def _collect_jobs(args: argparse.Namespace) -> list[tuple[str, dict[str, Any]]]:
+    jobs: list[tuple[str, dict[str, Any]]] = []
+    if args.jobs:
+        jobs.extend(load_jobs(args.jobs))
+    if args.mode:
+        kwargs: dict[str, Any] = {}
+        if args.kwargs_json:
+            loaded = _load_json_text(args.kwargs_json)
+            if not isinstance(loaded, dict):
+                raise JobSpecError("--kwargs must be a JSON object")
+            kwargs.update(loaded)
+        for raw in args.str_args:
+            key, value = _parse_assignment(raw, as_json=False)
+            kwargs[key] = value
+        for raw in args.json_args:
+            key, value = _parse_assignment(raw, as_json=True)
+            kwargs[key] = value
+        jobs.append(_normalize_job({"mode": args.mode, "kwargs": kwargs}, "<argv>"))
+    elif args.kwargs_json or args.str_args or args.json_args:
+        raise JobSpecError("kwargs given without a mode")
+    if not jobs:
+        raise JobSpecError("no mode or --jobs given")
+    return jobs
+
+
+def _discard_stdout(stream: TextIO) -> None:
+    """닫힌 stdout 을 devnull 로 돌려 종료 시 flush 가 다시 BrokenPipeError 를 내지 않게 한다."""
+    if stream is not sys.stdout:
+        return
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+    except (OSError, ValueError, AttributeError):
+        logger.debug("Failed to redirect closed stdout", exc_info=True)
+
+
+def _write_event(stream: TextIO, event: dict[str, Any]) -> None:
+    try:
+        stream.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+        stream.flush()
+    except BrokenPipeError:
+        _discard_stdout(stream)
+        raise _OutputClosed() from None
+
+
+def _run_job(index: int, mode: str, kwargs: dict[str, Any], stream: TextIO, *, progress: bool) -> HeadlessResult:
+    """작업을 별도 스레드에서 돌려 메인 스레드가 Ctrl+C 를 취소 요청으로 바꿀 수 있게 한다."""
+    cancel_event = threading.Event()
+    outcome: list[HeadlessResult] = []
+
+    def _emit(event: dict[str, Any]) -> None:
+        # 워커 스레드 콜백 — 출력을 받을 쪽이 없으면 작업을 취소한다
+        try:
+            _write_event(stream, event)
+        except _OutputClosed:
+            cancel_event.set()
+
+    def _on_progress(value: int) -> None:
+        _emit({"event": "progress", "job": index, "mode": mode, "value": int(value)})
+
+    def _on_partial(payload: dict[str, Any]) -> None:
+        _emit({"event": "partial", "job": index, "mode": mode, "payload": payload})
+
+    def _target() -> None:
+        outcome.append(
+            run_headless(
+                mode,
+                kwargs,
+                on_progress=_on_progress if progress else None,
+                on_partial_result=_on_partial,
+                cancel_event=cancel_event,
+            )
+        )
+
+    thread = threading.Thread(target=_target, name=f"pdf-master-cli-{mode}", daemon=True)
+    thread.start()
+    while thread.is_alive():
+        try:
+            thread.join(_JOIN_POLL_SECONDS)
+        except KeyboardInterrupt:
+            cancel_event.set()
+            _emit({"event": "cancel_requested", "job": index, "mode": mode})
+    if not outcome:
+        return HeadlessResult(mode=mode, status="error", message="worker thread exited without a result")
+    return outcome[0]
+
+
+def main(argv: list[str] | None = None, stream: TextIO | None = None) -> int:
+    out = stream if stream is not None else sys.stdout
+    try:
+        return _main(argv, out)
+    except (BrokenPipeError, _OutputClosed):
+        # `--list-modes | head` 처럼 소비자가 먼저 끝남 — traceback 없이 조용히 종료
+        _discard_stdout(out)
+        return EXIT_FAILED
+
+
+def _main(argv: list[str] | None, out: TextIO) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+
+    if args.list_modes:
+        for mode, spec in OPERATION_SPECS.items():
+            _write_event(
+                out,
+                {
+                    "mode": mode,
+                    "output_kind": spec.output_kind,
+                    "same_path_safe": spec.same_path_safe,
+                    "required_kwargs": list(spec.required_kwargs),
+                    "required_any_kwargs": [list(group) for group in spec.required_any_kwargs],
+                },
+            )
+        return EXIT_OK
+
+    try:
+        jobs = _collect_jobs(args)
+    except (JobSpecError, OSError, json.JSONDecodeError) as exc:
+        parser.print_usage(sys.stderr)
+        print(f"error: {exc}", file=sys.stderr)
+        return EXIT_USAGE
+
+    if args.trace:
+        set_telemetry_enabled(True)
+    try:
+        return _run_jobs(jobs, out, args)
+    finally:
+        if args.trace:
+            try:
+                TELEMETRY.export_chrome_trace(args.trace)
+                _write_event(out, {"event": "trace", "path": args.trace})
+            except OSError as exc:
+                print(f"error: failed to write trace: {exc}", file=sys.stderr)
+
+
+def _run_jobs(jobs: list[tuple[str, dict[str, Any]]], out: TextIO, args: argparse.Namespace) -> int:
+    exit_code = EXIT_OK
+    for index, (mode, kwargs) in enumerate(jobs):
+        _write_event(out, {"event": "start", "job": index, "mode": mode})
+        result = _run_job(index, mode, kwargs, out, progress=not args.no_progress)
+        _write_event(out, {"event": result.status, "job": index, **result.to_dict()})
+        if result.status == "cancelled":
+            return EXIT_CANCELLED
+        if not result.ok:
+            exit_code = EXIT_FAILED
+            if args.fail_fast:
+                break
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
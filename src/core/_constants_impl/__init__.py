@@ -32,6 +32,7 @@ from .values import (
     THREAD_TERMINATE_TIMEOUT,
     AI_DEFAULT_TIMEOUT,
     AI_MAX_TEXT_LENGTH,
+    AI_RETRIEVAL_TOP_K,
     AI_MAX_RETRIES,
     AI_BASE_DELAY,
     AI_MAX_DELAY,
@@ -74,6 +75,7 @@ __all__ = [
     "THREAD_TERMINATE_TIMEOUT",
     "AI_DEFAULT_TIMEOUT",
     "AI_MAX_TEXT_LENGTH",
+    "AI_RETRIEVAL_TOP_K",
     "AI_MAX_RETRIES",
     "AI_BASE_DELAY",
     "AI_MAX_DELAY",
@@ -93,6 +93,9 @@ AI_DEFAULT_TIMEOUT = 30
 
 AI_MAX_TEXT_LENGTH = 30000
 
+# 로컬 텍스트 Q&A 에 넣는 질문 관련 구간 수 (BM25 상위 k)
+AI_RETRIEVAL_TOP_K = 8
+
 AI_MAX_RETRIES = 3
 
 AI_BASE_DELAY = 1.0
@@ -105,8 +108,8 @@ UNDO_BACKUP_MAX_FILES = 100
 
 UNDO_BACKUP_MAX_AGE_HOURS = 24
 
-# 단일 파일 Undo 백업 복사 상한 (이보다 크면 백업 스킵 → undo unavailable)
-UNDO_BACKUP_MAX_SOURCE_BYTES = 200 * 1024 * 1024
+# 단일 파일 Undo 스냅샷 상한 (청크 중복 제거로 큰 파일도 백업 — 이보다 크면 스킵 → undo unavailable)
+UNDO_BACKUP_MAX_SOURCE_BYTES = 4 * 1024 * 1024 * 1024
 
 RECENT_FILES_MAX = 20
 
@@ -9,6 +9,7 @@ from .normalize import (
     _normalize_chat_histories,
     _normalize_language,
     _normalize_last_output_dir,
+    _normalize_library_folders,
     _normalize_recent_files,
     _normalize_splitter_sizes,
     _normalize_theme,
@@ -30,6 +31,7 @@ __all__ = [
     "save_settings",
     "reset_settings",
     "_normalize_recent_files",
+    "_normalize_library_folders",
     "_normalize_chat_histories",
     "_normalize_splitter_sizes",
     "_normalize_theme",
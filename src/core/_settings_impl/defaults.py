@@ -22,6 +22,8 @@ def default_settings() -> dict:
     return {
         "theme": "dark",
         "recent_files": [],
+        # 라이브러리 전문 색인 대상 폴더 (최근 파일은 항상 포함)
+        "library_folders": [],
         "last_output_dir": "",
         "splitter_sizes": None,
         "window_geometry": None,
@@ -36,5 +38,9 @@ def default_settings() -> dict:
         "notify_mode": "dialog",
         # Worker 취소 시 대기 큐 폐기
         "clear_pending_on_cancel": True,
+        # 성능 텔레메트리(span 링 버퍼·히스토그램) 수집 — 기본 OFF
+        "perf_telemetry_enabled": False,
+        # 페이지 텍스트 레이어 캐시 디스크 영속화 (앱 캐시 폴더) — 기본 OFF
+        "text_cache_persist": False,
         # gemini_api_key는 keyring 미사용 시에만 파일에 저장됨
     }
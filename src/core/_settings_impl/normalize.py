@@ -25,6 +25,20 @@ def _normalize_recent_files(value) -> list[str]:
         normalized.append(path_key)
     return normalized
 
+def _normalize_library_folders(value) -> list[str]:
+    """라이브러리 색인 폴더 — 존재하는 디렉터리만, 경로 키로 중복 제거."""
+    if not isinstance(value, list):
+        return []
+    normalized: list[str] = []
+    seen: set[str] = set()
+    for item in value:
+        path_key = normalize_path_key(item)
+        if not path_key or path_key in seen or not os.path.isdir(path_key):
+            continue
+        seen.add(path_key)
+        normalized.append(path_key)
+    return normalized
+
 def _normalize_chat_histories(value) -> dict:
     if not isinstance(value, dict):
         return {}
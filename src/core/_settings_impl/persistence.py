@@ -17,6 +17,7 @@ from .normalize import (
     _normalize_chat_histories,
     _normalize_language,
     _normalize_last_output_dir,
+    _normalize_library_folders,
     _normalize_recent_files,
     _normalize_splitter_sizes,
     _normalize_theme,
@@ -54,6 +55,7 @@ def load_settings():
 
                 # 타입 방어: 잘못된 타입이면 기본값으로 교체
                 settings["recent_files"] = _normalize_recent_files(settings.get("recent_files", []))
+                settings["library_folders"] = _normalize_library_folders(settings.get("library_folders", []))
                 settings["chat_histories"] = _normalize_chat_histories(settings.get("chat_histories", {}))
                 settings["splitter_sizes"] = _normalize_splitter_sizes(settings.get("splitter_sizes"))
                 settings["theme"] = _normalize_theme(settings.get("theme"))
@@ -81,6 +83,14 @@ def load_settings():
                     settings.get("clear_pending_on_cancel"),
                     True,
                 )
+                settings["perf_telemetry_enabled"] = _normalize_bool(
+                    settings.get("perf_telemetry_enabled"),
+                    False,
+                )
+                settings["text_cache_persist"] = _normalize_bool(
+                    settings.get("text_cache_persist"),
+                    False,
+                )
                 return settings
         except json.JSONDecodeError as e:
             # 손상된 설정 파일 백업
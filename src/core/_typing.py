@@ -42,13 +42,31 @@ class WorkerHost:
     ) -> None:
         ...
 
+    def _atomic_text_stream(
+        self,
+        output_path: str,
+        *,
+        encoding: str = "utf-8",
+        newline: str | None = None,
+    ) -> Any:
+        ...
+
     def _atomic_binary_save(self, output_path: str, data: bytes) -> None:
         ...
 
     def _atomic_pixmap_save(self, pixmap: Any, output_path: str) -> None:
         ...
 
-    def _open_pdf_document(self, file_path: str, password: str | None = None) -> Any:
+    def _commit_staged_output(self, staged_path: str, output_path: str) -> None:
+        ...
+
+    def _password_for_pdf_path(self, file_path: str) -> str:
+        ...
+
+    def _open_pdf_document(self, file_path: str, password: str | None = None, *, read_only: bool = False) -> Any:
+        ...
+
+    def _release_pdf_document(self, doc: Any) -> None:
         ...
 
     def _build_safe_attachment_output_path(
@@ -13,6 +13,7 @@ from ..path_utils import normalize_path_key
 from .client import GENAI_AVAILABLE, GENAI_CLIENT, PerfTimer, _GENAI_MODULE, _response_text, fitz
 from .config import AI_BASE_DELAY, AI_DEFAULT_TIMEOUT, AI_MAX_DELAY, AI_MAX_RETRIES, AI_MAX_TEXT_LENGTH
 from .errors import APIKeyError, APIRateLimitError, APITimeoutError, retry_with_backoff
+from .response_cache import AIResponseStore, document_content_hash, response_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,78 @@ class AICacheMixin:
             mtime_ns = 0
         return abs_path, mtime_ns
 
+    def _get_cached_retrieval_index(self, key: tuple[str, int]) -> Any | None:
+        cls = self.__class__
+        with cls._retrieval_cache_lock:
+            index = cls._retrieval_cache.get(key)
+            if index is not None:
+                cls._retrieval_cache.move_to_end(key)
+            return index
+
+    def _put_cached_retrieval_index(self, key: tuple[str, int], index: Any) -> None:
+        cls = self.__class__
+        with cls._retrieval_cache_lock:
+            # 같은 파일의 이전 mtime 색인은 버린다
+            for stale in [item for item in cls._retrieval_cache if item[0] == key[0]]:
+                cls._retrieval_cache.pop(stale, None)
+            cls._retrieval_cache[key] = index
+            while len(cls._retrieval_cache) > cls._RETRIEVAL_CACHE_MAX_ITEMS:
+                cls._retrieval_cache.popitem(last=False)
+
+    @classmethod
+    def _get_response_store(cls) -> AIResponseStore | None:
+        with cls._response_store_lock:
+            if cls._response_store is None and not cls._response_store_failed:
+                try:
+                    cls._response_store = AIResponseStore()
+                except Exception:
+                    logger.warning("AI response cache unavailable", exc_info=True)
+                    cls._response_store_failed = True
+            return cls._response_store
+
+    def _response_cache_key(
+        self,
+        operation: str,
+        pdf_path: str,
+        *,
+        prompt: str,
+        schema: dict[str, Any],
+        options: dict[str, Any],
+    ) -> str | None:
+        """디스크 응답 캐시 키. 캐시를 끄거나 내용 해시를 못 구하면 None."""
+        if not self.use_response_cache:
+            return None
+        content_hash = document_content_hash(pdf_path)
+        if content_hash is None:
+            return None
+        return response_cache_key(
+            operation=operation,
+            content_hash=content_hash,
+            model=self._model,
+            prompt=prompt,
+            schema=schema,
+            options=options,
+        )
+
+    def _get_cached_response(self, key: str | None) -> dict[str, Any] | None:
+        if key is None:
+            return None
+        store = self._get_response_store()
+        found = store.get(key) if store is not None else None
+        if found is None:
+            return None
+        payload, created = found
+        meta = self._normalize_meta(payload.get("meta"), default_source="file_api")
+        meta.update(cache_hit=True, cached_at=created)
+        return {**payload, "meta": meta}
+
+    def _put_cached_response(self, key: str | None, payload: dict[str, Any]) -> None:
+        if key is None:
+            return
+        store = self._get_response_store()
+        if store is not None:
+            store.put(key, payload)
+
     def _make_chat_session_cache_key(self, pdf_path: str) -> tuple[str, str, int]:
         abs_path = normalize_path_key(pdf_path)
         try:
@@ -165,6 +238,12 @@ class AICacheMixin:
         with cls._text_cache_lock:
             cls._text_cache.clear()
             cls._text_cache_bytes = 0
+        with cls._retrieval_cache_lock:
+            cls._retrieval_cache.clear()
+        with cls._response_store_lock:
+            store, cls._response_store = cls._response_store, None
+        if store is not None:
+            store.close()
 
         service = cls()
         for entry in stale_upload_entries:
@@ -9,10 +9,13 @@ import time
 from collections import OrderedDict
 from typing import Any, Callable, cast
 
+from ..doc_pool import DOC_POOL
 from ..path_utils import normalize_path_key
-from .client import GENAI_AVAILABLE, GENAI_CLIENT, PerfTimer, _GENAI_MODULE, _response_text, fitz
-from .config import AI_BASE_DELAY, AI_DEFAULT_TIMEOUT, AI_MAX_DELAY, AI_MAX_RETRIES, AI_MAX_TEXT_LENGTH
+from ..text_layer_cache import TEXT_LAYER_CACHE, cached_page_text
+from .client import GENAI_AVAILABLE, GENAI_CLIENT, PerfTimer, _GENAI_MODULE, _response_text
+from .config import AI_BASE_DELAY, AI_DEFAULT_TIMEOUT, AI_MAX_DELAY, AI_MAX_RETRIES, AI_MAX_TEXT_LENGTH, AI_RETRIEVAL_TOP_K
 from .errors import APIKeyError, APIRateLimitError, APITimeoutError, retry_with_backoff
+from .retrieval import BM25Index, chunk_pages, format_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -29,19 +32,18 @@ class AIExtractionMixin:
             if cached is not None:
                 return cached
 
-            doc = None
-            try:
-                doc = fitz.open(pdf_path)
+            with DOC_POOL.borrow(pdf_path) as doc:
+                if doc is None:
+                    raise ValueError(f"Encrypted PDF requires a decrypted copy: {os.path.basename(pdf_path)}")
                 text_parts: list[str] = []
                 page_count = len(doc) if max_pages is None else min(len(doc), max_pages)
                 current_length = 0
                 pages_used = 0
                 truncated = False
 
+                text_key = TEXT_LAYER_CACHE.document_key(doc)
                 for i in range(page_count):
-                    page = doc[i]
-                    raw_text = page.get_text()
-                    text = raw_text if isinstance(raw_text, str) else ""
+                    text = cached_page_text(doc, i, text_key)
                     if text.strip():
                         chunk = f"[Page {i + 1}]\n{text}"
                         if current_length + len(chunk) > self.MAX_TEXT_LENGTH:
@@ -68,9 +70,48 @@ class AIExtractionMixin:
                 )
                 self._put_cached_text(cache_key, full_text, meta)
                 return full_text, meta
-            finally:
-                if doc:
-                    doc.close()
+
+    def _retrieval_index(self, pdf_path: str) -> BM25Index:
+        """문서 전체 청크 BM25 색인 ((경로, mtime_ns) 캐시)."""
+        cache_key = self._make_upload_cache_key(pdf_path)
+        cached = self._get_cached_retrieval_index(cache_key)
+        if cached is not None:
+            return cached
+        with PerfTimer(
+            "core.ai.retrieval_index",
+            logger=logger,
+            extra={"file": os.path.basename(pdf_path)},
+        ):
+            with DOC_POOL.borrow(pdf_path) as doc:
+                if doc is None:
+                    raise ValueError(f"Encrypted PDF requires a decrypted copy: {os.path.basename(pdf_path)}")
+                text_key = TEXT_LAYER_CACHE.document_key(doc)
+                index = BM25Index(chunk_pages((i, cached_page_text(doc, i, text_key)) for i in range(len(doc))))
+        self._put_cached_retrieval_index(cache_key, index)
+        return index
+
+    def _retrieve_text_with_meta(
+        self,
+        pdf_path: str,
+        query: str,
+        *,
+        top_k: int = AI_RETRIEVAL_TOP_K,
+    ) -> tuple[str, dict[str, Any]]:
+        """질문 관련 청크만 담은 본문. 문서가 길이 제한 안에 들어가면 전체 본문을 그대로 쓴다."""
+        full_text, meta = self._extract_text_with_meta(pdf_path)
+        if not meta.get("truncated") or not query.strip():
+            return full_text, meta
+        index = self._retrieval_index(pdf_path)
+        chunks = index.select(query, top_k=top_k, max_chars=self.MAX_TEXT_LENGTH)
+        if not chunks:
+            # 질문 단어가 문서에 없으면 기존처럼 앞부분을 보낸다
+            return full_text, meta
+        return format_chunks(chunks), self._build_result_meta(
+            source="retrieval",
+            fallback_pages_total=meta.get("fallback_pages_total"),
+            fallback_pages_used=len({chunk.page_index for chunk in chunks}),
+            retrieved_chunks=len(chunks),
+        )
 
     def extract_text_from_pdf(self, pdf_path: str, max_pages: int | None = None) -> str:
         text, _meta = self._extract_text_with_meta(pdf_path, max_pages=max_pages)
@@ -123,9 +123,14 @@ class AIGenerationMixin:
         fallback_max_pages: int | None = None,
         upload_error: Exception | None = None,
         cancel_check: Callable[[], None] | None = None,
+        retrieval_query: str | None = None,
     ) -> dict[str, Any]:
         self._run_cancel_check(cancel_check)
-        extracted_text, meta = self._extract_text_with_meta(pdf_path, max_pages=fallback_max_pages)
+        if retrieval_query:
+            # Q&A: 앞부분 잘림 대신 질문 관련 청크 (BM25 상위 k)
+            extracted_text, meta = self._retrieve_text_with_meta(pdf_path, retrieval_query)
+        else:
+            extracted_text, meta = self._extract_text_with_meta(pdf_path, max_pages=fallback_max_pages)
         if not extracted_text.strip():
             raise RuntimeError(f"PDF text extraction failed after File API upload failure: {upload_error}")
         contents = [prompt, extracted_text]
@@ -223,6 +228,7 @@ class AIGenerationMixin:
         partial_callback: Callable[[str], None] | None = None,
         fallback_max_pages: int | None = None,
         cancel_check: Callable[[], None] | None = None,
+        retrieval_query: str | None = None,
     ) -> dict[str, Any]:
         try:
             uploaded_file = self._upload_pdf_file(pdf_path, cancel_check=cancel_check)
@@ -239,6 +245,7 @@ class AIGenerationMixin:
                 fallback_max_pages=fallback_max_pages,
                 upload_error=exc,
                 cancel_check=cancel_check,
+                retrieval_query=retrieval_query,
             )
 
         contents = [prompt, uploaded_file]
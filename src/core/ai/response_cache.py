@@ -0,0 +1,181 @@
+"""디스크 AI 응답 캐시 — 문서 내용 해시 + 모델 + 프롬프트/스키마 + 옵션 키.
+
+같은 계약서를 재시작 후 다시 요약해도 모델 왕복 없이 저장된 결과를 돌려준다. 키는 파일 경로가
+아니라 내용(blake2b)이라 복사·이름 변경된 같은 문서도 맞고, 내용이 바뀌면 자연히 빗나간다.
+앱 데이터 디렉터리의 SQLite(WAL)에 zlib(JSON) 으로 저장하고 TTL·총 크기(LRU)로 정리한다.
+암호화 문서의 복호화 임시 사본(AI_TEMP_PREFIX)은 저장하지 않는다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any
+
+from ..path_utils import app_data_dir, normalize_path_key
+from ..sqlite_store import SQLiteStore
+from ..temp_cleanup import AI_TEMP_PREFIX
+
+logger = logging.getLogger(__name__)
+
+AI_RESPONSE_CACHE_FILENAME = "ai_responses.sqlite3"
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_DISK_BYTES = 32 * 1024 * 1024
+_SCHEMA_VERSION = 1
+_ZLIB_LEVEL = 6
+_HASH_CHUNK_BYTES = 1024 * 1024
+_HASH_MEMO_MAX_ITEMS = 64
+
+# (경로 키, mtime_ns, 크기) → 내용 해시 — 같은 파일을 질문마다 다시 읽지 않는다
+_hash_memo: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_hash_memo_lock = threading.Lock()
+
+
+def document_content_hash(pdf_path: str) -> str | None:
+    """파일 내용 blake2b 해시. 복호화 임시 사본·읽기 실패는 None (캐시하지 않음)."""
+    path_key = normalize_path_key(pdf_path)
+    if not path_key or os.path.basename(path_key).startswith(AI_TEMP_PREFIX):
+        return None
+    try:
+        st = os.stat(path_key)
+    except OSError:
+        return None
+    memo_key = (path_key, int(st.st_mtime_ns), int(st.st_size))
+    with _hash_memo_lock:
+        digest = _hash_memo.get(memo_key)
+        if digest is not None:
+            _hash_memo.move_to_end(memo_key)
+            return digest
+    hasher = hashlib.blake2b(digest_size=20)
+    try:
+        with open(path_key, "rb") as handle:
+            for block in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+                hasher.update(block)
+    except OSError:
+        return None
+    digest = hasher.hexdigest()
+    with _hash_memo_lock:
+        _hash_memo[memo_key] = digest
+        while len(_hash_memo) > _HASH_MEMO_MAX_ITEMS:
+            _hash_memo.popitem(last=False)
+    return digest
+
+
+def response_cache_key(
+    *,
+    operation: str,
+    content_hash: str,
+    model: str,
+    prompt: str,
+    schema: dict[str, Any],
+    options: dict[str, Any],
+) -> str:
+    material = json.dumps(
+        [_SCHEMA_VERSION, operation, content_hash, model, prompt, schema, options],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def default_cache_path() -> str:
+    return app_data_dir("cache", AI_RESPONSE_CACHE_FILENAME)
+
+
+class AIResponseStore(SQLiteStore):
+    """key → (zlib JSON payload, 생성 시각) SQLite 저장소. 만료 항목은 읽을 때·넣을 때 지운다."""
+
+    store_name = "AI response cache"
+    schema_version = _SCHEMA_VERSION
+    tables = ("responses",)
+    schema = (
+        "CREATE TABLE IF NOT EXISTS responses ("
+        " key TEXT PRIMARY KEY, data BLOB NOT NULL, nbytes INTEGER NOT NULL,"
+        " created REAL NOT NULL, last_used REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS responses_last_used ON responses(last_used)",
+    )
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_DISK_BYTES,
+    ):
+        super().__init__(db_path or default_cache_path())
+        self.ttl_seconds = max(1.0, float(ttl_seconds))
+        self.max_bytes = max(1, int(max_bytes))
+        self._open()
+        self._total_bytes = self._stored_bytes("responses")
+
+    def get(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """(payload, 생성 시각). 없거나 만료면 None."""
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute("SELECT data, nbytes, created FROM responses WHERE key=?", (key,)).fetchone()
+                if row is None:
+                    return None
+                if now - float(row[2]) > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM responses WHERE key=?", (key,))
+                    self._total_bytes -= int(row[1])
+                    return None
+                self._conn.execute("UPDATE responses SET last_used=? WHERE key=?", (now, key))
+            except sqlite3.Error as exc:
+                logger.debug("AI response cache read failed: %s", exc)
+                return None
+        try:
+            payload = json.loads(zlib.decompress(row[0]).decode("utf-8"))
+        except Exception:
+            logger.debug("Corrupt AI response cache row ignored", exc_info=True)
+            return None
+        return (payload, float(row[2])) if isinstance(payload, dict) else None
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        try:
+            data = zlib.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"), _ZLIB_LEVEL)
+        except (TypeError, ValueError):
+            logger.debug("AI response not JSON-serializable; not cached", exc_info=True)
+            return
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                old = self._conn.execute("SELECT nbytes FROM responses WHERE key=?", (key,)).fetchone()
+                if old is not None:
+                    self._total_bytes -= int(old[0])
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, data, len(data), now, now),
+                )
+                self._total_bytes += len(data)
+                if self._total_bytes > self.max_bytes:
+                    self._evict_locked(now)
+            except sqlite3.Error as exc:
+                logger.debug("AI response cache write failed: %s", exc)
+
+    def _evict_locked(self, now: float) -> None:
+        assert self._conn is not None
+        self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+        self._total_bytes = self._stored_bytes("responses")
+        self._evict_lru_locked("responses", ("key",))
+
+__all__ = [
+    "AIResponseStore",
+    "AI_RESPONSE_CACHE_FILENAME",
+    "DEFAULT_DISK_BYTES",
+    "DEFAULT_TTL_SECONDS",
+    "default_cache_path",
+    "document_content_hash",
+    "response_cache_key",
+]
@@ -0,0 +1,118 @@
+"""로컬 텍스트 Q&A 용 검색 계층 — 페이지/문단 청크 + BM25.
+
+File API 를 쓸 수 없어 로컬 텍스트로 답할 때 문서 앞부분 AI_MAX_TEXT_LENGTH 자만 보내는 대신,
+질문과 관련된 상위 k 개 청크를 페이지 순으로 묶어 보낸다. 청크는 페이지 경계를 넘지 않아
+[Page N] 표기가 정확하다. 토큰화와 BM25 점수는 라이브러리 검색과 같은 text_search 를 쓴다
+(한글·한자·가나 구간은 문자 bigram — 조사·어미가 붙어도 어간이 맞도록).
+색인은 AIService 가 (경로, mtime_ns) 별로 LRU 캐시한다.
+"""
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable
+
+from ..text_search import bm25_idf, bm25_term_score, tokenize
+
+# 청크 목표 길이 (문자) — 짧은 문단은 합치고 긴 줄은 자른다
+CHUNK_TARGET_CHARS = 1200
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+
+
+@dataclass(frozen=True, slots=True)
+class TextChunk:
+    page_index: int
+    text: str
+
+
+def _split_long(text: str, limit: int) -> list[str]:
+    return [text[i:i + limit] for i in range(0, len(text), limit)]
+
+
+def chunk_pages(pages: Iterable[tuple[int, str]], *, target_chars: int = CHUNK_TARGET_CHARS) -> list[TextChunk]:
+    """(페이지 번호, 텍스트) 목록을 페이지 안에서 문단 단위로 묶은 청크 목록으로 만든다."""
+    chunks: list[TextChunk] = []
+    for page_index, text in pages:
+        buffer: list[str] = []
+        size = 0
+        for paragraph in _PARAGRAPH_RE.split(text or ""):
+            for line in paragraph.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                for piece in _split_long(line, target_chars):
+                    if buffer and size + len(piece) + 1 > target_chars:
+                        chunks.append(TextChunk(page_index, "\n".join(buffer)))
+                        buffer, size = [], 0
+                    buffer.append(piece)
+                    size += len(piece) + 1
+        if buffer:
+            chunks.append(TextChunk(page_index, "\n".join(buffer)))
+    return chunks
+
+
+class BM25Index:
+    """청크 BM25 역색인. postings 는 토큰 → [(청크 번호, tf)]."""
+
+    __slots__ = ("chunks", "_postings", "_lengths", "_avg_length", "_idf")
+
+    def __init__(self, chunks: list[TextChunk]) -> None:
+        self.chunks = chunks
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._lengths: list[int] = []
+        for chunk_id, chunk in enumerate(chunks):
+            counts = Counter(tokenize(chunk.text))
+            self._lengths.append(sum(counts.values()))
+            for token, tf in counts.items():
+                self._postings.setdefault(token, []).append((chunk_id, tf))
+        total = len(chunks)
+        self._avg_length = (sum(self._lengths) / total) if total else 0.0
+        self._idf = {token: bm25_idf(total, len(postings)) for token, postings in self._postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    @property
+    def total_chars(self) -> int:
+        return sum(len(chunk.text) for chunk in self.chunks)
+
+    def search(self, query: str, top_k: int) -> list[tuple[float, int]]:
+        """(점수, 청크 번호) 상위 top_k — 점수 내림차순, 동점은 문서 순서."""
+        scores: dict[int, float] = {}
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = self._idf[token]
+            for chunk_id, tf in postings:
+                term_score = bm25_term_score(idf, tf, self._lengths[chunk_id], self._avg_length)
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + term_score
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(score, chunk_id) for chunk_id, score in ranked[: max(0, int(top_k))]]
+
+    def select(self, query: str, *, top_k: int, max_chars: int) -> list[TextChunk]:
+        """점수 순으로 max_chars 안에 들어가는 상위 청크를 골라 문서 순서로 돌려준다."""
+        picked: list[int] = []
+        used = 0
+        for _score, chunk_id in self.search(query, top_k):
+            length = len(self.chunks[chunk_id].text) + 16  # [Page N] 머리글
+            if used + length > max_chars:
+                continue
+            picked.append(chunk_id)
+            used += length
+        return [self.chunks[chunk_id] for chunk_id in sorted(picked)]
+
+
+def format_chunks(chunks: Iterable[TextChunk]) -> str:
+    return "\n\n".join(f"[Page {chunk.page_index + 1}]\n{chunk.text}" for chunk in chunks)
+
+
+__all__ = [
+    "BM25Index",
+    "CHUNK_TARGET_CHARS",
+    "TextChunk",
+    "chunk_pages",
+    "format_chunks",
+    "tokenize",
+]
@@ -27,6 +27,9 @@ class AISchemaMixin:
         fallback_pages_total: int | None = None,
         fallback_pages_used: int | None = None,
         max_text_chars: int | None = None,
+        retrieved_chunks: int | None = None,
+        cache_hit: bool = False,
+        cached_at: float | None = None,
     ) -> dict[str, Any]:
         return {
             "source": source,
@@ -43,6 +46,11 @@ class AISchemaMixin:
                 else None
             ),
             "max_text_chars": int(max_text_chars) if isinstance(max_text_chars, int) and max_text_chars > 0 else None,
+            "retrieved_chunks": (
+                int(retrieved_chunks) if isinstance(retrieved_chunks, int) and retrieved_chunks > 0 else None
+            ),
+            "cache_hit": bool(cache_hit),
+            "cached_at": float(cached_at) if isinstance(cached_at, (int, float)) and cached_at > 0 else None,
         }
 
     def _normalize_meta(self, meta: Any, *, default_source: str = "file_api") -> dict[str, Any]:
@@ -55,6 +63,9 @@ class AISchemaMixin:
             fallback_pages_total=meta.get("fallback_pages_total"),
             fallback_pages_used=meta.get("fallback_pages_used"),
             max_text_chars=meta.get("max_text_chars"),
+            retrieved_chunks=meta.get("retrieved_chunks"),
+            cache_hit=bool(meta.get("cache_hit", False)),
+            cached_at=meta.get("cached_at"),
         )
 
     def _make_summary_schema(self) -> dict[str, Any]:
@@ -13,6 +13,8 @@ from .errors import AIServiceError, APIKeyError, APIRateLimitError, APITimeoutEr
 from .extraction import AIExtractionMixin
 from .generation import AIGenerationMixin
 from .prompts import AIPromptMixin
+from .response_cache import AIResponseStore
+from .retrieval import BM25Index
 from .schemas import AISchemaMixin
 from .session import AIChatSessionMixin
 
@@ -32,11 +34,21 @@ class AIService(
     DEFAULT_TIMEOUT = AI_DEFAULT_TIMEOUT
     _TEXT_CACHE_MAX_BYTES = 16 * 1024 * 1024
     _UPLOAD_CACHE_MAX_ITEMS = 16
+    _RETRIEVAL_CACHE_MAX_ITEMS = 8
 
     _text_cache: OrderedDict[tuple[Any, ...], tuple[str, int, dict[str, Any]]] = OrderedDict()
     _text_cache_bytes = 0
     _text_cache_lock = threading.Lock()
 
+    # 로컬 Q&A BM25 색인 ((경로, mtime_ns) → 색인)
+    _retrieval_cache: OrderedDict[tuple[str, int], BM25Index] = OrderedDict()
+    _retrieval_cache_lock = threading.Lock()
+
+    # 디스크 응답 캐시 (지연 생성, 프로세스 공유)
+    _response_store: AIResponseStore | None = None
+    _response_store_failed = False
+    _response_store_lock = threading.Lock()
+
     _uploaded_file_cache: OrderedDict[tuple[str, int], dict[str, Any]] = OrderedDict()
     _uploaded_file_cache_lock = threading.Lock()
 
@@ -45,8 +57,15 @@ class AIService(
     # chat 세션 생성 single-flight (cache_key → Lock)
     _chat_create_locks: dict[tuple[str, str, int], threading.Lock] = {}
 
-    def __init__(self, api_key: str = "", model: str | None = None, timeout: int | None = None):
+    def __init__(
+        self,
+        api_key: str = "",
+        model: str | None = None,
+        timeout: int | None = None,
+        response_cache: bool = True,
+    ):
         self._api_key = api_key
+        self.use_response_cache = bool(response_cache)
         self._model = model or self.DEFAULT_MODEL
         self._timeout = timeout or self.DEFAULT_TIMEOUT
         self._configured = False
@@ -146,10 +165,21 @@ class AIService(
             raise RuntimeError("AI service not available. Check API key and google-genai installation.")
         self._run_cancel_check(cancel_check)
         prompt = self._build_summary_prompt(language, style, max_pages)
+        schema = self._make_summary_schema()
+        cache_key = self._response_cache_key(
+            "summarize",
+            pdf_path,
+            prompt=prompt,
+            schema=schema,
+            options={"language": language, "style": style, "max_pages": max_pages},
+        )
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
         payload = self._generate_structured_payload(
             prompt=prompt,
             pdf_path=pdf_path,
-            schema=self._make_summary_schema(),
+            schema=schema,
             partial_callback=partial_callback,
             fallback_max_pages=max_pages,
             cancel_check=cancel_check,
@@ -159,12 +189,14 @@ class AIService(
         payload.setdefault("summary", "")
         payload.setdefault("key_points", [])
         meta = self._normalize_meta(payload.get("meta"), default_source="file_api")
-        return {
+        result = {
             "title": str(payload.get("title", "")),
             "summary": str(payload.get("summary", "")),
             "key_points": [str(item) for item in payload.get("key_points", []) if str(item).strip()],
             "meta": meta,
         }
+        self._put_cached_response(cache_key, result)
+        return result
 
     def ask_about_pdf(
         self,
@@ -181,6 +213,19 @@ class AIService(
 
         self._run_cancel_check(cancel_check)
         schema = self._make_answer_schema()
+        # 대화 맥락 없는 단독 질문만 디스크 캐시 (이전 대화에 따라 답이 달라지므로)
+        cache_key = None
+        if not conversation_history:
+            cache_key = self._response_cache_key(
+                "ask",
+                pdf_path,
+                prompt=question.strip(),
+                schema=schema,
+                options={},
+            )
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
         config = self._build_generate_config(schema)
         try:
             chat = self._get_or_create_chat(
@@ -195,6 +240,8 @@ class AIService(
             prompt = (
                 "Answer the user's question about the PDF and return JSON only. "
                 'Schema: {"answer": string}. '
+                "Long documents are given as the passages most relevant to the question, "
+                "each headed by [Page N]; cite those page numbers when useful. "
                 f"Question: {question}"
             )
             payload = self._generate_structured_payload(
@@ -204,6 +251,7 @@ class AIService(
                 partial_callback=partial_callback,
                 fallback_max_pages=None,
                 cancel_check=cancel_check,
+                retrieval_query=question,
             )
         else:
             if partial_callback is not None:
@@ -224,7 +272,9 @@ class AIService(
 
         payload.setdefault("answer", "")
         meta = self._normalize_meta(payload.get("meta"), default_source="file_api")
-        return {"answer": str(payload.get("answer", "")), "meta": meta}
+        result = {"answer": str(payload.get("answer", "")), "meta": meta}
+        self._put_cached_response(cache_key, result)
+        return result
 
     def extract_keywords(
         self,
@@ -237,10 +287,21 @@ class AIService(
             raise RuntimeError("AI service not available. Check API key and google-genai installation.")
         self._run_cancel_check(cancel_check)
         prompt = self._build_keywords_prompt(max_keywords, language)
+        schema = self._make_keywords_schema()
+        cache_key = self._response_cache_key(
+            "keywords",
+            pdf_path,
+            prompt=prompt,
+            schema=schema,
+            options={"max_keywords": max_keywords, "language": language},
+        )
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
         payload = self._generate_structured_payload(
             prompt=prompt,
             pdf_path=pdf_path,
-            schema=self._make_keywords_schema(),
+            schema=schema,
             partial_callback=None,
             fallback_max_pages=None,
             cancel_check=cancel_check,
@@ -258,7 +319,9 @@ class AIService(
             if len(deduped) >= max_keywords:
                 break
         meta = self._normalize_meta(payload.get("meta"), default_source="file_api")
-        return {"keywords": deduped, "meta": meta}
+        result = {"keywords": deduped, "meta": meta}
+        self._put_cached_response(cache_key, result)
+        return result
 
 
 _ai_service_instance: Optional[AIService] = None
@@ -0,0 +1,217 @@
+"""빈 페이지 판별 (remove_blank_pages, dry-run 추정 공용).
+
+싼 신호부터 본다: 콘텐츠 스트림 길이·주석 유무(파싱 없음) → 이미지 리소스 → 텍스트 → 드로잉 →
+마지막에만 0.2x 렌더. 렌더 통계는 NumPy 로 한 번에 평균·분산을 구하고, 없으면 표본 합산으로 대체한다.
+페이지가 많으면 구간 단위로 프로세스 풀에 나눠 판별한다 — 자식 프로세스는 PyQt·worker_ops 를 import 하지 않는다.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from .optional_deps import fitz, np
+from .perf import perf_sample
+from .process_pool import create_process_pool, resolve_pool_workers, shutdown_process_pool
+from .render_pool import worker_document
+
+logger = logging.getLogger(__name__)
+
+# 평균 밝기가 이보다 높고 분산이 작으면 빈 페이지
+BLANK_MIN_MEAN = 250.0
+BLANK_MAX_VARIANCE = 30.0
+_RENDER_ZOOM = 0.2
+# NumPy 가 없을 때 표본 화소 수
+_FALLBACK_SAMPLES = 3000
+# 이보다 페이지가 적으면 풀 기동 비용이 더 크다
+PARALLEL_MIN_PAGES = 200
+_CHUNK_PAGES = 128
+_POLL_SECONDS = 0.25
+
+
+def page_text_len(page: Any) -> int:
+    try:
+        return len(str(page.get_text("text") or "").strip())
+    except Exception:
+        return 0
+
+
+def page_image_count(page: Any) -> int:
+    try:
+        return len(page.get_images(full=True) or [])
+    except Exception:
+        return 0
+
+
+def page_drawing_count(page: Any) -> int:
+    # get_cdrawings 는 Python 객체 변환을 생략한 빠른 경로
+    get_drawings = getattr(page, "get_cdrawings", None) or getattr(page, "get_drawings", None)
+    if not callable(get_drawings):
+        return 0
+    try:
+        return len(get_drawings() or [])
+    except Exception:
+        return 0
+
+
+def _content_stream_length(page: Any) -> int | None:
+    """콘텐츠 스트림 원시 길이 합 (압축 해제·파싱 없음). 알 수 없으면 None."""
+    doc = getattr(page, "parent", None)
+    get_contents = getattr(page, "get_contents", None)
+    if doc is None or not callable(get_contents):
+        return None
+    total = 0
+    try:
+        for xref in get_contents():
+            kind, value = doc.xref_get_key(xref, "Length")
+            if kind == "int":
+                total += int(value)
+            else:
+                # 간접 참조 길이 등은 원시 스트림으로 잰다
+                total += len(doc.xref_stream_raw(xref) or b"")
+    except Exception:
+        return None
+    return total
+
+
+def _has_annotations(page: Any) -> bool:
+    doc = getattr(page, "parent", None)
+    try:
+        kind, _value = doc.xref_get_key(page.xref, "Annots")
+    except Exception:
+        return True
+    return kind != "null"
+
+
+def render_is_blank(samples: Any) -> bool:
+    """저해상도 렌더 화소가 거의 흰색이고 고른지 (평균·분산 한 번에)."""
+    if not samples:
+        return True
+    if np is not None:
+        values = np.frombuffer(samples, dtype=np.uint8)
+        mean = float(values.mean())
+        if mean < BLANK_MIN_MEAN:
+            return False
+        return float(values.var()) < BLANK_MAX_VARIANCE
+    step = max(1, len(samples) // _FALLBACK_SAMPLES)
+    vals = samples[::step]
+    avg = sum(vals) / len(vals)
+    if avg < BLANK_MIN_MEAN:
+        return False
+    var = sum((v - avg) ** 2 for v in vals) / len(vals)
+    return var < BLANK_MAX_VARIANCE
+
+
+def is_blank_page(page: Any, *, text_threshold: int = 0) -> bool:
+    if _content_stream_length(page) == 0 and not _has_annotations(page):
+        return True
+    if page_image_count(page) > 0:
+        return False
+    if page_text_len(page) > text_threshold:
+        return False
+    if page_drawing_count(page) > 0:
+        return False
+    try:
+        with perf_sample("page.render"):
+            pix = page.get_pixmap(matrix=fitz.Matrix(_RENDER_ZOOM, _RENDER_ZOOM), alpha=False)
+        return render_is_blank(pix.samples)
+    except Exception:
+        # 렌더 실패 시 빈 페이지로 오판하면 데이터 손실 → 보수적으로 유지
+        return False
+
+
+def blank_flags_in_range(
+    file_path: str,
+    password: str,
+    start: int,
+    stop: int,
+    text_threshold: int,
+) -> tuple[int, list[bool]]:
+    """자식 프로세스: [start, stop) 페이지의 빈 페이지 여부."""
+    doc = worker_document(file_path, password)
+    return start, [is_blank_page(doc[i], text_threshold=text_threshold) for i in range(start, stop)]
+
+
+def _poolable_path(doc: Any) -> str:
+    """자식이 다시 열 수 있는 디스크 문서 경로 (메모리·수정된 문서는 빈 문자열)."""
+    name = getattr(doc, "name", "") or ""
+    if not name or getattr(doc, "is_dirty", False) or getattr(doc, "stream", None) is not None:
+        return ""
+    return name
+
+
+def detect_blank_pages(
+    doc: Any,
+    *,
+    text_threshold: int = 0,
+    password: str = "",
+    workers: object = None,
+    check_cancelled: Callable[[], None] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> list[bool]:
+    """페이지별 빈 페이지 여부. 큰 문서는 구간 단위로 프로세스 풀에 나눈다 (풀 실패 시 직렬)."""
+    total = len(doc)
+    flags: list[bool | None] = [None] * total
+    done = 0
+
+    def _record(start: int, values: list[bool]) -> None:
+        nonlocal done
+        flags[start : start + len(values)] = values
+        done += len(values)
+        if on_progress is not None:
+            on_progress(done, total)
+
+    file_path = _poolable_path(doc) if total >= PARALLEL_MIN_PAGES else ""
+    pool_size = resolve_pool_workers(-(-total // _CHUNK_PAGES), workers) if file_path else 1
+    if pool_size > 1:
+        executor = None
+        terminate = True
+        try:
+            executor = create_process_pool(pool_size)
+            in_flight: set[Future] = {
+                executor.submit(
+                    blank_flags_in_range, file_path, password, start, min(total, start + _CHUNK_PAGES), text_threshold
+                )
+                for start in range(0, total, _CHUNK_PAGES)
+            }
+            while in_flight:
+                if check_cancelled is not None:
+                    check_cancelled()
+                finished, in_flight = wait(in_flight, timeout=_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    _record(*future.result())
+            terminate = False
+        except BrokenProcessPool:
+            logger.warning("Blank page pool broke; finishing serially")
+        except Exception as exc:
+            from .worker_runtime.errors import CancelledError
+
+            if isinstance(exc, CancelledError):
+                raise
+            # 자식에서 문서를 못 여는 경우(인증 등) — 남은 구간은 현 스레드에서
+            logger.warning("Blank page pool failed; finishing serially", exc_info=True)
+        finally:
+            shutdown_process_pool(executor, terminate=terminate)
+
+    for i in range(total):
+        if flags[i] is not None:
+            continue
+        if check_cancelled is not None:
+            check_cancelled()
+        _record(i, [is_blank_page(doc[i], text_threshold=text_threshold)])
+    return [bool(flag) for flag in flags]
+
+
+__all__ = [
+    "BLANK_MAX_VARIANCE",
+    "BLANK_MIN_MEAN",
+    "PARALLEL_MIN_PAGES",
+    "blank_flags_in_range",
+    "detect_blank_pages",
+    "is_blank_page",
+    "page_drawing_count",
+    "page_image_count",
+    "page_text_len",
+    "render_is_blank",
+]
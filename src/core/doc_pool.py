@@ -0,0 +1,290 @@
+"""프로세스 공용 읽기 전용 PDF 문서 핸들 풀.
+
+추출·비교·AI 본문·썸네일·인쇄가 같은 파일을 차례로 열 때 xref 파싱·복구 비용을 한 번만 치르도록
+열린 fitz 문서를 재사용한다. 키는 (normalize_path_key, mtime_ns, 인증 토큰) — 파일이 바뀌면 mtime 이
+달라져 새로 연다 (같은 시각 틱 안의 덮어쓰기·rename 교체도 잡도록 크기·inode 를 함께 본다). 암호 문서는 인증에 성공한 암호의 해시를 토큰으로 써서, 같은 암호를 내는 호출자만
+복호된 핸들을 받는다.
+
+스레드 정책: 빌려 간 핸들(refcount > 0)은 빌린 스레드 전용이다. 같은 스레드의 중첩 대여는 같은
+핸들을 공유하고, 다른 스레드는 별도 핸들을 연다. 반납된(유휴) 핸들은 어느 스레드든 가져갈 수 있다.
+유휴 핸들은 LRU 로 개수·유휴 시간 상한까지만 보관한다 (Windows 에서는 열린 파일의 교체·삭제가 막힌다).
+유휴 시간이 지난 핸들은 다음 acquire 를 기다리지 않고 데몬 타이머가 닫는다.
+대여자는 문서를 수정하지 않는다 — 반납할 때 새로 dirty 가 되었으면 풀에 두지 않고 닫는다.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from .optional_deps import fitz
+from .path_utils import normalize_path_key
+from .perf import perf_sample
+from .temp_cleanup import AI_TEMP_PREFIX, ATOMIC_TEMP_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# 유휴 핸들 상한 — 큰 문서 몇 개의 xref 테이블 정도
+DEFAULT_MAX_IDLE = 4
+DEFAULT_IDLE_SECONDS = 60.0
+# 만료 직후에 깨도록 타이머에 더하는 여유
+_SWEEP_SLACK_SECONDS = 0.05
+
+
+@dataclass(slots=True)
+class _PooledDocument:
+    path_key: str
+    stamp: tuple[int, int, int]
+    token: str
+    doc: Any
+    dirty_at_open: bool
+    refs: int = 0
+    owner: int | None = None
+    last_used: float = 0.0
+    stale: bool = False
+
+    def matches(self, path_key: str, stamp: tuple[int, int, int], tokens: tuple[str, ...]) -> bool:
+        return not self.stale and self.path_key == path_key and self.stamp == stamp and self.token in tokens
+
+
+def _auth_token(password: str) -> str:
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()[:32]
+
+
+def _password_candidates(passwords: Iterable[str | None]) -> list[str]:
+    candidates: list[str] = []
+    for password in passwords:
+        if isinstance(password, str) and password and password not in candidates:
+            candidates.append(password)
+    return candidates
+
+
+def _file_stamp(file_path: str) -> tuple[int, int, int] | None:
+    """(mtime_ns, 크기, inode). 파일이 없으면 None."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return int(st.st_mtime_ns), int(st.st_size), int(st.st_ino)
+
+
+def _is_temp_copy(path_key: str) -> bool:
+    name = os.path.basename(path_key)
+    return name.startswith(AI_TEMP_PREFIX) or name.startswith(ATOMIC_TEMP_PREFIX)
+
+
+def _close_quietly(doc: Any) -> None:
+    try:
+        doc.close()
+    except Exception:
+        logger.debug("Failed to close pooled document", exc_info=True)
+
+
+def open_authenticated(file_path: str, passwords: Iterable[str | None] = ()) -> tuple[Any | None, str]:
+    """(문서, 인증에 쓴 암호). 암호 문서인데 맞는 암호가 없으면 (None, "")."""
+    doc = fitz.open(file_path)
+    if not getattr(doc, "is_encrypted", False):
+        return doc, ""
+    for candidate in _password_candidates(passwords):
+        try:
+            if doc.authenticate(candidate):
+                return doc, candidate
+        except Exception:
+            logger.debug("PDF authentication attempt failed", exc_info=True)
+    doc.close()
+    return None, ""
+
+
+class DocumentPool:
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE, idle_seconds: float = DEFAULT_IDLE_SECONDS):
+        self.max_idle = max(0, int(max_idle))
+        self.idle_seconds = float(idle_seconds)
+        self._lock = threading.Lock()
+        # id(doc) → 항목. 유휴 목록은 오래된 것부터 (LRU)
+        self._idle: OrderedDict[int, _PooledDocument] = OrderedDict()
+        self._leased: dict[int, _PooledDocument] = {}
+        self._sweeper: threading.Timer | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, file_path: str, passwords: Iterable[str | None] = ()) -> Any | None:
+        """읽기 전용 문서를 빌린다. 암호가 맞지 않으면 None. 반드시 release 로 돌려준다."""
+        candidates = _password_candidates(passwords)
+        path_key = normalize_path_key(file_path)
+        stamp = _file_stamp(file_path)
+        if not path_key or stamp is None or _is_temp_copy(path_key):
+            # 풀 밖 핸들 — 없는 파일의 예외도 fitz.open 그대로 올라가게 둔다
+            return open_authenticated(file_path, candidates)[0]
+
+        tokens = ("", *(_auth_token(candidate) for candidate in candidates))
+        thread_id = threading.get_ident()
+        with self._lock:
+            expired = self._drop_expired_locked(path_key, stamp)
+            entry = self._find_locked(path_key, stamp, tokens, thread_id)
+            if entry is not None:
+                entry.refs += 1
+                entry.owner = thread_id
+                self._leased[id(entry.doc)] = entry
+                self.hits += 1
+        for stale_doc in expired:
+            _close_quietly(stale_doc)
+        if entry is not None:
+            return entry.doc
+
+        with perf_sample("doc_pool.open"):
+            doc, password = open_authenticated(file_path, candidates)
+        if doc is None:
+            return None
+        entry = _PooledDocument(
+            path_key=path_key,
+            stamp=stamp,
+            token=_auth_token(password) if password else "",
+            doc=doc,
+            dirty_at_open=bool(getattr(doc, "is_dirty", False)),
+            refs=1,
+            owner=thread_id,
+        )
+        with self._lock:
+            self._leased[id(doc)] = entry
+            self.misses += 1
+        return doc
+
+    def release(self, doc: Any) -> None:
+        """빌린 문서를 돌려준다. 풀에서 나온 문서가 아니면 그냥 닫는다."""
+        if doc is None:
+            return
+        to_close: list[Any] = []
+        with self._lock:
+            entry = self._leased.get(id(doc))
+            if entry is None or entry.doc is not doc:
+                to_close.append(doc)
+            else:
+                entry.refs -= 1
+                if entry.refs <= 0:
+                    del self._leased[id(doc)]
+                    entry.owner = None
+                    if entry.stale or self._unusable(entry):
+                        to_close.append(doc)
+                    else:
+                        entry.last_used = time.monotonic()
+                        self._idle[id(doc)] = entry
+                        while len(self._idle) > self.max_idle:
+                            _key, evicted = self._idle.popitem(last=False)
+                            to_close.append(evicted.doc)
+                        self._schedule_sweep_locked()
+        for stale_doc in to_close:
+            _close_quietly(stale_doc)
+
+    @contextmanager
+    def borrow(self, file_path: str, passwords: Iterable[str | None] = ()) -> Iterator[Any | None]:
+        doc = self.acquire(file_path, passwords)
+        try:
+            yield doc
+        finally:
+            if doc is not None:
+                self.release(doc)
+
+    def invalidate(self, file_path: str) -> None:
+        """경로의 유휴 핸들을 닫고, 대여 중인 핸들은 반납 시 닫히게 한다 (덮어쓰기·삭제 전 호출)."""
+        path_key = normalize_path_key(file_path)
+        if not path_key:
+            return
+        to_close: list[Any] = []
+        with self._lock:
+            for key, entry in list(self._idle.items()):
+                if entry.path_key == path_key:
+                    del self._idle[key]
+                    to_close.append(entry.doc)
+            for entry in self._leased.values():
+                if entry.path_key == path_key:
+                    entry.stale = True
+        for doc in to_close:
+            _close_quietly(doc)
+
+    def clear(self) -> None:
+        with self._lock:
+            to_close = [entry.doc for entry in self._idle.values()]
+            self._idle.clear()
+            for entry in self._leased.values():
+                entry.stale = True
+            sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.cancel()
+        for doc in to_close:
+            _close_quietly(doc)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"idle": len(self._idle), "leased": len(self._leased), "hits": self.hits, "misses": self.misses}
+
+    def _find_locked(
+        self, path_key: str, stamp: tuple[int, int, int], tokens: tuple[str, ...], thread_id: int
+    ) -> _PooledDocument | None:
+        # 같은 스레드가 이미 빌린 핸들 (중첩 대여) → 가장 최근 유휴 핸들 순
+        for entry in self._leased.values():
+            if entry.owner == thread_id and entry.matches(path_key, stamp, tokens):
+                return entry
+        for key in reversed(self._idle):
+            entry = self._idle[key]
+            if entry.matches(path_key, stamp, tokens):
+                if self._unusable(entry):
+                    continue
+                del self._idle[key]
+                return entry
+        return None
+
+    def _drop_expired_locked(self, path_key: str | None = None, stamp: tuple[int, int, int] | None = None) -> list[Any]:
+        """유휴 시간 초과·파일이 바뀐 유휴 핸들을 꺼낸다 (닫기는 잠금 밖에서)."""
+        now = time.monotonic()
+        dropped: list[Any] = []
+        for key, entry in list(self._idle.items()):
+            outdated = path_key is not None and entry.path_key == path_key and entry.stamp != stamp
+            if outdated or now - entry.last_used > self.idle_seconds or self._unusable(entry):
+                del self._idle[key]
+                dropped.append(entry.doc)
+        if path_key is None:
+            return dropped
+        for entry in self._leased.values():
+            if entry.path_key == path_key and entry.stamp != stamp:
+                entry.stale = True
+        return dropped
+
+    def _schedule_sweep_locked(self) -> None:
+        """가장 오래된 유휴 핸들이 만료될 때 깨는 타이머를 건다 (이미 걸려 있으면 그대로)."""
+        if self._sweeper is not None or not self._idle:
+            return
+        oldest = next(iter(self._idle.values())).last_used
+        delay = max(0.0, oldest + self.idle_seconds - time.monotonic()) + _SWEEP_SLACK_SECONDS
+        sweeper = threading.Timer(delay, self._sweep)
+        sweeper.daemon = True
+        self._sweeper = sweeper
+        sweeper.start()
+
+    def _sweep(self) -> None:
+        with self._lock:
+            if self._sweeper is not threading.current_thread():
+                return
+            self._sweeper = None
+            expired = self._drop_expired_locked()
+            self._schedule_sweep_locked()
+        for doc in expired:
+            _close_quietly(doc)
+
+    @staticmethod
+    def _unusable(entry: _PooledDocument) -> bool:
+        doc = entry.doc
+        if getattr(doc, "is_closed", False):
+            return True
+        return bool(getattr(doc, "is_dirty", False)) and not entry.dirty_at_open
+
+
+DOC_POOL = DocumentPool()
+
+
+__all__ = ["DEFAULT_IDLE_SECONDS", "DEFAULT_MAX_IDLE", "DOC_POOL", "DocumentPool", "open_authenticated"]
@@ -0,0 +1,196 @@
+"""Qt 없이 OPERATION_SPECS 핸들러를 실행하는 헤드리스 워커.
+
+WorkerThread 와 같은 실행 경로(kwargs 정규화 → preflight → 핸들러)를 쓰되,
+pyqtSignal 대신 `CallbackSignal`(connect/emit 만 가진 콜백 목록)로 결과를 전달한다.
+PyQt 를 import 하지 않으므로 렌더 서버·외부 스케줄러에서 QApplication 없이 쓸 수 있다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .worker_ops import WorkerAiOpsMixin, WorkerPdfOpsMixin
+from .worker_runtime import CancelledError, WorkerRuntimeMixin, get_operation_spec
+
+logger = logging.getLogger(__name__)
+
+# 취소 시 rollback 에서 제외할 입력 경로 kwargs (UI 취소 정리와 동일 키)
+_INPUT_PATH_KEYS = ("file_path", "file_path1", "file_path2", "source_path", "replace_path")
+_INPUT_LIST_KEYS = ("file_paths", "files")
+_STATUS_PRIORITY = {"finished": 0, "error": 1, "cancelled": 2}
+
+
+class CallbackSignal:
+    """pyqtSignal 대용 — 연결된 콜백을 emit 한 스레드에서 순서대로 호출한다."""
+
+    __slots__ = ("_slots",)
+
+    def __init__(self) -> None:
+        self._slots: list[Callable[..., Any]] = []
+
+    def connect(self, slot: Callable[..., Any]) -> None:
+        self._slots.append(slot)
+
+    def disconnect(self, slot: Callable[..., Any] | None = None) -> None:
+        if slot is None:
+            self._slots.clear()
+        elif slot in self._slots:
+            self._slots.remove(slot)
+
+    def emit(self, *args: Any) -> None:
+        for slot in list(self._slots):
+            try:
+                slot(*args)
+            except Exception:
+                logger.warning("Headless callback failed", exc_info=True)
+
+
+@dataclass(slots=True)
+class HeadlessResult:
+    mode: str
+    status: str
+    message: str = ""
+    result_payload: dict[str, Any] = field(default_factory=dict)
+    created_output_paths: list[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "finished"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "status": self.status,
+            "message": self.message,
+            "result": self.result_payload,
+            "created_output_paths": list(self.created_output_paths),
+            "elapsed_ms": round(self.elapsed_ms, 1),
+        }
+
+
+class HeadlessWorker(WorkerRuntimeMixin, WorkerPdfOpsMixin, WorkerAiOpsMixin):
+    """WorkerThread 의 Qt 비의존 대응물. `execute()` 는 호출한 스레드에서 동기 실행된다."""
+
+    def __init__(self, mode: str, **kwargs: Any):
+        self.mode = mode
+        created_output_paths = kwargs.get("created_output_paths")
+        if not isinstance(created_output_paths, list):
+            kwargs["created_output_paths"] = []
+        self.kwargs = kwargs
+        self.result_payload: dict[str, Any] = {}
+        self._cancel_requested = False
+        self._last_progress_value: int | None = None
+        self._last_progress_emit_ts_ms = 0.0
+        self._interrupted = threading.Event()
+        self.progress_signal = CallbackSignal()
+        self.partial_result_signal = CallbackSignal()
+        self.finished_signal = CallbackSignal()
+        self.error_signal = CallbackSignal()
+        self.cancelled_signal = CallbackSignal()
+
+    def isInterruptionRequested(self) -> bool:
+        return self._interrupted.is_set()
+
+    def cancel(self) -> None:
+        """다른 스레드(시그널 핸들러 등)에서 호출 가능한 취소 요청"""
+        self._cancel_requested = True
+        self._interrupted.set()
+        logger.info("Cancel requested for headless task: %s", self.mode)
+
+    def execute(self) -> HeadlessResult:
+        """핸들러를 실행하고 종료 상태(finished/error/cancelled)를 모아 반환한다.
+
+        취소되면 이번 실행이 만든 출력(입력 경로 제외)을 지운다.
+        """
+        outcome: list[tuple[str, str]] = []
+
+        def _record(status: str) -> Callable[[str], None]:
+            def _slot(message: str) -> None:
+                # 취소 > 오류 > 완료 순으로 우선
+                if not outcome or _STATUS_PRIORITY[status] >= _STATUS_PRIORITY[outcome[0][0]]:
+                    outcome[:] = [(status, str(message))]
+
+            return _slot
+
+        slots = {
+            self.finished_signal: _record("finished"),
+            self.error_signal: _record("error"),
+            self.cancelled_signal: _record("cancelled"),
+        }
+        for signal, slot in slots.items():
+            signal.connect(slot)
+        started = time.perf_counter()
+        try:
+            if self._cancel_requested:
+                raise CancelledError("cancelled before start")
+            self.run()
+        except CancelledError:
+            self.cancelled_signal.emit(self._get_msg("err_cancelled"))
+        finally:
+            for signal, slot in slots.items():
+                signal.disconnect(slot)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        status, message = outcome[0] if outcome else ("finished", "")
+        if status == "cancelled":
+            self._rollback_created_outputs()
+        created = [path for path in self.kwargs.get("created_output_paths") or [] if isinstance(path, str)]
+        return HeadlessResult(
+            mode=self.mode,
+            status=status,
+            message=message,
+            result_payload=dict(self.result_payload or {}),
+            created_output_paths=created,
+            elapsed_ms=elapsed_ms,
+        )
+
+    def _rollback_created_outputs(self) -> None:
+        spec = get_operation_spec(self.mode)
+        if spec is not None and spec.cancel_cleanup == "none":
+            return
+        input_paths: set[str] = set()
+        for key in _INPUT_PATH_KEYS:
+            value = self.kwargs.get(key)
+            if isinstance(value, str) and value:
+                input_paths.add(os.path.abspath(value))
+        for key in _INPUT_LIST_KEYS:
+            for value in self.kwargs.get(key) or []:
+                if isinstance(value, str) and value:
+                    input_paths.add(os.path.abspath(value))
+        for path in self.kwargs.get("created_output_paths") or []:
+            abs_path = os.path.abspath(str(path))
+            if abs_path in input_paths or not os.path.isfile(abs_path):
+                continue
+            try:
+                os.remove(abs_path)
+                logger.info("Removed cancelled output file: %s", abs_path)
+            except OSError:
+                logger.debug("Could not remove cancelled output: %s", abs_path, exc_info=True)
+
+
+def run_headless(
+    mode: str,
+    kwargs: dict[str, Any] | None = None,
+    *,
+    on_progress: Callable[[int], None] | None = None,
+    on_partial_result: Callable[[dict[str, Any]], None] | None = None,
+    cancel_event: threading.Event | None = None,
+) -> HeadlessResult:
+    """단일 작업을 동기 실행한다. cancel_event 가 설정되면 다음 취소 검사 지점에서 중단."""
+    worker = HeadlessWorker(mode, **dict(kwargs or {}))
+    if on_progress is not None:
+        worker.progress_signal.connect(on_progress)
+    if on_partial_result is not None:
+        worker.partial_result_signal.connect(on_partial_result)
+    if cancel_event is not None:
+        # 외부 이벤트를 워커 인터럽트 플래그로 그대로 사용
+        worker._interrupted = cancel_event
+    return worker.execute()
+
+
+__all__ = ["CallbackSignal", "HeadlessResult", "HeadlessWorker", "run_headless"]
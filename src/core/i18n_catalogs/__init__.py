@@ -13,6 +13,8 @@ TRANSLATIONS["ko"].update(
         "ai_meta_file_api_page_focus": "AI 상태: Gemini File API 사용, 처음 {}페이지 중심",
         "ai_meta_text_fallback": "AI 상태: 로컬 텍스트 fallback 사용 ({} / {}페이지)",
         "ai_meta_text_fallback_truncated": "AI 상태: 로컬 텍스트 fallback 사용, {} / {}페이지, {}자 제한으로 잘림",
+        "ai_meta_retrieval": "AI 상태: 로컬 텍스트 검색 사용, 질문 관련 {}개 구간 ({} / {}페이지)",
+        "ai_meta_cache_hit": "저장된 응답 재사용 ({})",
         "ai_meta_saved_header": "[AI 처리 메타] {}",
         "title_api_key_plaintext_confirm": "평문 저장 확인",
         "msg_api_key_plaintext_confirm": "보안 저장소에 API 키를 저장할 수 없습니다.\n설정 파일에 평문으로 저장할까요?",
@@ -39,6 +41,7 @@ TRANSLATIONS["ko"].update(
         "msg_metadata_saved": "✅ 메타데이터 저장 완료!",
         "msg_encryption_success": "✅ 암호화 완료!",
         "msg_compression_done": "✅ 압축 완료 ({})\n{}KB -> {}KB ({:.1f}% 감소)",
+        "msg_compress_estimated": "✅ 압축 예상 크기 계산 완료 ({})\n{}KB -> 약 {}KB",
         "msg_images_to_pdf_done": "✅ 이미지 → PDF 변환 완료!\n{}개 이미지 → 1개 PDF",
         "msg_merge_done": "✅ 병합 완료!\n{}개 파일 → 1개 PDF",
         "msg_merge_skipped": "\n⚠️ {}개 파일 건너뜀",
@@ -76,6 +79,7 @@ TRANSLATIONS["ko"].update(
         "err_redact_text_required": "삭제할 텍스트가 입력되지 않았습니다.",
         "msg_redact_done": "✅ {}개 영역 교정 완료!",
         "msg_markdown_extracted": "✅ Markdown 추출 완료!\n{}페이지",
+        "msg_library_indexed": "✅ 라이브러리 색인 갱신!\n새로 색인 {}개 · 변경 없음 {}개\n전체 {}개 파일, {}페이지",
         "msg_pages_copied": "✅ {}페이지 복사 완료!",
         "msg_background_added": "✅ 배경색 추가 완료!\n{}페이지",
         "msg_markup_label_underline": "밑줄",
@@ -99,6 +103,8 @@ TRANSLATIONS["en"].update(
         "ai_meta_file_api_page_focus": "AI status: Gemini File API, focusing on the first {} page(s)",
         "ai_meta_text_fallback": "AI status: local text fallback ({} / {} pages)",
         "ai_meta_text_fallback_truncated": "AI status: local text fallback, {} / {} pages, truncated at {} chars",
+        "ai_meta_retrieval": "AI status: local text search, {} relevant passage(s) ({} / {} pages)",
+        "ai_meta_cache_hit": "Reused saved response ({})",
         "ai_meta_saved_header": "[AI processing meta] {}",
         "title_api_key_plaintext_confirm": "Confirm plaintext save",
         "msg_api_key_plaintext_confirm": "The API key could not be saved to secure storage.\nSave it in plaintext in the settings file?",
@@ -125,6 +131,7 @@ TRANSLATIONS["en"].update(
         "msg_metadata_saved": "✅ Metadata saved!",
         "msg_encryption_success": "✅ PDF encrypted!",
         "msg_compression_done": "✅ Compression complete ({})\n{}KB -> {}KB ({:.1f}% reduced)",
+        "msg_compress_estimated": "✅ Compression estimate ready ({})\n{}KB -> about {}KB",
         "msg_images_to_pdf_done": "✅ Image to PDF conversion complete!\n{} image(s) -> 1 PDF",
         "msg_merge_done": "✅ Merge complete!\n{} file(s) -> 1 PDF",
         "msg_merge_skipped": "\n⚠️ Skipped {} file(s)",
@@ -162,6 +169,7 @@ TRANSLATIONS["en"].update(
         "err_redact_text_required": "Text to redact is required.",
         "msg_redact_done": "✅ Redacted {} region(s)!",
         "msg_markdown_extracted": "✅ Markdown extraction complete!\n{} page(s)",
+        "msg_library_indexed": "✅ Library index updated!\n{} file(s) indexed · {} unchanged\n{} file(s), {} page(s) in total",
         "msg_pages_copied": "✅ Copied {} page(s)!",
         "msg_background_added": "✅ Background color added!\n{} page(s)",
         "msg_markup_label_underline": "underline",
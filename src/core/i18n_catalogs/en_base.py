@@ -88,6 +88,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'err_password_required': 'Password is required.',
  'err_batch_unsupported_operation': 'Unsupported batch operation: {}',
  'err_batch_option_required': 'Batch operation requires an option: {}',
+ 'err_batch_worker_crashed': 'The worker process crashed while processing this file (the PDF may be damaged)',
  'err_search_term_required': 'Search term is required.',
  'err_uncaught_exception_title': 'Error',
  'err_uncaught_exception_body': 'An unexpected error occurred.\n\n{}\n\nLog file: {}',
@@ -124,7 +125,12 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'progress_cancelling_network_desc': 'Cancel requested. Waiting for the network request to finish…',
  'msg_confirm_remove_blank_pages_count': 'Remove blank pages?\nEstimated removal: {} of {} page(s)',
  'msg_confirm_dedupe_pages_count': 'Remove duplicate pages?\nEstimated removal: {} of {} page(s)',
+ 'lbl_dedupe_threshold': 'Similarity tolerance:',
+ 'tooltip_dedupe_threshold': 'Allowed difference (bits) between page image hashes. 0 keeps only near-identical pages; higher values treat scan noise and small differences as duplicates. Pages with text must also have the same text.',
+ 'msg_dedupe_cluster_line': 'Keep page {} ← duplicate page(s) {}',
  'msg_dry_run_unavailable': '(Could not estimate page counts)',
+ 'msg_compress_estimate_body': 'Original: {:,.0f} KB\n\nEstimated size per profile (from sampled images):\n{}',
+ 'msg_compress_estimate_line': '{}: about {:,.0f} KB ({}%)',
  'err_merge_no_pages': 'No valid pages to merge. (Only encrypted/corrupt files were skipped)',
  'about_desc': 'All-in-one PDF tool for all your needs.\nPowerful features with intuitive UI.',
  'tech_stack': '🛠️ Tech Stack:',
@@ -203,6 +209,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'shortcut_exit': '🔹 Ctrl + Q  :  Exit',
  'shortcut_theme': '🔹 Ctrl + T  :  Toggle Theme',
  'shortcut_preview_search': '🔹 Ctrl + F  :  Preview Search',
+ 'shortcut_library_search': '🔹 Ctrl + Shift + F  :  Library search',
  'shortcut_tabs': '🔹 Ctrl + 1~8 :  Switch Tab',
  'shortcut_help': '🔹 F1  :  Help',
  'msg_worker_busy': 'Previous task is still running.\nWait for it to complete?',
@@ -303,6 +310,8 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'ph_password': 'Enter password',
  'btn_encrypt': '🔒 Encrypt',
  'btn_compress': '📦 Compress',
+ 'btn_compress_estimate': '📏 Estimate',
+ 'tooltip_compress_estimate': 'Estimate the output size for each profile without compressing (from sampled images).',
  'tooltip_compress_profile': 'Choose how aggressively the saved PDF should be optimized.\n· Fast: structure cleanup only (no image recompress)\n· Compact: downsample images (~150 DPI) + font subsetting\n· Web: stronger image compression (~120 DPI) + linearize',
  'save_profile_fast': 'Fast',
  'save_profile_compact': 'Compact',
@@ -524,6 +533,35 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'pref_notify_dialog': 'Completion alerts: toast + dialog',
  'pref_notify_toast': 'Completion alerts: toast only',
  'pref_clear_pending_on_cancel': 'Clear pending queue when cancelling a task',
+ 'pref_perf_telemetry': 'Record performance telemetry (spans · histograms)',
+ 'pref_text_cache_persist': 'Keep the page text cache on disk (reuse across restarts)',
+ 'menu_library_search': 'Library Search...',
+ 'mode_library_index': 'Update library index',
+ 'library_search_title': 'Library full-text search',
+ 'library_search_placeholder': 'Search every PDF in recent files and indexed folders (Enter)',
+ 'library_search_button': 'Search',
+ 'library_col_file': 'File',
+ 'library_col_page': 'Page',
+ 'library_col_score': 'Score',
+ 'library_col_folder': 'Folder',
+ 'library_folders_label': 'Indexed folders (recent files are always included)',
+ 'library_add_folder': 'Add folder',
+ 'library_remove_folder': 'Remove folder',
+ 'library_update_index': 'Update index',
+ 'library_summary': 'Index: {} file(s) · {} page(s)',
+ 'library_hits': '{} matching page(s)',
+ 'menu_perf_telemetry': '⏱️ Performance telemetry',
+ 'perf_telemetry_title': 'Performance Telemetry',
+ 'perf_telemetry_disabled': 'Telemetry is off. Enable it under Preferences, then run a task.',
+ 'perf_telemetry_histograms': 'Hot loop histograms (count · mean · p50 · p95 · max ms)',
+ 'perf_telemetry_spans': 'Recent spans (newest first, nesting shown by indent)',
+ 'perf_telemetry_empty': '(no samples yet)',
+ 'perf_telemetry_dropped': '{} older span(s) dropped from the ring buffer',
+ 'perf_telemetry_refresh': 'Refresh',
+ 'perf_telemetry_clear': 'Clear',
+ 'perf_telemetry_export_json': 'Export JSON',
+ 'perf_telemetry_export_trace': 'Export Chrome trace',
+ 'perf_telemetry_exported': 'Exported: {}',
  'compare_report_title': 'PDF Compare Report',
  'compare_report_close': 'Close',
  'compare_report_open_visual': 'Open visual diff',
@@ -656,6 +694,34 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'msg_confirm_remove_annotations': 'Do you want to remove all annotations?\nThis cannot be undone.',
  'msg_confirm_redact': "Text '{}' will be permanently removed.\nThis cannot be undone.\n\nContinue?",
  'msg_worker_queued': 'Queued. It will run after the current task finishes.',
+ 'msg_job_started_background': '{} started in the background (no file conflicts).',
+ 'msg_job_waiting_conflict': 'Queued. It will start when the task using the same file finishes.',
+ 'msg_job_moved_background': '{} — continuing in the background',
+ 'msg_job_completed': '{} finished',
+ 'msg_job_failed': '{} failed:\n{}',
+ 'msg_job_cancelled': '{} cancelled',
+ 'btn_jobs_count': 'Jobs {} · queued {}',
+ 'progress_run_in_background': 'Run in background',
+ 'jobs_panel_title': 'Jobs',
+ 'jobs_col_task': 'Task',
+ 'jobs_col_target': 'Target',
+ 'jobs_col_state': 'Status',
+ 'jobs_col_progress': 'Progress',
+ 'jobs_col_priority': 'Priority',
+ 'job_state_foreground': 'Running (foreground)',
+ 'job_state_running': 'Running',
+ 'job_state_cancelling': 'Cancelling',
+ 'job_state_done': 'Done',
+ 'job_state_failed': 'Failed',
+ 'job_state_cancelled': 'Cancelled',
+ 'job_state_pending': 'Queued',
+ 'job_priority_high': 'High',
+ 'job_priority_normal': 'Normal',
+ 'job_priority_low': 'Low',
+ 'btn_job_priority_up': 'Raise priority',
+ 'btn_job_priority_down': 'Lower priority',
+ 'btn_job_cancel': 'Cancel',
+ 'btn_jobs_clear_finished': 'Clear finished',
  'processing_plain': 'Processing',
  'ph_chat_history': 'Chat history will be shown here.',
  'chat_user_prefix': '🧑 Question:',
@@ -749,6 +815,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'mode_add_background': 'Add background color',
  'mode_add_attachment': 'Add attachment',
  'mode_list_attachments': 'List attachments',
+ 'mode_estimate_compression': 'Estimate compressed size',
  'mode_extract_attachments': 'Extract attachments',
  'mode_get_form_fields': 'Detect form fields',
  'mode_fill_form': 'Fill and save form',
@@ -789,6 +856,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'err_compare_pdf1_encrypted': 'The first PDF is encrypted and cannot be compared: {}',
  'err_compare_pdf2_encrypted': 'The second PDF is encrypted and cannot be compared: {}',
  'msg_convert_to_img_done': '✅ PDF to image conversion complete!\nSaved {} file(s) as {}.',
+ 'msg_convert_pages_failed': '\n⚠️ Skipped {} page(s) that crashed the worker process: {}',
  'msg_extract_text_done': '✅ Text extraction complete!\nProcessed {} file(s){}',
  'msg_extract_text_detail_suffix': '\nIncluded detailed font/color metadata',
  'msg_compare_pdfs_done': '✅ PDF comparison complete!\nFound differences on {} page(s).{}',
@@ -823,6 +891,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'mode_remove_blank_pages': 'Remove blank pages',
  'btn_remove_blank_pages': '🗑️ Remove blank pages',
  'mode_dedupe_pages': 'Remove duplicate pages',
+ 'mode_find_duplicate_pages': 'Find duplicate pages',
  'btn_dedupe_pages': '🧹 Remove duplicate pages',
  'mode_sanitize_pdf': 'Sanitize PDF',
  'btn_sanitize_pdf': '🧼 Scrub metadata/sensitive extras',
@@ -866,6 +935,8 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'msg_remove_blank_none': '✅ No blank pages. Saved a copy of the original.',
  'msg_dedupe_pages_done': '✅ Removed {} duplicate page(s), kept {}',
  'msg_dedupe_pages_none': '✅ No duplicate pages. Saved a copy of the original.',
+ 'msg_duplicate_pages_found': '✅ Duplicate page check complete\nEstimated removal: {} of {} page(s)',
+ 'msg_no_duplicate_pages': 'No duplicate pages found.',
  'msg_auto_bookmarks_done': '✅ Auto bookmarks complete!\n{} item(s)',
  'msg_sanitize_done': '✅ PDF sanitize complete!',
  'msg_impose_nup_done': '✅ {}-up layout complete!\n{} sheet(s)',
@@ -882,7 +953,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'err_bookmarks_invalid': 'Invalid bookmark format. Expected a list of [level, title, page].',
  'msg_confirm_redact_area': 'Permanently redact page {} rect ({:.1f}, {:.1f}, {:.1f}, {:.1f}).\nThis cannot be undone.\n\nContinue?',
  'msg_confirm_remove_blank_pages': 'Create a copy with pages detected as blank removed.\nThis uses heuristics and may rarely affect content pages.\n\nContinue?',
- 'msg_confirm_dedupe_pages': 'Create a copy with duplicate pages removed by content signature.\nSimilar pages may occasionally be removed incorrectly.\n\nContinue?',
+ 'msg_confirm_dedupe_pages': 'Create a copy with identical or near-identical pages removed.\nMatching uses image hashes, so similar pages may occasionally be removed incorrectly. Use Show Details to review the duplicate groups.\n\nContinue?',
  'msg_confirm_sanitize_pdf': 'Create a scrubbed copy (metadata, attachments, some active content).\nThis is for pre-sharing cleanup, not forensic-grade sanitization.\n\nContinue?',
  'tip_batch_encrypt_permissions': 'Batch encrypt applies the same password as owner/user and allows only default permissions (print, copy, accessibility). Use the Security tab for fine-grained permissions.',
  'compare_summary_visual_errors': 'Pages with visual compare errors: {}',
@@ -890,6 +961,10 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'compare_report_file1': 'File 1',
  'compare_report_file2': 'File 2',
  'compare_report_page': 'Page {}',
+ 'compare_report_page_pair': 'Page {} ↔ {}',
+ 'compare_report_page_file2': 'File 2 page {}',
+ 'compare_report_deleted_pages': 'Pages only in file 1 (deleted): {}',
+ 'compare_report_inserted_pages': 'Pages only in file 2 (inserted): {}',
  'compare_report_missing_file1': 'This page is missing from file 1.',
  'compare_report_missing_file2': 'This page is missing from file 2.',
  'compare_report_visual_error': 'Visual comparison failed for this page.',
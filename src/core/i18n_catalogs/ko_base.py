@@ -88,6 +88,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'err_password_required': '비밀번호를 입력해주세요.',
  'err_batch_unsupported_operation': '지원하지 않는 배치 작업입니다: {}',
  'err_batch_option_required': '배치 작업에 필요한 옵션이 없습니다: {}',
+ 'err_batch_worker_crashed': '처리 중 작업 프로세스가 비정상 종료되었습니다 (손상된 PDF일 수 있습니다)',
  'err_search_term_required': '검색어를 입력해주세요.',
  'err_uncaught_exception_title': '오류 발생',
  'err_uncaught_exception_body': '예상치 못한 오류가 발생했습니다.\n\n{}\n\n상세 로그: {}',
@@ -124,7 +125,12 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'progress_cancelling_network_desc': '취소 요청됨. 네트워크 응답이 끝날 때까지 잠시 기다려 주세요…',
  'msg_confirm_remove_blank_pages_count': '빈 페이지 제거를 진행할까요?\n예상 제거: {}페이지 / 전체 {}페이지',
  'msg_confirm_dedupe_pages_count': '중복 페이지 제거를 진행할까요?\n예상 제거: {}페이지 / 전체 {}페이지',
+ 'lbl_dedupe_threshold': '유사도 허용:',
+ 'tooltip_dedupe_threshold': '페이지 이미지 해시의 허용 차이(비트). 0이면 거의 같은 페이지만, 클수록 스캔 잡음·미세한 차이를 중복으로 봅니다. 텍스트가 있는 페이지는 텍스트가 같아야 합니다.',
+ 'msg_dedupe_cluster_line': '{}쪽 유지 ← 중복 {}쪽',
  'msg_dry_run_unavailable': '(예상 개수를 계산하지 못했습니다)',
+ 'msg_compress_estimate_body': '원본: {:,.0f} KB\n\n프로필별 예상 크기 (표본 이미지 기준 추정):\n{}',
+ 'msg_compress_estimate_line': '{}: 약 {:,.0f} KB ({}%)',
  'err_merge_no_pages': '병합할 유효한 페이지가 없습니다. (암호·손상 파일만 있거나 모두 건너뛰었습니다)',
  'about_desc': '모든 PDF 작업을 한 곳에서 처리하는 올인원 PDF 도구입니다.\n강력한 기능과 직관적인 UI를 제공합니다.',
  'tech_stack': '🛠️ 기술 스택:',
@@ -132,6 +138,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'shortcut_exit': '🔹 Ctrl + Q  :  프로그램 종료',
  'shortcut_theme': '🔹 Ctrl + T  :  테마 전환',
  'shortcut_preview_search': '🔹 Ctrl + F  :  미리보기 검색',
+ 'shortcut_library_search': '🔹 Ctrl + Shift + F  :  라이브러리 검색',
  'shortcut_tabs': '🔹 Ctrl + 1~8 :  탭 전환',
  'shortcut_help': '🔹 F1  :  도움말 표시',
  'msg_worker_busy': '이전 작업이 아직 진행 중입니다.\n완료될 때까지 기다리시겠습니까?',
@@ -232,6 +239,8 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'ph_password': '비밀번호 입력',
  'btn_encrypt': '🔒 암호화',
  'btn_compress': '📦 압축',
+ 'btn_compress_estimate': '📏 예상 크기',
+ 'tooltip_compress_estimate': '압축하지 않고 프로필별 예상 결과 크기를 계산합니다 (표본 이미지 기준).',
  'tooltip_compress_profile': '저장 최적화 프로필을 선택합니다.\n· 빠름: 구조 정리만 (이미지 재압축 없음)\n· 균형: 이미지 다운샘플(~150DPI) + 폰트 서브셋\n· 웹 배포: 더 강한 이미지 압축(~120DPI) + 선형화',
  'save_profile_fast': '빠름',
  'save_profile_compact': '균형',
@@ -518,6 +527,35 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'pref_notify_dialog': '완료 알림: 토스트 + 대화상자',
  'pref_notify_toast': '완료 알림: 토스트만',
  'pref_clear_pending_on_cancel': '작업 취소 시 대기 큐 비우기',
+ 'pref_perf_telemetry': '성능 텔레메트리 기록 (span · 히스토그램)',
+ 'pref_text_cache_persist': '페이지 텍스트 캐시를 디스크에 보관 (재실행 후에도 재사용)',
+ 'menu_library_search': '라이브러리 검색...',
+ 'mode_library_index': '라이브러리 색인 갱신',
+ 'library_search_title': '라이브러리 전문 검색',
+ 'library_search_placeholder': '최근 파일과 색인 폴더의 모든 PDF에서 검색 (Enter)',
+ 'library_search_button': '검색',
+ 'library_col_file': '파일',
+ 'library_col_page': '페이지',
+ 'library_col_score': '점수',
+ 'library_col_folder': '폴더',
+ 'library_folders_label': '색인 폴더 (최근 파일은 항상 포함)',
+ 'library_add_folder': '폴더 추가',
+ 'library_remove_folder': '폴더 제거',
+ 'library_update_index': '색인 갱신',
+ 'library_summary': '색인: {}개 파일 · {}페이지',
+ 'library_hits': '{}개 페이지 일치',
+ 'menu_perf_telemetry': '⏱️ 성능 텔레메트리',
+ 'perf_telemetry_title': '성능 텔레메트리',
+ 'perf_telemetry_disabled': '텔레메트리가 꺼져 있습니다. 환경설정에서 켠 뒤 작업을 실행하세요.',
+ 'perf_telemetry_histograms': '고빈도 구간 히스토그램 (횟수 · 평균 · p50 · p95 · 최대 ms)',
+ 'perf_telemetry_spans': '최근 span (최신순, 들여쓰기 = 중첩)',
+ 'perf_telemetry_empty': '(아직 기록 없음)',
+ 'perf_telemetry_dropped': '링 버퍼에서 오래된 span {}개가 삭제됨',
+ 'perf_telemetry_refresh': '새로고침',
+ 'perf_telemetry_clear': '지우기',
+ 'perf_telemetry_export_json': 'JSON 내보내기',
+ 'perf_telemetry_export_trace': 'Chrome trace 내보내기',
+ 'perf_telemetry_exported': '내보냄: {}',
  'compare_report_title': 'PDF 비교 리포트',
  'compare_report_close': '닫기',
  'compare_report_open_visual': '시각 diff 열기',
@@ -650,6 +688,34 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'msg_confirm_remove_annotations': '모든 주석을 삭제하시겠습니까?\n이 작업은 되돌릴 수 없습니다.',
  'msg_confirm_redact': "'{}' 텍스트가 영구적으로 삭제됩니다.\n이 작업은 되돌릴 수 없습니다.\n\n계속하시겠습니까?",
  'msg_worker_queued': '이전 작업 완료 후 자동 실행됩니다.',
+ 'msg_job_started_background': '{} — 다른 작업과 겹치지 않아 백그라운드에서 시작했습니다.',
+ 'msg_job_waiting_conflict': '같은 파일을 쓰는 작업이 끝나면 자동 실행됩니다.',
+ 'msg_job_moved_background': '{} — 백그라운드에서 계속 진행 중',
+ 'msg_job_completed': '{} 완료',
+ 'msg_job_failed': '{} 실패:\n{}',
+ 'msg_job_cancelled': '{} 취소됨',
+ 'btn_jobs_count': '작업 {}·대기 {}',
+ 'progress_run_in_background': '백그라운드로 계속',
+ 'jobs_panel_title': '작업 목록',
+ 'jobs_col_task': '작업',
+ 'jobs_col_target': '대상',
+ 'jobs_col_state': '상태',
+ 'jobs_col_progress': '진행률',
+ 'jobs_col_priority': '우선순위',
+ 'job_state_foreground': '실행 중 (전경)',
+ 'job_state_running': '실행 중',
+ 'job_state_cancelling': '취소 중',
+ 'job_state_done': '완료',
+ 'job_state_failed': '실패',
+ 'job_state_cancelled': '취소됨',
+ 'job_state_pending': '대기',
+ 'job_priority_high': '높음',
+ 'job_priority_normal': '보통',
+ 'job_priority_low': '낮음',
+ 'btn_job_priority_up': '우선순위 올리기',
+ 'btn_job_priority_down': '우선순위 내리기',
+ 'btn_job_cancel': '취소',
+ 'btn_jobs_clear_finished': '끝난 작업 지우기',
  'processing_plain': '처리 중',
  'ph_chat_history': '대화 기록이 여기에 표시됩니다.',
  'chat_user_prefix': '🧑 질문:',
@@ -743,6 +809,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'mode_add_background': '배경색 추가',
  'mode_add_attachment': '첨부 파일 추가',
  'mode_list_attachments': '첨부 파일 목록 조회',
+ 'mode_estimate_compression': '압축 예상 크기 계산',
  'mode_extract_attachments': '첨부 파일 추출',
  'mode_get_form_fields': '양식 필드 감지',
  'mode_fill_form': '양식 작성 저장',
@@ -783,6 +850,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'err_compare_pdf1_encrypted': '비교할 첫 번째 PDF가 암호화되어 있습니다: {}',
  'err_compare_pdf2_encrypted': '비교할 두 번째 PDF가 암호화되어 있습니다: {}',
  'msg_convert_to_img_done': '✅ PDF → 이미지 변환 완료!\n{}개 파일을 {} 형식으로 저장했습니다.',
+ 'msg_convert_pages_failed': '\n⚠️ 작업 프로세스가 비정상 종료된 {}개 페이지를 건너뛰었습니다: {}',
  'msg_extract_text_done': '✅ 텍스트 추출 완료!\n{}개 파일을 처리했습니다{}',
  'msg_extract_text_detail_suffix': '\n상세 글꼴/색상 정보 포함',
  'msg_compare_pdfs_done': '✅ PDF 비교 완료!\n차이가 있는 페이지 {}개를 확인했습니다.{}',
@@ -815,6 +883,8 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'ai_meta_file_api_page_focus': 'AI 상태: Gemini File API 사용, 처음 {}페이지 중심',
  'ai_meta_text_fallback': 'AI 상태: 로컬 텍스트 fallback 사용 ({} / {}페이지)',
  'ai_meta_text_fallback_truncated': 'AI 상태: 로컬 텍스트 fallback 사용, {} / {}페이지, {}자 제한으로 잘림',
+ 'ai_meta_retrieval': 'AI 상태: 로컬 텍스트 검색 사용, 질문 관련 {}개 구간 ({} / {}페이지)',
+ 'ai_meta_cache_hit': '저장된 응답 재사용 ({})',
  'ai_meta_saved_header': '[AI 처리 메타] {}',
  'title_api_key_plaintext_confirm': '평문 저장 확인',
  'msg_api_key_plaintext_confirm': '보안 저장소에 API 키를 저장할 수 없습니다.\n설정 파일에 평문으로 저장할까요?',
@@ -830,6 +900,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'mode_remove_blank_pages': '빈 페이지 제거',
  'btn_remove_blank_pages': '🗑️ 빈 페이지 제거',
  'mode_dedupe_pages': '중복 페이지 제거',
+ 'mode_find_duplicate_pages': '중복 페이지 찾기',
  'btn_dedupe_pages': '🧹 중복 페이지 제거',
  'mode_sanitize_pdf': '문서 위생',
  'btn_sanitize_pdf': '🧼 민감정보/메타 제거',
@@ -873,6 +944,8 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'msg_remove_blank_none': '✅ 빈 페이지가 없습니다. 원본을 저장했습니다.',
  'msg_dedupe_pages_done': '✅ 중복 페이지 {}장 제거, {}장 유지',
  'msg_dedupe_pages_none': '✅ 중복 페이지가 없습니다. 원본을 저장했습니다.',
+ 'msg_duplicate_pages_found': '✅ 중복 페이지 검사 완료\n예상 제거: {}페이지 / 전체 {}페이지',
+ 'msg_no_duplicate_pages': '중복 페이지가 없습니다.',
  'msg_auto_bookmarks_done': '✅ 자동 목차 생성 완료!\n{}개 항목',
  'msg_sanitize_done': '✅ 문서 위생 처리 완료!',
  'msg_impose_nup_done': '✅ {}-up 배치 완료!\n{}장 생성',
@@ -889,7 +962,7 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'err_bookmarks_invalid': '북마크 형식이 올바르지 않습니다. [레벨, 제목, 페이지] 목록이 필요합니다.',
  'msg_confirm_redact_area': '페이지 {} 영역 ({:.1f}, {:.1f}, {:.1f}, {:.1f})을 영구 삭제합니다.\n이 작업은 되돌릴 수 없습니다.\n\n계속하시겠습니까?',
  'msg_confirm_remove_blank_pages': '빈 페이지로 판정된 페이지를 제거한 사본을 만듭니다.\n휴리스틱 기반이라 드물게 콘텐츠 페이지가 포함될 수 있습니다.\n\n계속하시겠습니까?',
- 'msg_confirm_dedupe_pages': '내용이 동일한 중복 페이지를 제거한 사본을 만듭니다.\n시그니처 기반이라 유사 페이지가 잘못 제거될 수 있습니다.\n\n계속하시겠습니까?',
+ 'msg_confirm_dedupe_pages': '내용이 같거나 거의 같은 중복 페이지를 제거한 사본을 만듭니다.\n이미지 해시 기반이라 유사 페이지가 잘못 제거될 수 있습니다. 상세 보기에서 중복 묶음을 확인하세요.\n\n계속하시겠습니까?',
  'msg_confirm_sanitize_pdf': '메타데이터·첨부·일부 활성 콘텐츠를 제거(스크럽)한 사본을 만듭니다.\n원본 공유 전 정리 용도이며 포렌식급 완전 삭제는 아닙니다.\n\n계속하시겠습니까?',
  'tip_batch_encrypt_permissions': '배치 암호화는 입력한 비밀번호를 owner/user에 동일 적용하며, 기본 권한(인쇄·복사·접근성)만 허용합니다. 세부 권한은 보안 탭의 단일 암호화를 사용하세요.',
  'compare_summary_visual_errors': '시각 비교 실패 페이지: {}개',
@@ -897,6 +970,10 @@ TRANSLATIONS = {'app_title': 'PDF Master',
  'compare_report_file1': '파일1',
  'compare_report_file2': '파일2',
  'compare_report_page': '페이지 {}',
+ 'compare_report_page_pair': '페이지 {} ↔ {}',
+ 'compare_report_page_file2': '파일2 페이지 {}',
+ 'compare_report_deleted_pages': '파일1에만 있는 페이지 (삭제됨): {}',
+ 'compare_report_inserted_pages': '파일2에만 있는 페이지 (삽입됨): {}',
  'compare_report_missing_file1': '파일1에 해당 페이지가 없습니다.',
  'compare_report_missing_file2': '파일2에 해당 페이지가 없습니다.',
  'compare_report_visual_error': '시각 비교 중 오류가 발생했습니다.',
@@ -0,0 +1,197 @@
+"""이미지 재인코딩 작업 (optimize_pdf_images 직렬·프로세스 풀 공용).
+
+자식 프로세스에서 실행되므로 PyQt·worker_ops 패키지를 import 하지 않는다.
+메인 스레드는 xref 스트림(또는 디코딩된 픽셀)만 읽어 보내고, 디코딩·다운샘플·JPEG 인코딩은
+자식이 한다. replace_image 는 문서 핸들을 가진 메인 스레드에서만 적용한다.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+from .optional_deps import fitz
+
+logger = logging.getLogger(__name__)
+
+# 용량 이득이 이 비율 미만이면 원본 유지 (품질 손실 방지)
+_MIN_GAIN_RATIO = 0.98
+_POLL_SECONDS = 0.1
+
+JOB_KIND_JPEG = "jpeg"
+JOB_KIND_SAMPLES = "samples"
+
+
+@dataclass(frozen=True, slots=True)
+class ReencodeOptions:
+    max_dpi: float = 150.0
+    jpeg_quality: int = 75
+    grayscale: bool = False
+    min_edge_px: int = 32
+
+
+@dataclass(frozen=True, slots=True)
+class ImageReencodeJob:
+    """자식에 넘기는 이미지 하나. kind=jpeg 이면 data 는 원본 DCT 스트림, samples 이면 픽셀."""
+
+    xref: int
+    kind: str
+    data: bytes
+    display_w: float
+    display_h: float
+    options: ReencodeOptions
+    width: int = 0
+    height: int = 0
+    components: int = 0
+    alpha: bool = False
+    original_len: int = 0
+
+
+def pixmap_for_reencode(pix: Any, *, grayscale: bool) -> Any:
+    """알파/CMYK를 정리하고 필요 시 그레이스케일로 변환한다."""
+    current = pix
+    # CMYK 등 4채널 이상 → RGB
+    if current.n - current.alpha >= 4:
+        current = fitz.Pixmap(fitz.csRGB, current)
+    if current.alpha:
+        current = fitz.Pixmap(current, 0)  # 알파 제거 (JPEG 불가)
+    if grayscale and current.n != 1:
+        current = fitz.Pixmap(fitz.csGRAY, current)
+    return current
+
+
+def target_scale(pix_w: int, pix_h: int, disp_w_pt: float, disp_h_pt: float, max_dpi: float) -> float:
+    """표시 크기 대비 현재 DPI가 max_dpi를 넘으면 축소 비율을 반환한다."""
+    if pix_w <= 0 or pix_h <= 0 or max_dpi <= 0:
+        return 1.0
+    dpi_x = pix_w / max(disp_w_pt / 72.0, 1e-6)
+    dpi_y = pix_h / max(disp_h_pt / 72.0, 1e-6)
+    dpi = max(dpi_x, dpi_y)
+    if dpi <= max_dpi:
+        return 1.0
+    return max(max_dpi / dpi, 0.05)
+
+
+def reencode_pixmap(
+    pix: Any,
+    *,
+    display_w: float,
+    display_h: float,
+    original_len: int,
+    options: ReencodeOptions,
+) -> bytes | None:
+    """다운샘플·JPEG 인코딩한 바이트. 너무 작거나 이득이 없으면 None (원본 유지)."""
+    if min(pix.width, pix.height) < options.min_edge_px:
+        return None
+    work = pixmap_for_reencode(pix, grayscale=options.grayscale)
+    scale = target_scale(work.width, work.height, display_w, display_h, float(options.max_dpi))
+    if scale < 0.99:
+        new_w = max(1, int(work.width * scale))
+        new_h = max(1, int(work.height * scale))
+        if new_w < work.width or new_h < work.height:
+            work = fitz.Pixmap(work, new_w, new_h, None)
+            work = pixmap_for_reencode(work, grayscale=False)
+
+    quality = max(1, min(95, int(options.jpeg_quality)))
+    jpeg_bytes = work.tobytes("jpeg", jpg_quality=quality)
+    if (
+        original_len
+        and len(jpeg_bytes) >= int(original_len * _MIN_GAIN_RATIO)
+        and scale >= 0.99
+        and not options.grayscale
+    ):
+        return None
+    return jpeg_bytes
+
+
+def _job_pixmap(job: ImageReencodeJob) -> tuple[Any, int]:
+    if job.kind == JOB_KIND_JPEG:
+        pix = fitz.Pixmap(job.data)
+        # 직렬 경로의 xref_stream 길이(디코딩된 샘플)와 같은 기준
+        return pix, len(pix.samples)
+    colorspace = {1: fitz.csGRAY, 3: fitz.csRGB, 4: fitz.csCMYK}[job.components]
+    pix = fitz.Pixmap(colorspace, job.width, job.height, job.data, job.alpha)
+    return pix, job.original_len
+
+
+def run_image_reencode_job(job: ImageReencodeJob) -> tuple[int, bytes | None]:
+    """자식 프로세스: (xref, 교체할 JPEG 바이트 또는 None)."""
+    try:
+        pix, original_len = _job_pixmap(job)
+        return job.xref, reencode_pixmap(
+            pix,
+            display_w=job.display_w,
+            display_h=job.display_h,
+            original_len=original_len,
+            options=job.options,
+        )
+    except Exception as exc:
+        logger.debug("Skip image xref=%s re-encode failed: %s", job.xref, exc)
+        return job.xref, None
+
+
+def iter_pool_reencode(
+    executor: ProcessPoolExecutor,
+    jobs: Iterable[ImageReencodeJob | tuple[int, bytes | None]],
+    *,
+    max_in_flight: int,
+    check_cancelled: Callable[[], None] | None = None,
+) -> Iterator[tuple[int, bytes | None]]:
+    """작업을 제한된 창 크기로 제출하고 입력 순서대로 (xref, 결과) 를 산출한다.
+
+    jobs 는 지연 생성된다 — 창이 빌 때만 다음 xref 스트림을 읽어 메모리를 묶어 둔다.
+    (xref, 결과) 튜플은 메인 스레드에서 이미 처리된 항목으로, 순서를 유지한 채 그대로 흘려보낸다.
+    대기 중에도 check_cancelled 를 폴링한다. 소비자가 중단하면 미시작 작업은 취소한다.
+    """
+    source = iter(jobs)
+    pending: dict[int, Future | tuple[int, bytes | None]] = {}
+    order: list[int] = []
+    window = max(1, int(max_in_flight))
+    exhausted = False
+    head = 0
+    try:
+        while True:
+            while not exhausted and sum(1 for f in pending.values() if isinstance(f, Future)) < window:
+                item = next(source, None)
+                if item is None:
+                    exhausted = True
+                    break
+                if isinstance(item, ImageReencodeJob):
+                    order.append(item.xref)
+                    pending[item.xref] = executor.submit(run_image_reencode_job, item)
+                else:
+                    order.append(item[0])
+                    pending[item[0]] = item
+            # 앞에서부터 끝난 결과만 순서대로 내보낸다 (적용 순서 = 직렬 경로와 동일)
+            while head < len(order):
+                entry = pending[order[head]]
+                if isinstance(entry, Future) and not entry.done():
+                    break
+                del pending[order[head]]
+                head += 1
+                yield entry.result() if isinstance(entry, Future) else entry
+            if exhausted and head >= len(order):
+                return
+            if check_cancelled is not None:
+                check_cancelled()
+            running = [f for f in pending.values() if isinstance(f, Future) and not f.done()]
+            if running:
+                wait(running, timeout=_POLL_SECONDS, return_when=FIRST_COMPLETED)
+    finally:
+        for entry in pending.values():
+            if isinstance(entry, Future):
+                entry.cancel()
+
+
+__all__ = [
+    "ImageReencodeJob",
+    "JOB_KIND_JPEG",
+    "JOB_KIND_SAMPLES",
+    "ReencodeOptions",
+    "iter_pool_reencode",
+    "pixmap_for_reencode",
+    "reencode_pixmap",
+    "run_image_reencode_job",
+    "target_scale",
+]
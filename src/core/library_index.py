@@ -0,0 +1,386 @@
+"""최근 파일·라이브러리 폴더 전체에 대한 디스크 역색인 (페이지 단위 전문 검색).
+
+단일 SQLite 파일에 (용어 → 파일·페이지·빈도) 포스팅을 정수 키로 보관한다.
+한글·한자·가나는 공백이 없어도 찾을 수 있도록 2-gram, 그 밖의 문자는 단어 단위로 색인한다.
+갱신은 (경로, mtime_ns, 크기) 가 바뀐 파일만 다시 읽고, 질의는 PDF 를 열지 않고 BM25 로 순위를 매긴다.
+암호 PDF 는 평문이 디스크에 남지 않도록 색인하지 않는다.
+"""
+from __future__ import annotations
+
+import heapq
+import logging
+import os
+import sqlite3
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from .optional_deps import fitz
+from .path_utils import app_data_dir, normalize_path_key
+from .sqlite_store import SQLiteStore
+from .text_layer_cache import cached_page_text
+from .text_search import bm25_idf, bm25_term_score, tokenize
+
+logger = logging.getLogger(__name__)
+
+LIBRARY_INDEX_FILENAME = "library_index.sqlite3"
+_SCHEMA_VERSION = 1
+# 폴더 순회 시 한 번에 색인할 최대 파일 수 (실수로 홈 전체를 고른 경우 보호)
+MAX_LIBRARY_FILES = 5000
+DEFAULT_SEARCH_LIMIT = 50
+
+STATUS_OK = "ok"
+STATUS_ENCRYPTED = "encrypted"
+STATUS_ERROR = "error"
+
+
+@dataclass(frozen=True, slots=True)
+class LibraryHit:
+    path: str
+    page: int  # 1-based
+    score: float
+
+
+@dataclass(slots=True)
+class LibraryUpdateStats:
+    indexed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    skipped_encrypted: int = 0
+    failed: int = 0
+    pages: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "indexed": self.indexed,
+            "unchanged": self.unchanged,
+            "removed": self.removed,
+            "skipped_encrypted": self.skipped_encrypted,
+            "failed": self.failed,
+            "pages": self.pages,
+        }
+
+
+def default_index_path() -> str:
+    return app_data_dir("cache", LIBRARY_INDEX_FILENAME)
+
+
+def collect_library_paths(
+    files: Iterable[object] = (),
+    folders: Iterable[object] = (),
+    *,
+    limit: int = MAX_LIBRARY_FILES,
+) -> list[str]:
+    """최근 파일 + 폴더(하위 포함) 안의 PDF 경로 키 목록 (중복 제거, 상한 적용)."""
+    seen: set[str] = set()
+    paths: list[str] = []
+
+    def _add(candidate: object) -> bool:
+        path_key = normalize_path_key(candidate)
+        if not path_key or path_key in seen or not path_key.lower().endswith(".pdf"):
+            return len(paths) < limit
+        if not os.path.isfile(path_key):
+            return len(paths) < limit
+        seen.add(path_key)
+        paths.append(path_key)
+        return len(paths) < limit
+
+    for item in files:
+        if not _add(item):
+            return paths
+    for folder in folders:
+        folder_key = normalize_path_key(folder)
+        if not folder_key or not os.path.isdir(folder_key):
+            continue
+        for root, dirnames, filenames in os.walk(folder_key):
+            # 숨김 폴더(.git 등)는 건너뛴다
+            dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+            for name in sorted(filenames):
+                if name.lower().endswith(".pdf") and not _add(os.path.join(root, name)):
+                    return paths
+    return paths
+
+
+class LibraryIndex(SQLiteStore):
+    """라이브러리 역색인 저장소. 갱신(워커 스레드)과 질의(UI 스레드)는 각자 인스턴스를 연다 (WAL)."""
+
+    # 색인은 언제든 다시 만들 수 있으므로 손상·스키마 불일치 시 버린다
+    store_name = "Library index"
+    schema_version = _SCHEMA_VERSION
+    tables = ("postings", "pages", "terms", "files")
+    schema = (
+        "CREATE TABLE IF NOT EXISTS files ("
+        " id INTEGER PRIMARY KEY, path_key TEXT NOT NULL UNIQUE, mtime_ns INTEGER NOT NULL,"
+        " size INTEGER NOT NULL, page_count INTEGER NOT NULL, status TEXT NOT NULL,"
+        " indexed_at REAL NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, term TEXT NOT NULL UNIQUE)",
+        "CREATE TABLE IF NOT EXISTS pages ("
+        " file_id INTEGER NOT NULL, page INTEGER NOT NULL, length INTEGER NOT NULL,"
+        " PRIMARY KEY (file_id, page)) WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS postings ("
+        " term_id INTEGER NOT NULL, file_id INTEGER NOT NULL, page INTEGER NOT NULL, tf INTEGER NOT NULL,"
+        " PRIMARY KEY (term_id, file_id, page)) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS postings_file ON postings(file_id)",
+    )
+    connect_timeout = 10.0
+
+    def __init__(self, db_path: str | None = None):
+        super().__init__(db_path or default_index_path())
+        self._open()
+
+    def update(
+        self,
+        paths: Iterable[str],
+        *,
+        prune: bool = True,
+        check_cancelled: Callable[[], None] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> LibraryUpdateStats:
+        """바뀐 파일만 다시 색인한다. prune 이면 목록에 없거나 사라진 파일을 지운다.
+
+        취소 시 진행 중이던 파일만 롤백되고, 이미 끝난 파일의 색인은 유지된다.
+        """
+        stats = LibraryUpdateStats()
+        wanted = [key for key in (normalize_path_key(path) for path in paths) if key]
+        wanted = list(dict.fromkeys(wanted))
+        with self._lock:
+            conn = self._require_conn()
+            known = {
+                row[0]: (int(row[1]), int(row[2]), int(row[3]))
+                for row in conn.execute("SELECT path_key, id, mtime_ns, size FROM files")
+            }
+        if prune:
+            wanted_set = set(wanted)
+            doomed = [path_key for path_key in known if path_key not in wanted_set or not os.path.exists(path_key)]
+            for path_key in doomed:
+                self._remove_file(known[path_key][0])
+            stats.removed = len(doomed)
+
+        total = len(wanted)
+        for done, path_key in enumerate(wanted, start=1):
+            if check_cancelled is not None:
+                check_cancelled()
+            try:
+                st = os.stat(path_key)
+            except OSError:
+                stats.failed += 1
+                continue
+            previous = known.get(path_key)
+            if previous is not None and previous[1] == st.st_mtime_ns and previous[2] == st.st_size:
+                stats.unchanged += 1
+            else:
+                status, page_count = self._index_file(path_key, st, check_cancelled)
+                if status == STATUS_OK:
+                    stats.indexed += 1
+                    stats.pages += page_count
+                elif status == STATUS_ENCRYPTED:
+                    stats.skipped_encrypted += 1
+                else:
+                    stats.failed += 1
+            if on_progress is not None:
+                on_progress(done, total)
+        if stats.removed or stats.indexed:
+            self._drop_orphan_terms()
+        return stats
+
+    def _index_file(
+        self,
+        path_key: str,
+        st: os.stat_result,
+        check_cancelled: Callable[[], None] | None,
+    ) -> tuple[str, int]:
+        page_terms: list[tuple[int, int, Counter[str]]] = []
+        status = STATUS_OK
+        try:
+            doc = fitz.open(path_key)
+        except Exception as exc:
+            logger.info("Library index skipped unreadable PDF %s: %s", path_key, exc)
+            doc = None
+            status = STATUS_ERROR
+        if doc is not None:
+            try:
+                if getattr(doc, "needs_pass", False):
+                    status = STATUS_ENCRYPTED
+                else:
+                    for page_index in range(len(doc)):
+                        if check_cancelled is not None:
+                            check_cancelled()
+                        try:
+                            # key=None: 라이브러리 일괄 색인이 작업용 텍스트 캐시를 밀어내지 않게 한다
+                            tokens = tokenize(cached_page_text(doc, page_index, None))
+                        except Exception as exc:
+                            logger.info("Library index failed for %s page %s: %s", path_key, page_index, exc)
+                            status = STATUS_ERROR
+                            page_terms = []
+                            break
+                        page_terms.append((page_index, len(tokens), Counter(tokens)))
+            finally:
+                doc.close()
+
+        with self._lock:
+            conn = self._require_conn()
+            conn.execute("BEGIN")
+            try:
+                row = conn.execute("SELECT id FROM files WHERE path_key=?", (path_key,)).fetchone()
+                if row is not None:
+                    file_id = int(row[0])
+                    conn.execute("DELETE FROM postings WHERE file_id=?", (file_id,))
+                    conn.execute("DELETE FROM pages WHERE file_id=?", (file_id,))
+                    conn.execute(
+                        "UPDATE files SET mtime_ns=?, size=?, page_count=?, status=?, indexed_at=? WHERE id=?",
+                        (int(st.st_mtime_ns), int(st.st_size), len(page_terms), status, time.time(), file_id),
+                    )
+                else:
+                    cursor = conn.execute(
+                        "INSERT INTO files (path_key, mtime_ns, size, page_count, status, indexed_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (path_key, int(st.st_mtime_ns), int(st.st_size), len(page_terms), status, time.time()),
+                    )
+                    file_id = int(cursor.lastrowid or 0)
+                term_ids = self._term_ids(conn, {term for _page, _length, counts in page_terms for term in counts})
+                conn.executemany(
+                    "INSERT INTO pages (file_id, page, length) VALUES (?, ?, ?)",
+                    [(file_id, page, length) for page, length, _counts in page_terms],
+                )
+                conn.executemany(
+                    "INSERT INTO postings (term_id, file_id, page, tf) VALUES (?, ?, ?, ?)",
+                    [
+                        (term_ids[term], file_id, page, count)
+                        for page, _length, counts in page_terms
+                        for term, count in counts.items()
+                    ],
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return status, len(page_terms)
+
+    @staticmethod
+    def _term_ids(conn: sqlite3.Connection, terms: set[str]) -> dict[str, int]:
+        if not terms:
+            return {}
+        conn.executemany("INSERT OR IGNORE INTO terms (term) VALUES (?)", [(term,) for term in terms])
+        ids: dict[str, int] = {}
+        ordered = sorted(terms)
+        # SQLite 변수 상한(999) 아래로 나눠 조회
+        for start in range(0, len(ordered), 500):
+            chunk = ordered[start : start + 500]
+            marks = ",".join("?" * len(chunk))
+            for term_id, term in conn.execute(f"SELECT id, term FROM terms WHERE term IN ({marks})", chunk):
+                ids[term] = int(term_id)
+        return ids
+
+    def _remove_file(self, file_id: int) -> None:
+        with self._lock:
+            conn = self._require_conn()
+            conn.execute("BEGIN")
+            try:
+                conn.execute("DELETE FROM postings WHERE file_id=?", (file_id,))
+                conn.execute("DELETE FROM pages WHERE file_id=?", (file_id,))
+                conn.execute("DELETE FROM files WHERE id=?", (file_id,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _drop_orphan_terms(self) -> None:
+        with self._lock:
+            try:
+                self._require_conn().execute(
+                    "DELETE FROM terms WHERE NOT EXISTS (SELECT 1 FROM postings WHERE postings.term_id = terms.id)"
+                )
+            except sqlite3.Error as exc:
+                logger.debug("Library index term cleanup failed: %s", exc)
+
+    def _require_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("library index is closed")
+        return self._conn
+
+    # ---- 질의 ----
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> list[LibraryHit]:
+        """모든 질의 용어를 포함한 페이지를 BM25 점수순으로 반환 (PDF 를 열지 않음)."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        with self._lock:
+            conn = self._require_conn()
+            marks = ",".join("?" * len(terms))
+            term_ids = dict(conn.execute(f"SELECT term, id FROM terms WHERE term IN ({marks})", terms).fetchall())
+            if len(term_ids) < len(terms):
+                return []
+            page_total, length_total = conn.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM pages").fetchone()
+            postings: list[dict[tuple[int, int], int]] = []
+            for term in terms:
+                rows = conn.execute(
+                    "SELECT file_id, page, tf FROM postings WHERE term_id=?", (term_ids[term],)
+                ).fetchall()
+                postings.append({(int(file_id), int(page)): int(tf) for file_id, page, tf in rows})
+            # 희소한 용어부터 교집합
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting.keys()
+                if not candidates:
+                    return []
+            lengths = self._page_lengths(conn, candidates)
+            paths = self._file_paths(conn, {file_id for file_id, _page in candidates})
+
+        page_count = max(1, int(page_total))
+        avg_length = max(1.0, float(length_total) / page_count)
+        idf = [bm25_idf(page_count, len(p)) for p in postings]
+        scored: list[tuple[float, str, int]] = []
+        for file_id, page in candidates:
+            length = lengths.get((file_id, page), avg_length)
+            score = sum(
+                bm25_term_score(weight, posting[(file_id, page)], length, avg_length)
+                for weight, posting in zip(idf, postings)
+            )
+            scored.append((score, paths.get(file_id, ""), page))
+        scored.sort(key=lambda item: (item[1], item[2]))
+        best = heapq.nlargest(max(1, int(limit)), scored, key=lambda item: item[0])
+        return [LibraryHit(path=path, page=page + 1, score=round(score, 4)) for score, path, page in best if path]
+
+    @staticmethod
+    def _page_lengths(conn: sqlite3.Connection, keys: set[tuple[int, int]]) -> dict[tuple[int, int], int]:
+        lengths: dict[tuple[int, int], int] = {}
+        for file_id in {file_id for file_id, _page in keys}:
+            for page, length in conn.execute("SELECT page, length FROM pages WHERE file_id=?", (file_id,)):
+                if (file_id, int(page)) in keys:
+                    lengths[(file_id, int(page))] = int(length)
+        return lengths
+
+    @staticmethod
+    def _file_paths(conn: sqlite3.Connection, file_ids: set[int]) -> dict[int, str]:
+        paths: dict[int, str] = {}
+        ordered = sorted(file_ids)
+        for start in range(0, len(ordered), 500):
+            chunk = ordered[start : start + 500]
+            marks = ",".join("?" * len(chunk))
+            for file_id, path_key in conn.execute(f"SELECT id, path_key FROM files WHERE id IN ({marks})", chunk):
+                paths[int(file_id)] = str(path_key)
+        return paths
+
+    def summary(self) -> dict[str, int]:
+        """색인된 파일/페이지/용어 수 (상태 표시용)."""
+        with self._lock:
+            conn = self._require_conn()
+            files = int(conn.execute("SELECT COUNT(*) FROM files WHERE status=?", (STATUS_OK,)).fetchone()[0])
+            pages = int(conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0])
+            terms = int(conn.execute("SELECT COUNT(*) FROM terms").fetchone()[0])
+        return {"files": files, "pages": pages, "terms": terms}
+
+
+__all__ = [
+    "DEFAULT_SEARCH_LIMIT",
+    "LIBRARY_INDEX_FILENAME",
+    "LibraryHit",
+    "LibraryIndex",
+    "LibraryUpdateStats",
+    "MAX_LIBRARY_FILES",
+    "collect_library_paths",
+    "default_index_path",
+    "tokenize",
+]
@@ -0,0 +1,339 @@
+"""선택적·병렬 OCR 파이프라인 (extract_text use_ocr 경로).
+
+1) 페이지를 먼저 분류한다 — 네이티브 텍스트 면적 대비 이미지 면적. 텍스트 레이어가 충분한
+   페이지는 OCR 없이 네이티브 텍스트를 쓰고, 스캔 페이지만 Tesseract 로 보낸다.
+2) OCR 대상 페이지는 프로세스 풀(spawn)로 나눠 처리한다. 자식 프로세스는 PyQt 를 import 하지 않는다.
+3) 결과는 (렌더 페이지 해시, 언어, DPI) 키로 SQLite(앱 데이터 디렉터리)에 보관한다 —
+   같은 스캔본을 다시 추출해도 OCR 을 반복하지 않는다. 파일 경로와 무관하므로 복사본도 적중한다.
+   TextPage 객체는 프로세스 간 전달·직렬화가 불가하므로 OCR 평문을 저장한다.
+   암호화 문서는 평문이 디스크에 남지 않도록 캐시하지 않는다.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+import urllib.request
+import zlib
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+from .optional_deps import fitz
+from .path_utils import app_data_dir
+from .perf import perf_sample
+from .render_pool import worker_document
+from .sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+OCR_CACHE_FILENAME = "ocr_pages.sqlite3"
+DEFAULT_DISK_BYTES = 128 * 1024 * 1024
+_SCHEMA_VERSION = 1
+_ZLIB_LEVEL = 6
+# 이보다 글자가 적으면 텍스트 레이어가 없는 것으로 본다 (스캔본의 쪽번호 스탬프 등)
+_MIN_NATIVE_CHARS = 16
+# 이미지가 페이지 대부분을 덮고 텍스트가 거의 없으면 스캔 페이지
+_SCAN_IMAGE_RATIO = 0.5
+_SCAN_TEXT_RATIO = 0.02
+# 풀 대기 중 취소 확인 간격
+_POLL_SECONDS = 0.25
+
+
+@dataclass(frozen=True, slots=True)
+class PageOcrClass:
+    native_chars: int
+    text_ratio: float
+    image_ratio: float
+
+    @property
+    def needs_ocr(self) -> bool:
+        if self.native_chars < _MIN_NATIVE_CHARS:
+            return True
+        return self.image_ratio >= _SCAN_IMAGE_RATIO and self.text_ratio < _SCAN_TEXT_RATIO
+
+
+@dataclass(frozen=True, slots=True)
+class OcrPageResult:
+    page_index: int
+    digest: str
+    text: str
+    cached: bool
+
+
+def _clipped_area(bbox: Any, page_rect: Any) -> float:
+    try:
+        rect = fitz.Rect(bbox) & page_rect
+    except Exception:
+        return 0.0
+    if rect.is_empty:
+        return 0.0
+    return float(rect.width * rect.height)
+
+
+def classify_page(page: Any) -> PageOcrClass:
+    """네이티브 텍스트(단어 bbox 면적·글자 수)와 이미지 면적 비율로 OCR 필요 여부를 판단."""
+    page_rect = page.rect
+    page_area = max(1.0, float(page_rect.width * page_rect.height))
+    native_chars = 0
+    text_area = 0.0
+    with perf_sample("page.get_text"):
+        words = page.get_text("words")
+    for word in words:
+        native_chars += len(str(word[4]).strip())
+        text_area += _clipped_area(word[:4], page_rect)
+    image_area = 0.0
+    try:
+        infos = page.get_image_info()
+    except Exception:
+        logger.debug("get_image_info failed on page %s", getattr(page, "number", "?"), exc_info=True)
+        infos = []
+    for info in infos:
+        image_area += _clipped_area(info.get("bbox"), page_rect)
+    return PageOcrClass(
+        native_chars=native_chars,
+        text_ratio=min(1.0, text_area / page_area),
+        image_ratio=min(1.0, image_area / page_area),
+    )
+
+
+def page_render_digest(page: Any, dpi: int) -> str:
+    """OCR 해상도로 렌더한 회색조 픽스맵의 해시 (캐시 키)."""
+    with perf_sample("page.render"):
+        pix = page.get_pixmap(dpi=int(dpi), colorspace=fitz.csGRAY, alpha=False)
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(f"{pix.width}x{pix.height}:".encode("ascii"))
+    hasher.update(pix.samples)
+    return hasher.hexdigest()
+
+
+def run_page_ocr(page: Any, dpi: int, language: str) -> str:
+    get_tp = getattr(page, "get_textpage_ocr", None)
+    if not callable(get_tp):
+        raise RuntimeError("page.get_textpage_ocr is not available in this PyMuPDF build")
+    tp = get_tp(dpi=int(dpi), language=language, full=True)
+    return page.get_text("text", textpage=tp) or ""
+
+
+def ocr_page(
+    page: Any,
+    page_index: int,
+    dpi: int,
+    language: str,
+    store: OcrResultStore | None,
+) -> OcrPageResult:
+    """캐시를 먼저 보고, 없을 때만 OCR 한다.
+
+    저장·last_used 갱신은 호출 측이 한다 — 쓰기는 메인 프로세스 하나로 모은다 (자식은 읽기 전용 연결).
+    """
+    digest = page_render_digest(page, dpi)
+    if store is not None:
+        text = store.get(digest, language, dpi)
+        if text is not None:
+            return OcrPageResult(page_index, digest, text, True)
+    with perf_sample("page.ocr"):
+        text = run_page_ocr(page, dpi, language)
+    return OcrPageResult(page_index, digest, text, False)
+
+
+def is_cacheable_document(doc: Any) -> bool:
+    # needs_pass 는 인증된 문서의 복호화 상태를 되돌리므로 메타데이터로만 판단한다
+    try:
+        return not bool((doc.metadata or {}).get("encryption"))
+    except Exception:
+        return False
+
+
+def default_cache_path() -> str:
+    return app_data_dir("cache", OCR_CACHE_FILENAME)
+
+
+class OcrResultStore(SQLiteStore):
+    """(digest, language, dpi) → zlib(OCR 평문) SQLite 저장소. 여러 프로세스가 함께 읽는다 (WAL).
+
+    read_only=True 는 풀 자식용 — 기존 DB 를 mode=ro 로 열고 스키마·행을 건드리지 않는다.
+    """
+
+    store_name = "OCR cache"
+    schema_version = _SCHEMA_VERSION
+    tables = ("ocr_pages",)
+    schema = (
+        "CREATE TABLE IF NOT EXISTS ocr_pages ("
+        " digest TEXT NOT NULL, language TEXT NOT NULL, dpi INTEGER NOT NULL,"
+        " data BLOB NOT NULL, nbytes INTEGER NOT NULL, last_used REAL NOT NULL,"
+        " PRIMARY KEY (digest, language, dpi))",
+        "CREATE INDEX IF NOT EXISTS ocr_pages_last_used ON ocr_pages(last_used)",
+    )
+
+    def __init__(self, db_path: str | None = None, *, max_bytes: int = DEFAULT_DISK_BYTES, read_only: bool = False):
+        super().__init__(db_path or default_cache_path())
+        self.max_bytes = max(1, int(max_bytes))
+        self.read_only = bool(read_only)
+        self._total_bytes = 0
+        if self.read_only:
+            # 없는 DB·스키마 불일치는 sqlite3.Error 로 올라간다 (호출 측은 캐시 없이 진행)
+            self._conn = self._connect_read_only()
+            return
+        self._open()
+        self._total_bytes = self._stored_bytes("ocr_pages")
+
+    def _connect_read_only(self) -> sqlite3.Connection:
+        uri = "file:" + urllib.request.pathname2url(os.path.abspath(self.db_path)) + "?mode=ro"
+        conn = sqlite3.connect(
+            uri, uri=True, timeout=self.connect_timeout, check_same_thread=False, isolation_level=None
+        )
+        try:
+            if int(conn.execute("PRAGMA user_version").fetchone()[0]) != self.schema_version:
+                raise sqlite3.DatabaseError("OCR cache schema mismatch")
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def get(self, digest: str, language: str, dpi: int) -> str | None:
+        key = (digest, language, int(dpi))
+        with self._lock:
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT data FROM ocr_pages WHERE digest=? AND language=? AND dpi=?", key
+                ).fetchone()
+            except sqlite3.Error as exc:
+                logger.debug("OCR cache read failed: %s", exc)
+                return None
+        if row is None:
+            return None
+        try:
+            return zlib.decompress(row[0]).decode("utf-8")
+        except Exception:
+            logger.debug("Corrupt OCR cache row ignored", exc_info=True)
+            return None
+
+    def touch(self, digest: str, language: str, dpi: int) -> None:
+        """적중한 행의 last_used 갱신 (LRU 제거 순서). 읽기 전용 저장소에서는 무시."""
+        with self._lock:
+            if self._conn is None or self.read_only:
+                return
+            try:
+                self._conn.execute(
+                    "UPDATE ocr_pages SET last_used=? WHERE digest=? AND language=? AND dpi=?",
+                    (time.time(), digest, language, int(dpi)),
+                )
+            except sqlite3.Error as exc:
+                logger.debug("OCR cache touch failed: %s", exc)
+
+    def put(self, digest: str, language: str, dpi: int, text: str) -> None:
+        data = zlib.compress(text.encode("utf-8"), _ZLIB_LEVEL)
+        key = (digest, language, int(dpi))
+        with self._lock:
+            if self._conn is None or self.read_only:
+                return
+            try:
+                old = self._conn.execute(
+                    "SELECT nbytes FROM ocr_pages WHERE digest=? AND language=? AND dpi=?", key
+                ).fetchone()
+                if old is not None:
+                    self._total_bytes -= int(old[0])
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ocr_pages VALUES (?, ?, ?, ?, ?, ?)",
+                    (*key, data, len(data), time.time()),
+                )
+                self._total_bytes += len(data)
+                if self._total_bytes > self.max_bytes:
+                    self._evict_lru_locked("ocr_pages", ("digest", "language", "dpi"))
+            except sqlite3.Error as exc:
+                logger.debug("OCR cache write failed: %s", exc)
+
+
+# ---- 프로세스 풀 자식 작업 ----
+_worker_store: OcrResultStore | None = None
+
+
+def _worker_result_store(cache_path: str) -> OcrResultStore | None:
+    global _worker_store
+    if not cache_path:
+        return None
+    if _worker_store is None or _worker_store.db_path != cache_path:
+        if _worker_store is not None:
+            _worker_store.close()
+            _worker_store = None
+        try:
+            _worker_store = OcrResultStore(cache_path, read_only=True)
+        except (sqlite3.Error, OSError) as exc:
+            logger.debug("OCR cache unavailable in worker: %s", exc)
+            return None
+    return _worker_store
+
+
+def ocr_document_page(
+    file_path: str,
+    password: str,
+    page_index: int,
+    dpi: int,
+    language: str,
+    cache_path: str,
+) -> OcrPageResult:
+    """자식 프로세스: 문서를 (프로세스당 한 번) 열어 페이지 하나를 캐시 조회 후 OCR."""
+    doc = worker_document(file_path, password)
+    return ocr_page(doc[page_index], page_index, dpi, language, _worker_result_store(cache_path))
+
+
+def iter_pool_ocr(
+    executor: ProcessPoolExecutor,
+    file_path: str,
+    password: str,
+    page_indices: list[int],
+    dpi: int,
+    language: str,
+    cache_path: str,
+    *,
+    max_in_flight: int,
+    check_cancelled: Callable[[], None],
+) -> Iterator[tuple[int, OcrPageResult | Exception]]:
+    """OCR 작업을 제한된 창 크기로 제출하고 완료 순서대로 (page_index, 결과 또는 예외)를 산출한다.
+
+    풀이 깨지면 BrokenProcessPool 을 그대로 올린다 — 호출 측이 남은 페이지를 직렬로 처리한다.
+    """
+    queue = deque(page_indices)
+    in_flight: dict[Future, int] = {}
+    window = max(1, int(max_in_flight))
+    try:
+        while queue or in_flight:
+            while queue and len(in_flight) < window:
+                page_index = queue.popleft()
+                future = executor.submit(
+                    ocr_document_page, file_path, password, page_index, int(dpi), language, cache_path
+                )
+                in_flight[future] = page_index
+            check_cancelled()
+            done, _pending = wait(list(in_flight), timeout=_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            for future in done:
+                page_index = in_flight.pop(future)
+                exc = future.exception()
+                if isinstance(exc, BrokenProcessPool):
+                    raise exc
+                yield page_index, (exc if isinstance(exc, Exception) else future.result())
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+__all__ = [
+    "OCR_CACHE_FILENAME",
+    "OcrPageResult",
+    "OcrResultStore",
+    "PageOcrClass",
+    "classify_page",
+    "default_cache_path",
+    "is_cacheable_document",
+    "iter_pool_ocr",
+    "ocr_document_page",
+    "ocr_page",
+    "page_render_digest",
+    "run_page_ocr",
+]
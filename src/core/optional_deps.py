@@ -88,9 +88,24 @@ KEYRING_AVAILABLE = _keyring_module is not None
 keyring: Any | None = _keyring_module
 
 
+_numpy_module = _import_optional_module("numpy")
+if _numpy_module is not None and not _has_required_attrs(
+    _numpy_module,
+    ("frombuffer", "uint8", "ndarray"),
+):
+    logger.warning("Ignoring 'numpy' module because required array APIs are missing")
+    _numpy_module = None
+
+# 벡터화 가속 경로 전용. 미설치(패키지 빌드 기본) 시 순수 Python 경로로 동작한다.
+NUMPY_AVAILABLE = _numpy_module is not None
+np: Any | None = _numpy_module
+
+
 __all__ = [
     "FITZ_AVAILABLE",
     "KEYRING_AVAILABLE",
+    "NUMPY_AVAILABLE",
     "fitz",
     "keyring",
+    "np",
 ]
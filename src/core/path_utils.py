@@ -5,6 +5,8 @@ import sys
 
 
 CHAT_HISTORY_KEY_PREFIX = "v2:"
+# 캐시·인덱스 저장 위치 재지정 (포터블 실행·테스트 격리용)
+APP_DATA_DIR_ENV = "PDF_MASTER_DATA_DIR"
 
 
 def bundle_root() -> str:
@@ -19,6 +21,21 @@ def resource_path(*parts: str) -> str:
     return os.path.join(bundle_root(), *parts)
 
 
+def app_data_dir(*parts: str) -> str:
+    """디스크 캐시 등 앱 데이터 기준 경로를 반환합니다 (디렉터리 생성은 호출 측 책임)."""
+    override = os.environ.get(APP_DATA_DIR_ENV, "").strip()
+    if override:
+        base = override
+    elif sys.platform == "win32":
+        base = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), "PDFMaster")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~"), "Library", "Application Support", "PDFMaster")
+    else:
+        xdg_data = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+        base = os.path.join(xdg_data, "pdf_master")
+    return os.path.join(base, *parts)
+
+
 def normalize_path_key(path: object) -> str:
     if not isinstance(path, str):
         return ""
@@ -1,7 +1,13 @@
 import json
 import logging
+import math
+import os
+import tempfile
+import threading
 import time
+from collections import deque
 from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -17,6 +23,242 @@ def perf_log(stage: str, elapsed_ms: float, extra: dict[str, Any] | None = None,
     target_logger.info("PERF|stage=%s|ms=%.3f|meta=%s", stage, elapsed_ms, meta)
 
 
+# 링 버퍼에 보관할 최근 span 수 (오래된 것부터 버림)
+_SPAN_RING_CAPACITY = 4096
+# 히스토그램 버킷 상한(ms). 마지막 버킷은 그 이상 전부.
+_HISTOGRAM_BOUNDS_MS = (0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, math.inf)
+_TRACE_CATEGORY = "pdf_master"
+
+
+@dataclass(frozen=True, slots=True)
+class PerfSpan:
+    name: str
+    start_us: float
+    duration_us: float
+    thread_id: int
+    thread_name: str
+    depth: int
+    parent: str
+    extra: dict[str, Any] = field(default_factory=dict)
+    error: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "start_us": round(self.start_us, 1),
+            "duration_ms": round(self.duration_us / 1000.0, 3),
+            "thread": self.thread_name,
+            "depth": self.depth,
+            "parent": self.parent,
+            "extra": self.extra,
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True)
+class PerfHistogram:
+    """고빈도 구간(페이지 렌더/텍스트 추출/저장)의 소요 시간 분포."""
+
+    name: str
+    count: int = 0
+    total_ms: float = 0.0
+    min_ms: float = math.inf
+    max_ms: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(_HISTOGRAM_BOUNDS_MS))
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.min_ms = min(self.min_ms, elapsed_ms)
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        for index, bound in enumerate(_HISTOGRAM_BOUNDS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[index] += 1
+                break
+
+    def percentile(self, fraction: float) -> float:
+        """버킷 상한 기준 근사 백분위 (마지막 버킷은 max)."""
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for bound, hits in zip(_HISTOGRAM_BOUNDS_MS, self.buckets):
+            seen += hits
+            if seen >= threshold:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.min_ms, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.percentile(0.5), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "buckets": [
+                {"le_ms": None if math.isinf(bound) else bound, "count": hits}
+                for bound, hits in zip(_HISTOGRAM_BOUNDS_MS, self.buckets)
+            ],
+        }
+
+
+class PerfTelemetry:
+    """프로세스 전역 텔레메트리 싱크 (중첩 span 링 버퍼 + 히스토그램).
+
+    비활성 상태에서는 PerfTimer/perf_sample 이 플래그 하나만 확인하고 빠진다.
+    """
+
+    def __init__(self, capacity: int = _SPAN_RING_CAPACITY):
+        self._lock = threading.Lock()
+        self._spans: deque[PerfSpan] = deque(maxlen=max(1, int(capacity)))
+        self._histograms: dict[str, PerfHistogram] = {}
+        self._local = threading.local()
+        self._epoch = time.perf_counter()
+        self._dropped = 0
+        self.enabled = False
+
+    def _stack(self) -> list[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def push_span(self, name: str) -> tuple[int, str]:
+        stack = self._stack()
+        parent = stack[-1] if stack else ""
+        stack.append(name)
+        return len(stack) - 1, parent
+
+    def pop_span(
+        self,
+        name: str,
+        start: float,
+        elapsed_ms: float,
+        depth: int,
+        parent: str,
+        extra: dict[str, Any] | None = None,
+        error: str = "",
+    ) -> None:
+        stack = self._stack()
+        # 예외로 중간 span 이 닫히지 않았어도 자기 깊이까지 되돌린다
+        del stack[depth:]
+        thread = threading.current_thread()
+        span = PerfSpan(
+            name=name,
+            start_us=(start - self._epoch) * 1_000_000.0,
+            duration_us=elapsed_ms * 1000.0,
+            thread_id=threading.get_ident(),
+            thread_name=thread.name,
+            depth=depth,
+            parent=parent,
+            extra=dict(extra or {}),
+            error=error,
+        )
+        with self._lock:
+            if len(self._spans) == self._spans.maxlen:
+                self._dropped += 1
+            self._spans.append(span)
+
+    def record_sample(self, name: str, elapsed_ms: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = PerfHistogram(name)
+                self._histograms[name] = histogram
+            histogram.add(float(elapsed_ms))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._histograms.clear()
+            self._dropped = 0
+
+    def spans(self) -> list[PerfSpan]:
+        with self._lock:
+            return list(self._spans)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            spans = list(self._spans)
+            histograms = [histogram.to_dict() for histogram in self._histograms.values()]
+            dropped = self._dropped
+        return {
+            "enabled": self.enabled,
+            "capacity": self._spans.maxlen,
+            "dropped_spans": dropped,
+            "spans": [span.to_dict() for span in spans],
+            "histograms": sorted(histograms, key=lambda item: item["total_ms"], reverse=True),
+        }
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """chrome://tracing / Perfetto 에서 여는 Trace Event 형식."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+        threads: dict[int, str] = {}
+        for span in self.spans():
+            threads.setdefault(span.thread_id, span.thread_name)
+            args = dict(span.extra)
+            if span.error:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": _TRACE_CATEGORY,
+                    "ph": "X",
+                    "ts": round(span.start_us, 1),
+                    "dur": round(span.duration_us, 1),
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+        for tid, thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}})
+        snapshot = self.snapshot()
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"histograms": snapshot["histograms"], "dropped_spans": snapshot["dropped_spans"]},
+        }
+
+    def export_json(self, path: str) -> None:
+        _write_json_atomic(path, self.snapshot())
+
+    def export_chrome_trace(self, path: str) -> None:
+        _write_json_atomic(path, self.chrome_trace())
+
+
+def _write_json_atomic(path: str, payload: dict[str, Any]) -> None:
+    out_dir = os.path.dirname(os.path.abspath(path)) or "."
+    os.makedirs(out_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".pdf_master_", suffix=".tmp.json", dir=out_dir)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+TELEMETRY = PerfTelemetry()
+
+
+def set_telemetry_enabled(enabled: bool) -> None:
+    TELEMETRY.enabled = bool(enabled)
+
+
+def telemetry_enabled() -> bool:
+    return TELEMETRY.enabled
+
+
 class PerfTimer(AbstractContextManager):
     """Simple context manager for timing code blocks."""
 
@@ -25,8 +267,10 @@ class PerfTimer(AbstractContextManager):
         self.logger = logger or logging.getLogger(__name__)
         self.extra = extra or {}
         self._start = 0.0
+        self._span: tuple[int, str] | None = None
 
     def __enter__(self):
+        self._span = TELEMETRY.push_span(self.name) if TELEMETRY.enabled else None
         self._start = time.perf_counter()
         return self
 
@@ -36,4 +280,45 @@ class PerfTimer(AbstractContextManager):
         if exc_type is not None:
             extra["error"] = getattr(exc_type, "__name__", str(exc_type))
         perf_log(self.name, elapsed_ms, extra=extra, logger=self.logger)
+        if self._span is not None:
+            depth, parent = self._span
+            TELEMETRY.pop_span(
+                self.name,
+                self._start,
+                elapsed_ms,
+                depth,
+                parent,
+                extra=self.extra,
+                error=str(extra.get("error", "")),
+            )
+            self._span = None
         return False
+
+
+class _PerfSample(AbstractContextManager):
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        TELEMETRY.record_sample(self.name, (time.perf_counter() - self._start) * 1000.0)
+        return False
+
+
+class _NullSample(AbstractContextManager):
+    __slots__ = ()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SAMPLE = _NullSample()
+
+
+def perf_sample(name: str) -> AbstractContextManager:
+    """고빈도 루프용 히스토그램 타이머. 로그를 남기지 않고, 비활성 시 공유 no-op 을 반환한다."""
+    if not TELEMETRY.enabled:
+        return _NULL_SAMPLE
+    return _PerfSample(name)
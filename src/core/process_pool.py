@@ -0,0 +1,83 @@
+"""CPU 바운드 작업용 프로세스 풀 공용 헬퍼.
+
+- Qt 스레드가 살아 있는 프로세스에서 fork 하지 않도록 항상 spawn 컨텍스트를 사용한다.
+- 자식 프로세스가 import 하는 모듈은 PyQt 에 의존하지 않아야 한다.
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# 풀 하나가 점유할 수 있는 최대 프로세스 수 (메모리 상한 보호)
+MAX_POOL_WORKERS = 8
+
+
+def resolve_pool_workers(task_count: int, requested: object = None) -> int:
+    """작업 수·CPU 수·요청값으로 풀 크기를 결정한다. 1 이하이면 직렬 실행을 의미."""
+    try:
+        task_count = int(task_count)
+    except (TypeError, ValueError):
+        return 1
+    if task_count <= 1:
+        return 1
+
+    cpu_count = os.cpu_count() or 1
+    # UI 스레드 몫으로 코어 하나를 남긴다.
+    limit = max(1, min(MAX_POOL_WORKERS, cpu_count - 1))
+    if requested is not None and not isinstance(requested, bool):
+        try:
+            requested_int = int(requested)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            requested_int = limit
+        limit = max(1, min(limit, requested_int))
+    return max(1, min(limit, task_count))
+
+
+def create_process_pool(
+    max_workers: int,
+    *,
+    initializer: Callable[..., Any] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> ProcessPoolExecutor:
+    """spawn 컨텍스트 기반 ProcessPoolExecutor 를 만든다."""
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(
+        max_workers=max(1, int(max_workers)),
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+def shutdown_process_pool(executor: ProcessPoolExecutor | None, *, terminate: bool = False) -> None:
+    """대기 중 작업을 취소하고 풀을 닫는다.
+
+    terminate=True 이면 실행 중인 자식 프로세스도 강제 종료한다 (취소 응답성 우선).
+    """
+    if executor is None:
+        return
+    if terminate:
+        processes = dict(getattr(executor, "_processes", None) or {})
+        for process in processes.values():
+            try:
+                if process.is_alive():
+                    process.terminate()
+            except Exception:
+                logger.debug("Failed to terminate pool process", exc_info=True)
+    try:
+        executor.shutdown(wait=True, cancel_futures=True)
+    except Exception:
+        logger.debug("Process pool shutdown failed", exc_info=True)
+
+
+__all__ = [
+    "MAX_POOL_WORKERS",
+    "create_process_pool",
+    "resolve_pool_workers",
+    "shutdown_process_pool",
+]
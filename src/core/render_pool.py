@@ -0,0 +1,173 @@
+"""프로세스 풀 페이지 렌더 작업 (convert_to_img 병렬 경로, 썸네일 렌더 서비스).
+
+자식 프로세스에서 실행되므로 PyQt·worker_ops 패키지를 import 하지 않는다.
+각 워커 프로세스는 문서를 한 번만 열어 두고 페이지 단위 작업을 처리한다.
+"""
+from __future__ import annotations
+
+import glob
+import logging
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Iterator
+
+from .optional_deps import fitz
+from .perf import perf_sample
+from .temp_cleanup import ATOMIC_TEMP_PREFIX
+
+logger = logging.getLogger(__name__)
+
+_worker_doc: Any = None
+_worker_doc_key: tuple[str, str] | None = None
+
+
+def _close_worker_document() -> None:
+    global _worker_doc, _worker_doc_key
+    if _worker_doc is not None:
+        try:
+            _worker_doc.close()
+        except Exception:
+            logger.debug("Failed to close render worker document", exc_info=True)
+    _worker_doc = None
+    _worker_doc_key = None
+
+
+def worker_document(file_path: str, password: str) -> Any:
+    """워커 프로세스별 문서 핸들 (같은 파일이면 재사용)."""
+    global _worker_doc, _worker_doc_key
+    key = (file_path, password)
+    if _worker_doc is not None and _worker_doc_key == key:
+        return _worker_doc
+
+    _close_worker_document()
+    doc = fitz.open(file_path)
+    if getattr(doc, "is_encrypted", False):
+        if not password or not doc.authenticate(password):
+            doc.close()
+            raise ValueError("PDF authentication failed in render worker")
+    _worker_doc = doc
+    _worker_doc_key = key
+    return doc
+
+
+def render_page_to_staged_file(
+    file_path: str,
+    password: str,
+    page_index: int,
+    zoom: float,
+    output_dir: str,
+    ext: str,
+) -> tuple[int, str]:
+    """페이지 하나를 출력 디렉터리의 임시 파일로 렌더하고 (page_index, 임시 경로)를 반환."""
+    doc = worker_document(file_path, password)
+    pix = doc[page_index].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+    fd, staged_path = tempfile.mkstemp(prefix=ATOMIC_TEMP_PREFIX, suffix=f".tmp{ext}", dir=output_dir)
+    os.close(fd)
+    try:
+        pix.save(staged_path)
+    except Exception:
+        discard_staged_file(staged_path)
+        raise
+    return page_index, staged_path
+
+
+def render_thumbnail_pixmap(page: Any, thumb_w: int, thumb_h: int) -> Any:
+    """썸네일 상자(thumb_w x thumb_h)에 맞춘 배율로 페이지를 렌더."""
+    scale = min(thumb_w / max(page.rect.width, 1), thumb_h / max(page.rect.height, 1))
+    scale = max(0.05, scale)
+    with perf_sample("page.render"):
+        return page.get_pixmap(matrix=fitz.Matrix(scale, scale))
+
+
+def render_page_thumbnail(
+    file_path: str,
+    password: str,
+    page_index: int,
+    thumb_w: int,
+    thumb_h: int,
+) -> tuple[int, int, int, int, bool, bytes]:
+    """썸네일 하나를 렌더해 (page_index, width, height, stride, alpha, samples) 로 반환."""
+    doc = worker_document(file_path, password)
+    pix = render_thumbnail_pixmap(doc[page_index], thumb_w, thumb_h)
+    return page_index, pix.width, pix.height, pix.stride, bool(pix.alpha), bytes(pix.samples)
+
+
+def discard_staged_file(path: str) -> None:
+    if path and os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError:
+            logger.debug("Failed to remove staged render file: %s", path, exc_info=True)
+
+
+def staged_render_files(output_dir: str, ext: str) -> set[str]:
+    """출력 디렉터리의 렌더 임시 파일 — 깨진 풀이 결과를 잃은 파일을 찾을 때 전후로 비교한다."""
+    return set(glob.glob(os.path.join(glob.escape(output_dir), f"{ATOMIC_TEMP_PREFIX}*.tmp{ext}")))
+
+
+def _discard_future_result(future: Future) -> None:
+    if future.cancelled() or future.exception() is not None:
+        return
+    _page_index, staged_path = future.result()
+    discard_staged_file(staged_path)
+
+
+def iter_staged_page_renders(
+    executor: ProcessPoolExecutor,
+    file_path: str,
+    password: str,
+    page_indices: list[int],
+    zoom: float,
+    output_dir: str,
+    ext: str,
+    *,
+    max_in_flight: int,
+) -> Iterator[tuple[int, str]]:
+    """페이지 렌더 작업을 제한된 창 크기로 제출하고 완료 순서대로 산출한다.
+
+    소비자가 중간에 중단(취소 예외 등)하면 미시작 작업은 취소하고,
+    이미 실행 중인 작업의 임시 파일은 완료 시점에 삭제한다.
+    """
+    queue = deque(page_indices)
+    in_flight: set[Future] = set()
+    ready: deque[Future] = deque()
+    window = max(1, int(max_in_flight))
+    try:
+        while queue or in_flight or ready:
+            if ready:
+                yield ready.popleft().result()
+                continue
+            while queue and len(in_flight) < window:
+                page_index = queue.popleft()
+                in_flight.add(
+                    executor.submit(
+                        render_page_to_staged_file,
+                        file_path,
+                        password,
+                        page_index,
+                        zoom,
+                        output_dir,
+                        ext,
+                    )
+                )
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            ready.extend(done)
+    finally:
+        for future in ready:
+            _discard_future_result(future)
+        for future in in_flight:
+            if not future.cancel():
+                future.add_done_callback(_discard_future_result)
+
+
+__all__ = [
+    "discard_staged_file",
+    "iter_staged_page_renders",
+    "render_page_thumbnail",
+    "render_page_to_staged_file",
+    "render_thumbnail_pixmap",
+    "staged_render_files",
+    "worker_document",
+]
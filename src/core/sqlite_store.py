@@ -0,0 +1,122 @@
+"""앱 데이터 디렉터리의 SQLite(WAL) 캐시·색인 저장소 공용 골격.
+
+썸네일·텍스트 레이어·OCR·AI 응답 캐시와 라이브러리 색인이 같은 규칙으로 연다.
+- WAL + synchronous=NORMAL, 자동 커밋(isolation_level=None), 여러 스레드에서 잠금과 함께 사용.
+- user_version 이 다르면 테이블을 버리고 다시 만든다 (내용은 언제든 다시 만들 수 있다).
+- 손상된 파일(DatabaseError)은 -wal/-shm 과 함께 지우고 새로 연다.
+- 크기 상한 저장소는 `last_used` 오래된 순(LRU)으로 상한의 90% 까지 지운다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Sequence
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+# 상한 초과 시 이 비율까지 축출 (매 put 마다 축출하지 않도록 여유를 둔다)
+EVICT_TARGET_RATIO = 0.9
+
+_StoreT = TypeVar("_StoreT", bound="SQLiteStore")
+
+
+class SQLiteStore:
+    """하위 클래스는 스키마(클래스 속성)만 정의하고 `_open()` 으로 연결한다.
+
+    `_conn` 접근은 `_lock` 안에서 한다. 크기 상한 저장소는 `max_bytes`·`_total_bytes` 를 둔다.
+    """
+
+    # 로그용 이름 (예: "OCR cache")
+    store_name = "SQLite store"
+    schema_version = 1
+    # 스키마 버전이 바뀌면 지울 테이블 (의존 순서대로)
+    tables: tuple[str, ...] = ()
+    # CREATE TABLE / CREATE INDEX ... IF NOT EXISTS 문
+    schema: tuple[str, ...] = ()
+    connect_timeout = 5.0
+
+    max_bytes: int
+    _total_bytes: int
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _open(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        try:
+            self._conn = self._connect()
+        except sqlite3.DatabaseError as exc:
+            # 손상된 파일은 버리고 새로 만든다
+            logger.warning("%s reset (%s): %s", self.store_name, self.db_path, exc)
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(self.db_path + suffix)
+                except OSError:
+                    pass
+            self._conn = self._connect()
+        return self._conn
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path, timeout=self.connect_timeout, check_same_thread=False, isolation_level=None
+        )
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if int(conn.execute("PRAGMA user_version").fetchone()[0]) != self.schema_version:
+                for table in self.tables:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+            for statement in self.schema:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version={int(self.schema_version)}")
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
+
+    def __enter__(self: _StoreT) -> _StoreT:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _stored_bytes(self, table: str) -> int:
+        assert self._conn is not None
+        row = self._conn.execute(f"SELECT COALESCE(SUM(nbytes), 0) FROM {table}").fetchone()
+        return int(row[0] or 0)
+
+    def _evict_lru_locked(self, table: str, key_columns: Sequence[str]) -> None:
+        """`last_used` 오래된 행부터 `max_bytes * EVICT_TARGET_RATIO` 이하가 될 때까지 지운다."""
+        assert self._conn is not None
+        target = int(self.max_bytes * EVICT_TARGET_RATIO)
+        rows = self._conn.execute(
+            f"SELECT {', '.join(key_columns)}, nbytes FROM {table} ORDER BY last_used"
+        ).fetchall()
+        doomed: list[tuple] = []
+        for *key, nbytes in rows:
+            if self._total_bytes <= target:
+                break
+            doomed.append(tuple(key))
+            self._total_bytes -= int(nbytes)
+        else:
+            # 모두 지웠다 — 어긋난 누계도 바로잡는다
+            self._total_bytes = 0
+        where = " AND ".join(f"{column}=?" for column in key_columns)
+        self._conn.executemany(f"DELETE FROM {table} WHERE {where}", doomed)
+
+
+__all__ = ["EVICT_TARGET_RATIO", "SQLiteStore"]
@@ -0,0 +1,385 @@
+"""작업 간 공유되는 페이지 텍스트 레이어 캐시.
+
+키는 (normalize_path_key, mtime_ns, page) — 파일이 바뀌면 mtime 이 달라져 자연히 무효화된다.
+페이지마다 TextPage 를 한 번만 만들어 텍스트·줄(bbox, 최대 글자 크기, 플래그)·블록을 뽑아
+메모리 LRU(바이트 상한)에 보관한다. 검색·하이라이트·교정은 캐시된 접힌(folded) 텍스트로
+검색어가 있을 수 없는 페이지를 건너뛰고, 후보 페이지에서만 `search_for` 를 호출한다.
+선택적으로 SQLite(앱 데이터 디렉터리)에 영속화한다 — 암호화 문서·임시 평문 파일은 제외.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .optional_deps import fitz
+from .path_utils import app_data_dir, normalize_path_key
+from .perf import perf_sample
+from .sqlite_store import SQLiteStore
+from .temp_cleanup import AI_TEMP_PREFIX, ATOMIC_TEMP_PREFIX
+
+logger = logging.getLogger(__name__)
+
+TEXT_LAYER_CACHE_FILENAME = "text_layers.sqlite3"
+# 메모리 상한 — 800쪽 문서 여러 개가 들어가는 정도
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_DISK_BYTES = 256 * 1024 * 1024
+_SCHEMA_VERSION = 1
+_ZLIB_LEVEL = 6
+# 검색 사전 필터에서 무시하는 문자 (공백·하이픈 — search_for 의 공백 정규화/dehyphenate 대응)
+_FOLD_DROP = frozenset("-\u00ad\u2010\u2011")
+# 줄 단위 오브젝트 오버헤드 추정치 (튜플 + 부동소수 4개 + 정수)
+_LINE_OVERHEAD = 160
+_BLOCK_OVERHEAD = 140
+_PAGE_OVERHEAD = 256
+
+
+@dataclass(frozen=True, slots=True)
+class TextLine:
+    text: str
+    bbox: tuple[float, float, float, float]
+    size: float
+    flags: int
+    block: int
+
+
+@dataclass(frozen=True, slots=True)
+class PageTextLayer:
+    """페이지 텍스트 레이어의 압축 표현."""
+
+    text: str
+    lines: tuple[TextLine, ...]
+    blocks: tuple[tuple[float, float, float, float, str], ...]
+    folded: str
+
+    @property
+    def nbytes(self) -> int:
+        text_bytes = len(self.text) + len(self.folded)
+        text_bytes += sum(len(line.text) + _LINE_OVERHEAD for line in self.lines)
+        text_bytes += sum(len(block[4]) + _BLOCK_OVERHEAD for block in self.blocks)
+        return _PAGE_OVERHEAD + text_bytes * 2
+
+    def may_contain(self, term: str) -> bool:
+        """검색어가 이 페이지에 있을 수 있는지 (거짓 음성 없음 — 애매하면 True)."""
+        needle = fold_search_text(term)
+        if not needle or "\ufffd" in self.text:
+            return True
+        return needle in self.folded
+
+    def to_payload(self) -> list[Any]:
+        return [
+            self.text,
+            [[line.text, list(line.bbox), line.size, line.flags, line.block] for line in self.lines],
+            [list(block) for block in self.blocks],
+        ]
+
+    @classmethod
+    def from_payload(cls, payload: list[Any]) -> PageTextLayer:
+        text, raw_lines, raw_blocks = payload
+        lines = tuple(
+            TextLine(str(item[0]), tuple(float(v) for v in item[1]), float(item[2]), int(item[3]), int(item[4]))
+            for item in raw_lines
+        )
+        blocks = tuple((float(b[0]), float(b[1]), float(b[2]), float(b[3]), str(b[4])) for b in raw_blocks)
+        return cls(text=str(text), lines=lines, blocks=blocks, folded=fold_search_text(str(text)))
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentTextKey:
+    path_key: str
+    mtime_ns: int
+    size: int
+    persistable: bool
+
+
+def fold_search_text(text: str) -> str:
+    """NFKC + casefold 후 공백·하이픈 제거 (합자·대소문자·줄바꿈 하이픈을 무시한 비교용)."""
+    folded = unicodedata.normalize("NFKC", text).casefold()
+    return "".join(ch for ch in folded if not ch.isspace() and ch not in _FOLD_DROP)
+
+
+def extract_page_text_layer(page: Any, textpage: Any | None = None) -> PageTextLayer:
+    """TextPage 하나로 텍스트/줄/블록을 모두 뽑는다 (get_text() 기본 플래그와 동일)."""
+    with perf_sample("page.get_text"):
+        tp = textpage if textpage is not None else page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+        text = str(page.get_text("text", textpage=tp) or "")
+        text_dict = page.get_text("dict", textpage=tp) or {}
+        raw_blocks = page.get_text("blocks", textpage=tp) or []
+    lines: list[TextLine] = []
+    for block_index, block in enumerate(text_dict.get("blocks", [])):
+        if block.get("type") != 0:
+            continue
+        for line in block.get("lines", []):
+            spans = line.get("spans") or []
+            if not spans:
+                continue
+            flags = 0
+            for span in spans:
+                flags |= int(span.get("flags") or 0)
+            lines.append(
+                TextLine(
+                    text="".join(str(span.get("text") or "") for span in spans),
+                    bbox=tuple(float(v) for v in line.get("bbox", (0.0, 0.0, 0.0, 0.0))),
+                    size=max(float(span.get("size") or 0.0) for span in spans),
+                    flags=flags,
+                    block=block_index,
+                )
+            )
+    blocks = tuple(
+        (float(b[0]), float(b[1]), float(b[2]), float(b[3]), str(b[4]))
+        for b in raw_blocks
+        if len(b) >= 7 and b[6] == 0
+    )
+    return PageTextLayer(text=text, lines=tuple(lines), blocks=blocks, folded=fold_search_text(text))
+
+
+def _is_temp_plaintext(path_key: str) -> bool:
+    name = os.path.basename(path_key)
+    return name.startswith(AI_TEMP_PREFIX) or name.startswith(ATOMIC_TEMP_PREFIX)
+
+
+class TextLayerCache:
+    """프로세스 공용 페이지 텍스트 레이어 LRU (스레드 안전)."""
+
+    def __init__(self, *, max_bytes: int = DEFAULT_MEMORY_BYTES):
+        self.max_bytes = max(1, int(max_bytes))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, int, int], PageTextLayer] = OrderedDict()
+        self._sizes: dict[tuple[str, int, int], int] = {}
+        self._mtimes: dict[str, int] = {}
+        self._total_bytes = 0
+        self._disk: TextLayerDiskStore | None = None
+        self.hits = 0
+        self.misses = 0
+
+    # ---- 설정 ----
+    def set_persistence(self, enabled: bool, db_path: str | None = None) -> None:
+        """영속화 켜기/끄기. 실패하면 메모리 캐시만 쓴다."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+            if not enabled:
+                return
+            try:
+                self._disk = TextLayerDiskStore(db_path or app_data_dir("cache", TEXT_LAYER_CACHE_FILENAME))
+            except (OSError, sqlite3.Error) as exc:
+                logger.info("Text layer disk cache disabled: %s", exc)
+
+    @property
+    def persistent(self) -> bool:
+        return self._disk is not None
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._mtimes.clear()
+            self._total_bytes = 0
+
+    # ---- 키 ----
+    def document_key(self, doc: Any) -> DocumentTextKey | None:
+        """열린 문서의 캐시 키 (메모리 문서·수정된 문서·임시 평문 파일은 None).
+
+        작업 시작 직후(문서 수정 전)에 한 번 구해 페이지 조회에 넘긴다.
+        """
+        name = getattr(doc, "name", "") or ""
+        path_key = normalize_path_key(name)
+        if not path_key or getattr(doc, "stream", None) is not None or _is_temp_plaintext(path_key):
+            return None
+        if getattr(doc, "is_dirty", False):
+            return None
+        try:
+            st = os.stat(path_key)
+        except OSError:
+            return None
+        # needs_pass 는 인증된 문서의 복호화 상태를 되돌리므로 메타데이터로만 판단한다
+        try:
+            encrypted = bool((doc.metadata or {}).get("encryption"))
+        except Exception:
+            encrypted = True
+        return DocumentTextKey(path_key, int(st.st_mtime_ns), int(st.st_size), persistable=not encrypted)
+
+    # ---- 조회 ----
+    def page_layer(
+        self,
+        doc: Any,
+        page_index: int,
+        key: DocumentTextKey | None,
+        *,
+        textpage: Any | None = None,
+    ) -> PageTextLayer:
+        if key is None:
+            return extract_page_text_layer(doc[page_index], textpage)
+        cache_key = (key.path_key, key.mtime_ns, int(page_index))
+        layer = self._lookup(cache_key)
+        if layer is None and key.persistable and self._disk is not None:
+            layer = self._disk.get(key, page_index)
+            if layer is not None:
+                self._store(cache_key, layer)
+        if layer is not None:
+            self.hits += 1
+            return layer
+        self.misses += 1
+        layer = extract_page_text_layer(doc[page_index], textpage)
+        self._store(cache_key, layer)
+        if key.persistable and self._disk is not None:
+            self._disk.put(key, page_index, layer)
+        return layer
+
+    def search_page(self, doc: Any, page_index: int, term: str, key: DocumentTextKey | None) -> list[Any]:
+        """`page.search_for(term)` 과 같은 결과. 캐시된 텍스트에 없으면 페이지를 건너뛴다."""
+        page = doc[page_index]
+        if key is None:
+            return list(page.search_for(term))
+        layer = self.page_layer(doc, page_index, key)
+        if not layer.may_contain(term):
+            return []
+        return list(page.search_for(term))
+
+    def _lookup(self, cache_key: tuple[str, int, int]) -> PageTextLayer | None:
+        with self._lock:
+            layer = self._entries.get(cache_key)
+            if layer is not None:
+                self._entries.move_to_end(cache_key)
+            return layer
+
+    def _store(self, cache_key: tuple[str, int, int], layer: PageTextLayer) -> None:
+        path_key, mtime_ns, _page = cache_key
+        nbytes = layer.nbytes
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous_mtime = self._mtimes.get(path_key)
+            if previous_mtime is not None and previous_mtime != mtime_ns:
+                # 같은 경로의 이전 버전은 다시 쓰일 일이 없다
+                for stale in [k for k in self._entries if k[0] == path_key and k[1] != mtime_ns]:
+                    self._drop(stale)
+            self._mtimes[path_key] = mtime_ns
+            if cache_key in self._entries:
+                self._drop(cache_key)
+            self._entries[cache_key] = layer
+            self._sizes[cache_key] = nbytes
+            self._total_bytes += nbytes
+            while self._total_bytes > self.max_bytes and self._entries:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, cache_key: tuple[str, int, int]) -> None:
+        self._entries.pop(cache_key, None)
+        self._total_bytes -= self._sizes.pop(cache_key, 0)
+
+
+class TextLayerDiskStore(SQLiteStore):
+    """(path_key, mtime_ns, size, page) → zlib(JSON) 페이지 레이어 SQLite 저장소."""
+
+    store_name = "Text layer cache"
+    schema_version = _SCHEMA_VERSION
+    tables = ("pages",)
+    schema = (
+        "CREATE TABLE IF NOT EXISTS pages ("
+        " path_key TEXT NOT NULL, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL,"
+        " page INTEGER NOT NULL, data BLOB NOT NULL, nbytes INTEGER NOT NULL,"
+        " last_used REAL NOT NULL, PRIMARY KEY (path_key, page))",
+        "CREATE INDEX IF NOT EXISTS pages_last_used ON pages(last_used)",
+    )
+
+    def __init__(self, db_path: str, *, max_bytes: int = DEFAULT_DISK_BYTES):
+        super().__init__(db_path)
+        self.max_bytes = max(1, int(max_bytes))
+        self._open()
+        self._total_bytes = self._stored_bytes("pages")
+
+    def get(self, key: DocumentTextKey, page_index: int) -> PageTextLayer | None:
+        with self._lock:
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT data FROM pages WHERE path_key=? AND page=? AND mtime_ns=? AND size=?",
+                    (key.path_key, int(page_index), key.mtime_ns, key.size),
+                ).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute(
+                    "UPDATE pages SET last_used=? WHERE path_key=? AND page=?",
+                    (time.time(), key.path_key, int(page_index)),
+                )
+            except sqlite3.Error as exc:
+                logger.debug("Text layer cache read failed: %s", exc)
+                return None
+        try:
+            return PageTextLayer.from_payload(json.loads(zlib.decompress(row[0]).decode("utf-8")))
+        except Exception:
+            logger.debug("Corrupt text layer cache row ignored", exc_info=True)
+            return None
+
+    def put(self, key: DocumentTextKey, page_index: int, layer: PageTextLayer) -> None:
+        data = zlib.compress(json.dumps(layer.to_payload(), ensure_ascii=False).encode("utf-8"), _ZLIB_LEVEL)
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                old = self._conn.execute(
+                    "SELECT nbytes FROM pages WHERE path_key=? AND page=?", (key.path_key, int(page_index))
+                ).fetchone()
+                if old is not None:
+                    self._total_bytes -= int(old[0])
+                # 같은 경로의 이전 버전 페이지는 교체된다 (PRIMARY KEY = path_key, page)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key.path_key, key.mtime_ns, key.size, int(page_index), data, len(data), time.time()),
+                )
+                self._total_bytes += len(data)
+                if self._total_bytes > self.max_bytes:
+                    self._evict_lru_locked("pages", ("path_key", "page"))
+            except sqlite3.Error as exc:
+                logger.debug("Text layer cache write failed: %s", exc)
+
+TEXT_LAYER_CACHE = TextLayerCache()
+
+
+def cached_page_text(doc: Any, page_index: int, key: DocumentTextKey | None) -> str:
+    """`page.get_text()` 과 같은 평문. 캐시할 수 없는 문서는 평문만 뽑는다."""
+    if key is None:
+        with perf_sample("page.get_text"):
+            text = doc[page_index].get_text()
+        return text if isinstance(text, str) else ""
+    return TEXT_LAYER_CACHE.page_layer(doc, page_index, key).text
+
+
+def search_document_pages(doc: Any, term: str) -> Callable[[int], list[Any]]:
+    """작업 시작 시 한 번 호출해 페이지별 검색 함수를 얻는다 (문서 키를 수정 전에 고정)."""
+    key = TEXT_LAYER_CACHE.document_key(doc)
+
+    def _search(page_index: int) -> list[Any]:
+        return TEXT_LAYER_CACHE.search_page(doc, page_index, term, key)
+
+    return _search
+
+
+__all__ = [
+    "DEFAULT_MEMORY_BYTES",
+    "DocumentTextKey",
+    "PageTextLayer",
+    "TEXT_LAYER_CACHE",
+    "TEXT_LAYER_CACHE_FILENAME",
+    "TextLayerCache",
+    "TextLayerDiskStore",
+    "TextLine",
+    "cached_page_text",
+    "extract_page_text_layer",
+    "fold_search_text",
+    "search_document_pages",
+]
@@ -0,0 +1,78 @@
+"""라이브러리 검색·AI 로컬 검색 공용 토크나이저와 BM25 점수.
+
+두 검색이 같은 질의를 같은 토큰으로 나누고 같은 식으로 순위를 매기도록 한 곳에 둔다.
+토큰은 NFKC·casefold 후 단어 단위, 한글·한자·가나 구간은 공백이 없어도 찾을 수 있도록 문자 2-gram 이다.
+"""
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+# 용어 하나의 최대 길이 (긴 해시·URL 조각은 잘라서 색인)
+MAX_TERM_LENGTH = 48
+
+_WORD_RE = re.compile(r"[^\W_]+")
+_CJK_RANGES = (
+    (0x1100, 0x11FF),  # 한글 자모
+    (0x3040, 0x30FF),  # 히라가나·가타카나
+    (0x3130, 0x318F),  # 호환 자모
+    (0x3400, 0x4DBF),  # CJK 확장 A
+    (0x4E00, 0x9FFF),  # CJK 통합 한자
+    (0xAC00, 0xD7A3),  # 한글 음절
+    (0xF900, 0xFAFF),  # CJK 호환 한자
+)
+
+
+def _is_cjk(ch: str) -> bool:
+    code = ord(ch)
+    return any(low <= code <= high for low, high in _CJK_RANGES)
+
+
+def tokenize(text: str) -> list[str]:
+    """색인·질의 공용 토크나이저 (NFKC + casefold, CJK 2-gram)."""
+    tokens: list[str] = []
+    folded = unicodedata.normalize("NFKC", text or "").casefold()
+    for match in _WORD_RE.finditer(folded):
+        word = match.group(0)
+        start = 0
+        # 한 단어 안에서 CJK 구간과 나머지 구간을 나눈다 (예: "PDF변환" → "pdf", "변환")
+        while start < len(word):
+            cjk = _is_cjk(word[start])
+            end = start + 1
+            while end < len(word) and _is_cjk(word[end]) == cjk:
+                end += 1
+            segment = word[start:end]
+            if cjk:
+                if len(segment) == 1:
+                    tokens.append(segment)
+                else:
+                    tokens.extend(segment[i : i + 2] for i in range(len(segment) - 1))
+            else:
+                tokens.append(segment[:MAX_TERM_LENGTH])
+            start = end
+    return tokens
+
+
+def bm25_idf(doc_count: int, doc_freq: int) -> float:
+    """문서 doc_count 개 중 doc_freq 개에 나오는 용어의 IDF (log(1+…) 형태 — 흔한 용어도 음수가 아니다)."""
+    return math.log(1.0 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+
+def bm25_term_score(idf: float, tf: int, length: float, avg_length: float) -> float:
+    """한 문서에서 용어 하나의 BM25 기여분."""
+    norm = BM25_K1 * (1.0 - BM25_B + BM25_B * length / (avg_length or 1.0))
+    return idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+
+
+__all__ = [
+    "BM25_B",
+    "BM25_K1",
+    "MAX_TERM_LENGTH",
+    "bm25_idf",
+    "bm25_term_score",
+    "tokenize",
+]
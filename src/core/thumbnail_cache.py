@@ -0,0 +1,241 @@
+"""세션 간 공유되는 디스크 썸네일 캐시.
+
+단일 SQLite 파일(앱 데이터 디렉터리)에 인코딩된 썸네일 blob 을 보관한다.
+키는 (파일 내용 digest, 페이지, 크기 키) — 같은 내용의 사본/이름 변경에도 적중한다.
+(경로, mtime_ns, 크기) → digest 메모 테이블 덕분에 재실행 시 파일을 다시 해시하지 않는다.
+캐시는 보조 수단이므로 모든 SQLite 오류는 로그 후 '미적중'으로 처리한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+
+from .path_utils import app_data_dir, normalize_path_key
+from .sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_CACHE_FILENAME = "thumbnails.sqlite3"
+# 디스크 상한 — 초과 시 최근 사용 순으로 90% 까지 축출
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_SCHEMA_VERSION = 1
+# 이보다 큰 파일은 전체 대신 표본(머리/꼬리/구간) + mtime 으로 digest 계산
+_FULL_HASH_MAX_BYTES = 64 * 1024 * 1024
+_HASH_CHUNK = 1024 * 1024
+_SAMPLE_EDGE_BYTES = 4 * 1024 * 1024
+_SAMPLE_COUNT = 16
+_SAMPLE_BYTES = 64 * 1024
+
+
+def file_content_digest(path: str) -> str:
+    """썸네일 키용 파일 내용 digest (큰 파일은 표본 기반)."""
+    st = os.stat(path)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(str(st.st_size).encode("ascii"))
+    with open(path, "rb") as fp:
+        if st.st_size <= _FULL_HASH_MAX_BYTES:
+            for chunk in iter(lambda: fp.read(_HASH_CHUNK), b""):
+                hasher.update(chunk)
+        else:
+            # 표본 밖 수정이 같은 digest 가 되지 않도록 mtime 도 섞는다 (큰 파일은 사본 공유 포기).
+            hasher.update(str(st.st_mtime_ns).encode("ascii"))
+            hasher.update(fp.read(_SAMPLE_EDGE_BYTES))
+            step = max(1, (st.st_size - 2 * _SAMPLE_EDGE_BYTES) // (_SAMPLE_COUNT + 1))
+            for index in range(1, _SAMPLE_COUNT + 1):
+                fp.seek(_SAMPLE_EDGE_BYTES + step * index)
+                hasher.update(fp.read(_SAMPLE_BYTES))
+            fp.seek(max(0, st.st_size - _SAMPLE_EDGE_BYTES))
+            hasher.update(fp.read(_SAMPLE_EDGE_BYTES))
+    return hasher.hexdigest()
+
+
+class ThumbnailDiskCache(SQLiteStore):
+    """크기 상한 LRU 디스크 썸네일 저장소 (스레드 안전)."""
+
+    store_name = "Thumbnail cache"
+    schema_version = _SCHEMA_VERSION
+    tables = ("thumbs", "files")
+    schema = (
+        "CREATE TABLE IF NOT EXISTS thumbs ("
+        " digest TEXT NOT NULL, page INTEGER NOT NULL, size_key TEXT NOT NULL,"
+        " fmt TEXT NOT NULL, data BLOB NOT NULL, nbytes INTEGER NOT NULL,"
+        " last_used REAL NOT NULL, PRIMARY KEY (digest, page, size_key))",
+        "CREATE INDEX IF NOT EXISTS thumbs_last_used ON thumbs(last_used)",
+        "CREATE TABLE IF NOT EXISTS files ("
+        " path_key TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL,"
+        " size INTEGER NOT NULL, digest TEXT NOT NULL)",
+    )
+
+    def __init__(self, db_path: str, *, max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__(db_path)
+        self.max_bytes = max(1, int(max_bytes))
+        self._open()
+        self._total_bytes = self._stored_bytes("thumbs")
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    # ---- digest 메모 ----
+    def resolve_digest(self, path: str, *, compute: bool = True) -> str:
+        """파일 digest. 메모 미적중 시 compute=False 면 "" (GUI 스레드에서 해시 금지)."""
+        path_key = normalize_path_key(path)
+        if not path_key:
+            return ""
+        try:
+            st = os.stat(path_key)
+        except OSError:
+            return ""
+        mtime_ns = int(st.st_mtime_ns)
+        size = int(st.st_size)
+        with self._lock:
+            row = self._fetchone(
+                "SELECT digest FROM files WHERE path_key=? AND mtime_ns=? AND size=?",
+                (path_key, mtime_ns, size),
+            )
+        if row:
+            return str(row[0])
+        if not compute:
+            return ""
+        try:
+            digest = file_content_digest(path_key)
+        except OSError as exc:
+            logger.debug("Thumbnail digest failed for %s: %s", path_key, exc)
+            return ""
+        with self._lock:
+            self._execute(
+                "INSERT OR REPLACE INTO files(path_key, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+                (path_key, mtime_ns, size, digest),
+            )
+        return digest
+
+    # ---- blob 조회/저장 ----
+    def get_many(self, digest: str, pages: Iterable[int], size_key: str) -> dict[int, bytes]:
+        page_list = sorted({int(page) for page in pages})
+        if not digest or not page_list:
+            return {}
+        found: dict[int, bytes] = {}
+        now = time.time()
+        with self._lock:
+            # SQLite 변수 상한(999) 대비 나눠서 조회
+            for start in range(0, len(page_list), 500):
+                chunk = page_list[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self._fetchall(
+                    f"SELECT page, data FROM thumbs WHERE digest=? AND size_key=? AND page IN ({marks})",
+                    (digest, size_key, *chunk),
+                )
+                hit_pages = [int(page) for page, _data in rows]
+                found.update((int(page), bytes(data)) for page, data in rows)
+                if hit_pages:
+                    hit_marks = ",".join("?" * len(hit_pages))
+                    self._execute(
+                        f"UPDATE thumbs SET last_used=? WHERE digest=? AND size_key=? AND page IN ({hit_marks})",
+                        (now, digest, size_key, *hit_pages),
+                    )
+        return found
+
+    def get(self, digest: str, page: int, size_key: str) -> bytes | None:
+        return self.get_many(digest, (page,), size_key).get(int(page))
+
+    def put(self, digest: str, page: int, size_key: str, data: bytes, fmt: str) -> None:
+        if not digest or not data:
+            return
+        nbytes = len(data)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._fetchone(
+                "SELECT nbytes FROM thumbs WHERE digest=? AND page=? AND size_key=?",
+                (digest, int(page), size_key),
+            )
+            ok = self._execute(
+                "INSERT OR REPLACE INTO thumbs(digest, page, size_key, fmt, data, nbytes, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (digest, int(page), size_key, fmt, sqlite3.Binary(data), nbytes, time.time()),
+            )
+            if not ok:
+                return
+            self._total_bytes += nbytes - (int(old[0]) if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._execute("DELETE FROM thumbs")
+            self._execute("DELETE FROM files")
+            self._total_bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._fetchone("SELECT COUNT(*) FROM thumbs", ())
+        return int(row[0]) if row else 0
+
+    # ---- 내부 ----
+    def _evict_locked(self) -> None:
+        try:
+            self._evict_lru_locked("thumbs", ("rowid",))
+            # 썸네일이 모두 축출된 파일의 digest 메모도 정리
+            self._execute("DELETE FROM files WHERE digest NOT IN (SELECT DISTINCT digest FROM thumbs)")
+        except sqlite3.Error as exc:
+            logger.debug("Thumbnail cache eviction failed: %s", exc)
+
+    def _execute(self, sql: str, params: tuple = ()) -> bool:
+        if self._conn is None:
+            return False
+        try:
+            self._conn.execute(sql, params)
+            return True
+        except sqlite3.Error as exc:
+            logger.debug("Thumbnail cache write failed: %s", exc)
+            return False
+
+    def _fetchone(self, sql: str, params: tuple) -> tuple | None:
+        if self._conn is None:
+            return None
+        try:
+            return self._conn.execute(sql, params).fetchone()
+        except sqlite3.Error as exc:
+            logger.debug("Thumbnail cache read failed: %s", exc)
+            return None
+
+    def _fetchall(self, sql: str, params: tuple) -> list[tuple]:
+        if self._conn is None:
+            return []
+        try:
+            return list(self._conn.execute(sql, params).fetchall())
+        except sqlite3.Error as exc:
+            logger.debug("Thumbnail cache read failed: %s", exc)
+            return []
+
+
+_shared_cache: ThumbnailDiskCache | None = None
+_shared_cache_failed = False
+_shared_cache_lock = threading.Lock()
+
+
+def get_thumbnail_disk_cache() -> ThumbnailDiskCache | None:
+    """프로세스 공용 디스크 캐시 (열기 실패 시 None — 메모리 LRU 만 사용)."""
+    global _shared_cache, _shared_cache_failed
+    with _shared_cache_lock:
+        if _shared_cache is None and not _shared_cache_failed:
+            try:
+                _shared_cache = ThumbnailDiskCache(app_data_dir("cache", THUMBNAIL_CACHE_FILENAME))
+            except (OSError, sqlite3.Error) as exc:
+                logger.info("Thumbnail disk cache disabled: %s", exc)
+                _shared_cache_failed = True
+        return _shared_cache
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "THUMBNAIL_CACHE_FILENAME",
+    "ThumbnailDiskCache",
+    "file_content_digest",
+    "get_thumbnail_disk_cache",
+]
@@ -0,0 +1,270 @@
+"""Undo 스냅샷용 내용 주소(content-addressed) 청크 저장소.
+
+스냅샷마다 파일 전체를 복사하는 대신
+- 파일을 내용 기반 경계(PDF `endobj` 토큰 + 주변 바이트 해시)로 청크로 나누고,
+- 청크를 blake2b digest 이름으로 zlib 압축 저장하며,
+- 스냅샷 자체는 청크 목록만 담은 작은 매니페스트 파일로 남긴다.
+같은 문서의 연속 버전은 바뀌지 않은 객체 구간의 청크를 공유하므로 큰 PDF 도 백업이 싸다.
+경계가 위치가 아닌 내용으로 정해져서 앞쪽 객체 크기가 바뀌어(오프셋 이동) 도 뒤쪽 청크가 다시 맞물린다.
+청크 수명은 매니페스트 참조 수로 관리한다 (참조 0 → GC 대상).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+import time
+import zlib
+from collections import Counter
+from collections.abc import Iterable, Iterator
+
+from .temp_cleanup import ATOMIC_TEMP_PREFIX
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = "pdf_master_undo_chunks/1"
+CHUNKS_DIRNAME = "chunks"
+# 청크 크기 범위 — 최소 이상에서 경계 후보(endobj)를 찾고, 최대에서 강제 절단
+_MIN_CHUNK = 64 * 1024
+_MAX_CHUNK = 4 * 1024 * 1024
+_ANCHOR = b"endobj"
+# 경계 후보 앞 바이트 해시의 하위 비트가 0 이면 절단 (후보 8개 중 1개꼴)
+_CUT_WINDOW = 48
+_CUT_MASK = 0x7
+_ZLIB_LEVEL = 6
+# 압축 이득이 이보다 작으면(이미 압축된 스트림 등) 원본 저장
+_MIN_COMPRESS_RATIO = 0.95
+_RAW_TAG = b"R"
+_ZLIB_TAG = b"Z"
+_CHUNK_TEMP_PREFIX = ".tmp_"
+# 이보다 오래된 청크 임시 파일은 중단된 쓰기로 보고 GC 에서 삭제
+_STALE_TEMP_SECONDS = 3600.0
+_HEADER_PROBE = len(b'{"format": "') + len(SNAPSHOT_FORMAT)
+
+
+def iter_chunk_bounds(data, size: int) -> Iterator[tuple[int, int]]:
+    """내용 기반 청크 경계 [(start, end), ...] (data 는 bytes/mmap)."""
+    start = 0
+    while start < size:
+        limit = min(size, start + _MAX_CHUNK)
+        cut = limit
+        search = start + _MIN_CHUNK
+        while search < limit:
+            hit = data.find(_ANCHOR, search, limit)
+            if hit < 0:
+                break
+            end = hit + len(_ANCHOR)
+            if zlib.crc32(data[max(start, end - _CUT_WINDOW):end]) & _CUT_MASK == 0:
+                cut = end
+                break
+            search = end
+        yield start, cut
+        start = cut
+
+
+def chunk_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _write_atomic(path: str, payload: bytes, *, prefix: str) -> None:
+    directory = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(prefix=prefix, dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class UndoChunkStore:
+    """백업 디렉터리 아래 `chunks/` 에 청크를, 디렉터리 자체에 매니페스트를 둔다."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.chunks_dir = os.path.join(root, CHUNKS_DIRNAME)
+
+    def _chunk_path(self, digest: str) -> str:
+        return os.path.join(self.chunks_dir, digest[:2], digest)
+
+    # ---- 스냅샷 ----
+    def create_snapshot(self, source_path: str, snapshot_path: str) -> int:
+        """source 를 청크로 저장하고 매니페스트를 쓴다. 새로 쓴 청크 바이트 수를 반환."""
+        st = os.stat(source_path)
+        chunks: list[list] = []
+        written = 0
+        with open(source_path, "rb") as fp:
+            size = os.fstat(fp.fileno()).st_size
+            if size > 0:
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    for start, end in iter_chunk_bounds(data, size):
+                        piece = data[start:end]
+                        digest = chunk_digest(piece)
+                        written += self._put_chunk(digest, piece)
+                        chunks.append([digest, end - start])
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "size": size,
+            "mtime_ns": int(st.st_mtime_ns),
+            "chunks": chunks,
+        }
+        _write_atomic(
+            snapshot_path,
+            json.dumps(manifest).encode("utf-8"),
+            prefix=ATOMIC_TEMP_PREFIX,
+        )
+        return written
+
+    def restore_snapshot(self, snapshot_path: str, target_path: str) -> None:
+        """매니페스트를 원본 바이트로 재조립해 target 을 원자적으로 교체한다."""
+        manifest = self.read_manifest(snapshot_path)
+        if manifest is None:
+            raise ValueError(f"Not an undo snapshot: {snapshot_path}")
+        target_dir = os.path.dirname(os.path.abspath(target_path)) or "."
+        fd, temp_path = tempfile.mkstemp(prefix=ATOMIC_TEMP_PREFIX, suffix=".pdf", dir=target_dir)
+        try:
+            total = 0
+            with os.fdopen(fd, "wb") as out:
+                for digest, length in manifest["chunks"]:
+                    piece = self._get_chunk(digest)
+                    if len(piece) != int(length):
+                        raise ValueError(f"Undo chunk length mismatch: {digest}")
+                    out.write(piece)
+                    total += len(piece)
+            if total != int(manifest.get("size", total)):
+                raise ValueError(f"Undo snapshot size mismatch: {snapshot_path}")
+            mtime_ns = manifest.get("mtime_ns")
+            if isinstance(mtime_ns, int):
+                # shutil.copy2 기반 복원과 같은 mtime 보존
+                os.utime(temp_path, ns=(time.time_ns(), mtime_ns))
+            os.replace(temp_path, target_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def is_snapshot(path: str) -> bool:
+        try:
+            with open(path, "rb") as fp:
+                head = fp.read(_HEADER_PROBE)
+        except OSError:
+            return False
+        return head == f'{{"format": "{SNAPSHOT_FORMAT}'.encode("ascii")
+
+    def read_manifest(self, snapshot_path: str) -> dict | None:
+        if not self.is_snapshot(snapshot_path):
+            return None
+        try:
+            with open(snapshot_path, "r", encoding="utf-8") as fp:
+                manifest = json.load(fp)
+        except (OSError, ValueError) as exc:
+            logger.debug("Undo snapshot manifest unreadable %s: %s", snapshot_path, exc)
+            return None
+        if not isinstance(manifest, dict) or not isinstance(manifest.get("chunks"), list):
+            return None
+        return manifest
+
+    # ---- 참조 수 / GC ----
+    def reference_counts(self, snapshot_paths: Iterable[str]) -> Counter:
+        """매니페스트들이 참조하는 청크별 참조 수."""
+        refs: Counter = Counter()
+        for path in snapshot_paths:
+            manifest = self.read_manifest(path)
+            if manifest is None:
+                continue
+            refs.update(str(entry[0]) for entry in manifest["chunks"])
+        return refs
+
+    def chunk_sizes(self) -> dict[str, int]:
+        """저장된 청크 digest → 디스크 바이트 수."""
+        sizes: dict[str, int] = {}
+        if not os.path.isdir(self.chunks_dir):
+            return sizes
+        for bucket in os.scandir(self.chunks_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.startswith(_CHUNK_TEMP_PREFIX):
+                    continue
+                try:
+                    sizes[entry.name] = entry.stat().st_size
+                except OSError:
+                    continue
+        return sizes
+
+    def collect_garbage(self, refcounts: Counter, sizes: dict[str, int] | None = None) -> tuple[int, int]:
+        """참조 수 0 인 청크(및 오래된 임시 파일) 삭제. (삭제 수, 회수 바이트) 반환."""
+        if sizes is None:
+            sizes = self.chunk_sizes()
+        removed = 0
+        freed = 0
+        for digest, nbytes in sizes.items():
+            if refcounts.get(digest, 0) > 0:
+                continue
+            try:
+                os.remove(self._chunk_path(digest))
+                removed += 1
+                freed += nbytes
+            except OSError:
+                logger.debug("Failed to remove undo chunk %s", digest, exc_info=True)
+        self._sweep_stale_temps()
+        return removed, freed
+
+    # ---- 내부 ----
+    def _put_chunk(self, digest: str, piece: bytes) -> int:
+        path = self._chunk_path(digest)
+        if os.path.exists(path):
+            return 0
+        packed = zlib.compress(piece, _ZLIB_LEVEL)
+        if len(packed) < len(piece) * _MIN_COMPRESS_RATIO:
+            payload = _ZLIB_TAG + packed
+        else:
+            payload = _RAW_TAG + piece
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _write_atomic(path, payload, prefix=_CHUNK_TEMP_PREFIX)
+        return len(payload)
+
+    def _get_chunk(self, digest: str) -> bytes:
+        with open(self._chunk_path(digest), "rb") as fp:
+            payload = fp.read()
+        tag, body = payload[:1], payload[1:]
+        if tag == _ZLIB_TAG:
+            piece = zlib.decompress(body)
+        elif tag == _RAW_TAG:
+            piece = body
+        else:
+            raise ValueError(f"Unknown undo chunk encoding: {digest}")
+        if chunk_digest(piece) != digest:
+            raise ValueError(f"Undo chunk corrupted: {digest}")
+        return piece
+
+    def _sweep_stale_temps(self) -> None:
+        if not os.path.isdir(self.chunks_dir):
+            return
+        cutoff = time.time() - _STALE_TEMP_SECONDS
+        for bucket in os.scandir(self.chunks_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                try:
+                    if entry.name.startswith(_CHUNK_TEMP_PREFIX) and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    continue
+            try:
+                os.rmdir(bucket.path)  # 빈 버킷만 삭제됨
+            except OSError:
+                pass
+
+
+__all__ = ["CHUNKS_DIRNAME", "SNAPSHOT_FORMAT", "UndoChunkStore", "chunk_digest", "iter_chunk_bounds"]
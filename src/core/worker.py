@@ -1,16 +1,15 @@
 import logging
+from concurrent.futures import Future, wait
 from typing import Any
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from .worker_ops import WorkerAiOpsMixin, WorkerPdfOpsMixin
-from .worker_runtime import WorkerRuntimeMixin
+from .worker_runtime import CancelledError, WorkerRuntimeMixin
 
 logger = logging.getLogger(__name__)
 
-
-class CancelledError(Exception):
-    """작업 취소 시 발생하는 예외"""
+__all__ = ["CancelledError", "WorkerThread"]
 
 
 class WorkerThread(QThread, WorkerRuntimeMixin, WorkerPdfOpsMixin, WorkerAiOpsMixin):
@@ -31,6 +30,7 @@ class WorkerThread(QThread, WorkerRuntimeMixin, WorkerPdfOpsMixin, WorkerAiOpsMi
         self._cancel_requested = False
         self._last_progress_value: int | None = None
         self._last_progress_emit_ts_ms = 0.0
+        self._run_barriers: list[Future] = []
         logger.debug("WorkerThread initialized: mode=%s", mode)
 
     def cancel(self):
@@ -42,5 +42,16 @@ class WorkerThread(QThread, WorkerRuntimeMixin, WorkerPdfOpsMixin, WorkerAiOpsMi
             logger.debug("requestInterruption() failed", exc_info=True)
         logger.info("Cancel requested for task: %s", self.mode)
 
+    def wait_before_run(self, barrier: Future) -> None:
+        """작업 본문 전에 끝나야 하는 선행 작업 (원본 undo 스냅샷 등). start 전에 호출한다."""
+        self._run_barriers.append(barrier)
+
     def run(self):
+        for barrier in self._run_barriers:
+            while not barrier.done():
+                if self._cancel_requested or self.isInterruptionRequested():
+                    logger.info("Task cancelled before start: %s", self.mode)
+                    self.cancelled_signal.emit(self._get_msg("err_cancelled"))
+                    return None
+                wait([barrier], timeout=0.1)
         return WorkerRuntimeMixin.run(self)
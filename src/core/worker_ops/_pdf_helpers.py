@@ -10,11 +10,24 @@ from ._pdf_helpers_impl import (
     _page_asset_placeholders,
     _markdown_front_matter,
     _sample_diff_text,
-    _pixmap_for_reencode,
     _image_display_size_pt,
-    _target_scale,
+    estimate_optimized_sizes,
     optimize_pdf_images,
     subset_document_fonts,
+    PageFingerprint,
+    page_fingerprint,
+    normalize_page_text,
+    simhash64,
+    dhash64,
+    hamming64,
+    coalesce_page_runs,
+    copy_page_subset,
+    build_page_subset,
+    PageStamper,
+    stamp_document,
+    StreamDedupeStats,
+    dedupe_document_streams,
+    find_duplicate_streams,
 )
 
-__all__ = ['text_needs_cjk', '_normalize_stroke_points', '_fallback_markdown_from_text', '_extract_native_markdown', '_extract_page_markdown', '_page_asset_placeholders', '_markdown_front_matter', '_sample_diff_text', '_pixmap_for_reencode', '_image_display_size_pt', '_target_scale', 'optimize_pdf_images', 'subset_document_fonts']
+__all__ = ['text_needs_cjk', '_normalize_stroke_points', '_fallback_markdown_from_text', '_extract_native_markdown', '_extract_page_markdown', '_page_asset_placeholders', '_markdown_front_matter', '_sample_diff_text', '_image_display_size_pt', 'estimate_optimized_sizes', 'optimize_pdf_images', 'subset_document_fonts', 'PageFingerprint', 'page_fingerprint', 'normalize_page_text', 'simhash64', 'dhash64', 'hamming64', 'coalesce_page_runs', 'copy_page_subset', 'build_page_subset', 'PageStamper', 'stamp_document', 'StreamDedupeStats', 'dedupe_document_streams', 'find_duplicate_streams']
@@ -4,33 +4,61 @@ from __future__ import annotations
 from __future__ import annotations
 import json
 import logging
+import multiprocessing
 import os
+import zlib
 from collections.abc import Callable
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any, cast
+from ...image_pool import (
+    JOB_KIND_JPEG,
+    JOB_KIND_SAMPLES,
+    ImageReencodeJob,
+    ReencodeOptions,
+    iter_pool_reencode,
+    reencode_pixmap,
+)
 from ...optional_deps import fitz
+from ...process_pool import create_process_pool, resolve_pool_workers, shutdown_process_pool
 from ...worker_runtime.args import _as_str
+from ...worker_runtime.save_profiles import IMAGE_OPTIMIZE_PROFILES, SAVE_PROFILES
+from .stream_dedupe import _stream_length, find_duplicate_streams
 logger = logging.getLogger(__name__)
 
-def _pixmap_for_reencode(pix: Any, *, grayscale: bool) -> Any:
-    """알파/CMYK를 정리하고 필요 시 그레이스케일로 변환한다."""
-    current = pix
-    # CMYK 등 4채널 이상 → RGB
-    if current.n - current.alpha >= 4:
-        current = fitz.Pixmap(fitz.csRGB, current)
-    if current.alpha:
-        current = fitz.Pixmap(current, 0)  # 알파 제거 (JPEG 불가)
-    if grayscale and current.n != 1:
-        current = fitz.Pixmap(fitz.csGRAY, current)
-    return current
-
-def _image_display_size_pt(page: Any, xref: int, fallback_w: float, fallback_h: float) -> tuple[float, float]:
+# 이보다 이미지가 적으면 풀 기동 비용이 더 크다
+PARALLEL_MIN_IMAGES = 8
+_POOL_DEVICE_COLORSPACES = frozenset({"/DeviceGray", "/DeviceRGB", "/DeviceCMYK"})
+_POOL_PIXMAP_COLORSPACES = ("DeviceGray", "DeviceRGB", "DeviceCMYK", "ICCBased(")
+# 크기 추정 때 실제로 재인코딩해 보는 이미지 수 / deflate 비율 표본 바이트
+ESTIMATE_SAMPLE_IMAGES = 6
+_ESTIMATE_DEFLATE_SAMPLE_BYTES = 2 * 1024 * 1024
+
+def _direct_image_bbox(page: Any, item: Any) -> Any | None:
+    """페이지에 직접 놓인 이미지의 bbox. get_image_rects 와 달리 이미지를 디코딩(MD5)하지 않는다."""
+    try:
+        if int(item[9] or 0) != 0:  # Form XObject 안의 이미지
+            return None
+        bbox = page.get_image_bbox(item)
+    except Exception:
+        return None
+    if bbox.is_infinite or bbox.is_empty:
+        return None
+    return bbox
+
+def _image_display_size_pt(
+    page: Any, xref: int, fallback_w: float, fallback_h: float, item: Any = None
+) -> tuple[float, float]:
     """페이지 위 이미지 표시 크기(포인트). 없으면 메타데이터 기반 폴백."""
     max_w = 0.0
     max_h = 0.0
-    try:
-        rects = page.get_image_rects(xref)
-    except Exception:
-        rects = None
+    bbox = _direct_image_bbox(page, item) if item is not None else None
+    if bbox is not None:
+        rects = [bbox]
+    else:
+        try:
+            rects = page.get_image_rects(xref)
+        except Exception:
+            rects = None
     if rects:
         for rect in rects:
             max_w = max(max_w, float(getattr(rect, "width", 0.0) or 0.0))
@@ -41,32 +69,113 @@ def _image_display_size_pt(page: Any, xref: int, fallback_w: float, fallback_h:
         max_h = max(fallback_h * 72.0 / 96.0, 1.0)
     return max_w, max_h
 
-def _target_scale(pix_w: int, pix_h: int, disp_w_pt: float, disp_h_pt: float, max_dpi: float) -> float:
-    """표시 크기 대비 현재 DPI가 max_dpi를 넘으면 축소 비율을 반환한다."""
-    if pix_w <= 0 or pix_h <= 0 or max_dpi <= 0:
-        return 1.0
-    dpi_x = pix_w / max(disp_w_pt / 72.0, 1e-6)
-    dpi_y = pix_h / max(disp_h_pt / 72.0, 1e-6)
-    dpi = max(dpi_x, dpi_y)
-    if dpi <= max_dpi:
-        return 1.0
-    return max(max_dpi / dpi, 0.05)
+def _dct_pool_ready(doc: Any, xref: int) -> bool:
+    """원본 DCT 스트림을 그대로 자식에 보내도 같은 픽셀로 디코딩되는지 (Decode 배열·특수 색공간 제외)."""
+    try:
+        if doc.xref_get_key(xref, "Filter") != ("name", "/DCTDecode"):
+            return False
+        if doc.xref_get_key(xref, "Decode")[0] != "null":
+            return False
+        cs_type, cs_value = doc.xref_get_key(xref, "ColorSpace")
+        if cs_type == "name":
+            return cs_value in _POOL_DEVICE_COLORSPACES
+        if cs_type == "xref":
+            return doc.xref_object(int(cs_value.split()[0])).lstrip("[ \n").startswith("/ICCBased")
+    except Exception:
+        return False
+    return False
+
 
-def optimize_pdf_images(
+def _reencode_on_main(doc: Any, xref: int, display: tuple[float, float], options: ReencodeOptions) -> bytes | None:
+    try:
+        pix = fitz.Pixmap(doc, xref)
+    except Exception as exc:
+        logger.debug("Skip image xref=%s open failed: %s", xref, exc)
+        return None
+    try:
+        if min(pix.width, pix.height) < options.min_edge_px:
+            return None
+        try:
+            original_stream = doc.xref_stream(xref)
+            original_len = len(original_stream) if original_stream else 0
+        except Exception:
+            original_len = 0
+        return reencode_pixmap(
+            pix, display_w=display[0], display_h=display[1], original_len=original_len, options=options
+        )
+    except Exception as exc:
+        logger.debug("Skip image xref=%s optimize failed: %s", xref, exc)
+        return None
+
+
+def _pool_job(
+    doc: Any,
+    xref: int,
+    display: tuple[float, float],
+    options: ReencodeOptions,
+    meta_size: tuple[float, float],
+) -> ImageReencodeJob | tuple[int, bytes | None]:
+    """메인 스레드: 자식에 보낼 작업. 보낼 수 없는 이미지는 여기서 처리해 (xref, 결과) 로 돌려준다."""
+    if 0 < min(meta_size) < options.min_edge_px:
+        return xref, None
+    if _dct_pool_ready(doc, xref):
+        try:
+            raw = doc.xref_stream_raw(xref)
+        except Exception:
+            raw = b""
+        if raw:
+            return ImageReencodeJob(xref, JOB_KIND_JPEG, raw, display[0], display[1], options)
+    try:
+        pix = fitz.Pixmap(doc, xref)
+    except Exception as exc:
+        logger.debug("Skip image xref=%s open failed: %s", xref, exc)
+        return xref, None
+    components = pix.n - pix.alpha
+    cs_name = str(getattr(pix.colorspace, "name", "") or "")
+    if (
+        components not in (1, 3, 4)
+        or not cs_name.startswith(_POOL_PIXMAP_COLORSPACES)
+        or min(pix.width, pix.height) < options.min_edge_px
+    ):
+        return xref, _reencode_on_main(doc, xref, display, options)
+    try:
+        original_stream = doc.xref_stream(xref)
+        original_len = len(original_stream) if original_stream else 0
+    except Exception:
+        original_len = 0
+    return ImageReencodeJob(
+        xref,
+        JOB_KIND_SAMPLES,
+        bytes(pix.samples),
+        display[0],
+        display[1],
+        options,
+        width=pix.width,
+        height=pix.height,
+        components=components,
+        alpha=bool(pix.alpha),
+        original_len=original_len,
+    )
+
+
+def _image_pool_size(candidates: int, workers: object) -> int:
+    # 일괄 압축 자식 프로세스 안에서는 풀을 중첩하지 않는다
+    if candidates < PARALLEL_MIN_IMAGES or multiprocessing.parent_process() is not None:
+        return 1
+    return resolve_pool_workers(candidates, workers)
+
+
+def _scan_image_placements(
     doc: Any,
     *,
-    max_dpi: float = 150.0,
-    jpeg_quality: int = 75,
-    grayscale: bool = False,
-    min_edge_px: int = 32,
     check_cancelled: Callable[[], None] | None = None,
-    progress_cb: Callable[[int, int], None] | None = None,
-) -> int:
-    """임베디드 이미지를 다운샘플·JPEG 재인코딩한다. 교체 횟수를 반환."""
+    on_page: Callable[[int], None] | None = None,
+) -> tuple[list[int], dict[int, tuple[float, float]], dict[int, tuple[float, float]]]:
+    """(재인코딩 대상 xref 목록, xref→최대 표시 크기(pt), xref→메타 픽셀 크기). SMask 는 제외."""
     # xref -> 문서 전체에서 가장 크게 쓰인 표시 크기
     placement_size: dict[int, tuple[float, float]] = {}
+    meta_sizes: dict[int, tuple[float, float]] = {}
     smask_xrefs: set[int] = set()
-    page_count = max(1, len(doc))
 
     for page_index in range(len(doc)):
         if check_cancelled is not None:
@@ -94,72 +203,238 @@ def optimize_pdf_images(
                 meta_h = float(img[3] or 0)
             except (TypeError, ValueError, IndexError):
                 meta_w, meta_h = 0.0, 0.0
+            meta_sizes[xref] = (meta_w, meta_h)
 
-            disp_w, disp_h = _image_display_size_pt(page, xref, meta_w, meta_h)
+            disp_w, disp_h = _image_display_size_pt(page, xref, meta_w, meta_h, img)
             prev_w, prev_h = placement_size.get(xref, (0.0, 0.0))
             placement_size[xref] = (max(prev_w, disp_w), max(prev_h, disp_h))
 
+        if on_page is not None:
+            on_page(page_index)
+
+    xrefs = [xref for xref in sorted(placement_size) if xref not in smask_xrefs]
+    return xrefs, placement_size, meta_sizes
+
+
+def optimize_pdf_images(
+    doc: Any,
+    *,
+    max_dpi: float = 150.0,
+    jpeg_quality: int = 75,
+    grayscale: bool = False,
+    min_edge_px: int = 32,
+    check_cancelled: Callable[[], None] | None = None,
+    progress_cb: Callable[[int, int], None] | None = None,
+    workers: object = None,
+) -> int:
+    """임베디드 이미지를 다운샘플·JPEG 재인코딩한다. 교체 횟수를 반환.
+
+    이미지가 많으면 디코딩·축소·인코딩을 프로세스 풀에 나누고, replace_image 는 현 스레드에서
+    xref 순서대로 적용한다 (직렬 경로와 같은 결과). 풀을 못 쓰거나 깨지면 남은 이미지는 직렬로.
+    """
+    page_count = max(1, len(doc))
+
+    def _on_page(page_index: int) -> None:
         if progress_cb is not None:
             progress_cb(page_index + 1, page_count * 2)  # 스캔 단계: 0~50%
 
-    replaced = 0
-    xrefs = sorted(placement_size.keys())
+    xrefs, placement_size, meta_sizes = _scan_image_placements(
+        doc, check_cancelled=check_cancelled, on_page=_on_page
+    )
+    options = ReencodeOptions(
+        max_dpi=float(max_dpi),
+        jpeg_quality=int(jpeg_quality),
+        grayscale=bool(grayscale),
+        min_edge_px=int(min_edge_px),
+    )
     total_xrefs = max(1, len(xrefs))
+    done = 0
+    replaced = 0
+
+    def _apply(xref: int, jpeg_bytes: bytes | None) -> None:
+        nonlocal done, replaced
+        if jpeg_bytes is not None:
+            try:
+                # 교체는 아무 페이지에서나 xref 기준으로 가능
+                doc[0].replace_image(xref, stream=jpeg_bytes)
+                replaced += 1
+            except Exception as exc:
+                logger.debug("Skip image xref=%s replace failed: %s", xref, exc)
+        done += 1
+        if progress_cb is not None:
+            progress_cb(page_count + done, page_count + total_xrefs)
 
-    for idx, xref in enumerate(xrefs):
+    pool_size = _image_pool_size(len(xrefs), workers)
+    if pool_size > 1:
+        executor = None
+        terminate = True
+        try:
+            executor = create_process_pool(pool_size)
+            jobs = (
+                _pool_job(doc, xref, placement_size[xref], options, meta_sizes.get(xref, (0.0, 0.0)))
+                for xref in xrefs
+            )
+            for xref, jpeg_bytes in iter_pool_reencode(
+                executor, jobs, max_in_flight=pool_size * 2, check_cancelled=check_cancelled
+            ):
+                _apply(xref, jpeg_bytes)
+            terminate = False
+        except BrokenProcessPool:
+            logger.warning("Image re-encode pool broke; %d image(s) left for serial pass", len(xrefs) - done)
+        except Exception as exc:
+            from ...worker_runtime.errors import CancelledError
+
+            if isinstance(exc, CancelledError):
+                raise
+            logger.warning("Image re-encode pool failed; finishing serially", exc_info=True)
+        finally:
+            shutdown_process_pool(executor, terminate=terminate)
+
+    for xref in xrefs[done:]:
         if check_cancelled is not None:
             check_cancelled()
-        if xref in smask_xrefs:
-            continue
+        _apply(xref, _reencode_on_main(doc, xref, placement_size[xref], options))
+
+    return replaced
+
+def _sample_evenly(items: list[int], limit: int) -> list[int]:
+    if len(items) <= limit:
+        return list(items)
+    return [items[(index * len(items)) // limit] for index in range(limit)]
+
 
+def _deflate_ratio(doc: Any, xrefs: list[int]) -> float:
+    """필터 없는 스트림 표본의 deflate 후/전 비율."""
+    before = after = 0
+    for xref in xrefs:
         try:
-            pix = fitz.Pixmap(doc, xref)
-        except Exception as exc:
-            logger.debug("Skip image xref=%s open failed: %s", xref, exc)
+            data = doc.xref_stream_raw(xref) or b""
+        except Exception:
             continue
+        before += len(data)
+        after += len(zlib.compress(data, 6))
+        if before >= _ESTIMATE_DEFLATE_SAMPLE_BYTES:
+            break
+    return (after / before) if before else 1.0
 
+
+def _profile_reencode_options(profile_name: str) -> ReencodeOptions | None:
+    optimize = IMAGE_OPTIMIZE_PROFILES.get(profile_name, {})
+    if not optimize.get("optimize_images"):
+        return None
+    return ReencodeOptions(
+        max_dpi=float(optimize.get("max_dpi") or 150.0),
+        jpeg_quality=int(optimize.get("jpeg_quality") or 75),
+        grayscale=bool(optimize.get("grayscale")),
+    )
+
+
+def _sample_reencode_ratios(
+    doc: Any,
+    samples: list[int],
+    lengths: dict[int, int],
+    placement_size: dict[int, tuple[float, float]],
+    option_sets: list[ReencodeOptions],
+    check_cancelled: Callable[[], None] | None,
+) -> dict[ReencodeOptions, float]:
+    """설정별 표본 (재인코딩 후 / 원본) 바이트 비율. 표본 이미지는 한 번만 디코딩한다."""
+    before = 0
+    after = dict.fromkeys(option_sets, 0)
+    for xref in samples:
+        if check_cancelled is not None:
+            check_cancelled()
+        length = lengths[xref]
+        before += length
         try:
-            if min(pix.width, pix.height) < min_edge_px:
-                continue
+            pix = fitz.Pixmap(doc, xref)
+            decoded_len = len(doc.xref_stream(xref) or b"")
+        except Exception:
+            pix = None
+        for options in option_sets:
+            encoded = None
+            if pix is not None:
+                try:
+                    display_w, display_h = placement_size[xref]
+                    encoded = reencode_pixmap(
+                        pix, display_w=display_w, display_h=display_h, original_len=decoded_len, options=options
+                    )
+                except Exception:
+                    encoded = None
+            after[options] += len(encoded) if encoded is not None else length
+    return {options: (total / before) if before else 1.0 for options, total in after.items()}
 
-            try:
-                original_stream = doc.xref_stream(xref)
-                original_len = len(original_stream) if original_stream else 0
-            except Exception:
-                original_len = 0
-
-            work = _pixmap_for_reencode(pix, grayscale=grayscale)
-            disp_w, disp_h = placement_size.get(xref, (float(work.width), float(work.height)))
-            scale = _target_scale(work.width, work.height, disp_w, disp_h, float(max_dpi))
-            if scale < 0.99:
-                new_w = max(1, int(work.width * scale))
-                new_h = max(1, int(work.height * scale))
-                if new_w < work.width or new_h < work.height:
-                    work = fitz.Pixmap(work, new_w, new_h, None)
-                    work = _pixmap_for_reencode(work, grayscale=False)
-
-            quality = max(1, min(95, int(jpeg_quality)))
-            try:
-                jpeg_bytes = work.tobytes("jpeg", jpg_quality=quality)
-            except Exception as exc:
-                logger.debug("Skip image xref=%s jpeg encode failed: %s", xref, exc)
-                continue
 
-            # 용량 이득이 거의 없으면 유지 (품질 손실 방지)
-            if original_len and len(jpeg_bytes) >= int(original_len * 0.98) and scale >= 0.99 and not grayscale:
+def estimate_optimized_sizes(
+    doc: Any,
+    *,
+    original_size: int,
+    sample_images: int = ESTIMATE_SAMPLE_IMAGES,
+    check_cancelled: Callable[[], None] | None = None,
+) -> dict[str, int]:
+    """저장 프로필별 압축 결과 크기 추정 (바이트).
+
+    이미지 xref 를 크기 순으로 고르게 sample_images 개만 골라 각 프로필의 IMAGE_OPTIMIZE_PROFILES
+    설정으로 실제 재인코딩해 보고, 표본의 (새 크기 / 원본 크기) 비율을 전체 이미지 바이트에 적용한다.
+    중복 병합(dedupe_streams)은 실제와 같은 판정으로 빠질 사본을 계산에서 뺀다. 이미지 외 부분은
+    필터 없는 스트림의 deflate 비율만 반영한다 — 폰트 서브셋 이득은 빠져 있어 보수적인 값이다.
+    """
+    xrefs, placement_size, _meta_sizes = _scan_image_placements(doc, check_cancelled=check_cancelled)
+    duplicates: dict[int, int] = {}
+    if any(profile.get("dedupe_streams") for profile in IMAGE_OPTIMIZE_PROFILES.values()):
+        duplicates, _stats = find_duplicate_streams(doc, check_cancelled=check_cancelled)
+
+    lengths: dict[int, int] = {}
+    unfiltered: set[int] = set()
+    image_streams: set[int] = set(xrefs)
+    for xref in range(1, doc.xref_length()):
+        try:
+            if not doc.xref_is_stream(xref):
                 continue
+            lengths[xref] = _stream_length(doc, xref)
+            if doc.xref_get_key(xref, "Filter")[0] == "null":
+                unfiltered.add(xref)
+            if doc.xref_get_key(xref, "Subtype") == ("name", "/Image"):
+                image_streams.add(xref)
+        except Exception:
+            continue
+    for xref in xrefs:
+        lengths.setdefault(xref, 0)
 
-            # 교체는 아무 페이지에서나 xref 기준으로 가능
-            page0 = doc[0]
-            page0.replace_image(xref, stream=jpeg_bytes)
-            replaced += 1
-        except Exception as exc:
-            logger.debug("Skip image xref=%s optimize failed: %s", xref, exc)
-        finally:
-            if progress_cb is not None:
-                progress_cb(page_count + idx + 1, page_count + total_xrefs)
+    other_unfiltered = [xref for xref in sorted(unfiltered) if xref not in image_streams]
+    deflate_ratio = _deflate_ratio(doc, _sample_evenly(other_unfiltered, 64))
+    ranked = sorted(xrefs, key=lambda xref: (-lengths[xref], xref))
+    option_sets = list(dict.fromkeys(filter(None, (_profile_reencode_options(name) for name in SAVE_PROFILES))))
+    ratios: dict[ReencodeOptions, float] = {}
+
+    estimates: dict[str, int] = {}
+    for profile_name, save_kwargs in SAVE_PROFILES.items():
+        optimize = IMAGE_OPTIMIZE_PROFILES.get(profile_name, {})
+        dropped = duplicates if optimize.get("dedupe_streams") else {}
+        kept_images = [xref for xref in xrefs if xref not in dropped]
+        image_total = sum(lengths[xref] for xref in kept_images)
+        other_total = max(
+            0,
+            int(original_size)
+            - sum(lengths[xref] for xref in xrefs)
+            - sum(lengths.get(xref, 0) for xref in dropped if xref not in placement_size),
+        )
+        options = _profile_reencode_options(profile_name)
+        images_after = float(image_total)
+        if options is not None and kept_images:
+            if not ratios:
+                samples = _sample_evenly([xref for xref in ranked if xref not in duplicates], max(1, int(sample_images)))
+                ratios = _sample_reencode_ratios(doc, samples, lengths, placement_size, option_sets, check_cancelled)
+            images_after = image_total * ratios[options]
+        elif save_kwargs.get("deflate_images"):
+            raw_images = sum(lengths[xref] for xref in kept_images if xref in unfiltered)
+            images_after -= raw_images * (1.0 - deflate_ratio)
+        other_after = float(other_total)
+        if save_kwargs.get("deflate"):
+            raw_other = sum(lengths[xref] for xref in other_unfiltered if xref not in dropped)
+            other_after -= min(other_total, raw_other) * (1.0 - deflate_ratio)
+        estimates[profile_name] = max(0, int(round(other_after + images_after)))
+    return estimates
 
-    return replaced
 
 def subset_document_fonts(doc: Any) -> bool:
     """사용 글리프만 남기도록 폰트 서브셋을 시도한다. 성공 여부 반환."""
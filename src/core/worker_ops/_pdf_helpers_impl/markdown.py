@@ -8,11 +8,14 @@ import os
 from collections.abc import Callable
 from typing import Any, cast
 from ...optional_deps import fitz
+from ...perf import perf_sample
 from ...worker_runtime.args import _as_str
 logger = logging.getLogger(__name__)
 
-def _fallback_markdown_from_text(page: Any) -> str:
-    text = _as_str(page.get_text("text"))
+def _fallback_markdown_from_text(page: Any, text: str | None = None) -> str:
+    """평문을 문단 Markdown 으로. 캐시된 페이지 텍스트가 있으면 text 로 넘긴다."""
+    if text is None:
+        text = _as_str(page.get_text("text"))
     page_chunks: list[str] = []
     for line in text.split("\n"):
         stripped = line.strip()
@@ -30,14 +33,29 @@ def _extract_native_markdown(page: Any) -> str:
             return extracted.strip()
     return ""
 
-def _extract_page_markdown(page: Any, markdown_mode: str) -> str:
+def _extract_page_markdown(
+    page: Any,
+    markdown_mode: str,
+    *,
+    page_text: Callable[[], str] | None = None,
+) -> str:
+    """page_text: 평문 폴백에 쓸 텍스트 공급자 (텍스트 레이어 캐시)."""
+    with perf_sample("page.get_text"):
+        return _extract_page_markdown_impl(page, markdown_mode, page_text)
+
+
+def _extract_page_markdown_impl(
+    page: Any,
+    markdown_mode: str,
+    page_text: Callable[[], str] | None = None,
+) -> str:
     if markdown_mode in {"auto", "native"}:
         native_markdown = _extract_native_markdown(page)
         if native_markdown:
             return native_markdown
         if markdown_mode == "native":
             raise RuntimeError("Native Markdown extraction is not available for this document/runtime.")
-    return _fallback_markdown_from_text(page)
+    return _fallback_markdown_from_text(page, page_text() if page_text is not None else None)
 
 def _page_asset_placeholders(page: Any) -> list[str]:
     placeholders: list[str] = []
@@ -0,0 +1,177 @@
+"""PDF helpers: page_fingerprint.
+
+페이지 단위 저비용 지문 — 정규화 텍스트 해시, 텍스트 SimHash, 저해상도 dHash/pHash.
+비교 페이지 정렬(compare)과 유사 페이지 탐지(cleanup)가 공용으로 사용한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from ...optional_deps import fitz, np
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+# dHash 렌더 배율 — 내용 해석 비용이 지배적이므로 작게 유지
+_DHASH_RENDER_ZOOM = 0.1
+_HASH_BITS = 64
+# pHash — 32x32 회색조의 저주파 8x8 DCT 계수
+_PHASH_SIZE = 32
+_PHASH_LOW = 8
+
+
+def normalize_page_text(text: object) -> str:
+    return " ".join(str(text or "").split()).casefold()
+
+
+def text_digest(normalized_text: str) -> str:
+    if not normalized_text:
+        return ""
+    return hashlib.sha1(normalized_text.encode("utf-8", errors="ignore")).hexdigest()
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8", errors="ignore"), digest_size=8).digest(), "big")
+
+
+def _text_features(normalized_text: str) -> list[str]:
+    words = _WORD_RE.findall(normalized_text)
+    features: list[str] = []
+    for word in words:
+        # 공백 없는 CJK 문장은 한 단어로 묶이므로 bigram 으로 분해한다.
+        if len(word) > 4 and not word.isascii():
+            features.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            features.append(word)
+    return features
+
+
+def simhash64(normalized_text: str) -> int:
+    """정규화 텍스트의 64-bit SimHash (빈 텍스트는 0)."""
+    features = _text_features(normalized_text)
+    if not features:
+        return 0
+    weights = [0] * _HASH_BITS
+    for feature, count in Counter(features).items():
+        value = _token_hash(feature)
+        for bit in range(_HASH_BITS):
+            weights[bit] += count if (value >> bit) & 1 else -count
+    result = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            result |= 1 << bit
+    return result
+
+
+def _gray_thumbnail(page: Any) -> Any:
+    zoom = _DHASH_RENDER_ZOOM
+    short_side = min(float(page.rect.width), float(page.rect.height))
+    if short_side > 0:
+        # pHash 축소 전 원본이 32px 보다 작아지지 않게
+        zoom = max(zoom, (_PHASH_SIZE + 1) / short_side)
+    return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
+
+
+def _resized_rows(pix: Any, width: int, height: int) -> list[bytes]:
+    if pix.width != width or pix.height != height:
+        pix = fitz.Pixmap(pix, width, height, None)
+    samples = pix.samples
+    stride = int(getattr(pix, "stride", width) or width)
+    return [bytes(samples[y * stride : y * stride + width]) for y in range(height)]
+
+
+def _dhash_from_pixmap(pix: Any, hash_size: int) -> int:
+    rows = _resized_rows(pix, hash_size + 1, hash_size)
+    result = 0
+    bit = 0
+    for row in rows:
+        for x in range(hash_size):
+            if row[x] > row[x + 1]:
+                result |= 1 << bit
+            bit += 1
+    return result
+
+
+def _dct_basis() -> list[list[float]]:
+    n = _PHASH_SIZE
+    return [[math.cos(math.pi * (2 * i + 1) * k / (2 * n)) for i in range(n)] for k in range(_PHASH_LOW)]
+
+
+_DCT_BASIS = _dct_basis()
+
+
+def _phash_from_pixmap(pix: Any) -> int:
+    rows = _resized_rows(pix, _PHASH_SIZE, _PHASH_SIZE)
+    if np is not None:
+        basis = np.asarray(_DCT_BASIS, dtype=np.float64)
+        image = np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(_PHASH_SIZE, _PHASH_SIZE)
+        coeffs = (basis @ image @ basis.T).ravel().tolist()
+    else:
+        # 분리형 DCT — 행마다 저주파 8개만 구한 뒤 열 방향으로 8개
+        row_coeffs = [[sum(b * v for b, v in zip(basis_row, row)) for basis_row in _DCT_BASIS] for row in rows]
+        coeffs = [
+            sum(_DCT_BASIS[k][y] * row_coeffs[y][u] for y in range(_PHASH_SIZE))
+            for k in range(_PHASH_LOW)
+            for u in range(_PHASH_LOW)
+        ]
+    # DC(평균 밝기)는 중앙값 계산에서 뺀다
+    median = sorted(coeffs[1:])[(len(coeffs) - 1) // 2]
+    result = 0
+    for bit, value in enumerate(coeffs):
+        if value > median:
+            result |= 1 << bit
+    return result
+
+
+def dhash64(page: Any, *, hash_size: int = 8) -> int:
+    """저해상도 grayscale 렌더 기반 difference hash (hash_size² bit)."""
+    pix = page.get_pixmap(matrix=fitz.Matrix(_DHASH_RENDER_ZOOM, _DHASH_RENDER_ZOOM), colorspace=fitz.csGRAY, alpha=False)
+    return _dhash_from_pixmap(pix, hash_size)
+
+
+def visual_hashes64(page: Any) -> tuple[int, int]:
+    """렌더 한 번으로 (dHash, pHash). pHash 는 NumPy 가 있으면 행렬곱 DCT."""
+    pix = _gray_thumbnail(page)
+    return _dhash_from_pixmap(pix, 8), _phash_from_pixmap(pix)
+
+
+def hamming64(left: int, right: int) -> int:
+    return (int(left) ^ int(right)).bit_count()
+
+
+@dataclass(slots=True)
+class PageFingerprint:
+    index: int
+    text: str
+    text_hash: str
+    simhash: int
+    dhash: int | None = None
+
+    @property
+    def has_text(self) -> bool:
+        return bool(self.text_hash)
+
+
+def page_fingerprint(page: Any, index: int, *, raw_text: str | None = None, with_dhash: bool = False) -> PageFingerprint:
+    """페이지 지문을 만든다. dHash 는 요청 시(또는 텍스트가 없을 때)만 렌더한다."""
+    text = raw_text if isinstance(raw_text, str) else str(page.get_text() or "")
+    normalized = normalize_page_text(text)
+    fingerprint = PageFingerprint(
+        index=index,
+        text=text,
+        text_hash=text_digest(normalized),
+        simhash=simhash64(normalized),
+    )
+    if with_dhash or not fingerprint.has_text:
+        try:
+            fingerprint.dhash = dhash64(page)
+        except Exception as exc:
+            # 지문은 보조 정보 — 렌더 실패는 비교/정리 본 처리에서 다시 드러난다.
+            logger.debug("dhash render failed page %s: %s", index, exc)
+    return fingerprint
@@ -0,0 +1,105 @@
+"""PDF helpers: page_subset.
+
+페이지 부분집합 출력(빈/중복 페이지 제거, 순서 변경, 범위 추출) 공용 복사기.
+연속 구간(오름차순·내림차순)을 `insert_pdf` 한 번으로 묶고, 마지막 호출 전까지 `final=False` 로
+graft map 을 유지해 공유 리소스(폰트·이미지 XObject)를 구간마다 다시 복사하지 않는다.
+같은 페이지가 다시 나오면 그 앞에서 graft map 을 닫는다 — 하나의 map 으로 두 번 복사하면 주석·위젯
+객체(/P 포함)까지 두 페이지가 공유하게 된다.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+from ...optional_deps import fitz
+
+# 구간 하나를 이 크기로 나눠 복사한다 (취소·진행률 응답성 — graft map 은 계속 공유)
+_MAX_RUN_PAGES = 200
+
+
+def coalesce_page_runs(indices: Sequence[int]) -> list[tuple[int, int]]:
+    """페이지 목록을 (from_page, to_page) 구간으로 묶는다. from > to 는 역순 구간."""
+    runs: list[tuple[int, int]] = []
+    start = prev = None
+    step = 0
+    for index in indices:
+        index = int(index)
+        if start is None:
+            start = prev = index
+            continue
+        assert prev is not None
+        delta = index - prev
+        if delta in (1, -1) and (step == 0 or delta == step):
+            step = delta
+            prev = index
+            continue
+        runs.append((start, prev))
+        start = prev = index
+        step = 0
+    if start is not None:
+        assert prev is not None
+        runs.append((start, prev))
+    return runs
+
+
+def _run_pages(run: tuple[int, int]) -> range:
+    start, end = run
+    return range(min(start, end), max(start, end) + 1)
+
+
+def _graft_map_breaks(runs: list[tuple[int, int]]) -> list[bool]:
+    """구간마다 insert_pdf 의 final 값. 마지막 구간과, 다음 구간이 현재 map 으로 복사한 페이지를 다시 쓰는 구간."""
+    finals: list[bool] = []
+    grafted: set[int] = set()
+    for run_index, run in enumerate(runs):
+        grafted.update(_run_pages(run))
+        following = runs[run_index + 1] if run_index + 1 < len(runs) else None
+        repeats = following is not None and any(index in grafted for index in _run_pages(following))
+        finals.append(following is None or repeats)
+        if repeats:
+            grafted = set()
+    return finals
+
+
+def copy_page_subset(
+    target: Any,
+    source: Any,
+    indices: Sequence[int],
+    *,
+    check_cancelled: Callable[[], None] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """source 의 indices 페이지를 순서대로 target 끝에 복사하고 복사한 페이지 수를 돌려준다."""
+    runs: list[tuple[int, int]] = []
+    for start, end in coalesce_page_runs(indices):
+        step = 1 if end >= start else -1
+        for chunk_start in range(start, end + step, step * _MAX_RUN_PAGES):
+            chunk_end = chunk_start + step * (_MAX_RUN_PAGES - 1)
+            runs.append((chunk_start, min(chunk_end, end) if step > 0 else max(chunk_end, end)))
+    finals = _graft_map_breaks(runs)
+    total = sum(abs(end - start) + 1 for start, end in runs)
+    copied = 0
+    for run_index, (start, end) in enumerate(runs):
+        if check_cancelled is not None:
+            check_cancelled()
+        target.insert_pdf(source, from_page=start, to_page=end, final=finals[run_index])
+        copied += abs(end - start) + 1
+        if on_progress is not None:
+            on_progress(copied, total)
+    return copied
+
+
+def build_page_subset(
+    source: Any,
+    indices: Sequence[int],
+    *,
+    check_cancelled: Callable[[], None] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> Any:
+    """indices 페이지만 담은 새 문서 (호출 측이 닫는다)."""
+    out = fitz.open()
+    try:
+        copy_page_subset(out, source, indices, check_cancelled=check_cancelled, on_progress=on_progress)
+    except BaseException:
+        out.close()
+        raise
+    return out
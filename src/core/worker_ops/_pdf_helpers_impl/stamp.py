@@ -0,0 +1,97 @@
+"""PDF helpers: stamp.
+
+워터마크·배경 공용 스탬프 엔진. 텍스트/이미지/타일 패턴을 임시 문서의 페이지에 한 번만 그리고,
+대상 페이지에는 `show_pdf_page` 로 그 페이지를 Form XObject 로 참조한다. PyMuPDF 는 같은 원본
+페이지를 대상 문서에 한 번만 복사하고(`doc.ShownPages`) 페이지마다 위치 행렬만 담은 얇은 래퍼를
+추가하므로, 페이지 수가 늘어도 글꼴·이미지·타일 텍스트는 한 벌만 저장된다.
+페이지 크기가 다르면 크기별로 한 쪽짜리 스탬프 문서를 따로 만든다 — graft map 은 첫 사용 시점의
+원본 객체 수로 고정되므로 이미 참조한 스탬프 문서에 페이지를 추가하면 안 된다.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from ...optional_deps import fitz
+
+# (스탬프 페이지) -> 무언가 그렸는지. False 면 해당 크기에는 스탬프를 붙이지 않는다.
+StampPainter = Callable[[Any], bool | None]
+
+
+def _size_key(width: float, height: float) -> tuple[float, float]:
+    return (round(float(width), 2), round(float(height), 2))
+
+
+class PageStamper:
+    """크기별 스탬프 페이지를 지연 생성해 여러 페이지에 재사용한다 (with 문으로 닫는다)."""
+
+    __slots__ = ("_painter", "_overlay", "_stamps")
+
+    def __init__(self, painter: StampPainter, *, overlay: bool = True) -> None:
+        self._painter = painter
+        self._overlay = bool(overlay)
+        self._stamps: dict[tuple[float, float], Any] = {}
+
+    def __enter__(self) -> "PageStamper":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        stamps, self._stamps = self._stamps, {}
+        for stamp in stamps.values():
+            if stamp is not None:
+                stamp.close()
+
+    @property
+    def stamp_count(self) -> int:
+        return sum(1 for stamp in self._stamps.values() if stamp is not None)
+
+    def _stamp_doc(self, width: float, height: float) -> Any:
+        key = _size_key(width, height)
+        if key in self._stamps:
+            return self._stamps[key]
+        stamp = fitz.open()
+        try:
+            drew = self._painter(stamp.new_page(width=key[0], height=key[1]))
+        except BaseException:
+            stamp.close()
+            raise
+        if drew is False:
+            stamp.close()
+            stamp = None
+        self._stamps[key] = stamp
+        return stamp
+
+    def apply(self, page: Any, rect: Any = None) -> bool:
+        """page 의 rect(기본: 페이지 전체)에 스탬프를 붙인다. 그린 것이 없으면 False."""
+        target = page.rect if rect is None else fitz.Rect(rect)
+        if target.is_empty:
+            return False
+        stamp = self._stamp_doc(target.width, target.height)
+        if stamp is None:
+            return False
+        page.show_pdf_page(target, stamp, 0, overlay=self._overlay)
+        return True
+
+
+def stamp_document(
+    doc: Any,
+    painter: StampPainter,
+    *,
+    overlay: bool = True,
+    check_cancelled: Callable[[], None] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """모든 페이지에 전체 크기 스탬프를 붙이고 스탬프가 붙은 페이지 수를 돌려준다."""
+    total = len(doc)
+    stamped = 0
+    with PageStamper(painter, overlay=overlay) as stamper:
+        for index in range(total):
+            if check_cancelled is not None:
+                check_cancelled()
+            if stamper.apply(doc[index]):
+                stamped += 1
+            if on_progress is not None:
+                on_progress(index + 1, total)
+    return stamped
@@ -0,0 +1,203 @@
+"""PDF helpers: stream_dedupe.
+
+병합된 PDF 에 xref 만 다르게 반복 임베드된 이미지·폰트 프로그램을 하나로 합친다.
+garbage=4 는 원시(압축된) 바이트가 같은 스트림만 합치므로, 압축 방식·색공간 객체가 다른 같은
+로고·폰트는 남는다. 여기서는 디코딩된 내용 + 참조를 재귀적으로 정규화한 사전으로 동일성을 판단하고,
+가장 작게 인코딩된 사본 하나로 참조를 모은 뒤 나머지 객체를 지운다 (garbage 없이 저장해도 빠진다).
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# 이 필터의 스트림은 원시 바이트로 비교한다 (디코딩 비용이 크고, 재압축 변형이 드물다)
+_IMAGE_CODECS = ("/DCTDecode", "/JPXDecode", "/JBIG2Decode", "/CCITTFaxDecode")
+_FONT_FILE_KEYS = ("FontFile", "FontFile2", "FontFile3")
+# 디코딩된 내용으로 비교할 때 무시하는 인코딩 키
+_ENCODING_KEYS = frozenset({"Length", "Filter", "DecodeParms", "DL"})
+_SKIP_TYPES = frozenset({"/XRef", "/ObjStm"})
+_REF_RE = re.compile(r"\b(\d+) (\d+) R\b")
+# MuPDF 는 문자열 안의 괄호를 항상 이스케이프해 출력한다
+_LITERAL_STRING_RE = re.compile(r"\((?:\\.|[^\\()])*\)")
+
+
+@dataclass(frozen=True, slots=True)
+class StreamDedupeStats:
+    images_merged: int = 0
+    fonts_merged: int = 0
+    bytes_saved: int = 0
+
+    def to_payload(self) -> dict[str, int]:
+        return {
+            "dedupe_images_merged": self.images_merged,
+            "dedupe_fonts_merged": self.fonts_merged,
+            "dedupe_bytes_saved": self.bytes_saved,
+        }
+
+
+def _outside_strings(text: str, transform: Callable[[str], str]) -> str:
+    parts: list[str] = []
+    pos = 0
+    for match in _LITERAL_STRING_RE.finditer(text):
+        parts.append(transform(text[pos : match.start()]))
+        parts.append(match.group(0))
+        pos = match.end()
+    parts.append(transform(text[pos:]))
+    return "".join(parts)
+
+
+class _ObjectIdentity:
+    """xref → 내용 해시. 참조는 대상의 해시로 바꿔 넣어 동등한 객체 그래프가 같은 값을 갖는다."""
+
+    def __init__(self, doc: Any) -> None:
+        self._doc = doc
+        self._memo: dict[int, str] = {}
+        self._active: set[int] = set()
+
+    def of(self, xref: int) -> str:
+        digest = self._memo.get(xref)
+        if digest is not None:
+            return digest
+        if xref in self._active:
+            return f"#{xref}"  # 순환 참조 — 병합 대상에서 빠지도록 xref 자체를 쓴다
+        self._active.add(xref)
+        try:
+            digest = self._compute(xref)
+        except Exception:
+            logger.debug("Object identity failed xref=%s", xref, exc_info=True)
+            digest = f"#{xref}"
+        finally:
+            self._active.discard(xref)
+        self._memo[xref] = digest
+        return digest
+
+    def _canonical_refs(self, text: str) -> str:
+        return _outside_strings(text, lambda chunk: _REF_RE.sub(lambda m: "@" + self.of(int(m.group(1))), chunk))
+
+    def _compute(self, xref: int) -> str:
+        doc = self._doc
+        hasher = hashlib.sha256()
+        if not doc.xref_is_stream(xref):
+            hasher.update(self._canonical_refs(doc.xref_object(xref, compressed=True)).encode("utf-8"))
+            return hasher.hexdigest()
+
+        filters = doc.xref_get_key(xref, "Filter")[1]
+        raw_codec = any(codec in filters for codec in _IMAGE_CODECS)
+        for key in sorted(doc.xref_get_keys(xref)):
+            if key == "Length" or (key in _ENCODING_KEYS and not raw_codec):
+                continue
+            kind, value = doc.xref_get_key(xref, key)
+            if kind == "xref":
+                value = "@" + self.of(int(value.split()[0]))
+            elif kind in ("dict", "array"):
+                value = self._canonical_refs(value)
+            hasher.update(f"/{key} {kind} {value}\n".encode("utf-8"))
+        data = doc.xref_stream_raw(xref) if raw_codec else doc.xref_stream(xref)
+        hasher.update(b"stream\n")
+        hasher.update(data or b"")
+        return hasher.hexdigest()
+
+
+def _stream_length(doc: Any, xref: int) -> int:
+    kind, value = doc.xref_get_key(xref, "Length")
+    if kind == "int":
+        return int(value)
+    return len(doc.xref_stream_raw(xref) or b"")
+
+
+def _dedupe_candidates(doc: Any, check_cancelled: Callable[[], None] | None) -> dict[int, str]:
+    """xref → "image" | "font" (이미지 XObject 스트림, FontDescriptor 가 가리키는 폰트 프로그램)."""
+    candidates: dict[int, str] = {}
+    for xref in range(1, doc.xref_length()):
+        if check_cancelled is not None and xref % 256 == 0:
+            check_cancelled()
+        try:
+            if doc.xref_is_stream(xref):
+                if doc.xref_get_key(xref, "Subtype") == ("name", "/Image"):
+                    candidates[xref] = "image"
+                continue
+            if doc.xref_get_key(xref, "Type") != ("name", "/FontDescriptor"):
+                continue
+            for key in _FONT_FILE_KEYS:
+                kind, value = doc.xref_get_key(xref, key)
+                if kind == "xref":
+                    candidates.setdefault(int(value.split()[0]), "font")
+        except Exception:
+            logger.debug("Skip dedupe scan xref=%s", xref, exc_info=True)
+    return candidates
+
+
+def _rewrite_references(doc: Any, mapping: dict[int, int], check_cancelled: Callable[[], None] | None) -> None:
+    def _remap(chunk: str) -> str:
+        def _sub(match: re.Match[str]) -> str:
+            target = mapping.get(int(match.group(1)))
+            return match.group(0) if target is None else f"{target} 0 R"
+
+        return _REF_RE.sub(_sub, chunk)
+
+    for xref in range(1, doc.xref_length()):
+        if check_cancelled is not None and xref % 256 == 0:
+            check_cancelled()
+        if xref in mapping:
+            continue
+        try:
+            if doc.xref_get_key(xref, "Type")[1] in _SKIP_TYPES:
+                continue
+            source = doc.xref_object(xref)
+        except Exception:
+            continue
+        rewritten = _outside_strings(source, _remap)
+        if rewritten != source:
+            doc.update_object(xref, rewritten)
+
+
+def find_duplicate_streams(
+    doc: Any, *, check_cancelled: Callable[[], None] | None = None
+) -> tuple[dict[int, int], StreamDedupeStats]:
+    """(중복 xref → 남길 xref, 예상 통계). 문서는 바꾸지 않는다 (압축 크기 추정에도 사용)."""
+    if not getattr(doc, "is_pdf", True):
+        return {}, StreamDedupeStats()
+    candidates = _dedupe_candidates(doc, check_cancelled)
+    identity = _ObjectIdentity(doc)
+    groups: dict[tuple[str, str], list[int]] = {}
+    for xref, kind in candidates.items():
+        if check_cancelled is not None:
+            check_cancelled()
+        digest = identity.of(xref)
+        if not digest.startswith("#"):
+            groups.setdefault((kind, digest), []).append(xref)
+
+    mapping: dict[int, int] = {}
+    merged = {"image": 0, "font": 0}
+    bytes_saved = 0
+    for (kind, _digest), xrefs in groups.items():
+        if len(xrefs) < 2:
+            continue
+        sized = sorted((_stream_length(doc, xref), xref) for xref in xrefs)
+        canonical = sized[0][1]
+        for length, xref in sized[1:]:
+            mapping[xref] = canonical
+            merged[kind] += 1
+            bytes_saved += length
+    return mapping, StreamDedupeStats(
+        images_merged=merged["image"], fonts_merged=merged["font"], bytes_saved=bytes_saved
+    )
+
+
+def dedupe_document_streams(doc: Any, *, check_cancelled: Callable[[], None] | None = None) -> StreamDedupeStats:
+    """내용이 같은 이미지·폰트 프로그램 스트림을 가장 작은 사본 하나로 합친다."""
+    mapping, stats = find_duplicate_streams(doc, check_cancelled=check_cancelled)
+    if not mapping:
+        return stats
+    _rewrite_references(doc, mapping, check_cancelled)
+    for xref in mapping:
+        doc.update_object(xref, "null")
+    return stats
+
+
+__all__ = ["StreamDedupeStats", "dedupe_document_streams", "find_duplicate_streams"]
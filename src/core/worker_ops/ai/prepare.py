@@ -113,7 +113,7 @@ class WorkerAiPrepareMixin(WorkerHost):
             logger.warning("AI temp orphan sweep failed", exc_info=True)
 
     def _reraise_if_cancelled(self, exc: BaseException) -> None:
-        from ...worker import CancelledError
+        from ...worker_runtime.errors import CancelledError
 
         if isinstance(exc, CancelledError):
             raise exc
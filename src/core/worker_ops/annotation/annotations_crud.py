@@ -64,7 +64,7 @@ class WorkerAnnotationCrudMixin(WorkerHost):
             if annot:
                 annot.update()
 
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
         finally:
             if doc:
                 doc.close()
@@ -15,6 +15,7 @@ from ...constants import (
     WATERMARK_TILE_SPACING_Y,
 )
 from ...optional_deps import fitz
+from ...text_layer_cache import search_document_pages
 from ...worker_runtime.args import (
     _as_bool,
     _as_dict,
@@ -45,11 +46,12 @@ class WorkerAnnotationHighlightMixin(WorkerHost):
         doc = self._open_pdf_document(file_path)
         highlight_count = 0
         try:
+            search_page = search_document_pages(doc, search_term)
             total_pages = len(doc)
             for page_num in range(len(doc)):
                 page = doc[page_num]
                 self._check_cancelled()  # 취소 체크포인트
-                text_instances = page.search_for(search_term)
+                text_instances = search_page(page_num)
                 for inst in text_instances:
                     highlight = page.add_highlight_annot(inst)
                     highlight.set_colors(stroke=color)
@@ -57,7 +59,7 @@ class WorkerAnnotationHighlightMixin(WorkerHost):
                     highlight_count += 1
                 self._emit_progress_if_due(int((page_num + 1) / total_pages * 100))
 
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self.finished_signal.emit(self._get_msg("msg_highlight_done", search_term, highlight_count))
         finally:
             doc.close()
@@ -77,11 +79,12 @@ class WorkerAnnotationHighlightMixin(WorkerHost):
         doc = self._open_pdf_document(file_path)
         count = 0
         try:
+            search_page = search_document_pages(doc, search_term)
             total_pages = len(doc)
             for page_num in range(len(doc)):
                 page = doc[page_num]
                 self._check_cancelled()  # 취소 체크포인트
-                instances = page.search_for(search_term)
+                instances = search_page(page_num)
                 for inst in instances:
                     annot = None
                     if markup_type == 'underline':
@@ -95,7 +98,7 @@ class WorkerAnnotationHighlightMixin(WorkerHost):
                     count += 1
                 self._emit_progress_if_due(int((page_num + 1) / total_pages * 100))
 
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             markup_name = self._get_msg(f"msg_markup_label_{markup_type}")
             if markup_name == f"msg_markup_label_{markup_type}":
                 markup_name = markup_type
@@ -130,7 +133,7 @@ class WorkerAnnotationHighlightMixin(WorkerHost):
                 annot.update()
 
             self._emit_progress_if_due(100)
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self.finished_signal.emit(self._get_msg("msg_sticky_note_added", resolved_page_num + 1, icon))
         finally:
             doc.close()
@@ -15,6 +15,7 @@ from ...constants import (
     WATERMARK_TILE_SPACING_Y,
 )
 from ...optional_deps import fitz
+from ...text_layer_cache import search_document_pages
 from ...worker_runtime.args import (
     _as_bool,
     _as_dict,
@@ -51,11 +52,13 @@ class WorkerAnnotationRedactionMixin(WorkerHost):
         try:
             redact_count = 0
             total_pages = len(doc)
+            # 문서 키는 교정 적용 전에 고정 — 페이지 N 교정은 N+1 이후 텍스트에 영향 없음
+            search_page = search_document_pages(doc, search_term)
 
             for page_num in range(len(doc)):
                 page = doc[page_num]
                 self._check_cancelled()  # 취소 체크포인트
-                text_instances = page.search_for(search_term)
+                text_instances = search_page(page_num)
                 for inst in text_instances:
                     page.add_redact_annot(inst, fill=fill_color)
                     redact_count += 1
@@ -80,7 +80,7 @@ class WorkerAnnotationShapesLinksMixin(WorkerHost):
                     rect = fitz.Rect(shape_info['rect'])
                     page.draw_oval(rect, color=color, width=width, fill=fill)
 
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self._emit_progress_if_due(100)
             self.finished_signal.emit(self._get_msg("msg_shapes_added", len(shapes)))
         finally:
@@ -147,7 +147,7 @@ class WorkerAnnotationShapesLinksMixin(WorkerHost):
                     return
 
             page.insert_link(link)
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self._emit_progress_if_due(100)
             self.finished_signal.emit(self._get_msg("msg_link_added", page_num + 1))
         finally:
@@ -65,7 +65,7 @@ class WorkerAnnotationSignaturesMixin(WorkerHost):
                 page.insert_text(point, stamp_text, fontsize=14, fontname="helv", color=color)
                 self._emit_progress_if_due(int((i + 1) / total_pages * 100))
 
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self.finished_signal.emit(self._get_msg("msg_stamp_done"))
         finally:
             doc.close()
@@ -144,7 +144,7 @@ class WorkerAnnotationSignaturesMixin(WorkerHost):
 
             self._emit_progress_if_due(100)
 
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             extra_info = ""
             if signer_name:
                 extra_info += self._get_msg("msg_signature_signer_suffix", signer_name)
@@ -195,7 +195,7 @@ class WorkerAnnotationSignaturesMixin(WorkerHost):
                 annot.update()
 
             self._emit_progress_if_due(100)
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self.finished_signal.emit(
                 self._get_msg("msg_ink_annotation_added", resolved_page_num + 1, len(normalized_points))
             )
@@ -254,7 +254,7 @@ class WorkerAnnotationSignaturesMixin(WorkerHost):
 
             self._check_cancelled()
             self._emit_progress_if_due(100)
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self.finished_signal.emit(
                 self._get_msg("msg_freehand_signature_added", resolved_page_num + 1, len(all_strokes))
             )
@@ -119,7 +119,7 @@ class WorkerAnnotationTextboxMixin(WorkerHost):
                 self.error_signal.emit(self._get_msg("err_textbox_insert_failed"))
                 return
 
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self._emit_progress_if_due(100)
             self.finished_signal.emit(self._get_msg("msg_textbox_inserted", page_num + 1))
         finally:
@@ -207,7 +207,7 @@ class WorkerAnnotationTextboxMixin(WorkerHost):
             if wrote_count <= 0:
                 self.error_signal.emit(self._get_msg("err_textbox_insert_failed"))
                 return
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self._emit_progress_if_due(100)
             if failed_indices:
                 # 부분 성공: 실패한 큐 번호(1-based) 요약
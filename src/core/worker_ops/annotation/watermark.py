@@ -30,6 +30,8 @@ from .._pdf_helpers import (
     _normalize_stroke_points,
     _page_asset_placeholders,
     _sample_diff_text,
+    PageStamper,
+    stamp_document,
     text_needs_cjk,
 )
 logger = logging.getLogger(__name__)
@@ -67,30 +69,28 @@ class WorkerAnnotationWatermarkMixin(WorkerHost):
                 self.error_signal.emit(self._get_msg("err_watermark_text_required"))
                 return
 
-            total_pages = max(1, len(doc))
             margin = 50  # 가장자리 여백
-            # CJK 텍스트면 임베드 폰트명 사용 (helv 고정 실패 방지)
-            resolved_font = fontname
-            if text_needs_cjk(text) or (fontname or "").strip().lower() in {
-                "cjk", "cjk_safe", "ko", "korean", "auto", "default", ""
-            }:
-                if hasattr(self, "_resolve_textbox_fontname"):
-                    resolved_font = self._resolve_textbox_fontname(  # type: ignore[attr-defined]
-                        doc[0], fontname or "cjk", text
-                    )
-                else:
-                    try:
-                        registered = "pdfmaster_cjk"
-                        doc[0].insert_font(fontname=registered, fontbuffer=fitz.Font("cjk").buffer)
-                        resolved_font = registered
-                    except Exception:
-                        logger.warning("CJK watermark font embed failed", exc_info=True)
-                        resolved_font = fontname or "helv"
-
-            for i in range(len(doc)):
-                page = doc[i]
-                self._check_cancelled()
-                rect = page.rect
+            tile = position == 'tile'
+
+            def _paint(stamp_page):
+                rect = stamp_page.rect
+                # CJK 텍스트면 임베드 폰트명 사용 (helv 고정 실패 방지) — 폰트는 스탬프에 한 번만 임베드
+                resolved_font = fontname
+                if text_needs_cjk(text) or (fontname or "").strip().lower() in {
+                    "cjk", "cjk_safe", "ko", "korean", "auto", "default", ""
+                }:
+                    if hasattr(self, "_resolve_textbox_fontname"):
+                        resolved_font = self._resolve_textbox_fontname(  # type: ignore[attr-defined]
+                            stamp_page, fontname or "cjk", text
+                        )
+                    else:
+                        try:
+                            registered = "pdfmaster_cjk"
+                            stamp_page.insert_font(fontname=registered, fontbuffer=fitz.Font("cjk").buffer)
+                            resolved_font = registered
+                        except Exception:
+                            logger.warning("CJK watermark font embed failed", exc_info=True)
+                            resolved_font = fontname or "helv"
 
                 # v4.5: 모든 위치 옵션 지원
                 positions = {
@@ -102,42 +102,32 @@ class WorkerAnnotationWatermarkMixin(WorkerHost):
                     'bottom-left': (margin, rect.height - margin),
                     'bottom-right': (rect.width - margin, rect.height - margin),
                 }
-
-                if layer == 'background':
-                    shape = page.new_shape()
-                    if position == 'tile':
-                        for y in range(0, int(rect.height), 200):
-                            for x in range(0, int(rect.width), 300):
-                                shape.insert_text(
-                                    fitz.Point(x, y), text, fontsize=actual_fontsize,
-                                    fontname=resolved_font, rotate=rotation,
-                                    color=color, fill_opacity=opacity
-                                )
-                    else:
-                        x, y = positions.get(position, positions['center'])
-                        shape.insert_text(
-                            fitz.Point(x, y), text, fontsize=actual_fontsize,
-                            fontname=resolved_font, rotate=rotation,
-                            color=color, fill_opacity=opacity
-                        )
-                    shape.commit(overlay=False)
+                if tile:
+                    points = [
+                        (x, y)
+                        for y in range(0, int(rect.height), WATERMARK_TILE_SPACING_Y)
+                        for x in range(0, int(rect.width), WATERMARK_TILE_SPACING_X)
+                    ]
                 else:
-                    if position == 'tile':
-                        for y in range(0, int(rect.height), 200):
-                            for x in range(0, int(rect.width), 300):
-                                page.insert_text(
-                                    fitz.Point(x, y), text, fontsize=actual_fontsize,
-                                    fontname=resolved_font, rotate=rotation,
-                                    color=color, fill_opacity=opacity
-                                )
-                    else:
-                        x, y = positions.get(position, positions['center'])
-                        page.insert_text(
-                            fitz.Point(x, y), text, fontsize=actual_fontsize,
-                            fontname=resolved_font, rotate=rotation,
-                            color=color, fill_opacity=opacity
-                        )
-                self._emit_progress_if_due(int((i + 1) / total_pages * 100))
+                    points = [positions.get(position, positions['center'])]
+                shape = stamp_page.new_shape()
+                for x, y in points:
+                    shape.insert_text(
+                        fitz.Point(x, y), text, fontsize=actual_fontsize,
+                        fontname=resolved_font, rotate=rotation,
+                        color=color, fill_opacity=opacity
+                    )
+                shape.commit()
+                return True
+
+            # 패턴을 Form XObject 하나로 만들고 각 페이지는 참조만 한다 (배경 레이어는 내용 아래)
+            stamp_document(
+                doc,
+                _paint,
+                overlay=layer != 'background',
+                check_cancelled=self._check_cancelled,
+                on_progress=lambda done, count: self._emit_progress_if_due(int(done / max(1, count) * 100)),
+            )
             self._atomic_pdf_save(doc, output_path)
             layer_name = self._get_msg("msg_layer_background" if layer == 'background' else "msg_layer_foreground")
             self.finished_signal.emit(self._get_msg("msg_watermark_applied", layer_name, int(opacity * 100)))
@@ -159,30 +149,36 @@ class WorkerAnnotationWatermarkMixin(WorkerHost):
         doc = self._open_pdf_document(file_path)
         try:
             total_pages = len(doc)
-            for i in range(total_pages):
-                page = doc[i]
-                self._check_cancelled()  # 취소 체크포인트
-                rect = page.rect
-                if position == 'center':
-                    x, y = (rect.width - img_width) / 2, (rect.height - img_height) / 2
-                elif position == 'top':
-                    x, y = (rect.width - img_width) / 2, 20
-                elif position == 'bottom':
-                    x, y = (rect.width - img_width) / 2, rect.height - img_height - 20
-                elif position == 'top-left':
-                    x, y = 20, 20
-                elif position == 'top-right':
-                    x, y = rect.width - img_width - 20, 20
-                elif position == 'bottom-left':
-                    x, y = 20, rect.height - img_height - 20
-                else:  # bottom-right
-                    x, y = rect.width - img_width - 20, rect.height - img_height - 20
-
-                img_rect = fitz.Rect(x, y, x + img_width, y + img_height)
-                # v4.5: opacity를 alpha로 변환 (0~255)
-                alpha = int(opacity * 255) if 0 <= opacity <= 1 else 255
-                page.insert_image(img_rect, filename=image_path, overlay=True, alpha=alpha)
-                self._emit_progress_if_due(int((i + 1) / total_pages * 100))
+            # v4.5: opacity를 alpha로 변환 (0~255)
+            alpha = int(opacity * 255) if 0 <= opacity <= 1 else 255
+
+            def _paint(stamp_page):
+                stamp_page.insert_image(stamp_page.rect, filename=image_path, alpha=alpha)
+                return True
+
+            # 이미지는 img_width × img_height 스탬프 하나로 만들어 페이지마다 위치만 바꿔 참조한다
+            with PageStamper(_paint) as stamper:
+                for i in range(total_pages):
+                    page = doc[i]
+                    self._check_cancelled()  # 취소 체크포인트
+                    rect = page.rect
+                    if position == 'center':
+                        x, y = (rect.width - img_width) / 2, (rect.height - img_height) / 2
+                    elif position == 'top':
+                        x, y = (rect.width - img_width) / 2, 20
+                    elif position == 'bottom':
+                        x, y = (rect.width - img_width) / 2, rect.height - img_height - 20
+                    elif position == 'top-left':
+                        x, y = 20, 20
+                    elif position == 'top-right':
+                        x, y = rect.width - img_width - 20, 20
+                    elif position == 'bottom-left':
+                        x, y = 20, rect.height - img_height - 20
+                    else:  # bottom-right
+                        x, y = rect.width - img_width - 20, rect.height - img_height - 20
+
+                    stamper.apply(page, fitz.Rect(x, y, x + img_width, y + img_height))
+                    self._emit_progress_if_due(int((i + 1) / total_pages * 100))
 
             self._atomic_pdf_save(doc, output_path)
             opacity_pct = int(opacity * 100) if 0 <= opacity <= 1 else 100
@@ -205,16 +201,20 @@ class WorkerAnnotationWatermarkMixin(WorkerHost):
 
         doc = self._open_pdf_document(file_path)
         try:
-            total_pages = len(doc)
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                self._check_cancelled()  # 취소 체크포인트
-                rect = page.rect
-                shape = page.new_shape()
-                shape.draw_rect(rect)
+            def _paint(stamp_page):
+                shape = stamp_page.new_shape()
+                shape.draw_rect(stamp_page.rect)
                 shape.finish(color=color, fill=color)
-                shape.commit(overlay=False)  # 배경으로 삽입
-                self._emit_progress_if_due(int((page_num + 1) / total_pages * 100))
+                shape.commit()
+                return True
+
+            stamp_document(
+                doc,
+                _paint,
+                overlay=False,  # 배경으로 삽입
+                check_cancelled=self._check_cancelled,
+                on_progress=lambda done, count: self._emit_progress_if_due(int(done / max(1, count) * 100)),
+            )
 
             self._atomic_pdf_save(doc, output_path)
             self.finished_signal.emit(self._get_msg("msg_background_added", len(doc)))
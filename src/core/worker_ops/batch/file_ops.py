@@ -0,0 +1,217 @@
+"""일괄 처리 파일 단위 작업 (직렬 경로와 프로세스 풀 자식이 공유).
+
+자식 프로세스에서도 실행되므로 PyQt·worker 모듈을 import 하지 않는다.
+옵션 해석(resolve_batch_settings)은 메인 스레드에서 한 번 하고, 결과 dict 만 자식에 넘긴다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from ...optional_deps import fitz
+from ...worker_runtime.args import _as_float, _as_int, _as_str
+from ...worker_runtime.messages import get_message
+from ...worker_runtime.save_profiles import (
+    DEFAULT_COMPRESSION_SAVE_PROFILE,
+    normalize_save_profile,
+    resolve_image_optimize_options,
+    resolve_save_kwargs,
+)
+from .._pdf_helpers import (
+    dedupe_document_streams,
+    optimize_pdf_images,
+    stamp_document,
+    subset_document_fonts,
+    text_needs_cjk,
+)
+from ..annotation.textbox_helpers import resolve_textbox_fontname, write_textbox_content
+from ..security_ops import (
+    FITZ_PDF_ENCRYPT_AES_256,
+    FITZ_PDF_PERM_ACCESSIBILITY,
+    FITZ_PDF_PERM_COPY,
+    FITZ_PDF_PERM_PRINT,
+    _resolve_permissions,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class BatchFileJob:
+    index: int
+    file_path: str
+    password: str
+    staged_path: str
+    operation: str
+    option: str
+    settings: dict[str, Any]
+
+
+def resolve_batch_settings(kwargs: dict[str, Any], operation: str, option: str) -> dict[str, Any]:
+    """작업별 옵션을 피클 가능한 dict 로 해석한다."""
+    if operation == "compress":
+        save_profile = normalize_save_profile(
+            kwargs.get("save_profile"),
+            default=DEFAULT_COMPRESSION_SAVE_PROFILE,
+        )
+        optimize_opts = resolve_image_optimize_options(
+            save_profile,
+            optimize_images=kwargs.get("optimize_images"),
+            subset_fonts=kwargs.get("subset_fonts"),
+            max_image_dpi=kwargs.get("max_image_dpi"),
+            jpeg_quality=kwargs.get("jpeg_quality"),
+            grayscale_images=kwargs.get("grayscale_images"),
+            dedupe_streams=kwargs.get("dedupe_streams"),
+        )
+        return {"save_profile": save_profile, "optimize": optimize_opts}
+    if operation == "watermark":
+        # 단일 워터마크/텍스트 상자와 동일 계열: CJK 자동 임베드 + 옵션 kwargs
+        wm_rotation = _as_int(kwargs.get("rotation"), 0) % 360
+        wm_fontname = _as_str(kwargs.get("fontname"), "")
+        if not wm_fontname:
+            wm_fontname = "cjk" if text_needs_cjk(option) else "helv"
+        raw_color = kwargs.get("color", (0.5, 0.5, 0.5))
+        try:
+            wm_color = tuple(float(c) for c in raw_color[:3])  # type: ignore[index]
+            if len(wm_color) < 3:
+                wm_color = (0.5, 0.5, 0.5)
+        except Exception:
+            wm_color = (0.5, 0.5, 0.5)
+        return {
+            "fontsize": max(1, _as_int(kwargs.get("fontsize"), 40)),
+            "opacity": max(0.0, min(1.0, _as_float(kwargs.get("opacity"), 0.3))),
+            "rotation": int(round(wm_rotation / 90.0) * 90) % 360,
+            "fontname": wm_fontname,
+            "color": wm_color,
+        }
+    if operation == "encrypt":
+        # 단일 protect와 동일 권한 해석 (미지정 시 기본 accessibility/print/copy)
+        raw_perm = kwargs.get("permissions")
+        if raw_perm is None:
+            perm = FITZ_PDF_PERM_ACCESSIBILITY | FITZ_PDF_PERM_PRINT | FITZ_PDF_PERM_COPY
+        else:
+            perm = _resolve_permissions(raw_perm)
+        return {
+            "permissions": perm,
+            "owner_pw": _as_str(kwargs.get("owner_password")) or option,
+            "user_pw": _as_str(kwargs.get("user_password")) or option,
+        }
+    return {}
+
+
+def apply_batch_operation(
+    doc: Any,
+    operation: str,
+    option: str,
+    settings: dict[str, Any],
+    check_cancelled: Callable[[], None],
+) -> dict[str, Any]:
+    """열린 문서에 작업을 적용하고 저장 kwargs 를 반환한다."""
+    if operation == "compress":
+        optimize_opts = settings.get("optimize") or {}
+        if optimize_opts.get("dedupe_streams"):
+            dedupe_document_streams(doc, check_cancelled=check_cancelled)
+        if optimize_opts.get("optimize_images"):
+            optimize_pdf_images(
+                doc,
+                max_dpi=float(optimize_opts.get("max_dpi") or 150.0),
+                jpeg_quality=int(optimize_opts.get("jpeg_quality") or 75),
+                grayscale=bool(optimize_opts.get("grayscale")),
+                check_cancelled=check_cancelled,
+            )
+        if optimize_opts.get("subset_fonts"):
+            check_cancelled()
+            subset_document_fonts(doc)
+        return {"save_profile": settings.get("save_profile")}
+    if operation == "watermark":
+        fontsize = int(settings["fontsize"])
+
+        def _paint(stamp_page: Any) -> bool:
+            text_rect = fitz.Rect(
+                40,
+                (stamp_page.rect.height / 2) - max(30.0, float(fontsize)),
+                stamp_page.rect.width - 40,
+                (stamp_page.rect.height / 2) + max(30.0, float(fontsize) * 1.5),
+            )
+            return write_textbox_content(
+                stamp_page,
+                text_rect,
+                option,
+                fontsize=fontsize,
+                fontname=resolve_textbox_fontname(stamp_page, settings["fontname"], option),
+                color=tuple(settings["color"]),
+                align=1,
+                rotation=int(settings["rotation"]),
+                opacity=float(settings["opacity"]),
+                overlay=True,
+            )
+
+        # 페이지 크기별 스탬프 하나(Form XObject)를 모든 페이지가 참조 — 글꼴도 한 번만 임베드
+        if not stamp_document(doc, _paint, check_cancelled=check_cancelled):
+            raise ValueError(get_message("err_textbox_insert_failed"))
+        return {}
+    if operation == "encrypt":
+        return {
+            "encryption": FITZ_PDF_ENCRYPT_AES_256,
+            "owner_pw": settings["owner_pw"],
+            "user_pw": settings["user_pw"],
+            "permissions": settings["permissions"],
+        }
+    if operation == "rotate":
+        for page in doc:
+            check_cancelled()
+            page.set_rotation(page.rotation + 90)
+        return {}
+    raise ValueError(get_message("err_batch_unsupported_operation", operation))
+
+
+def _no_cancel() -> None:
+    return None
+
+
+def run_batch_file_job(job: BatchFileJob) -> int:
+    """자식 프로세스: 파일 하나를 처리해 job.staged_path 에 저장하고 job.index 를 반환.
+
+    최종 경로 교체·생성 추적·취소 판단은 메인 스레드가 맡는다.
+    """
+    doc = fitz.open(job.file_path)
+    try:
+        if getattr(doc, "is_encrypted", False):
+            if not job.password or not doc.authenticate(job.password):
+                raise ValueError(get_message("err_wrong_password"))
+        save_kwargs = apply_batch_operation(doc, job.operation, job.option, job.settings, _no_cancel)
+        resolved = resolve_save_kwargs(
+            doc,
+            job.staged_path,
+            save_profile=save_kwargs.pop("save_profile", None),
+            **save_kwargs,
+        )
+        try:
+            doc.save(job.staged_path, **resolved)
+        except Exception:
+            # PyMuPDF 1.28+ linearisation 제거 대응 (atomic_pdf_save 와 동일)
+            if not resolved.pop("linear", None):
+                raise
+            doc.save(job.staged_path, **resolved)
+    finally:
+        doc.close()
+    return job.index
+
+
+def discard_staged_path(path: str) -> None:
+    if path and os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError:
+            logger.debug("Failed to remove staged batch output: %s", path, exc_info=True)
+
+
+__all__ = [
+    "BatchFileJob",
+    "apply_batch_operation",
+    "discard_staged_path",
+    "resolve_batch_settings",
+    "run_batch_file_job",
+]
@@ -1,27 +1,30 @@
 import logging
 import os
+import tempfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from concurrent.futures.process import BrokenProcessPool
 
 from ..._typing import WorkerHost
-from ...optional_deps import fitz
-from ...worker_runtime.args import _as_float, _as_int, _as_list, _as_str
-from ...worker_runtime.save_profiles import (
-    DEFAULT_COMPRESSION_SAVE_PROFILE,
-    normalize_save_profile,
-    resolve_image_optimize_options,
-)
-from .._pdf_helpers import optimize_pdf_images, subset_document_fonts, text_needs_cjk
-from ..security_ops import (
-    FITZ_PDF_ENCRYPT_AES_256,
-    FITZ_PDF_PERM_ACCESSIBILITY,
-    FITZ_PDF_PERM_COPY,
-    FITZ_PDF_PERM_PRINT,
-    _resolve_permissions,
+from ...process_pool import create_process_pool, resolve_pool_workers, shutdown_process_pool
+from ...temp_cleanup import ATOMIC_TEMP_PREFIX
+from ...worker_runtime.args import _as_list, _as_str
+from .file_ops import (
+    BatchFileJob,
+    apply_batch_operation,
+    discard_staged_path,
+    resolve_batch_settings,
+    run_batch_file_job,
 )
 
 logger = logging.getLogger(__name__)
 
 _BATCH_OPERATIONS = frozenset({"compress", "watermark", "encrypt", "rotate"})
 _BATCH_OPERATIONS_REQUIRING_OPTION = frozenset({"watermark", "encrypt"})
+# 이 파일 수 이상이면 프로세스 풀 사용 (소량은 spawn 비용이 더 큼)
+_PARALLEL_BATCH_MIN_FILES = 4
+# 완료 대기 중에도 취소를 빠르게 반영하기 위한 폴링 간격
+_CANCEL_POLL_SECONDS = 0.1
 
 
 class WorkerBatchOpsMixin(WorkerHost):
@@ -39,142 +42,163 @@ class WorkerBatchOpsMixin(WorkerHost):
             self.error_signal.emit(self._get_msg("err_batch_option_required", operation))
             return
 
+        settings = resolve_batch_settings(self.kwargs, operation, option)
         failed_files: list[tuple[str, str]] = []
         used_output_stems: set[str] = set()
+        completed = 0
+
+        def _out_path_for(file_path: str) -> str:
+            base = os.path.splitext(os.path.basename(file_path))[0]
+            unique_stem = self._build_unique_output_stem(
+                output_dir,
+                f"{base}_processed",
+                ".pdf",
+                used_output_stems,
+            )
+            return os.path.join(output_dir, f"{unique_stem}.pdf")
+
+        def _on_file_done(file_path: str, error: Exception | None) -> None:
+            nonlocal completed
+            if error is not None:
+                logger.warning("Batch error on %s: %s", file_path, error)
+                failed_files.append((os.path.basename(file_path), str(error)))
+            completed += 1
+            self._emit_progress_if_due(int(completed / len(files) * 100))
 
-        success_count = 0
-        skipped_count = 0
-        for idx, file_path in enumerate(files):
+        workers = 1
+        if len(files) >= _PARALLEL_BATCH_MIN_FILES:
+            workers = resolve_pool_workers(len(files), self.kwargs.get("batch_workers"))
+        serial_files: list[tuple[str, str]] = [(file_path, "") for file_path in files]
+        if workers > 1:
+            serial_files = self._batch_parallel(
+                files, workers, operation, option, settings, _out_path_for, _on_file_done
+            )
+
+        for file_path, reserved_out_path in serial_files:
             self._check_cancelled()
             doc = None
+            error: Exception | None = None
             try:
-                base = os.path.splitext(os.path.basename(file_path))[0]
-                unique_stem = self._build_unique_output_stem(
-                    output_dir,
-                    f"{base}_processed",
-                    ".pdf",
-                    used_output_stems,
-                )
-                out_path = os.path.join(output_dir, f"{unique_stem}.pdf")
-
+                out_path = reserved_out_path or _out_path_for(file_path)
                 doc = self._open_pdf_document(file_path)
-
-                if operation == "compress":
-                    save_profile = normalize_save_profile(
-                        self.kwargs.get("save_profile"),
-                        default=DEFAULT_COMPRESSION_SAVE_PROFILE,
-                    )
-                    optimize_opts = resolve_image_optimize_options(
-                        save_profile,
-                        optimize_images=self.kwargs.get("optimize_images"),
-                        subset_fonts=self.kwargs.get("subset_fonts"),
-                        max_image_dpi=self.kwargs.get("max_image_dpi"),
-                        jpeg_quality=self.kwargs.get("jpeg_quality"),
-                        grayscale_images=self.kwargs.get("grayscale_images"),
-                    )
-                    if optimize_opts.get("optimize_images"):
-                        optimize_pdf_images(
-                            doc,
-                            max_dpi=float(optimize_opts.get("max_dpi") or 150.0),
-                            jpeg_quality=int(optimize_opts.get("jpeg_quality") or 75),
-                            grayscale=bool(optimize_opts.get("grayscale")),
-                            check_cancelled=self._check_cancelled,
-                        )
-                    if optimize_opts.get("subset_fonts"):
-                        self._check_cancelled()
-                        subset_document_fonts(doc)
-                    self._atomic_pdf_save(
-                        doc,
-                        out_path,
-                        save_profile=save_profile,
-                    )
-                elif operation == "watermark":
-                    # 단일 워터마크/텍스트 상자와 동일 계열: CJK 자동 임베드 + 옵션 kwargs
-                    wm_fontsize = max(1, _as_int(self.kwargs.get("fontsize"), 40))
-                    wm_opacity = max(0.0, min(1.0, _as_float(self.kwargs.get("opacity"), 0.3)))
-                    wm_rotation = _as_int(self.kwargs.get("rotation"), 0) % 360
-                    wm_rotation = int(round(wm_rotation / 90.0) * 90) % 360
-                    wm_fontname = _as_str(self.kwargs.get("fontname"), "")
-                    if not wm_fontname:
-                        wm_fontname = "cjk" if text_needs_cjk(option) else "helv"
-                    raw_color = self.kwargs.get("color", (0.5, 0.5, 0.5))
-                    try:
-                        wm_color = tuple(float(c) for c in raw_color[:3])  # type: ignore[index]
-                        if len(wm_color) < 3:
-                            wm_color = (0.5, 0.5, 0.5)
-                    except Exception:
-                        wm_color = (0.5, 0.5, 0.5)
-                    wrote_any = False
-                    for page in doc:
-                        self._check_cancelled()
-                        text_rect = fitz.Rect(
-                            40,
-                            (page.rect.height / 2) - max(30.0, float(wm_fontsize)),
-                            page.rect.width - 40,
-                            (page.rect.height / 2) + max(30.0, float(wm_fontsize) * 1.5),
-                        )
-                        resolved = self._resolve_textbox_fontname(page, wm_fontname, option)
-                        ok = self._write_textbox_content(
-                            page,
-                            text_rect,
-                            option,
-                            fontsize=wm_fontsize,
-                            fontname=resolved,
-                            color=wm_color,
-                            align=1,
-                            rotation=wm_rotation,
-                            opacity=wm_opacity,
-                            overlay=True,
-                        )
-                        if ok:
-                            wrote_any = True
-                    if not wrote_any:
-                        raise ValueError(self._get_msg("err_textbox_insert_failed"))
-                    self._atomic_pdf_save(doc, out_path)
-                elif operation == "encrypt":
-                    # 단일 protect와 동일 권한 해석 (미지정 시 기본 accessibility/print/copy)
-                    raw_perm = self.kwargs.get("permissions")
-                    if raw_perm is None:
-                        perm = FITZ_PDF_PERM_ACCESSIBILITY | FITZ_PDF_PERM_PRINT | FITZ_PDF_PERM_COPY
-                    else:
-                        perm = _resolve_permissions(raw_perm)
-                    owner_pw = _as_str(self.kwargs.get("owner_password")) or option
-                    user_pw = _as_str(self.kwargs.get("user_password")) or option
-                    self._atomic_pdf_save(
-                        doc,
-                        out_path,
-                        encryption=FITZ_PDF_ENCRYPT_AES_256,
-                        owner_pw=owner_pw,
-                        user_pw=user_pw,
-                        permissions=perm,
-                    )
-                elif operation == "rotate":
-                    for page in doc:
-                        self._check_cancelled()
-                        page.set_rotation(page.rotation + 90)
-                    self._atomic_pdf_save(doc, out_path)
-                success_count += 1
+                save_kwargs = apply_batch_operation(doc, operation, option, settings, self._check_cancelled)
+                self._atomic_pdf_save(doc, out_path, **save_kwargs)
             except Exception as exc:
-                from ...worker import CancelledError
+                from ...worker_runtime.errors import CancelledError
 
                 if isinstance(exc, CancelledError):
                     raise
-                logger.warning("Batch error on %s: %s", file_path, exc)
-                failed_files.append((os.path.basename(file_path), str(exc)))
-                skipped_count += 1
+                error = exc
             finally:
                 if doc:
                     doc.close()
+            _on_file_done(file_path, error)
 
-            self._emit_progress_if_due(int((idx + 1) / len(files) * 100))
-
+        success_count = len(files) - len(failed_files)
         result_msg = self._get_msg("msg_batch_done", success_count, len(files))
-        if skipped_count > 0:
-            result_msg += self._get_msg("msg_batch_skipped", skipped_count)
-            if failed_files:
-                result_msg += self._get_msg("msg_batch_failed_header")
-                for name, reason in failed_files[:3]:
-                    result_msg += self._get_msg("msg_batch_failed_row", name, reason)
-                if len(failed_files) > 3:
-                    result_msg += self._get_msg("msg_batch_failed_more", len(failed_files) - 3)
+        if failed_files:
+            result_msg += self._get_msg("msg_batch_skipped", len(failed_files))
+            result_msg += self._get_msg("msg_batch_failed_header")
+            for name, reason in failed_files[:3]:
+                result_msg += self._get_msg("msg_batch_failed_row", name, reason)
+            if len(failed_files) > 3:
+                result_msg += self._get_msg("msg_batch_failed_more", len(failed_files) - 3)
         self.finished_signal.emit(result_msg)
+
+    def _batch_parallel(self, files, workers, operation, option, settings, out_path_for, on_file_done):
+        """프로세스 풀로 파일별 작업을 실행하고 완료 순서대로 커밋한다.
+
+        출력 이름은 입력 순서대로 미리 정해 결정적이다. 자식은 메인이 만든 임시 경로에만 쓰고,
+        최종 교체(생성 추적 포함)는 메인 스레드가 한다. 취소 시 실행 중 자식을 강제 종료하고
+        임시 파일을 지운다 — 이미 커밋된 출력은 created_output_paths 로 rollback 된다.
+        풀이 깨지면 그때 실행 중이던 파일은 새 풀에서 하나씩 격리해 다시 돌리고, 혼자 돌려도
+        자식이 죽는 파일은 실패로 기록한다 — 자식을 죽인 입력을 GUI 프로세스에서 열지 않는다.
+        풀을 만들 수 없을 때만 아직 손대지 않은 (입력 경로, 예약된 출력 경로) 목록을 직렬 처리용으로 반환한다.
+        """
+        output_dir = os.path.abspath(_as_str(self.kwargs.get("output_dir")) or ".")
+        os.makedirs(output_dir, exist_ok=True)
+        try:
+            executor = create_process_pool(workers)
+        except Exception:
+            logger.warning("Batch process pool unavailable; processing serially", exc_info=True)
+            return [(file_path, "") for file_path in files]
+
+        queue = deque((index, file_path, "") for index, file_path in enumerate(files))
+        # 풀 붕괴 때 실행 중이던 파일 (index, 입력 경로, 예약된 출력 경로) — 한 번에 하나씩 격리 재시도
+        suspects: deque[tuple[int, str, str]] = deque()
+        # future -> (작업, 출력 경로, 격리 실행 여부)
+        in_flight: dict[Future, tuple[BatchFileJob, str, bool]] = {}
+
+        def _submit(index: int, file_path: str, out_path: str, isolated: bool) -> None:
+            out_path = out_path or out_path_for(file_path)
+            fd, staged_path = tempfile.mkstemp(prefix=ATOMIC_TEMP_PREFIX, suffix=".tmp.pdf", dir=output_dir)
+            os.close(fd)
+            job = BatchFileJob(
+                index=index,
+                file_path=file_path,
+                password=self._password_for_pdf_path(file_path),
+                staged_path=staged_path,
+                operation=operation,
+                option=option,
+                settings=settings,
+            )
+            in_flight[executor.submit(run_batch_file_job, job)] = (job, out_path, isolated)
+
+        terminate = True
+        try:
+            while queue or suspects or in_flight:
+                self._check_cancelled()
+                try:
+                    if suspects:
+                        if not in_flight:
+                            _submit(*suspects.popleft(), isolated=True)
+                    elif not any(isolated for _job, _out, isolated in in_flight.values()):
+                        while queue and len(in_flight) < workers * 2:
+                            _submit(*queue.popleft(), isolated=False)
+                    done, _pending = wait(list(in_flight), timeout=_CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        job, out_path, _isolated = in_flight.pop(future)
+                        error: Exception | None = None
+                        try:
+                            future.result()
+                            self._commit_staged_output(job.staged_path, out_path)
+                        except BrokenProcessPool:
+                            in_flight[future] = (job, out_path, _isolated)
+                            raise
+                        except Exception as exc:
+                            from ...worker_runtime.errors import CancelledError
+
+                            if isinstance(exc, CancelledError):
+                                raise
+                            discard_staged_path(job.staged_path)
+                            error = exc
+                        on_file_done(job.file_path, error)
+                except BrokenProcessPool:
+                    shutdown_process_pool(executor, terminate=True)
+                    crashed = sorted(in_flight.values(), key=lambda entry: entry[0].index)
+                    in_flight.clear()
+                    for job, out_path, isolated in crashed:
+                        discard_staged_path(job.staged_path)
+                        if isolated:
+                            # 혼자 돌려도 자식이 죽었다 — 이 파일이 원인
+                            on_file_done(job.file_path, RuntimeError(self._get_msg("err_batch_worker_crashed")))
+                        else:
+                            suspects.append((job.index, job.file_path, out_path))
+                    logger.warning(
+                        "Batch process pool broke; retrying %d in-flight file(s) one at a time in a fresh pool",
+                        len(suspects),
+                    )
+                    try:
+                        executor = create_process_pool(workers)
+                    except Exception:
+                        logger.warning("Batch process pool could not be recreated", exc_info=True)
+                        for _index, file_path, _out_path in suspects:
+                            on_file_done(file_path, RuntimeError(self._get_msg("err_batch_worker_crashed")))
+                        terminate = False
+                        return [(file_path, out_path) for _index, file_path, out_path in queue]
+            terminate = False
+            return []
+        finally:
+            shutdown_process_pool(executor, terminate=terminate)
+            for job, _out_path, _isolated in in_flight.values():
+                discard_staged_path(job.staged_path)
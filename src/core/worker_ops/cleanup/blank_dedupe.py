@@ -7,7 +7,8 @@ import re
 from collections import Counter
 from typing import Any, cast
 from ..._typing import WorkerHost
-from ...optional_deps import fitz
+from ...blank_pages import detect_blank_pages
+from .._pdf_helpers import build_page_subset
 from ...worker_runtime.args import (
     _as_bool,
     _as_float,
@@ -20,7 +21,13 @@ _HEADING_MIN_SIZE = 12.0
 _HEADING_SIZE_GAP = 1.5
 
 
-from .helpers import _page_text_len, _page_image_count, _page_drawing_count, _is_blank_page, _page_signature, _content_bbox, _collect_heading_toc
+from .near_duplicates import (
+    DEFAULT_TEXT_THRESHOLD,
+    EXACT_VISUAL_THRESHOLD,
+    duplicate_page_indices,
+    find_duplicate_clusters,
+)
+from .helpers import _page_text_len, _page_image_count, _page_drawing_count, _content_bbox, _collect_heading_toc
 
 class WorkerCleanupBlankDedupeMixin(WorkerHost):
     def remove_blank_pages(self):
@@ -29,17 +36,18 @@ class WorkerCleanupBlankDedupeMixin(WorkerHost):
 
         doc = self._open_pdf_document(file_path)
         try:
-            keep: list[int] = []
             total = len(doc)
             if total == 0:
                 self.error_signal.emit(self._get_msg("err_pdf_has_no_pages"))
                 return
-            for i in range(total):
-                self._check_cancelled()
-                page = doc[i]
-                if not _is_blank_page(page):
-                    keep.append(i)
-                self._emit_progress_if_due(int((i + 1) / total * 80))
+            flags = detect_blank_pages(
+                doc,
+                password=self._password_for_pdf_path(file_path),
+                workers=self.kwargs.get("blank_workers"),
+                check_cancelled=self._check_cancelled,
+                on_progress=lambda done, count: self._emit_progress_if_due(int(done / count * 80)),
+            )
+            keep = [i for i, blank in enumerate(flags) if not blank]
 
             if not keep:
                 self.error_signal.emit(self._get_msg("err_all_pages_blank"))
@@ -51,12 +59,13 @@ class WorkerCleanupBlankDedupeMixin(WorkerHost):
                 self.finished_signal.emit(self._get_msg("msg_remove_blank_none"))
                 return
 
-            out = fitz.open()
+            out = build_page_subset(
+                doc,
+                keep,
+                check_cancelled=self._check_cancelled,
+                on_progress=lambda done, count: self._emit_progress_if_due(80 + int(done / count * 20)),
+            )
             try:
-                for idx, page_index in enumerate(keep):
-                    self._check_cancelled()
-                    out.insert_pdf(doc, from_page=page_index, to_page=page_index)
-                    self._emit_progress_if_due(80 + int((idx + 1) / len(keep) * 20))
                 self._atomic_pdf_save(out, output_path)
             finally:
                 out.close()
@@ -66,6 +75,38 @@ class WorkerCleanupBlankDedupeMixin(WorkerHost):
         finally:
             doc.close()
 
+    def _find_duplicate_clusters(self, doc: Any, *, progress_span: int) -> list[Any]:
+        # 기본은 정확히 같은 페이지만 — 유사 허용 거리는 호출측(대화형 UI)이 명시해야 한다
+        return find_duplicate_clusters(
+            doc,
+            threshold=_as_int(self.kwargs.get("dedupe_threshold"), EXACT_VISUAL_THRESHOLD),
+            text_threshold=_as_int(self.kwargs.get("dedupe_text_threshold"), DEFAULT_TEXT_THRESHOLD),
+            check_cancelled=self._check_cancelled,
+            on_progress=lambda done, count: self._emit_progress_if_due(int(done / count * progress_span)),
+        )
+
+    def find_duplicate_pages(self):
+        """중복 페이지 dry-run: 삭제 없이 중복 묶음만 보고한다"""
+        file_path = _as_str(self.kwargs.get("file_path"))
+
+        doc = self._open_pdf_document(file_path, read_only=True)
+        try:
+            total = len(doc)
+            clusters = self._find_duplicate_clusters(doc, progress_span=100)
+        finally:
+            self._release_pdf_document(doc)
+
+        removed = len(duplicate_page_indices(clusters))
+        self._set_result_payload(
+            file_path=file_path,
+            dedupe_threshold=_as_int(self.kwargs.get("dedupe_threshold"), EXACT_VISUAL_THRESHOLD),
+            duplicate_clusters=[cluster.to_payload() for cluster in clusters],
+            removed=removed,
+            total=total,
+        )
+        self._emit_progress_if_due(100)
+        self.finished_signal.emit(self._get_msg("msg_duplicate_pages_found", removed, total))
+
     def dedupe_pages(self):
         file_path = _as_str(self.kwargs.get("file_path"))
         output_path = _as_str(self.kwargs.get("output_path"))
@@ -76,29 +117,23 @@ class WorkerCleanupBlankDedupeMixin(WorkerHost):
             if total == 0:
                 self.error_signal.emit(self._get_msg("err_pdf_has_no_pages"))
                 return
-            seen: set[str] = set()
-            keep: list[int] = []
-            for i in range(total):
-                self._check_cancelled()
-                sig = _page_signature(doc[i])
-                if sig in seen:
-                    self._emit_progress_if_due(int((i + 1) / total * 80))
-                    continue
-                seen.add(sig)
-                keep.append(i)
-                self._emit_progress_if_due(int((i + 1) / total * 80))
+            clusters = self._find_duplicate_clusters(doc, progress_span=80)
+            duplicates = duplicate_page_indices(clusters)
+            keep = [i for i in range(total) if i not in duplicates]
+            self._set_result_payload(duplicate_clusters=[cluster.to_payload() for cluster in clusters])
 
             if len(keep) == total:
                 self._atomic_pdf_save(doc, output_path)
                 self.finished_signal.emit(self._get_msg("msg_dedupe_pages_none"))
                 return
 
-            out = fitz.open()
+            out = build_page_subset(
+                doc,
+                keep,
+                check_cancelled=self._check_cancelled,
+                on_progress=lambda done, count: self._emit_progress_if_due(80 + int(done / count * 20)),
+            )
             try:
-                for idx, page_index in enumerate(keep):
-                    self._check_cancelled()
-                    out.insert_pdf(doc, from_page=page_index, to_page=page_index)
-                    self._emit_progress_if_due(80 + int((idx + 1) / len(keep) * 20))
                 self._atomic_pdf_save(out, output_path)
             finally:
                 out.close()
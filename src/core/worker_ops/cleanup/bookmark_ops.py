@@ -20,7 +20,7 @@ _HEADING_MIN_SIZE = 12.0
 _HEADING_SIZE_GAP = 1.5
 
 
-from .helpers import _page_text_len, _page_image_count, _page_drawing_count, _is_blank_page, _page_signature, _content_bbox, _collect_heading_toc
+from .helpers import _page_text_len, _page_image_count, _page_drawing_count, _is_blank_page, _content_bbox, _collect_heading_toc
 
 class WorkerCleanupBookmarkOpsMixin(WorkerHost):
     def split_by_bookmarks(self):
@@ -102,7 +102,7 @@ class WorkerCleanupBookmarkOpsMixin(WorkerHost):
                 return
             self._check_cancelled()
             doc.set_toc(toc)
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self._emit_progress_if_due(100)
             self.finished_signal.emit(self._get_msg("msg_auto_bookmarks_done", len(toc)))
         finally:
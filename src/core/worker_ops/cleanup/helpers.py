@@ -6,97 +6,70 @@ import re
 from collections import Counter
 from typing import Any, cast
 from ..._typing import WorkerHost
+from .._pdf_helpers import estimate_optimized_sizes
+from ...blank_pages import (
+    detect_blank_pages,
+    is_blank_page,
+    page_drawing_count,
+    page_image_count,
+    page_text_len,
+)
 from ...optional_deps import fitz
+from ...text_layer_cache import TEXT_LAYER_CACHE
 from ...worker_runtime.args import (
     _as_bool,
     _as_float,
     _as_int,
     _as_list,
-    _as_str,
+)
+from .near_duplicates import (
+    DEFAULT_TEXT_THRESHOLD,
+    EXACT_VISUAL_THRESHOLD,
+    duplicate_page_indices,
+    find_duplicate_clusters,
 )
 logger = logging.getLogger(__name__)
 _HEADING_MIN_SIZE = 12.0
 _HEADING_SIZE_GAP = 1.5
 
 
-def _page_text_len(page: Any) -> int:
-    try:
-        return len((_as_str(page.get_text("text")) or "").strip())
-    except Exception:
-        return 0
-
-def _page_image_count(page: Any) -> int:
-    try:
-        return len(page.get_images(full=True) or [])
-    except Exception:
-        return 0
-
-def _page_drawing_count(page: Any) -> int:
-    get_drawings = getattr(page, "get_drawings", None)
-    if not callable(get_drawings):
-        return 0
-    try:
-        drawings = get_drawings() or []
-        return len(cast(list[Any], drawings))
-    except Exception:
-        return 0
+_page_text_len = page_text_len
+_page_image_count = page_image_count
+_page_drawing_count = page_drawing_count
 
-def estimate_blank_page_removals(doc: Any, *, text_threshold: int = 0) -> tuple[int, int]:
+def estimate_blank_page_removals(doc: Any, *, text_threshold: int = 0, password: str = "") -> tuple[int, int]:
     """(제거 예상 페이지 수, 전체 페이지 수) dry-run."""
-    total = len(doc)
-    blank = 0
-    for i in range(total):
-        if _is_blank_page(doc[i], text_threshold=text_threshold):
-            blank += 1
-    return blank, total
+    flags = detect_blank_pages(doc, text_threshold=text_threshold, password=password)
+    return sum(flags), len(flags)
 
 
-def estimate_dedupe_page_removals(doc: Any) -> tuple[int, int]:
+def estimate_dedupe_page_removals(
+    doc: Any,
+    *,
+    threshold: int = EXACT_VISUAL_THRESHOLD,
+    text_threshold: int = DEFAULT_TEXT_THRESHOLD,
+) -> tuple[int, int]:
     """(제거 예상 중복 페이지 수, 전체 페이지 수) dry-run."""
-    total = len(doc)
-    seen: set[str] = set()
-    keep = 0
-    for i in range(total):
-        sig = _page_signature(doc[i])
-        if sig in seen:
-            continue
-        seen.add(sig)
-        keep += 1
-    return total - keep, total
+    clusters = find_duplicate_clusters(doc, threshold=threshold, text_threshold=text_threshold)
+    return len(duplicate_page_indices(clusters)), len(doc)
+
+
+def estimate_compression_sizes(doc: Any, *, original_size: int | None = None) -> dict[str, int]:
+    """저장 프로필별 예상 압축 결과 크기(바이트) dry-run. 표본 이미지만 재인코딩한다."""
+    if original_size is None:
+        name = getattr(doc, "name", "") or ""
+        original_size = os.path.getsize(name) if name and os.path.isfile(name) else len(doc.tobytes())
+    return estimate_optimized_sizes(doc, original_size=int(original_size))
 
 
 def _is_blank_page(page: Any, *, text_threshold: int = 0) -> bool:
-    if _page_text_len(page) > text_threshold:
-        return False
-    if _page_image_count(page) > 0:
-        return False
-    if _page_drawing_count(page) > 0:
-        return False
-    # 저해상도 렌더로 거의 흰 페이지만 빈 페이지로 취급
-    try:
-        pix = page.get_pixmap(matrix=fitz.Matrix(0.2, 0.2), alpha=False)
-        samples = pix.samples
-        if not samples:
-            return True
-        # 평균 밝기 매우 높고 분산이 작으면 빈 페이지
-        step = max(1, len(samples) // 3000)
-        vals = samples[::step]
-        if not vals:
-            return True
-        avg = sum(vals) / len(vals)
-        if avg < 250:
-            return False
-        var = sum((v - avg) ** 2 for v in vals) / len(vals)
-        return var < 30.0
-    except Exception:
-        # 렌더 실패 시 빈 페이지로 오판하면 데이터 손실 → 보수적으로 유지
-        return False
+    return is_blank_page(page, text_threshold=text_threshold)
 
 def _page_signature(page: Any) -> str:
-    """중복 판별용 시그니처 (텍스트 + 저해상도 해시)."""
+    """정확한 중복 판별용 시그니처 (텍스트 + 저해상도 렌더 해시). 유사 중복은 near_duplicates."""
     text = ""
     try:
-        text = " ".join((_as_str(page.get_text("text")) or "").split())
+        text = " ".join(str(page.get_text("text") or "").split())
     except Exception:
         text = ""
     digest = hashlib.sha1()
@@ -170,33 +143,26 @@ def _collect_heading_toc(
     size_counter: Counter[float] = Counter()
     candidates: list[tuple[int, float, str]] = []
 
+    text_key = TEXT_LAYER_CACHE.document_key(doc)
     for page_index in range(len(doc)):
         if callable(check_cancelled):
             check_cancelled()
-        page = doc[page_index]
         try:
-            text_dict = page.get_text("dict") or {}
+            layer = TEXT_LAYER_CACHE.page_layer(doc, page_index, text_key)
         except Exception:
             continue
-        for block in text_dict.get("blocks", []):
-            if block.get("type") != 0:
+        for line in layer.lines:
+            text = line.text.strip()
+            if not text or len(text) > 120:
                 continue
-            for line in block.get("lines", []):
-                spans = line.get("spans") or []
-                if not spans:
-                    continue
-                text = "".join(str(s.get("text") or "") for s in spans).strip()
-                if not text or len(text) > 120:
-                    continue
-                # 번호·한 줄 제목 위주
-                if text.endswith(".") and len(text) > 80:
-                    continue
-                size = max(float(s.get("size") or 0.0) for s in spans)
-                if size < min_size:
-                    continue
-                rounded = round(size, 1)
-                size_counter[rounded] += 1
-                candidates.append((page_index + 1, rounded, text))
+            # 번호·한 줄 제목 위주
+            if text.endswith(".") and len(text) > 80:
+                continue
+            if line.size < min_size:
+                continue
+            rounded = round(line.size, 1)
+            size_counter[rounded] += 1
+            candidates.append((page_index + 1, rounded, text))
 
     if not candidates:
         return []
@@ -0,0 +1,218 @@
+"""유사(near-duplicate) 페이지 탐지 — dHash/pHash + 텍스트 SimHash, BK-tree 색인.
+
+페이지마다 저해상도 회색조 렌더 한 번으로 dHash·pHash 를 만들고, pHash 해밍 거리로 BK-tree 를
+질의한다. 후보는 dHash 거리와 텍스트(기본: 정규화 텍스트 동일, 선택: SimHash 거리)로 다시 확인한다.
+색인에는 유지되는 대표 페이지만 넣는다 — 연쇄(A≈B≈C 이지만 A≉C)로 클러스터가 번지지 않는다.
+텍스트가 같아야 하는 기본 모드에서는 정규화 텍스트 해시별로 트리를 나눠 수만 쪽에서도 질의가 작다.
+텍스트 층이 없는(스캔) 페이지는 해시만으로는 이름·금액만 다른 같은 양식을 가르지 못하므로,
+후보 쌍을 다시 렌더해 화소 단위로 확인한다 — 밝기 잡음만 허용하고 잉크 차이는 한 화소도 허용하지 않는다.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .._pdf_helpers import hamming64, normalize_page_text, simhash64
+from .._pdf_helpers_impl.page_fingerprint import text_digest, visual_hashes64
+from ...optional_deps import NUMPY_AVAILABLE, fitz, np
+from ...text_layer_cache import TEXT_LAYER_CACHE, cached_page_text
+
+logger = logging.getLogger(__name__)
+
+# 시각 해시(64 bit) 허용 해밍 거리 기본값 (대화형 UI 가 고르는 유사 허용치)
+DEFAULT_VISUAL_THRESHOLD = 6
+# 해시·텍스트가 같은 페이지만 — 확인 없이 도는 dedupe_pages 의 기본값
+EXACT_VISUAL_THRESHOLD = 0
+# 0 이면 정규화 텍스트가 같아야 한다 (그 외에는 SimHash 허용 거리)
+DEFAULT_TEXT_THRESHOLD = 0
+MAX_THRESHOLD = 24
+# 텍스트 없는 후보 확인 렌더 DPI 와 화소 밝기 허용차 (스캔 톤 잡음)
+_SCAN_CONFIRM_DPI = 72.0
+_SCAN_PIXEL_TOLERANCE = 32
+
+
+@dataclass(frozen=True, slots=True)
+class PageHashes:
+    index: int
+    dhash: int
+    phash: int
+    simhash: int
+    text_hash: str
+
+
+@dataclass(frozen=True, slots=True)
+class DuplicateCluster:
+    keep: int
+    duplicates: tuple[int, ...]
+
+    def to_payload(self) -> dict[str, Any]:
+        # UI·결과 payload 는 1-based 페이지 번호
+        return {"keep": self.keep + 1, "duplicates": [index + 1 for index in self.duplicates]}
+
+
+class BKTree:
+    """정수 키 해밍 거리 BK-tree. 노드는 [키, 값 목록, {거리: 자식}]."""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self) -> None:
+        self._root: list[Any] | None = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: int, value: Any) -> None:
+        self._size += 1
+        if self._root is None:
+            self._root = [key, [value], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming64(key, node[0])
+            if distance == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [key, [value], {}]
+                return
+            node = child
+
+    def query(self, key: int, radius: int) -> list[tuple[int, Any]]:
+        """반경 안의 (거리, 값) 목록 — 거리, 삽입 순서로 정렬."""
+        if self._root is None:
+            return []
+        found: list[tuple[int, Any]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = hamming64(key, node[0])
+            if distance <= radius:
+                found.extend((distance, value) for value in node[1])
+            # 삼각 부등식 — [d - r, d + r] 가지만 내려간다
+            for edge, child in node[2].items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+        found.sort(key=lambda item: item[0])
+        return found
+
+
+def page_hashes(doc: Any, index: int, text_key: Any = None) -> PageHashes:
+    page = doc[index]
+    normalized = normalize_page_text(cached_page_text(doc, index, text_key))
+    dhash, phash = visual_hashes64(page)
+    return PageHashes(
+        index=index,
+        dhash=dhash,
+        phash=phash,
+        simhash=simhash64(normalized),
+        text_hash=text_digest(normalized),
+    )
+
+
+def _texts_match(left: PageHashes, right: PageHashes, text_threshold: int) -> bool:
+    if bool(left.text_hash) != bool(right.text_hash):
+        return False
+    if not left.text_hash or left.text_hash == right.text_hash:
+        return True
+    return text_threshold > 0 and hamming64(left.simhash, right.simhash) <= text_threshold
+
+
+def _gray_render(page: Any) -> Any:
+    zoom = _SCAN_CONFIRM_DPI / 72.0
+    return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
+
+
+def _scans_match(doc: Any, left: int, right: int) -> bool:
+    """텍스트 없는 두 페이지의 렌더가 밝기 허용차 안에서 화소마다 같은지."""
+    try:
+        pix1 = _gray_render(doc[left])
+        pix2 = _gray_render(doc[right])
+    except Exception as exc:
+        logger.debug("Scan confirm render failed pages %s/%s: %s", left + 1, right + 1, exc)
+        return False
+    if (pix1.width, pix1.height, pix1.stride) != (pix2.width, pix2.height, pix2.stride):
+        return False
+    s1, s2 = pix1.samples, pix2.samples
+    if s1 == s2:
+        return True
+    if NUMPY_AVAILABLE:
+        a = np.frombuffer(s1, dtype=np.uint8).astype(np.int16)
+        b = np.frombuffer(s2, dtype=np.uint8).astype(np.int16)
+        return int(np.abs(a - b).max()) <= _SCAN_PIXEL_TOLERANCE
+    return all(abs(x - y) <= _SCAN_PIXEL_TOLERANCE for x, y in zip(s1, s2))
+
+
+def find_duplicate_clusters(
+    doc: Any,
+    *,
+    threshold: int = DEFAULT_VISUAL_THRESHOLD,
+    text_threshold: int = DEFAULT_TEXT_THRESHOLD,
+    check_cancelled: Callable[[], None] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> list[DuplicateCluster]:
+    """앞쪽 페이지를 대표로 유지하는 중복 클러스터 목록 (대표 페이지 순)."""
+    threshold = max(0, min(MAX_THRESHOLD, int(threshold)))
+    text_threshold = max(0, min(MAX_THRESHOLD, int(text_threshold)))
+    text_key = TEXT_LAYER_CACHE.document_key(doc)
+    total = len(doc)
+    trees: dict[str, BKTree] = {}
+    representatives: dict[int, PageHashes] = {}
+    members: dict[int, list[int]] = {}
+
+    for index in range(total):
+        if check_cancelled is not None:
+            check_cancelled()
+        try:
+            hashes = page_hashes(doc, index, text_key)
+        except Exception as exc:
+            # 지문을 못 만든 페이지는 중복으로 판정하지 않는다 (삭제 방지)
+            logger.debug("Page hash failed page %s: %s", index + 1, exc)
+            if on_progress is not None:
+                on_progress(index + 1, total)
+            continue
+        if not hashes.text_hash:
+            group = ""
+        elif text_threshold == 0:
+            group = hashes.text_hash
+        else:
+            group = "text"
+        tree = trees.setdefault(group, BKTree())
+        match: int | None = None
+        for _distance, rep_index in tree.query(hashes.phash, threshold):
+            rep = representatives[rep_index]
+            if match is not None and rep_index > match:
+                continue
+            if hamming64(rep.dhash, hashes.dhash) > threshold or not _texts_match(rep, hashes, text_threshold):
+                continue
+            # 텍스트 없는 후보는 해시가 가까워도 렌더를 확인해야 삭제 대상이 된다
+            if hashes.text_hash or _scans_match(doc, rep_index, index):
+                match = rep_index
+        if match is None:
+            representatives[index] = hashes
+            tree.add(hashes.phash, index)
+        else:
+            members.setdefault(match, []).append(index)
+        if on_progress is not None:
+            on_progress(index + 1, total)
+
+    return [DuplicateCluster(keep, tuple(dupes)) for keep, dupes in sorted(members.items())]
+
+
+def duplicate_page_indices(clusters: list[DuplicateCluster]) -> set[int]:
+    return {index for cluster in clusters for index in cluster.duplicates}
+
+
+__all__ = [
+    "BKTree",
+    "DEFAULT_TEXT_THRESHOLD",
+    "DEFAULT_VISUAL_THRESHOLD",
+    "DuplicateCluster",
+    "MAX_THRESHOLD",
+    "PageHashes",
+    "duplicate_page_indices",
+    "find_duplicate_clusters",
+    "page_hashes",
+]
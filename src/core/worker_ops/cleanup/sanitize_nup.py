@@ -20,7 +20,7 @@ _HEADING_MIN_SIZE = 12.0
 _HEADING_SIZE_GAP = 1.5
 
 
-from .helpers import _page_text_len, _page_image_count, _page_drawing_count, _is_blank_page, _page_signature, _content_bbox, _collect_heading_toc
+from .helpers import _page_text_len, _page_image_count, _page_drawing_count, _is_blank_page, _content_bbox, _collect_heading_toc
 
 class WorkerCleanupSanitizeNupMixin(WorkerHost):
     def sanitize_pdf(self):
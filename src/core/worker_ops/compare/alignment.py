@@ -0,0 +1,135 @@
+"""PDF 비교 페이지 정렬 — 삽입/삭제 페이지가 있어도 대응 페이지끼리 비교한다.
+
+1) 페이지 지문 토큰(텍스트 해시, 텍스트 없는 페이지는 dHash)으로 difflib 앵커 정렬
+2) 앵커 사이의 불일치 구간만 유사도(SimHash/dHash 해밍 거리) 기반 DP 정렬
+"""
+from __future__ import annotations
+
+import difflib
+from collections.abc import Callable
+from typing import Any
+
+from ...text_layer_cache import TEXT_LAYER_CACHE, cached_page_text
+from .._pdf_helpers import PageFingerprint, hamming64, page_fingerprint
+
+PagePair = tuple[int | None, int | None]
+
+# 이 유사도 이하 페이지 쌍은 '변경'이 아니라 삭제+삽입으로 본다 (무관 텍스트 SimHash ≈ 0.5).
+PAIR_SIMILARITY_THRESHOLD = 0.7
+# DP 구간 상한 (셀 수). 넘으면 위치 기반 짝짓기로 대체.
+MAX_DP_CELLS = 250_000
+
+
+def _align_token(fingerprint: PageFingerprint) -> str:
+    if fingerprint.has_text:
+        return f"t:{fingerprint.text_hash}"
+    return f"i:{fingerprint.dhash or 0:016x}"
+
+
+def page_similarity(left: PageFingerprint, right: PageFingerprint) -> float:
+    if left.has_text and right.has_text:
+        return 1.0 - hamming64(left.simhash, right.simhash) / 64.0
+    if left.dhash is not None and right.dhash is not None:
+        return 1.0 - hamming64(left.dhash, right.dhash) / 64.0
+    return 0.0
+
+
+def _positional_pairs(left: list[int], right: list[int]) -> list[PagePair]:
+    pairs: list[PagePair] = list(zip(left, right))
+    pairs.extend((i, None) for i in left[len(right):])
+    pairs.extend((None, j) for j in right[len(left):])
+    return pairs
+
+
+def _dp_pairs(
+    left: list[PageFingerprint],
+    right: list[PageFingerprint],
+    threshold: float,
+) -> list[PagePair]:
+    n = len(left)
+    m = len(right)
+    score = [[0.0] * (m + 1) for _ in range(n + 1)]
+    for i in range(1, n + 1):
+        row = score[i]
+        prev = score[i - 1]
+        for j in range(1, m + 1):
+            best = max(prev[j], row[j - 1])
+            gain = page_similarity(left[i - 1], right[j - 1]) - threshold
+            if gain > 0:
+                best = max(best, prev[j - 1] + gain)
+            row[j] = best
+
+    pairs: list[PagePair] = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        if i > 0 and j > 0:
+            gain = page_similarity(left[i - 1], right[j - 1]) - threshold
+            if gain > 0 and score[i][j] == score[i - 1][j - 1] + gain:
+                pairs.append((left[i - 1].index, right[j - 1].index))
+                i -= 1
+                j -= 1
+                continue
+        if i > 0 and (j == 0 or score[i][j] == score[i - 1][j]):
+            pairs.append((left[i - 1].index, None))
+            i -= 1
+        else:
+            pairs.append((None, right[j - 1].index))
+            j -= 1
+    pairs.reverse()
+    return pairs
+
+
+def align_pages(
+    left: list[PageFingerprint],
+    right: list[PageFingerprint],
+    *,
+    threshold: float = PAIR_SIMILARITY_THRESHOLD,
+) -> list[PagePair]:
+    """두 문서 페이지 지문을 정렬해 (file1 index|None, file2 index|None) 순서 목록을 반환."""
+    matcher = difflib.SequenceMatcher(
+        a=[_align_token(fp) for fp in left],
+        b=[_align_token(fp) for fp in right],
+        autojunk=False,
+    )
+    pairs: list[PagePair] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            pairs.extend((left[i].index, right[j].index) for i, j in zip(range(i1, i2), range(j1, j2)))
+            continue
+        block_left = left[i1:i2]
+        block_right = right[j1:j2]
+        if len(block_left) == len(block_right) or not block_left or not block_right:
+            # 같은 길이의 교체 구간은 제자리 수정으로 본다 (기존 index 짝짓기와 동일).
+            pairs.extend(_positional_pairs([fp.index for fp in block_left], [fp.index for fp in block_right]))
+        elif len(block_left) * len(block_right) > MAX_DP_CELLS:
+            pairs.extend(_positional_pairs([fp.index for fp in block_left], [fp.index for fp in block_right]))
+        else:
+            pairs.extend(_dp_pairs(block_left, block_right, threshold))
+    return pairs
+
+
+def fingerprint_document(
+    doc: Any,
+    check_cancelled: Callable[[], None],
+    on_page: Callable[[int], None] | None = None,
+) -> list[PageFingerprint]:
+    """문서 전체 페이지 지문. 추출한 텍스트는 지문에 보관해 비교 단계에서 재사용한다."""
+    fingerprints: list[PageFingerprint] = []
+    text_key = TEXT_LAYER_CACHE.document_key(doc)
+    for index in range(len(doc)):
+        check_cancelled()
+        fingerprints.append(page_fingerprint(doc[index], index, raw_text=cached_page_text(doc, index, text_key)))
+        if on_page is not None:
+            on_page(index + 1)
+    return fingerprints
+
+
+def page_heading_args(result: dict[str, Any]) -> tuple[Any, ...]:
+    """비교 결과 항목의 보고서 제목 메시지 (key, *args)."""
+    page1 = result.get("page1")
+    page2 = result.get("page2")
+    if page1 is None and page2 is not None:
+        return ("compare_report_page_file2", page2)
+    if page1 is not None and page2 is not None and page1 != page2:
+        return ("compare_report_page_pair", page1, page2)
+    return ("compare_report_page", result.get("page"))
@@ -11,11 +11,12 @@ def normalize_block_text(text: Any) -> str:
     return " ".join(str(text or "").split()).casefold()
 
 
-def collect_text_blocks(page: Any) -> list[dict[str, Any]]:
+def collect_text_blocks(page: Any, raw_blocks: Any = None) -> list[dict[str, Any]]:
+    """raw_blocks: 텍스트 레이어 캐시의 (x0, y0, x1, y1, text) 블록 (이미 텍스트 블록만)."""
     blocks: list[dict[str, Any]] = []
-    for block in page.get_text("blocks"):
-        if len(block) < 7 or block[6] != 0:
-            continue
+    if raw_blocks is None:
+        raw_blocks = [block for block in page.get_text("blocks") if len(block) >= 7 and block[6] == 0]
+    for block in raw_blocks:
         normalized = normalize_block_text(block[4])
         if not normalized:
             continue
@@ -69,31 +70,7 @@ def pixel_diff_ratio(
     *,
     visual_dpi: float = 72.0,
 ) -> float:
-    """두 페이지 pixmap 샘플 기반 픽셀 차이 비율 (0~1)."""
-    zoom = visual_dpi / 72.0
-    mat = fitz.Matrix(zoom, zoom)
-    pix1 = p1.get_pixmap(matrix=mat, alpha=False)
-    pix2 = p2.get_pixmap(matrix=mat, alpha=False)
-    # 크기 맞추기
-    w = min(pix1.width, pix2.width)
-    h = min(pix1.height, pix2.height)
-    if w <= 0 or h <= 0:
-        return 1.0
-    if pix1.width != w or pix1.height != h:
-        pix1 = fitz.Pixmap(pix1, w, h, None)
-    if pix2.width != w or pix2.height != h:
-        pix2 = fitz.Pixmap(pix2, w, h, None)
-    s1 = pix1.samples
-    s2 = pix2.samples
-    n = min(len(s1), len(s2))
-    if n == 0:
-        return 1.0
-    # 샘플링으로 속도 확보
-    step = max(1, n // 120000)
-    diff = 0
-    total = 0
-    for i in range(0, n, step):
-        total += 1
-        if s1[i] != s2[i]:
-            diff += 1
-    return diff / max(1, total)
+    """두 페이지 전체 pixmap 기반 픽셀 차이 비율 (0~1)."""
+    from .pixel_diff import compare_page_pixels
+
+    return compare_page_pixels(p1, p2, visual_dpi=visual_dpi).ratio
@@ -16,6 +16,7 @@ from ...constants import (
     WATERMARK_TILE_SPACING_Y,
 )
 from ...optional_deps import fitz
+from ...text_layer_cache import TEXT_LAYER_CACHE, cached_page_text
 from ...worker_runtime.args import (
     _as_bool,
     _as_dict,
@@ -25,6 +26,7 @@ from ...worker_runtime.args import (
     _as_str,
 )
 from .._pdf_helpers import (
+    PageFingerprint,
     _extract_page_markdown,
     _fallback_markdown_from_text,
     _markdown_front_matter,
@@ -38,9 +40,10 @@ from .helpers import (
     diff_blocks,
     draw_overlay_rect,
     normalize_block_text,
-    pixel_diff_ratio,
     scale_rect,
 )
+from .alignment import align_pages, fingerprint_document, page_heading_args
+from .pixel_diff import compare_page_pixels, regions_to_page_rects
 
 logger = logging.getLogger(__name__)
 
@@ -70,45 +73,81 @@ class WorkerCompareOpsMixin(WorkerHost):
         )
         visual_dpi = max(36.0, min(150.0, _as_float(self.kwargs.get("visual_dpi"), 72.0) or 72.0))
         visual_threshold = max(0.0, min(1.0, _as_float(self.kwargs.get("visual_threshold"), 0.02) or 0.02))
+        # 삽입/삭제 페이지 정렬 (False 면 기존 index 짝짓기)
+        do_align = _as_bool(self.kwargs.get("align_pages"), True)
 
         doc1 = None
         doc2 = None
         try:
-            doc1 = self._open_pdf_document(file_path1)
-            doc2 = self._open_pdf_document(file_path2)
+            doc1 = self._open_pdf_document(file_path1, read_only=True)
+            doc2 = self._open_pdf_document(file_path2, read_only=True)
+            text_key1 = TEXT_LAYER_CACHE.document_key(doc1)
+            text_key2 = TEXT_LAYER_CACHE.document_key(doc2)
 
             results: list[dict[str, Any]] = []
             diff_pages: list[dict[str, Any]] = []
-            max_pages = max(len(doc1), len(doc2))
+            total_pages = max(1, len(doc1) + len(doc2))
 
-            def _pixel_diff_ratio(p1: Any, p2: Any) -> float:
-                return pixel_diff_ratio(p1, p2, visual_dpi=visual_dpi)
+            fingerprints1: list[PageFingerprint] | None = None
+            fingerprints2: list[PageFingerprint] | None = None
+            if do_align:
 
-            for index in range(max_pages):
-                self._check_cancelled()
-                self._emit_progress_if_due(int((index + 1) / max(1, max_pages) * 100))
+                def _fingerprint_progress(done: int) -> None:
+                    self._emit_progress_if_due(int(done / total_pages * 20))
 
-                page1 = doc1[index] if index < len(doc1) else None
-                page2 = doc2[index] if index < len(doc2) else None
-                if page1 is None:
-                    results.append({"page": index + 1, "status": "missing_file1"})
-                    diff_pages.append({"page_index": index, "page1": None, "page2": page2, "file1_only": [], "file2_only": []})
-                    continue
-                if page2 is None:
-                    results.append({"page": index + 1, "status": "missing_file2"})
-                    diff_pages.append({"page_index": index, "page1": page1, "page2": None, "file1_only": [], "file2_only": []})
+                fingerprints1 = fingerprint_document(doc1, self._check_cancelled, _fingerprint_progress)
+                fingerprints2 = fingerprint_document(
+                    doc2,
+                    self._check_cancelled,
+                    lambda done: _fingerprint_progress(len(doc1) + done),
+                )
+                pairs = align_pages(fingerprints1, fingerprints2)
+            else:
+                # index 짝짓기는 지문(dHash 렌더)이 필요 없다 — 텍스트만 캐시에서 읽는다
+                pairs = [
+                    (index if index < len(doc1) else None, index if index < len(doc2) else None)
+                    for index in range(max(len(doc1), len(doc2)))
+                ]
+
+            def _page_text(doc: Any, fingerprints: list[PageFingerprint] | None, text_key: Any, page_index: int) -> str:
+                if fingerprints is not None:
+                    return fingerprints[page_index].text
+                return cached_page_text(doc, page_index, text_key)
+
+            deleted_pages = [i1 + 1 for i1, i2 in pairs if i1 is not None and i2 is None]
+            inserted_pages = [i2 + 1 for i1, i2 in pairs if i1 is None and i2 is not None]
+
+            for step, (index1, index2) in enumerate(pairs):
+                self._check_cancelled()
+                self._emit_progress_if_due(20 + int((step + 1) / max(1, len(pairs)) * 80))
+
+                page1 = doc1[index1] if index1 is not None else None
+                page2 = doc2[index2] if index2 is not None else None
+                index = index1 if index1 is not None else cast(int, index2)
+                page_ref = {
+                    "page": index + 1,
+                    "page1": index1 + 1 if index1 is not None else None,
+                    "page2": index2 + 1 if index2 is not None else None,
+                }
+                diff_ref = {"page_index1": index1, "page_index2": index2, "page1": page1, "page2": page2}
+                if page1 is None or page2 is None:
+                    status = "missing_file1" if page1 is None else "missing_file2"
+                    results.append({**page_ref, "status": status})
+                    diff_pages.append({**diff_ref, "file1_only": [], "file2_only": []})
                     continue
 
-                text1 = _as_str(page1.get_text()) if do_text or do_visual else ""
-                text2 = _as_str(page2.get_text()) if do_text or do_visual else ""
+                text1 = _page_text(doc1, fingerprints1, text_key1, cast(int, index1)) if do_text or do_visual else ""
+                text2 = _page_text(doc2, fingerprints2, text_key2, cast(int, index2)) if do_text or do_visual else ""
                 text_same = text1 == text2
 
                 visual_ratio = 0.0
                 visual_diff = False
                 visual_error: str | None = None
+                pixel_result = None
                 if do_visual:
                     try:
-                        visual_ratio = _pixel_diff_ratio(page1, page2)
+                        pixel_result = compare_page_pixels(page1, page2, visual_dpi=visual_dpi)
+                        visual_ratio = pixel_result.ratio
                         visual_diff = visual_ratio > visual_threshold
                     except Exception as exc:
                         logger.warning("visual compare failed page %s: %s", index + 1, exc)
@@ -117,7 +156,7 @@ class WorkerCompareOpsMixin(WorkerHost):
                 if visual_error is not None:
                     results.append(
                         {
-                            "page": index + 1,
+                            **page_ref,
                             "status": "visual_error",
                             "added": 0,
                             "deleted": 0,
@@ -139,23 +178,24 @@ class WorkerCompareOpsMixin(WorkerHost):
                 if text_same and visual_diff:
                     results.append(
                         {
-                            "page": index + 1,
+                            **page_ref,
                             "status": "visual_diff",
                             "added": 0,
                             "deleted": 0,
                             "modified": 0,
                             "samples": [f"pixel_diff={visual_ratio:.3f}"],
                             "visual_ratio": visual_ratio,
+                            "visual_regions": len(pixel_result.regions) if pixel_result else 0,
                         }
                     )
-                    # 전체 페이지 오버레이용 빈 블록 대신 페이지 전체 rect
-                    full1 = [{"text": "", "rect": page1.rect}]
-                    full2 = [{"text": "", "rect": page2.rect}]
+                    # 변경 타일 bbox 로 국소 오버레이, 영역 계산 실패 시 페이지 전체 rect
+                    rects1 = regions_to_page_rects(pixel_result, page1.rect) if pixel_result else []
+                    rects2 = regions_to_page_rects(pixel_result, page2.rect) if pixel_result else []
+                    full1 = [{"text": "", "rect": rect} for rect in rects1] or [{"text": "", "rect": page1.rect}]
+                    full2 = [{"text": "", "rect": rect} for rect in rects2] or [{"text": "", "rect": page2.rect}]
                     diff_pages.append(
                         {
-                            "page_index": index,
-                            "page1": page1,
-                            "page2": page2,
+                            **diff_ref,
                             "file1_only": full1 if visual_diff else [],
                             "file2_only": full2 if visual_diff else [],
                         }
@@ -211,14 +251,18 @@ class WorkerCompareOpsMixin(WorkerHost):
                 if first_deleted_text and len(samples) < 3:
                     samples.append(f"- {first_deleted_text}")
 
-                file1_blocks = _collect_text_blocks(page1)
-                file2_blocks = _collect_text_blocks(page2)
+                file1_blocks = _collect_text_blocks(
+                    page1, TEXT_LAYER_CACHE.page_layer(doc1, cast(int, index1), text_key1).blocks
+                )
+                file2_blocks = _collect_text_blocks(
+                    page2, TEXT_LAYER_CACHE.page_layer(doc2, cast(int, index2), text_key2).blocks
+                )
                 file1_only = _diff_blocks(file1_blocks, file2_blocks)
                 file2_only = _diff_blocks(file2_blocks, file1_blocks)
 
                 results.append(
                     {
-                        "page": index + 1,
+                        **page_ref,
                         "status": "diff",
                         "added": added,
                         "deleted": deleted,
@@ -228,9 +272,7 @@ class WorkerCompareOpsMixin(WorkerHost):
                 )
                 diff_pages.append(
                     {
-                        "page_index": index,
-                        "page1": page1,
-                        "page2": page2,
+                        **diff_ref,
                         "file1_only": file1_only,
                         "file2_only": file2_only,
                     }
@@ -253,9 +295,9 @@ class WorkerCompareOpsMixin(WorkerHost):
                         canvas_rect = new_page.rect
 
                         if page1 is not None:
-                            new_page.show_pdf_page(canvas_rect, doc1, diff_page["page_index"])
+                            new_page.show_pdf_page(canvas_rect, doc1, diff_page["page_index1"])
                         elif page2 is not None:
-                            new_page.show_pdf_page(canvas_rect, doc2, diff_page["page_index"])
+                            new_page.show_pdf_page(canvas_rect, doc2, diff_page["page_index2"])
 
                         if page1 is None and page2 is not None:
                             _draw_overlay_rect(new_page, canvas_rect, stroke=(0.1, 0.2, 0.8), fill=(0.7, 0.8, 1.0))
@@ -302,11 +344,16 @@ class WorkerCompareOpsMixin(WorkerHost):
                 f"{self._get_msg('compare_report_file2')}: {os.path.basename(file_path2)}",
                 "",
             ]
+            if deleted_pages:
+                report_lines.append(f"- {self._get_msg('compare_report_deleted_pages', ', '.join(map(str, deleted_pages)))}")
+            if inserted_pages:
+                report_lines.append(f"- {self._get_msg('compare_report_inserted_pages', ', '.join(map(str, inserted_pages)))}")
+            if deleted_pages or inserted_pages:
+                report_lines.append("")
             if results:
                 for result in results:
-                    page_number = result["page"]
                     status = result["status"]
-                    report_lines.append(f"## {self._get_msg('compare_report_page', page_number)}")
+                    report_lines.append(f"## {self._get_msg(*page_heading_args(result))}")
                     if status == "missing_file1":
                         report_lines.append(f"- {self._get_msg('compare_report_missing_file1')}")
                     elif status == "missing_file2":
@@ -352,6 +399,8 @@ class WorkerCompareOpsMixin(WorkerHost):
                 results=results,
                 report_path=output_path,
                 visual_diff_path=visual_diff_path or "",
+                inserted_pages=inserted_pages,
+                deleted_pages=deleted_pages,
             )
             self.finished_signal.emit(
                 self._get_msg(
@@ -361,10 +410,10 @@ class WorkerCompareOpsMixin(WorkerHost):
                 )
             )
         finally:
-            if doc1:
-                doc1.close()
-            if doc2:
-                doc2.close()
+            if doc1 is not None:
+                self._release_pdf_document(doc1)
+            if doc2 is not None:
+                self._release_pdf_document(doc2)
 
     def compare_pdfs(self):
         """두 PDF 비교"""
@@ -0,0 +1,212 @@
+"""PDF 비교 visual 모드 픽셀 차이 엔진.
+
+전체 pixmap 을 타일 단위로 비교해 실제 차이 비율과 변경 영역 bbox 를 계산한다.
+NumPy 가 있으면 벡터화 경로, 없으면 행 단위 bytes 비교 후 차이 구간만 화소 비교한다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from ...optional_deps import NUMPY_AVAILABLE, fitz, np
+
+# 타일 한 변 (px). 72dpi 기준 A4 ≈ 39x50 타일.
+DEFAULT_TILE_SIZE = 16
+# 타일 내 변경 화소 비율이 이 값을 넘으면 변경 타일로 본다 (안티앨리어싱 잡음 완화).
+DEFAULT_TILE_THRESHOLD = 0.01
+# 영역이 너무 많으면 하나의 외곽 bbox 로 합친다 (오버레이 과밀 방지).
+MAX_DIFF_REGIONS = 64
+
+
+@dataclass(frozen=True, slots=True)
+class PixelDiffResult:
+    ratio: float
+    width: int
+    height: int
+    tile_size: int
+    tile_map: list[list[float]] = field(default_factory=list)
+    regions: list[tuple[int, int, int, int]] = field(default_factory=list)
+
+
+def _tile_fractions_numpy(
+    s1: Any,
+    s2: Any,
+    width: int,
+    height: int,
+    stride: int,
+    n: int,
+    tile_size: int,
+) -> tuple[float, list[list[float]]]:
+    assert np is not None
+    row_bytes = width * n
+    a = np.frombuffer(s1, dtype=np.uint8)[: height * stride].reshape(height, stride)[:, :row_bytes]
+    b = np.frombuffer(s2, dtype=np.uint8)[: height * stride].reshape(height, stride)[:, :row_bytes]
+    changed = (a != b).reshape(height, width, n).any(axis=2)
+    ratio = float(changed.mean()) if changed.size else 0.0
+
+    rows = -(-height // tile_size)
+    cols = -(-width // tile_size)
+    padded = np.zeros((rows * tile_size, cols * tile_size), dtype=np.uint32)
+    padded[:height, :width] = changed
+    counts = padded.reshape(rows, tile_size, cols, tile_size).sum(axis=(1, 3))
+    area = np.zeros_like(padded)
+    area[:height, :width] = 1
+    areas = area.reshape(rows, tile_size, cols, tile_size).sum(axis=(1, 3))
+    fractions = counts / np.maximum(areas, 1)
+    return ratio, fractions.tolist()
+
+
+def _tile_fractions_python(
+    s1: bytes,
+    s2: bytes,
+    width: int,
+    height: int,
+    stride: int,
+    n: int,
+    tile_size: int,
+) -> tuple[float, list[list[float]]]:
+    rows = -(-height // tile_size)
+    cols = -(-width // tile_size)
+    counts = [[0] * cols for _ in range(rows)]
+    total_changed = 0
+    row_bytes = width * n
+    seg_bytes = tile_size * n
+    for y in range(height):
+        start = y * stride
+        if s1[start:start + row_bytes] == s2[start:start + row_bytes]:
+            continue
+        tile_row = counts[y // tile_size]
+        for tx in range(cols):
+            seg_start = start + tx * seg_bytes
+            seg_end = min(seg_start + seg_bytes, start + row_bytes)
+            seg1 = s1[seg_start:seg_end]
+            seg2 = s2[seg_start:seg_end]
+            if seg1 == seg2:
+                continue
+            changed = sum(1 for i in range(0, len(seg1), n) if seg1[i:i + n] != seg2[i:i + n])
+            tile_row[tx] += changed
+            total_changed += changed
+
+    fractions: list[list[float]] = []
+    for ty in range(rows):
+        tile_h = min(tile_size, height - ty * tile_size)
+        row_out = []
+        for tx in range(cols):
+            tile_w = min(tile_size, width - tx * tile_size)
+            row_out.append(counts[ty][tx] / max(1, tile_w * tile_h))
+        fractions.append(row_out)
+    return total_changed / max(1, width * height), fractions
+
+
+def merge_changed_tiles(
+    tile_map: list[list[float]],
+    *,
+    tile_size: int,
+    width: int,
+    height: int,
+    tile_threshold: float = DEFAULT_TILE_THRESHOLD,
+) -> list[tuple[int, int, int, int]]:
+    """변경 타일의 8-연결 성분을 픽셀 좌표 bbox (x0, y0, x1, y1) 목록으로 묶는다."""
+    rows = len(tile_map)
+    cols = len(tile_map[0]) if rows else 0
+    seen = [[False] * cols for _ in range(rows)]
+    regions: list[tuple[int, int, int, int]] = []
+    for ty in range(rows):
+        for tx in range(cols):
+            if seen[ty][tx] or tile_map[ty][tx] <= tile_threshold:
+                continue
+            seen[ty][tx] = True
+            stack = [(ty, tx)]
+            min_y, min_x, max_y, max_x = ty, tx, ty, tx
+            while stack:
+                cy, cx = stack.pop()
+                min_y, max_y = min(min_y, cy), max(max_y, cy)
+                min_x, max_x = min(min_x, cx), max(max_x, cx)
+                for ny in (cy - 1, cy, cy + 1):
+                    for nx in (cx - 1, cx, cx + 1):
+                        if 0 <= ny < rows and 0 <= nx < cols and not seen[ny][nx]:
+                            if tile_map[ny][nx] > tile_threshold:
+                                seen[ny][nx] = True
+                                stack.append((ny, nx))
+            regions.append(
+                (
+                    min_x * tile_size,
+                    min_y * tile_size,
+                    min(width, (max_x + 1) * tile_size),
+                    min(height, (max_y + 1) * tile_size),
+                )
+            )
+    if len(regions) > MAX_DIFF_REGIONS:
+        regions = [
+            (
+                min(r[0] for r in regions),
+                min(r[1] for r in regions),
+                max(r[2] for r in regions),
+                max(r[3] for r in regions),
+            )
+        ]
+    return regions
+
+
+def diff_pixmaps(
+    pix1: Any,
+    pix2: Any,
+    *,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    tile_threshold: float = DEFAULT_TILE_THRESHOLD,
+) -> PixelDiffResult:
+    """같은 크기·채널의 두 pixmap 전체를 비교한다."""
+    width = min(pix1.width, pix2.width)
+    height = min(pix1.height, pix2.height)
+    tile_size = max(1, int(tile_size))
+    if width <= 0 or height <= 0:
+        return PixelDiffResult(1.0, max(0, width), max(0, height), tile_size)
+    if pix1.width != width or pix1.height != height:
+        pix1 = fitz.Pixmap(pix1, width, height, None)
+    if pix2.width != width or pix2.height != height:
+        pix2 = fitz.Pixmap(pix2, width, height, None)
+    n = min(int(pix1.n), int(pix2.n))
+    stride = int(getattr(pix1, "stride", width * n) or width * n)
+    if n <= 0 or pix1.n != pix2.n or stride != int(getattr(pix2, "stride", stride) or stride):
+        return PixelDiffResult(1.0, width, height, tile_size)
+
+    if NUMPY_AVAILABLE:
+        s1 = getattr(pix1, "samples_mv", None) or pix1.samples
+        s2 = getattr(pix2, "samples_mv", None) or pix2.samples
+        ratio, tile_map = _tile_fractions_numpy(s1, s2, width, height, stride, n, tile_size)
+    else:
+        ratio, tile_map = _tile_fractions_python(pix1.samples, pix2.samples, width, height, stride, n, tile_size)
+    regions = merge_changed_tiles(
+        tile_map,
+        tile_size=tile_size,
+        width=width,
+        height=height,
+        tile_threshold=tile_threshold,
+    )
+    return PixelDiffResult(ratio, width, height, tile_size, tile_map, regions)
+
+
+def compare_page_pixels(p1: Any, p2: Any, *, visual_dpi: float = 72.0) -> PixelDiffResult:
+    """두 페이지를 같은 DPI 로 렌더해 diff_pixmaps 결과를 반환한다."""
+    zoom = visual_dpi / 72.0
+    mat = fitz.Matrix(zoom, zoom)
+    pix1 = p1.get_pixmap(matrix=mat, alpha=False)
+    pix2 = p2.get_pixmap(matrix=mat, alpha=False)
+    return diff_pixmaps(pix1, pix2)
+
+
+def regions_to_page_rects(result: PixelDiffResult, page_rect: Any) -> list[Any]:
+    """픽셀 bbox 를 페이지 좌표계 fitz.Rect 로 변환한다."""
+    if result.width <= 0 or result.height <= 0:
+        return []
+    sx = page_rect.width / result.width
+    sy = page_rect.height / result.height
+    return [
+        fitz.Rect(
+            page_rect.x0 + x0 * sx,
+            page_rect.y0 + y0 * sy,
+            page_rect.x0 + x1 * sx,
+            page_rect.y0 + y1 * sy,
+        )
+        for x0, y0, x1, y1 in result.regions
+    ]
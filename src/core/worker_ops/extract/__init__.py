@@ -6,6 +6,7 @@ from .search_tables import WorkerExtractSearchTablesMixin
 from .annotations_links import WorkerExtractAnnotationsLinksMixin
 from .attachments import WorkerExtractAttachmentsMixin
 from .images_markdown import WorkerExtractImagesMarkdownMixin
+from .library_index import WorkerExtractLibraryIndexMixin
 
 
 class WorkerExtractOpsMixin(
@@ -15,6 +16,7 @@ class WorkerExtractOpsMixin(
     WorkerExtractAnnotationsLinksMixin,
     WorkerExtractAttachmentsMixin,
     WorkerExtractImagesMarkdownMixin,
+    WorkerExtractLibraryIndexMixin,
 ):
     """Composed WorkerExtractOpsMixin surface split by SOLID/SRP domain modules."""
 
@@ -41,7 +41,7 @@ class WorkerExtractAnnotationsLinksMixin(WorkerHost):
         all_annots: list[dict[str, Any]] = []
         doc = None
         try:
-            doc = self._open_pdf_document(file_path)
+            doc = self._open_pdf_document(file_path, read_only=True)
             total_pages = max(1, len(doc))
             for page_num in range(len(doc)):
                 self._check_cancelled()
@@ -61,8 +61,8 @@ class WorkerExtractAnnotationsLinksMixin(WorkerHost):
                         )
                 self._emit_progress_if_due(int((page_num + 1) / total_pages * 100))
         finally:
-            if doc:
-                doc.close()
+            if doc is not None:
+                self._release_pdf_document(doc)
 
         lines = [f"# 주석 목록: {os.path.basename(file_path)}", "", f"총 {len(all_annots)}개 주석", ""]
         for annot in all_annots:
@@ -82,7 +82,7 @@ class WorkerExtractAnnotationsLinksMixin(WorkerHost):
         file_path = _as_str(self.kwargs.get('file_path'))
         output_path = _as_str(self.kwargs.get('output_path'))
 
-        doc = self._open_pdf_document(file_path)
+        doc = self._open_pdf_document(file_path, read_only=True)
         all_links = []
         try:
             total_pages = len(doc)
@@ -98,7 +98,7 @@ class WorkerExtractAnnotationsLinksMixin(WorkerHost):
                         })
                 self._emit_progress_if_due(int((i + 1) / total_pages * 100))
         finally:
-            doc.close()
+            self._release_pdf_document(doc)
 
         body = [f"# {os.path.basename(file_path)} - Link List", ""]
         body.extend(f"Page {link['page']}: {link['url']}" for link in all_links)
@@ -39,7 +39,7 @@ class WorkerExtractAttachmentsMixin(WorkerHost):
         """PDF 첨부 파일 목록"""
         file_path = _as_str(self.kwargs.get('file_path'))
 
-        doc = self._open_pdf_document(file_path)
+        doc = self._open_pdf_document(file_path, read_only=True)
         attachments = []
 
         try:
@@ -59,7 +59,7 @@ class WorkerExtractAttachmentsMixin(WorkerHost):
             self._emit_progress_if_due(100)
             self.finished_signal.emit(self._get_msg("msg_attachments_listed", len(attachments)))
         finally:
-            doc.close()
+            self._release_pdf_document(doc)
 
     def add_attachment(self):
         """PDF에 파일 첨부"""
@@ -93,7 +93,7 @@ class WorkerExtractAttachmentsMixin(WorkerHost):
 
             self._check_cancelled()
             doc.embfile_add(os.path.basename(attach_path), data)
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
         finally:
             if doc:
                 doc.close()
@@ -111,7 +111,7 @@ class WorkerExtractAttachmentsMixin(WorkerHost):
         used_names: set[str] = set()
         try:
             os.makedirs(output_dir, exist_ok=True)
-            doc = self._open_pdf_document(file_path)
+            doc = self._open_pdf_document(file_path, read_only=True)
             total = doc.embfile_count()
 
             if total == 0:
@@ -129,6 +129,6 @@ class WorkerExtractAttachmentsMixin(WorkerHost):
                 count += 1
                 self._emit_progress_if_due(int((i + 1) / total * 100))
         finally:
-            if doc:
-                doc.close()
+            if doc is not None:
+                self._release_pdf_document(doc)
         self.finished_signal.emit(self._get_msg("msg_attachments_extracted", count))
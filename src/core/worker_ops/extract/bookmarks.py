@@ -41,11 +41,11 @@ class WorkerExtractBookmarksMixin(WorkerHost):
         toc: list[list[Any]] = []
         doc = None
         try:
-            doc = self._open_pdf_document(file_path)
+            doc = self._open_pdf_document(file_path, read_only=True)
             toc = cast(list[list[Any]], doc.get_toc() or [])
         finally:
-            if doc:
-                doc.close()
+            if doc is not None:
+                self._release_pdf_document(doc)
 
         lines = [f"# {self._get_msg('extract_bookmarks_title', os.path.basename(file_path))}", ""]
         if toc:
@@ -99,7 +99,7 @@ class WorkerExtractBookmarksMixin(WorkerHost):
                     )
                     return
             doc.set_toc(normalized)
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
         finally:
             if doc:
                 doc.close()
@@ -15,6 +15,7 @@ from ...constants import (
     WATERMARK_TILE_SPACING_Y,
 )
 from ...optional_deps import fitz
+from ...text_layer_cache import TEXT_LAYER_CACHE, cached_page_text
 from ...worker_runtime.args import (
     _as_bool,
     _as_dict,
@@ -43,7 +44,7 @@ class WorkerExtractImagesMarkdownMixin(WorkerHost):
         include_info = _as_bool(self.kwargs.get('include_info'), True)  # v3.2: 상세 정보 포함
         deduplicate = _as_bool(self.kwargs.get('deduplicate'), True)  # v3.2: 중복 제거
 
-        doc = self._open_pdf_document(file_path)
+        doc = self._open_pdf_document(file_path, read_only=True)
         image_count = 0
         image_info_list = []  # v3.2: 이미지 정보 목록
         seen_xrefs = set()  # v3.2: 중복 추적
@@ -100,7 +101,7 @@ class WorkerExtractImagesMarkdownMixin(WorkerHost):
                 )
 
         finally:
-            doc.close()
+            self._release_pdf_document(doc)
         dedup_msg = self._get_msg("msg_dedup_removed_suffix") if deduplicate else ""
         self.finished_signal.emit(self._get_msg("msg_images_extracted", dedup_msg, image_count))
 
@@ -115,50 +116,56 @@ class WorkerExtractImagesMarkdownMixin(WorkerHost):
         include_page_markers = _as_bool(self.kwargs.get('include_page_markers'), True)
         include_asset_placeholders = _as_bool(self.kwargs.get('include_asset_placeholders'), False)
 
-        doc = self._open_pdf_document(file_path)
-        markdown_chunks: list[str] = []
+        doc = self._open_pdf_document(file_path, read_only=True)
         total_pages = 0
 
         try:
             total_pages = len(doc)
-            if include_front_matter:
-                markdown_chunks.append(_markdown_front_matter(file_path, doc))
-
-            metadata = doc.metadata if isinstance(getattr(doc, "metadata", None), dict) else {}
-            document_title = _as_str(metadata.get("title")) or os.path.basename(file_path)
-            markdown_chunks.append(f"# {document_title}\n\n")
-
-            for page_num in range(total_pages):
-                page = doc[page_num]
-                self._check_cancelled()
-
-                if page_num > 0:
-                    markdown_chunks.append("\n")
-                if include_page_markers:
-                    markdown_chunks.append(f"---\n\n## Page {page_num + 1}\n\n")
-                if include_asset_placeholders:
-                    placeholders = _page_asset_placeholders(page)
-                    if placeholders:
-                        markdown_chunks.append("\n".join(placeholders))
-                        markdown_chunks.append("\n\n")
-
-                if markdown_mode == 'text':
-                    markdown_text = _fallback_markdown_from_text(page)
-                else:
-                    try:
-                        markdown_text = _extract_page_markdown(page, markdown_mode)
-                    except RuntimeError as exc:
-                        self.error_signal.emit(str(exc))
-                        return
-
-                if markdown_text:
-                    markdown_chunks.append(markdown_text)
-                    markdown_chunks.append("\n\n")
-                self._emit_progress_if_due(int((page_num + 1) / total_pages * 100))
+            # 페이지마다 임시 파일에 바로 기록하고 끝에서 교체 — 중간 오류·취소 시 기존 출력 유지
+            with self._atomic_text_stream(output_path) as writer:
+                if include_front_matter:
+                    writer.write(_markdown_front_matter(file_path, doc))
+
+                metadata = doc.metadata if isinstance(getattr(doc, "metadata", None), dict) else {}
+                document_title = _as_str(metadata.get("title")) or os.path.basename(file_path)
+                writer.write(f"# {document_title}\n\n")
+
+                text_key = TEXT_LAYER_CACHE.document_key(doc)
+                for page_num in range(total_pages):
+                    page = doc[page_num]
+                    self._check_cancelled()
+
+                    if page_num > 0:
+                        writer.write("\n")
+                    if include_page_markers:
+                        writer.write(f"---\n\n## Page {page_num + 1}\n\n")
+                    if include_asset_placeholders:
+                        placeholders = _page_asset_placeholders(page)
+                        if placeholders:
+                            writer.write("\n".join(placeholders))
+                            writer.write("\n\n")
+
+                    if markdown_mode == 'text':
+                        markdown_text = _fallback_markdown_from_text(
+                            page, cached_page_text(doc, page_num, text_key)
+                        )
+                    else:
+                        try:
+                            markdown_text = _extract_page_markdown(
+                                page,
+                                markdown_mode,
+                                page_text=lambda index=page_num: cached_page_text(doc, index, text_key),
+                            )
+                        except RuntimeError as exc:
+                            self.error_signal.emit(str(exc))
+                            return
+
+                    if markdown_text:
+                        writer.write(markdown_text)
+                        writer.write("\n\n")
+                    self._emit_progress_if_due(int((page_num + 1) / total_pages * 100))
+                writer.commit()
         finally:
-            doc.close()
-
-        markdown_text = "".join(markdown_chunks)
-        self._atomic_text_save(output_path, markdown_text)
+            self._release_pdf_document(doc)
 
         self.finished_signal.emit(self._get_msg("msg_markdown_extracted", total_pages))
@@ -0,0 +1,35 @@
+from __future__ import annotations
+import logging
+from ..._typing import WorkerHost
+from ...library_index import LibraryIndex, collect_library_paths
+from ...worker_runtime.args import _as_bool, _as_list, _as_str
+logger = logging.getLogger(__name__)
+
+
+class WorkerExtractLibraryIndexMixin(WorkerHost):
+    def library_index(self):
+        """최근 파일·라이브러리 폴더 전문 색인 갱신 (바뀐 파일만)"""
+        library_files = _as_list(self.kwargs.get("library_files"))
+        library_folders = _as_list(self.kwargs.get("library_folders"))
+        index_path = _as_str(self.kwargs.get("index_path")) or None
+        prune = _as_bool(self.kwargs.get("prune"), True)
+
+        paths = collect_library_paths(library_files, library_folders)
+
+        def _progress(done: int, total: int) -> None:
+            self._emit_progress_if_due(int(done / max(1, total) * 100))
+
+        with LibraryIndex(index_path) as index:
+            stats = index.update(
+                paths,
+                prune=prune,
+                check_cancelled=self._check_cancelled,
+                on_progress=_progress,
+            )
+            summary = index.summary()
+
+        self._set_result_payload(**stats.to_dict(), files=summary["files"], total_pages=summary["pages"])
+        self._emit_progress_if_due(100)
+        self.finished_signal.emit(
+            self._get_msg("msg_library_indexed", stats.indexed, stats.unchanged, summary["files"], summary["pages"])
+        )
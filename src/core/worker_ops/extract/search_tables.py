@@ -15,6 +15,7 @@ from ...constants import (
     WATERMARK_TILE_SPACING_Y,
 )
 from ...optional_deps import fitz
+from ...text_layer_cache import search_document_pages
 from ...worker_runtime.args import (
     _as_bool,
     _as_dict,
@@ -45,12 +46,12 @@ class WorkerExtractSearchTablesMixin(WorkerHost):
         results: list[dict[str, Any]] = []
         doc = None
         try:
-            doc = self._open_pdf_document(file_path)
+            doc = self._open_pdf_document(file_path, read_only=True)
+            search_page = search_document_pages(doc, search_term)
             total_pages = max(1, len(doc))
             for page_num in range(len(doc)):
                 self._check_cancelled()
-                page = doc[page_num]
-                text_instances = page.search_for(search_term)
+                text_instances = search_page(page_num)
                 if text_instances:
                     results.append(
                         {
@@ -61,8 +62,8 @@ class WorkerExtractSearchTablesMixin(WorkerHost):
                     )
                 self._emit_progress_if_due(int((page_num + 1) / total_pages * 100))
         finally:
-            if doc:
-                doc.close()
+            if doc is not None:
+                self._release_pdf_document(doc)
 
         lines = [
             f"# {self._get_msg('extract_search_title', search_term)}",
@@ -94,7 +95,7 @@ class WorkerExtractSearchTablesMixin(WorkerHost):
         all_tables: list[dict[str, Any]] = []
         doc = None
         try:
-            doc = self._open_pdf_document(file_path)
+            doc = self._open_pdf_document(file_path, read_only=True)
             total_pages = max(1, len(doc))
             for page_num in range(len(doc)):
                 self._check_cancelled()
@@ -115,8 +116,8 @@ class WorkerExtractSearchTablesMixin(WorkerHost):
                     logger.error("Page %s table extraction error: %s", page_num + 1, exc)
                 self._emit_progress_if_due(int((page_num + 1) / total_pages * 100))
         finally:
-            if doc:
-                doc.close()
+            if doc is not None:
+                self._release_pdf_document(doc)
 
         buffer = io.StringIO(newline="")
         writer = csv.writer(buffer)
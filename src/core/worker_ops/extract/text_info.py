@@ -5,7 +5,10 @@ import json
 import logging
 import os
 from collections import Counter
-from typing import Any, cast
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, cast
 from ..._typing import WorkerHost
 from ...constants import (
     DEFAULT_PAGE_SIZE,
@@ -14,7 +17,16 @@ from ...constants import (
     WATERMARK_TILE_SPACING_X,
     WATERMARK_TILE_SPACING_Y,
 )
+from ...ocr_pipeline import (
+    OcrResultStore,
+    classify_page,
+    is_cacheable_document,
+    iter_pool_ocr,
+    ocr_page,
+)
 from ...optional_deps import fitz
+from ...perf import perf_sample
+from ...process_pool import create_process_pool, resolve_pool_workers, shutdown_process_pool
 from ...worker_runtime.args import (
     _as_bool,
     _as_dict,
@@ -32,6 +44,26 @@ from .._pdf_helpers import (
     _sample_diff_text,
 )
 logger = logging.getLogger(__name__)
+# OCR 대상 페이지가 이보다 적으면 풀 기동 비용이 더 크다
+_PARALLEL_OCR_MIN_PAGES = 2
+
+
+@dataclass(slots=True)
+class _OcrRun:
+    """extract_text 한 번의 OCR 상태 (파일 간 공유되는 풀·캐시 저장소와 집계)."""
+
+    dpi: int
+    language: str
+    all_pages: bool
+    # 요청 풀 크기 (ocr_workers 인자 그대로 — resolve_pool_workers 가 해석)
+    workers: object = None
+    store: OcrResultStore | None = None
+    executor: ProcessPoolExecutor | None = None
+    success_pages: int = 0
+    fail_pages: int = 0
+    skipped_pages: int = 0
+    cache_hits: int = 0
+    last_error: str | None = None
 
 
 class WorkerExtractTextInfoMixin(WorkerHost):
@@ -47,125 +79,231 @@ class WorkerExtractTextInfoMixin(WorkerHost):
 
         total_files = len(file_paths)
         used_output_stems: set[str] = set()
-        ocr_success_pages = 0
-        ocr_fail_pages = 0
-        ocr_hard_fail: str | None = None
-        pages_processed = 0
+        ocr_run: _OcrRun | None = None
+        if use_ocr:
+            ocr_run = _OcrRun(
+                dpi=ocr_dpi,
+                language=ocr_language,
+                # 기본은 스캔 페이지만 OCR — True 면 모든 페이지 (이전 동작)
+                all_pages=_as_bool(self.kwargs.get("ocr_all_pages"), False),
+                workers=self.kwargs.get("ocr_workers"),
+            )
+            if _as_bool(self.kwargs.get("ocr_cache"), True):
+                try:
+                    ocr_run.store = OcrResultStore()
+                except Exception:
+                    logger.warning("OCR result cache unavailable", exc_info=True)
 
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
 
-        for file_idx, file_path in enumerate(file_paths):
-            if not file_path or not os.path.exists(file_path):
-                continue
-            doc = None
-            try:
-                doc = self._open_pdf_document(file_path)
-                text_chunks = []
-
-                for i in range(len(doc)):
-                    page = doc[i]
-                    self._check_cancelled()  # 취소 체크포인트
-                    text_chunks.append(f"\n--- Page {i+1} ---\n")
-                    pages_processed += 1
-
-                    if use_ocr:
-                        try:
-                            get_tp = getattr(page, "get_textpage_ocr", None)
-                            if not callable(get_tp):
-                                raise RuntimeError("page.get_textpage_ocr is not available in this PyMuPDF build")
-                            tp = get_tp(dpi=ocr_dpi, language=ocr_language, full=True)
-                            text_chunks.append(page.get_text("text", textpage=tp) or "")
-                            ocr_success_pages += 1
-                        except Exception as exc:
-                            logger.warning("OCR failed page %s: %s", i + 1, exc, exc_info=True)
-                            ocr_hard_fail = str(exc)
-                            ocr_fail_pages += 1
-                            # 네이티브 레이어 폴백
-                            text_chunks.append(page.get_text() or "")
-                    elif include_details:
-                        # v3.2: 상세 정보 추출 (폰트, 크기, 색상)
-                        text_dict = _as_dict(page.get_text("dict"))
-                        blocks = cast(list[dict[str, Any]], text_dict.get("blocks", []))
-                        for block in blocks:
-                            if block.get("type") == 0:  # 텍스트 블록
-                                for line in cast(list[dict[str, Any]], block.get("lines", [])):
-                                    for span in cast(list[dict[str, Any]], line.get("spans", [])):
-                                        text = span.get("text", "")
-                                        font = span.get("font", "unknown")
-                                        size = span.get("size", 0)
-                                        color = span.get("color", 0)
-                                        # RGB로 변환
-                                        r = (color >> 16) & 0xFF
-                                        g = (color >> 8) & 0xFF
-                                        b = color & 0xFF
-                                        text_chunks.append(
-                                            f"[Font: {font}, Size: {size:.1f}pt, Color: RGB({r},{g},{b})] {text}\n"
-                                        )
-                    else:
-                        text_chunks.append(page.get_text())
-            finally:
-                if doc:
-                    doc.close()
-
-            # 출력 경로 결정
-            if output_dir:
-                base = os.path.splitext(os.path.basename(file_path))[0]
-                unique_stem = self._build_unique_output_stem(
-                    output_dir,
-                    base,
-                    ".txt",
-                    used_output_stems,
-                )
-                out_path = os.path.join(output_dir, f"{unique_stem}.txt")
-            else:
-                out_path = output_path
+        finished_cleanly = False
+        try:
+            for file_idx, file_path in enumerate(file_paths):
+                if not file_path or not os.path.exists(file_path):
+                    continue
+                # 출력 경로 결정
+                if output_dir:
+                    base = os.path.splitext(os.path.basename(file_path))[0]
+                    unique_stem = self._build_unique_output_stem(
+                        output_dir,
+                        base,
+                        ".txt",
+                        used_output_stems,
+                    )
+                    out_path = os.path.join(output_dir, f"{unique_stem}.txt")
+                else:
+                    out_path = output_path
+
+                doc = None
+                try:
+                    doc = self._open_pdf_document(file_path, read_only=True)
+                    ocr_texts: dict[int, str] = {}
+                    if ocr_run is not None:
+                        ocr_texts = self._ocr_document_pages(
+                            doc,
+                            file_path,
+                            ocr_run,
+                            on_progress=lambda fraction: self._emit_progress_if_due(
+                                int((file_idx + fraction) / max(1, total_files) * 100)
+                            ),
+                        )
 
-            full_text = "".join(text_chunks)
-            self._atomic_text_save(out_path, full_text)
+                    # 페이지를 뽑는 즉시 임시 파일에 기록 — 문서 전체 텍스트를 메모리에 모으지 않는다
+                    with self._atomic_text_stream(out_path) as writer:
+                        for i in range(len(doc)):
+                            page = doc[i]
+                            self._check_cancelled()  # 취소 체크포인트
+                            writer.write(f"\n--- Page {i+1} ---\n")
+                            if ocr_run is not None:
+                                writer.write(ocr_texts.pop(i, ""))
+                                continue
 
-            self._emit_progress_if_due(int((file_idx + 1) / max(1, total_files) * 100))
+                            with perf_sample("page.get_text"):
+                                if include_details:
+                                    # v3.2: 상세 정보 추출 (폰트, 크기, 색상)
+                                    text_dict = _as_dict(page.get_text("dict"))
+                                    blocks = cast(list[dict[str, Any]], text_dict.get("blocks", []))
+                                    for block in blocks:
+                                        if block.get("type") == 0:  # 텍스트 블록
+                                            for line in cast(list[dict[str, Any]], block.get("lines", [])):
+                                                for span in cast(list[dict[str, Any]], line.get("spans", [])):
+                                                    text = span.get("text", "")
+                                                    font = span.get("font", "unknown")
+                                                    size = span.get("size", 0)
+                                                    color = span.get("color", 0)
+                                                    # RGB로 변환
+                                                    r = (color >> 16) & 0xFF
+                                                    g = (color >> 8) & 0xFF
+                                                    b = color & 0xFF
+                                                    writer.write(
+                                                        f"[Font: {font}, Size: {size:.1f}pt, Color: RGB({r},{g},{b})] {text}\n"
+                                                    )
+                                else:
+                                    writer.write(page.get_text())
+                        writer.commit()
+                finally:
+                    if doc is not None:
+                        self._release_pdf_document(doc)
 
-        # OCR 요청인데 성공 페이지가 0이면 hard-fail (네이티브 폴백만 남은 경우 포함)
-        if use_ocr and pages_processed > 0 and ocr_success_pages == 0:
-            detail = ocr_hard_fail or "OCR produced no successful pages"
-            self._update_result_payload(
-                ocr=True,
-                ocr_fallback=True,
-                ocr_success_pages=0,
-                ocr_fail_pages=ocr_fail_pages,
+                self._emit_progress_if_due(int((file_idx + 1) / max(1, total_files) * 100))
+            finished_cleanly = True
+        finally:
+            if ocr_run is not None:
+                # 취소·오류 시 실행 중인 Tesseract 자식은 강제 종료
+                shutdown_process_pool(ocr_run.executor, terminate=not finished_cleanly)
+                if ocr_run.store is not None:
+                    ocr_run.store.close()
+
+        if ocr_run is None:
+            self.finished_signal.emit(
+                self._get_msg(
+                    "msg_extract_text_done",
+                    total_files,
+                    self._get_msg("msg_extract_text_detail_suffix") if include_details else "",
+                )
             )
-            self.error_signal.emit(self._get_msg("err_ocr_unavailable", detail))
             return
 
-        if use_ocr and ocr_success_pages > 0:
-            # 부분 폴백이 있어도 결과 파일은 저장됨 — 경고 메타 포함
-            self._update_result_payload(
-                ocr=True,
-                ocr_fallback=bool(ocr_fail_pages),
-                ocr_success_pages=ocr_success_pages,
-                ocr_fail_pages=ocr_fail_pages,
+        ocr_payload = dict(
+            ocr=True,
+            ocr_fallback=bool(ocr_run.fail_pages),
+            ocr_success_pages=ocr_run.success_pages,
+            ocr_fail_pages=ocr_run.fail_pages,
+            ocr_skipped_pages=ocr_run.skipped_pages,
+            ocr_cache_hits=ocr_run.cache_hits,
+        )
+        # OCR 을 시도한 페이지가 모두 실패하면 hard-fail (네이티브 폴백만 남은 경우 포함)
+        if ocr_run.fail_pages and ocr_run.success_pages == 0:
+            self._update_result_payload(**ocr_payload)
+            self.error_signal.emit(
+                self._get_msg("err_ocr_unavailable", ocr_run.last_error or "OCR produced no successful pages")
             )
-            if ocr_fail_pages:
-                self.finished_signal.emit(
-                    self._get_msg(
-                        "msg_ocr_extract_done_partial",
-                        total_files,
-                        ocr_fail_pages,
-                        ocr_hard_fail or "",
-                    )
+            return
+
+        # 부분 폴백이 있어도 결과 파일은 저장됨 — 경고 메타 포함
+        self._update_result_payload(**ocr_payload)
+        if ocr_run.fail_pages:
+            self.finished_signal.emit(
+                self._get_msg(
+                    "msg_ocr_extract_done_partial",
+                    total_files,
+                    ocr_run.fail_pages,
+                    ocr_run.last_error or "",
                 )
+            )
+        else:
+            self.finished_signal.emit(self._get_msg("msg_ocr_extract_done", total_files))
+
+    def _ocr_document_pages(
+        self,
+        doc: Any,
+        file_path: str,
+        run: _OcrRun,
+        *,
+        on_progress: Callable[[float], None],
+    ) -> dict[int, str]:
+        """스캔 페이지만 OCR(캐시 → 프로세스 풀 → 직렬 순)하고 페이지별 텍스트를 돌려준다.
+
+        텍스트 레이어가 있는 페이지와 OCR 실패 페이지는 네이티브 텍스트를 쓴다.
+        """
+        texts: dict[int, str] = {}
+        targets: list[int] = []
+        for i in range(len(doc)):
+            self._check_cancelled()
+            page = doc[i]
+            if run.all_pages or classify_page(page).needs_ocr:
+                targets.append(i)
             else:
-                self.finished_signal.emit(self._get_msg("msg_ocr_extract_done", total_files))
-            return
+                with perf_sample("page.get_text"):
+                    texts[i] = page.get_text() or ""
+                run.skipped_pages += 1
+
+        # 암호화 문서는 OCR 평문을 디스크 캐시에 남기지 않는다
+        store = run.store if run.store is not None and is_cacheable_document(doc) else None
 
-        self.finished_signal.emit(
-            self._get_msg(
-                "msg_extract_text_done",
-                total_files,
-                self._get_msg("msg_extract_text_detail_suffix") if include_details else "",
+        def _accept(page_index: int, result: Any) -> None:
+            if isinstance(result, Exception):
+                logger.warning("OCR failed page %s: %s", page_index + 1, result, exc_info=result)
+                run.last_error = str(result)
+                run.fail_pages += 1
+                # 네이티브 레이어 폴백
+                texts[page_index] = doc[page_index].get_text() or ""
+            else:
+                texts[page_index] = result.text
+                run.success_pages += 1
+                if result.cached:
+                    run.cache_hits += 1
+                    if store is not None:
+                        store.touch(result.digest, run.language, run.dpi)
+                elif store is not None:
+                    store.put(result.digest, run.language, run.dpi, result.text)
+            on_progress(len(texts) / max(1, len(doc)))
+
+        pending = targets
+        workers = 1
+        if len(targets) >= _PARALLEL_OCR_MIN_PAGES:
+            workers = resolve_pool_workers(len(targets), run.workers)
+        if workers > 1 and run.executor is None:
+            try:
+                run.executor = create_process_pool(workers)
+            except Exception:
+                logger.warning("OCR process pool unavailable; running OCR serially", exc_info=True)
+                run.workers = 1
+        if workers > 1 and run.executor is not None:
+            remaining = set(targets)
+            results = iter_pool_ocr(
+                run.executor,
+                file_path,
+                self._password_for_pdf_path(file_path),
+                targets,
+                run.dpi,
+                run.language,
+                store.db_path if store is not None else "",
+                max_in_flight=workers * 2,
+                check_cancelled=self._check_cancelled,
             )
-        )
+            try:
+                for page_index, result in results:
+                    remaining.discard(page_index)
+                    _accept(page_index, result)
+            except BrokenProcessPool:
+                logger.warning("OCR process pool broke; %d page(s) left for serial OCR", len(remaining))
+                shutdown_process_pool(run.executor, terminate=True)
+                run.executor = None
+                run.workers = 1
+            finally:
+                results.close()
+            pending = sorted(remaining)
+
+        for i in pending:
+            self._check_cancelled()
+            try:
+                result: Any = ocr_page(doc[i], i, run.dpi, run.language, store)
+            except Exception as exc:
+                result = exc
+            _accept(i, result)
+        return texts
 
     def get_pdf_info(self):
         total_chars = 0
@@ -177,7 +315,7 @@ class WorkerExtractTextInfoMixin(WorkerHost):
         doc = None
         meta: dict[str, Any] = {}
         try:
-            doc = self._open_pdf_document(file_path)
+            doc = self._open_pdf_document(file_path, read_only=True)
             page_count = len(doc)
 
             for i in range(page_count):
@@ -191,8 +329,8 @@ class WorkerExtractTextInfoMixin(WorkerHost):
 
             meta = cast(dict[str, Any], doc.metadata or {})
         finally:
-            if doc:
-                doc.close()
+            if doc is not None:
+                self._release_pdf_document(doc)
 
         font_list = ", ".join(sorted(fonts_used)) if fonts_used else self._get_msg("pdf_info_fonts_none")
         file_kb = os.path.getsize(file_path) / 1024
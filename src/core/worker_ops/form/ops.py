@@ -93,7 +93,7 @@ class WorkerFormOpsMixin(WorkerHost):
                 self._emit_progress_if_due(int((page_index + 1) / total_pages * 100))
 
             self._check_cancelled()
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self._emit_progress_if_due(100)
             self.finished_signal.emit(self._get_msg("msg_form_filled", filled_count))
         finally:
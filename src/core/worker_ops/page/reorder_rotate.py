@@ -13,7 +13,6 @@ from ...constants import (
     WATERMARK_TILE_SPACING_X,
     WATERMARK_TILE_SPACING_Y,
 )
-from ...optional_deps import fitz
 from ...worker_runtime.args import (
     _as_bool,
     _as_dict,
@@ -29,6 +28,7 @@ from .._pdf_helpers import (
     _normalize_stroke_points,
     _page_asset_placeholders,
     _sample_diff_text,
+    build_page_subset,
 )
 logger = logging.getLogger(__name__)
 
@@ -97,12 +97,13 @@ class WorkerPageReorderRotateMixin(WorkerHost):
         doc_out = None
         try:
             doc_src = self._open_pdf_document(file_path)
-            doc_out = fitz.open()
-
-            for idx, page_num in enumerate(page_order):
-                self._check_cancelled()  # 취소 체크포인트
-                doc_out.insert_pdf(doc_src, from_page=page_num, to_page=page_num)
-                self._emit_progress_if_due(int((idx + 1) / len(page_order) * 100))
+            # 연속 구간(역순 포함)은 insert_pdf 한 번으로 복사
+            doc_out = build_page_subset(
+                doc_src,
+                page_order,
+                check_cancelled=self._check_cancelled,
+                on_progress=lambda done, count: self._emit_progress_if_due(int(done / count * 100)),
+            )
 
             self._atomic_pdf_save(doc_out, output_path)
             self.finished_signal.emit(self._get_msg("msg_reorder_done", len(page_order)))
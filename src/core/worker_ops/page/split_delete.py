@@ -29,6 +29,7 @@ from .._pdf_helpers import (
     _normalize_stroke_points,
     _page_asset_placeholders,
     _sample_diff_text,
+    build_page_subset,
 )
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,7 @@ class WorkerPageSplitDeleteMixin(WorkerHost):
         page_range = _as_str(self.kwargs.get('page_range'))
 
         doc_src = self._open_pdf_document(file_path)
-        doc_final = fitz.open()
+        doc_final = None
         try:
             total_pages = len(doc_src)
             # v3.2: 개선된 페이지 파싱 유틸리티 사용
@@ -53,11 +54,12 @@ class WorkerPageSplitDeleteMixin(WorkerHost):
             if not pages_to_keep:
                 raise ValueError(f"유효한 페이지 범위가 아닙니다: {page_range}")
 
-            total_count = max(1, len(pages_to_keep))  # Division by zero 방지
-            for idx, p_num in enumerate(pages_to_keep):
-                self._check_cancelled()
-                doc_final.insert_pdf(doc_src, from_page=p_num, to_page=p_num)
-                self._emit_progress_if_due(int((idx + 1) / total_count * 100))
+            doc_final = build_page_subset(
+                doc_src,
+                pages_to_keep,
+                check_cancelled=self._check_cancelled,
+                on_progress=lambda done, count: self._emit_progress_if_due(int(done / count * 100)),
+            )
 
             base = os.path.splitext(os.path.basename(file_path))[0]
             out = os.path.join(output_dir, f"{base}_extracted.pdf")
@@ -66,7 +68,8 @@ class WorkerPageSplitDeleteMixin(WorkerHost):
             self.finished_signal.emit(self._get_msg("msg_pages_extracted", len(pages_to_keep)))
         finally:
             doc_src.close()
-            doc_final.close()
+            if doc_final is not None:
+                doc_final.close()
 
     def delete_pages(self):
         file_path = _as_str(self.kwargs.get('file_path'))
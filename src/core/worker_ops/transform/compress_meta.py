@@ -25,18 +25,22 @@ from ...worker_runtime.args import (
     _as_str,
 )
 from .._pdf_helpers import (
+    StreamDedupeStats,
     _extract_page_markdown,
     _fallback_markdown_from_text,
     _markdown_front_matter,
     _normalize_stroke_points,
     _page_asset_placeholders,
     _sample_diff_text,
+    dedupe_document_streams,
+    estimate_optimized_sizes,
     optimize_pdf_images,
     subset_document_fonts,
 )
 from ..cleanup_ops import _content_bbox
 from ...pdf_validation import validate_pdf_file
 from ...worker_runtime.save_profiles import (
+    DEFAULT_COMPRESSION_SAVE_PROFILE,
     normalize_save_profile,
     quality_to_save_profile,
     resolve_image_optimize_options,
@@ -76,14 +80,21 @@ class WorkerTransformCompressMetaMixin(WorkerHost):
                 max_image_dpi=self.kwargs.get("max_image_dpi"),
                 jpeg_quality=self.kwargs.get("jpeg_quality"),
                 grayscale_images=self.kwargs.get("grayscale_images"),
+                dedupe_streams=self.kwargs.get("dedupe_streams"),
             )
 
+            # 중복 이미지·폰트를 먼저 합쳐 재인코딩 대상도 줄인다
+            dedupe_stats = StreamDedupeStats()
+            if optimize_opts.get("dedupe_streams"):
+                dedupe_stats = dedupe_document_streams(doc, check_cancelled=self._check_cancelled)
+                self._emit_progress_if_due(10)
+
             images_replaced = 0
             if optimize_opts.get("optimize_images"):
                 def _image_progress(done: int, total: int) -> None:
-                    # 이미지 단계: 0~70%
+                    # 이미지 단계: 10~70%
                     ratio = done / max(1, total)
-                    self._emit_progress_if_due(int(ratio * 70))
+                    self._emit_progress_if_due(10 + int(ratio * 60))
 
                 images_replaced = optimize_pdf_images(
                     doc,
@@ -92,6 +103,7 @@ class WorkerTransformCompressMetaMixin(WorkerHost):
                     grayscale=bool(optimize_opts.get("grayscale")),
                     check_cancelled=self._check_cancelled,
                     progress_cb=_image_progress,
+                    workers=self.kwargs.get("image_workers"),
                 )
             else:
                 self._check_cancelled()
@@ -106,6 +118,11 @@ class WorkerTransformCompressMetaMixin(WorkerHost):
             # 완료 메시지/디버그에 쓸 수 있도록 기록
             self.kwargs["compress_images_replaced"] = images_replaced
             self.kwargs["compress_fonts_subset"] = fonts_subset
+            self._set_result_payload(
+                dedupe_stats.to_payload(),
+                images_replaced=images_replaced,
+                fonts_subset=fonts_subset,
+            )
 
             self._atomic_pdf_save(
                 doc,
@@ -119,11 +136,42 @@ class WorkerTransformCompressMetaMixin(WorkerHost):
 
         new_size = os.path.getsize(output_path)
         ratio = (1 - new_size / original_size) * 100 if original_size > 0 else 0
+        self._update_result_payload(original_size=original_size, output_size=new_size)
         self._emit_progress_if_due(100)
         self.finished_signal.emit(
             self._get_msg("msg_compression_done", save_profile, original_size // 1024, new_size // 1024, ratio)
         )
 
+    def estimate_compression(self):
+        """저장 프로필별 압축 결과 크기 dry-run (파일은 쓰지 않는다)"""
+        file_path = _as_str(self.kwargs.get("file_path"))
+        save_profile = normalize_save_profile(
+            _as_str(self.kwargs.get("save_profile")),
+            default=DEFAULT_COMPRESSION_SAVE_PROFILE,
+        )
+
+        if not file_path or not os.path.exists(file_path):
+            self.error_signal.emit(self._get_msg("err_input_file_missing"))
+            return
+
+        original_size = os.path.getsize(file_path)
+        doc = self._open_pdf_document(file_path, read_only=True)
+        try:
+            estimates = estimate_optimized_sizes(
+                doc,
+                original_size=original_size,
+                check_cancelled=self._check_cancelled,
+            )
+        finally:
+            self._release_pdf_document(doc)
+
+        self._set_result_payload(original_size=original_size, estimates=estimates, save_profile=save_profile)
+        self._emit_progress_if_due(100)
+        estimated = estimates.get(save_profile, original_size)
+        self.finished_signal.emit(
+            self._get_msg("msg_compress_estimated", save_profile, original_size // 1024, estimated // 1024)
+        )
+
     def metadata_update(self):
         file_path = _as_str(self.kwargs.get("file_path"))
         output_path = _as_str(self.kwargs.get("output_path"))
@@ -136,7 +184,7 @@ class WorkerTransformCompressMetaMixin(WorkerHost):
                 if value:
                     meta[key] = value
             doc.set_metadata(meta)
-            self._atomic_pdf_save(doc, output_path)
+            self._atomic_pdf_save(doc, output_path, incremental=True)
             self._emit_progress_if_due(100)
             self.finished_signal.emit(self._get_msg("msg_metadata_saved"))
         finally:
@@ -4,8 +4,9 @@ import io
 import json
 import logging
 import os
-from collections import Counter
-from typing import Any, cast
+from collections import Counter, deque
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, cast
 from ..._typing import WorkerHost
 from ...constants import (
     COMPRESSION_SETTINGS,
@@ -16,6 +17,7 @@ from ...constants import (
     WATERMARK_TILE_SPACING_Y,
 )
 from ...optional_deps import fitz
+from ...perf import perf_sample
 from ...worker_runtime.args import (
     _as_bool,
     _as_dict,
@@ -36,6 +38,8 @@ from .._pdf_helpers import (
 )
 from ..cleanup_ops import _content_bbox
 from ...pdf_validation import validate_pdf_file
+from ...process_pool import create_process_pool, resolve_pool_workers, shutdown_process_pool
+from ...render_pool import discard_staged_file, iter_staged_page_renders, staged_render_files
 from ...worker_runtime.save_profiles import (
     normalize_save_profile,
     quality_to_save_profile,
@@ -43,6 +47,9 @@ from ...worker_runtime.save_profiles import (
 )
 logger = logging.getLogger(__name__)
 
+# 이보다 페이지가 적으면 프로세스 기동 비용이 렌더 시간보다 커서 직렬 렌더한다.
+_PARALLEL_RENDER_MIN_PAGES = 16
+
 
 class WorkerTransformConvertMixin(WorkerHost):
     def convert_to_img(self):
@@ -51,40 +58,190 @@ class WorkerTransformConvertMixin(WorkerHost):
         output_dir = _as_str(self.kwargs.get('output_dir'))
         fmt = _as_str(self.kwargs.get('fmt'), 'png')
         dpi = _as_int(self.kwargs.get('dpi'), 200)
+        render_workers = self.kwargs.get('render_workers')
         zoom = dpi / 72
         mat = fitz.Matrix(zoom, zoom)
 
         total_files = len(file_paths)
         used_output_stems: set[str] = set()
         os.makedirs(output_dir, exist_ok=True)
+        executor = None
+        # 렌더 중 작업 프로세스를 죽인 페이지 ("파일명 p번호")
+        failed_pages: list[str] = []
 
-        for file_idx, file_path in enumerate(file_paths):
-            if not file_path or not os.path.exists(file_path):
+        try:
+            for file_idx, file_path in enumerate(file_paths):
+                if not file_path or not os.path.exists(file_path):
+                    continue
+                doc = None
+                try:
+                    doc = self._open_pdf_document(file_path, read_only=True)
+                    page_count = len(doc)
+                    base = os.path.splitext(os.path.basename(file_path))[0]
+                    unique_stem = self._build_unique_output_stem(
+                        output_dir,
+                        base,
+                        f"_p001.{fmt}",
+                        used_output_stems,
+                    )
+                    pages_done = 0
+
+                    def _on_page_done() -> None:
+                        nonlocal pages_done
+                        pages_done += 1
+                        fraction = (file_idx + pages_done / max(1, page_count)) / max(1, total_files)
+                        self._emit_progress_if_due(int(fraction * 100))
+
+                    pending_pages = list(range(page_count))
+                    workers = 1
+                    if page_count >= _PARALLEL_RENDER_MIN_PAGES:
+                        workers = resolve_pool_workers(page_count, render_workers)
+                    if workers > 1 and executor is None:
+                        try:
+                            executor = create_process_pool(workers)
+                        except Exception:
+                            logger.warning("Render process pool unavailable; rendering serially", exc_info=True)
+                            render_workers = 1
+                    if workers > 1 and executor is not None:
+                        executor, crashed_pages, pending_pages = self._render_pages_in_pool(
+                            executor,
+                            workers,
+                            file_path,
+                            pending_pages,
+                            zoom=zoom,
+                            output_dir=output_dir,
+                            unique_stem=unique_stem,
+                            fmt=fmt,
+                            on_page_done=_on_page_done,
+                        )
+                        failed_pages.extend(f"{base} p{i + 1}" for i in crashed_pages)
+                        if pending_pages:
+                            # 풀을 다시 만들 수 없다 — 크래시와 무관한 남은 페이지만 현 스레드에서 렌더한다.
+                            render_workers = 1
+
+                    for i in pending_pages:
+                        page = doc[i]
+                        self._check_cancelled()  # 취소 체크포인트
+                        with perf_sample("page.render"):
+                            pix = page.get_pixmap(matrix=mat)
+                        save_path = os.path.join(output_dir, f"{unique_stem}_p{i+1:03d}.{fmt}")
+                        self._atomic_pixmap_save(pix, save_path)
+                        _on_page_done()
+                finally:
+                    if doc is not None:
+                        self._release_pdf_document(doc)
+                self._emit_progress_if_due(int((file_idx + 1) / max(1, total_files) * 100))
+        finally:
+            shutdown_process_pool(executor)
+
+        message = self._get_msg("msg_convert_to_img_done", total_files, fmt.upper())
+        if failed_pages:
+            self._set_result_payload(failed_pages=failed_pages)
+            message += self._get_msg("msg_convert_pages_failed", len(failed_pages), ", ".join(failed_pages[:10]))
+        self.finished_signal.emit(message)
+
+    def _render_pages_in_pool(
+        self,
+        executor: Any,
+        workers: int,
+        file_path: str,
+        page_indices: list[int],
+        *,
+        zoom: float,
+        output_dir: str,
+        unique_stem: str,
+        fmt: str,
+        on_page_done: Callable[[], None],
+    ) -> tuple[Any, list[int], list[int]]:
+        """풀 손상에 견디며 페이지를 렌더한다. (계속 쓸 풀 또는 None, 실패 페이지, 직렬로 렌더할 페이지) 반환.
+
+        풀이 깨지면 그때 실행 중이던 페이지(남은 페이지 중 앞쪽 창 크기 안)를 새 풀에서 하나씩 격리해
+        다시 렌더하고, 혼자 돌려도 자식이 죽는 페이지는 실패로 돌린다 — GUI 프로세스에서 다시 열지 않는다.
+        풀을 다시 만들 수 없을 때만 아직 의심받지 않은 페이지를 직렬 렌더용으로 돌려준다.
+        """
+        # 깨진 풀의 자식이 쓰다 만(또는 결과를 잃은) 임시 파일은 풀을 닫은 뒤 지운다
+        staged_dir = os.path.abspath(output_dir)
+        staged_before = staged_render_files(staged_dir, f".{fmt}")
+
+        def _discard_lost_renders() -> None:
+            for staged_path in staged_render_files(staged_dir, f".{fmt}") - staged_before:
+                discard_staged_file(staged_path)
+
+        window = workers * 2
+        pending = list(page_indices)
+        suspects: deque[int] = deque()
+        failed: list[int] = []
+        render_kwargs: dict[str, Any] = dict(
+            zoom=zoom,
+            output_dir=output_dir,
+            unique_stem=unique_stem,
+            fmt=fmt,
+            on_page_done=on_page_done,
+        )
+        broken = False
+        while pending or suspects:
+            if broken:
+                shutdown_process_pool(executor, terminate=True)
+                _discard_lost_renders()
+                try:
+                    executor = create_process_pool(workers)
+                except Exception:
+                    logger.warning("Render process pool could not be recreated", exc_info=True)
+                    failed.extend(suspects)
+                    return None, failed, pending
+            if suspects:
+                page_index = suspects.popleft()
+                broken = bool(self._render_pages_parallel(executor, file_path, [page_index], max_in_flight=1, **render_kwargs))
+                if broken:
+                    logger.warning("Page %d of %s crashed the render worker; skipping it", page_index + 1, file_path)
+                    failed.append(page_index)
                 continue
-            doc = None
-            try:
-                doc = self._open_pdf_document(file_path)
-                base = os.path.splitext(os.path.basename(file_path))[0]
-                unique_stem = self._build_unique_output_stem(
-                    output_dir,
-                    base,
-                    f"_p001.{fmt}",
-                    used_output_stems,
-                )
-                for i in range(len(doc)):
-                    page = doc[i]
-                    self._check_cancelled()  # 취소 체크포인트
-                    pix = page.get_pixmap(matrix=mat)
-                    save_path = os.path.join(output_dir, f"{unique_stem}_p{i+1:03d}.{fmt}")
-                    self._atomic_pixmap_save(pix, save_path)
-            finally:
-                if doc:
-                    doc.close()
-            self._emit_progress_if_due(int((file_idx + 1) / max(1, total_files) * 100))
+            remaining = self._render_pages_parallel(executor, file_path, pending, max_in_flight=window, **render_kwargs)
+            broken = bool(remaining)
+            suspects.extend(remaining[:window])
+            pending = remaining[window:]
+        if broken:
+            shutdown_process_pool(executor, terminate=True)
+            _discard_lost_renders()
+            return None, failed, []
+        return executor, failed, []
 
-        self.finished_signal.emit(
-            self._get_msg("msg_convert_to_img_done", total_files, fmt.upper())
+    def _render_pages_parallel(
+        self,
+        executor: Any,
+        file_path: str,
+        page_indices: list[int],
+        *,
+        zoom: float,
+        output_dir: str,
+        unique_stem: str,
+        fmt: str,
+        max_in_flight: int,
+        on_page_done: Callable[[], None],
+    ) -> list[int]:
+        """프로세스 풀로 페이지를 렌더하고 완료 순서대로 커밋한다. 풀이 깨지면 남은(미렌더) 페이지를 반환."""
+        remaining = set(page_indices)
+        renders = iter_staged_page_renders(
+            executor,
+            file_path,
+            self._password_for_pdf_path(file_path),
+            page_indices,
+            zoom,
+            os.path.abspath(output_dir),
+            f".{fmt}",
+            max_in_flight=max_in_flight,
         )
+        try:
+            for page_index, staged_path in renders:
+                save_path = os.path.join(output_dir, f"{unique_stem}_p{page_index + 1:03d}.{fmt}")
+                self._commit_staged_output(staged_path, save_path)
+                remaining.discard(page_index)
+                on_page_done()
+        except BrokenProcessPool:
+            logger.warning("Render process pool broke; %d page(s) not rendered", len(remaining))
+        finally:
+            renders.close()
+        return sorted(remaining)
 
     def convert_to_svg(self):
         """페이지별 SVG 내보내기."""
@@ -108,7 +265,7 @@ class WorkerTransformConvertMixin(WorkerHost):
                 continue
             doc = None
             try:
-                doc = self._open_pdf_document(file_path)
+                doc = self._open_pdf_document(file_path, read_only=True)
                 base = os.path.splitext(os.path.basename(file_path))[0]
                 unique_stem = self._build_unique_output_stem(
                     output_dir,
@@ -124,8 +281,8 @@ class WorkerTransformConvertMixin(WorkerHost):
                     self._atomic_text_save(out_path, svg if isinstance(svg, str) else str(svg))
                     page_total_written += 1
             finally:
-                if doc:
-                    doc.close()
+                if doc is not None:
+                    self._release_pdf_document(doc)
             self._emit_progress_if_due(int((file_idx + 1) / max(1, total_files) * 100))
 
         self.finished_signal.emit(self._get_msg("msg_convert_to_svg_done", page_total_written))
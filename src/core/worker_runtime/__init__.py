@@ -1,7 +1,9 @@
 from .dispatch import MODE_TO_HANDLER, OPERATION_SPECS, OperationSpec, get_handler_method_name, get_operation_spec
+from .errors import CancelledError
 from .mixin import WorkerRuntimeMixin
 
 __all__ = [
+    "CancelledError",
     "MODE_TO_HANDLER",
     "OPERATION_SPECS",
     "OperationSpec",
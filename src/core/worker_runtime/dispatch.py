@@ -134,6 +134,8 @@ OPERATION_SPECS: dict[str, OperationSpec] = {
             "results",
             "report_path",
             "visual_diff_path",
+            "inserted_pages",
+            "deleted_pages",
         ),
     ),
     "auto_bookmarks": _spec("auto_bookmarks", undo_eligible=True, same_path_safe=True, output_kind="pdf", title_key="mode_auto_bookmarks"),
@@ -147,6 +149,14 @@ OPERATION_SPECS: dict[str, OperationSpec] = {
     "delete_pages": _spec("delete_pages", undo_eligible=True, same_path_safe=True, output_kind="pdf", title_key="action_delete_pages", required_kwargs=("page_range",)),
     "draw_shapes": _spec("draw_shapes", undo_eligible=True, same_path_safe=True, output_kind="pdf", title_key="mode_draw_shapes"),
     "duplicate_page": _spec("duplicate_page", undo_eligible=True, same_path_safe=True, output_kind="pdf", title_key="btn_duplicate"),
+    "estimate_compression": _spec(
+        "estimate_compression",
+        output_kind="memory",
+        result_kind="compress_estimate",
+        title_key="mode_estimate_compression",
+        result_payload_keys=("original_size", "estimates", "save_profile"),
+        refresh_preview=False,
+    ),
     "extract_attachments": _spec("extract_attachments", output_kind="directory", title_key="mode_extract_attachments"),
     "extract_images": _spec("extract_images", output_kind="directory", title_key="mode_extract_images"),
     "extract_links": _spec("extract_links", output_kind="text", title_key="mode_extract_links"),
@@ -160,6 +170,14 @@ OPERATION_SPECS: dict[str, OperationSpec] = {
     ),
     "fill_form": _spec("fill_form", undo_eligible=True, same_path_safe=True, output_kind="pdf", title_key="mode_fill_form"),
     "flatten_form": _spec("flatten_form", undo_eligible=True, same_path_safe=True, output_kind="pdf", title_key="mode_flatten_form"),
+    "find_duplicate_pages": _spec(
+        "find_duplicate_pages",
+        output_kind="memory",
+        result_kind="duplicate_pages",
+        title_key="mode_find_duplicate_pages",
+        result_payload_keys=("file_path", "dedupe_threshold", "duplicate_clusters", "removed", "total"),
+        refresh_preview=False,
+    ),
     "get_bookmarks": _spec("get_bookmarks", output_kind="text", title_key="mode_get_bookmarks"),
     "get_form_fields": _spec(
         "get_form_fields",
@@ -204,6 +222,14 @@ OPERATION_SPECS: dict[str, OperationSpec] = {
         result_payload_keys=("attachments",),
         refresh_preview=False,
     ),
+    "library_index": _spec(
+        "library_index",
+        output_kind="memory",
+        result_kind="library_index",
+        title_key="mode_library_index",
+        result_payload_keys=("indexed", "unchanged", "removed", "skipped_encrypted", "failed", "pages", "files", "total_pages"),
+        refresh_preview=False,
+    ),
     "merge": _spec("merge", output_kind="pdf", title_key="action_merge"),
     "metadata_update": _spec("metadata_update", undo_eligible=True, same_path_safe=True, output_kind="pdf", title_key="mode_metadata_update"),
     "protect": _spec("protect", undo_eligible=True, same_path_safe=True, output_kind="pdf", title_key="action_encrypt", required_kwargs=("password",)),
@@ -0,0 +1,5 @@
+class CancelledError(Exception):
+    """작업 취소 시 발생하는 예외 (Qt 비의존 — worker.py 가 재노출)"""
+
+
+__all__ = ["CancelledError"]
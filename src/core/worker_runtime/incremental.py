@@ -0,0 +1,94 @@
+"""증분(incremental) 저장 — 원본 사본에 변경 객체만 덧붙인다.
+
+PyMuPDF 의 `save(incremental=True)` 는 원본 파일에 직접 쓰므로 원자 교체를 깨뜨린다.
+대신 원본을 임시 파일로 복제(reflink 지원 FS 에서는 copy-on-write)하고,
+MuPDF 저수준 writer 로 업데이트 섹션만 그 사본 끝에 추가한 뒤 호출측이 os.replace 한다.
+암호화·복구(repair)된 문서나 재작성 옵션(garbage/deflate 등)이 있으면 전체 저장으로 폴백한다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+from typing import Any
+
+from ..optional_deps import FITZ_AVAILABLE, fitz
+
+logger = logging.getLogger(__name__)
+
+# 증분 저장과 함께 허용되는(값이 참이어도 재작성을 요구하지 않는) 저장 옵션
+_INCREMENTAL_COMPATIBLE_KEYS = frozenset({"incremental", "no_new_id"})
+_CLONE_CHUNK = 64 * 1024 * 1024
+
+
+def incremental_save_blocker(doc: Any, save_kwargs: dict[str, Any]) -> str:
+    """증분 저장이 불가능한 이유 (가능하면 "")."""
+    if not FITZ_AVAILABLE or not hasattr(fitz, "mupdf") or not hasattr(fitz, "_as_pdf_document"):
+        # 저수준 바인딩이 없는 PyMuPDF (구버전)
+        return "fitz_unavailable"
+    name = getattr(doc, "name", "") or ""
+    if not name or getattr(doc, "stream", None) is not None or not os.path.isfile(name):
+        return "no_source_file"
+    if not getattr(doc, "is_pdf", False):
+        return "not_pdf"
+    for key, value in save_kwargs.items():
+        if value and key not in _INCREMENTAL_COMPATIBLE_KEYS:
+            return f"option:{key}"
+    try:
+        if doc.needs_pass or (doc.metadata or {}).get("encryption"):
+            return "encrypted"
+        if doc.is_repaired or not doc.can_save_incrementally():
+            return "repaired"
+        # 열린 뒤 원본이 바뀌었으면 사본 끝에 덧붙인 xref 오프셋이 어긋난다
+        pdf = fitz._as_pdf_document(doc)
+        if int(pdf.m_internal.file_size) != os.path.getsize(name):
+            return "source_changed"
+    except Exception as exc:
+        return f"probe_failed:{exc}"
+    return ""
+
+
+def clone_file(src: str, dst: str) -> None:
+    """src 를 dst 로 복제. 가능하면 커널 내 복사(reflink FS 에서는 블록 공유)를 쓴다."""
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        shutil.copyfile(src, dst)
+        return
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = copy_range(fsrc.fileno(), fdst.fileno(), min(remaining, _CLONE_CHUNK))
+                if copied <= 0:
+                    break
+                remaining -= copied
+        except OSError:
+            # 교차 FS·미지원 커널 — 일반 복사로 처음부터
+            remaining = -1
+    if remaining != 0:
+        shutil.copyfile(src, dst)
+
+
+def write_incremental_copy(doc: Any, tmp_path: str) -> int:
+    """원본 사본(tmp_path)에 증분 업데이트를 덧붙이고 추가된 바이트 수를 반환한다."""
+    mupdf = fitz.mupdf
+    clone_file(doc.name, tmp_path)
+    base_size = os.path.getsize(tmp_path)
+    pdf = fitz._as_pdf_document(doc)
+    opts = mupdf.PdfWriteOptions()
+    opts.do_incremental = 1
+    opts.do_encrypt = fitz.PDF_ENCRYPT_KEEP
+    embedded_clean = getattr(fitz, "JM_embedded_clean", None)
+    if embedded_clean is not None:
+        embedded_clean(pdf)
+    out = mupdf.FzOutput(tmp_path, 1)
+    try:
+        mupdf.pdf_write_document(pdf, out, opts)
+    finally:
+        out.fz_close_output()
+    appended = os.path.getsize(tmp_path) - base_size
+    logger.debug("Incremental save appended %s bytes to copy of %s", appended, doc.name)
+    return appended
+
+
+__all__ = ["clone_file", "incremental_save_blocker", "write_incremental_copy"]
@@ -6,6 +6,9 @@ import re
 import tempfile
 from typing import Any, cast
 
+from ..doc_pool import DOC_POOL
+from ..perf import perf_sample
+from .incremental import incremental_save_blocker, write_incremental_copy
 from .save_profiles import resolve_save_kwargs
 
 logger = logging.getLogger(__name__)
@@ -107,6 +110,86 @@ def record_created_output_path(host: Any, path: str) -> None:
         created_paths.append(abs_path)
 
 
+class AtomicTextWriter:
+    """스트리밍 원자적 텍스트 저장기.
+
+    같은 디렉터리의 임시 파일을 한 번 열어 조각을 바로 기록하고 `commit()` 에서 os.replace 로
+    교체한다. commit 전에 빠져나가면(예외·취소·조기 return) 임시 파일만 지우고 기존 출력은
+    그대로 둔다. host 가 있으면 교체 전후 취소 확인과 생성 파일 추적을 atomic_text_save 와
+    똑같이 한다.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        *,
+        encoding: str = "utf-8",
+        newline: str | None = None,
+        host: Any = None,
+    ) -> None:
+        if not output_path:
+            raise ValueError("output_path is required")
+        self.output_path = output_path
+        self._host = host
+        out_dir = os.path.dirname(os.path.abspath(output_path)) or "."
+        os.makedirs(out_dir, exist_ok=True)
+        suffix = os.path.splitext(output_path)[1] or ".tmp"
+        fd, self._tmp_path = tempfile.mkstemp(prefix=".pdf_master_", suffix=f".tmp{suffix}", dir=out_dir)
+        try:
+            self._handle: Any = os.fdopen(fd, "w", encoding=encoding, newline=newline)
+        except Exception:
+            os.close(fd)
+            self._remove_tmp()
+            raise
+        self._committed = False
+
+    def __enter__(self) -> "AtomicTextWriter":
+        return self
+
+    def __exit__(self, _exc_type: object, _exc_val: object, _exc_tb: object) -> None:
+        if not self._committed:
+            self.discard()
+
+    def write(self, text: str) -> None:
+        if text:
+            self._handle.write(text)
+
+    def commit(self) -> bool:
+        """임시 파일을 최종 경로로 교체하고 새로 만든 파일인지 반환한다."""
+        if self._committed:
+            raise RuntimeError("AtomicTextWriter already committed")
+        try:
+            self._handle.close()
+            if self._host is not None:
+                self._host._check_cancelled()
+            output_existed = os.path.exists(self.output_path)
+            os.replace(self._tmp_path, self.output_path)
+        except BaseException:
+            self.discard()
+            raise
+        self._committed = True
+        created = not output_existed
+        if self._host is not None:
+            if created:
+                record_created_output_path(self._host, self.output_path)
+            self._host._check_cancelled()
+        return created
+
+    def discard(self) -> None:
+        try:
+            self._handle.close()
+        except Exception:
+            logger.debug("Failed to close temporary text file", exc_info=True)
+        self._remove_tmp()
+
+    def _remove_tmp(self) -> None:
+        if os.path.exists(self._tmp_path):
+            try:
+                os.remove(self._tmp_path)
+            except Exception:
+                logger.debug("Failed to remove temporary text file", exc_info=True)
+
+
 def atomic_text_write(
     output_path: str,
     text: str,
@@ -115,29 +198,9 @@ def atomic_text_write(
     newline: str | None = None,
 ) -> bool:
     """Write text atomically and return whether the target file was newly created."""
-    if not output_path:
-        raise ValueError("output_path is required")
-
-    out_dir = os.path.dirname(os.path.abspath(output_path)) or "."
-    os.makedirs(out_dir, exist_ok=True)
-    output_existed = os.path.exists(output_path)
-
-    suffix = os.path.splitext(output_path)[1] or ".tmp"
-    fd, tmp_path = tempfile.mkstemp(prefix=".pdf_master_", suffix=f".tmp{suffix}", dir=out_dir)
-    os.close(fd)
-
-    try:
-        with open(tmp_path, "w", encoding=encoding, newline=newline) as handle:
-            handle.write(text)
-        os.replace(tmp_path, output_path)
-    finally:
-        if os.path.exists(tmp_path):
-            try:
-                os.remove(tmp_path)
-            except Exception:
-                logger.debug("Failed to remove temporary text file", exc_info=True)
-
-    return not output_existed
+    with AtomicTextWriter(output_path, encoding=encoding, newline=newline) as writer:
+        writer.write(text)
+        return writer.commit()
 
 
 def atomic_text_save(
@@ -172,6 +235,7 @@ def atomic_binary_write(output_path: str, data: bytes) -> bool:
     try:
         with open(tmp_path, "wb") as handle:
             handle.write(data)
+        DOC_POOL.invalidate(output_path)
         os.replace(tmp_path, output_path)
     finally:
         if os.path.exists(tmp_path):
@@ -221,12 +285,65 @@ def atomic_pixmap_save(host: Any, pixmap: Any, output_path: str) -> None:
                 logger.debug("Failed to remove temporary pixmap file", exc_info=True)
 
 
+def commit_staged_output(host: Any, staged_path: str, output_path: str) -> None:
+    """다른 프로세스가 같은 디렉터리에 써 둔 임시 파일을 최종 경로로 원자 교체한다."""
+    if not output_path:
+        raise ValueError("output_path is required")
+
+    output_existed = os.path.exists(output_path)
+    try:
+        host._check_cancelled()
+        DOC_POOL.invalidate(output_path)
+        os.replace(staged_path, output_path)
+        if not output_existed:
+            record_created_output_path(host, output_path)
+        host._check_cancelled()
+    finally:
+        if os.path.exists(staged_path):
+            try:
+                os.remove(staged_path)
+            except Exception:
+                logger.debug("Failed to remove staged output file", exc_info=True)
+
+
+def _save_full_copy(doc: Any, tmp_path: str, resolved_save_kwargs: dict[str, Any]) -> None:
+    try:
+        doc.save(tmp_path, **cast(Any, resolved_save_kwargs))
+    except Exception as exc:
+        # PyMuPDF 1.28+ 는 linearisation을 제거했다. web 프로필 호환을 위해 재시도.
+        if resolved_save_kwargs.get("linear"):
+            logger.warning(
+                "PDF linearisation unsupported; retrying save without linear (%s)",
+                exc,
+            )
+            fallback_kwargs = dict(resolved_save_kwargs)
+            fallback_kwargs.pop("linear", None)
+            doc.save(tmp_path, **cast(Any, fallback_kwargs))
+        else:
+            raise
+
+
+def _save_incremental_copy(doc: Any, tmp_path: str, resolved_save_kwargs: dict[str, Any]) -> bool:
+    """원본 사본 + 증분 섹션으로 tmp_path 작성. 불가/실패 시 False (호출측 전체 저장)."""
+    blocker = incremental_save_blocker(doc, resolved_save_kwargs)
+    if blocker:
+        logger.debug("Incremental save unavailable (%s); using full save", blocker)
+        return False
+    try:
+        write_incremental_copy(doc, tmp_path)
+    except Exception as exc:
+        logger.info("Incremental save failed; falling back to full save: %s", exc)
+        return False
+    return True
+
+
 def atomic_pdf_save(host: Any, doc: Any, output_path: str, **save_kwargs: Any) -> None:
     """
     원자적 PDF 저장.
 
     - 같은 디렉터리에 임시 파일로 먼저 저장한 뒤 os.replace로 교체합니다.
     - 저장/교체 사이에 취소가 들어오면 최종 파일을 만들지 않고 취소 처리합니다.
+    - incremental=True 면 원본 사본에 변경 객체만 덧붙입니다 (암호화/복구 문서 등은 전체 저장).
     """
     if not output_path:
         raise ValueError("output_path is required")
@@ -252,24 +369,16 @@ def atomic_pdf_save(host: Any, doc: Any, output_path: str, **save_kwargs: Any) -
         save_profile=save_kwargs.pop("save_profile", None),
         **save_kwargs,
     )
+    incremental = bool(resolved_save_kwargs.pop("incremental", False))
 
     try:
         host._check_cancelled()
-        try:
-            doc.save(tmp_path, **cast(Any, resolved_save_kwargs))
-        except Exception as exc:
-            # PyMuPDF 1.28+ 는 linearisation을 제거했다. web 프로필 호환을 위해 재시도.
-            if resolved_save_kwargs.get("linear"):
-                logger.warning(
-                    "PDF linearisation unsupported; retrying save without linear (%s)",
-                    exc,
-                )
-                fallback_kwargs = dict(resolved_save_kwargs)
-                fallback_kwargs.pop("linear", None)
-                doc.save(tmp_path, **cast(Any, fallback_kwargs))
-            else:
-                raise
+        with perf_sample("pdf.save"):
+            if not (incremental and _save_incremental_copy(doc, tmp_path, resolved_save_kwargs)):
+                _save_full_copy(doc, tmp_path, resolved_save_kwargs)
         host._check_cancelled()
+        # 풀에 남은 읽기 핸들은 교체 전에 닫는다 (Windows 에서는 열린 파일을 바꿀 수 없다)
+        DOC_POOL.invalidate(output_path)
         try:
             os.replace(tmp_path, output_path)
         except PermissionError:
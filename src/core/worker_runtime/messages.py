@@ -43,6 +43,7 @@ FALLBACK_MESSAGES = {
     "msg_metadata_saved": "✅ 메타데이터 저장 완료!",
     "msg_encryption_success": "✅ 암호화 완료!",
     "msg_compression_done": "✅ 압축 완료 ({})\n{}KB -> {}KB ({:.1f}% 감소)",
+    "msg_compress_estimated": "✅ 압축 예상 크기 계산 완료 ({})\n{}KB -> 약 {}KB",
     "msg_images_to_pdf_done": "✅ 이미지 → PDF 변환 완료!\n{}개 이미지 → 1개 PDF",
     "msg_merge_done": "✅ 병합 완료!\n{}개 파일 → 1개 PDF",
     "msg_merge_skipped": "\n⚠️ {}개 파일 건너뜀",
@@ -74,6 +75,7 @@ FALLBACK_MESSAGES = {
     "msg_attachments_listed": "✅ 첨부 파일 목록!\n{}개 발견",
     "msg_redact_done": "✅ {}개 영역 교정 완료!",
     "msg_markdown_extracted": "✅ Markdown 추출 완료!\n{}페이지",
+    "msg_library_indexed": "✅ 라이브러리 색인 갱신!\n새로 색인 {}개 · 변경 없음 {}개\n전체 {}개 파일, {}페이지",
     "msg_pages_copied": "✅ {}페이지 복사 완료!",
     "msg_background_added": "✅ 배경색 추가 완료!\n{}페이지",
     "msg_markup_label_underline": "밑줄",
@@ -118,6 +120,7 @@ FALLBACK_MESSAGES = {
     "msg_remove_blank_none": "✅ 빈 페이지가 없습니다. 원본을 저장했습니다.",
     "msg_dedupe_pages_done": "✅ 중복 페이지 {}장 제거, {}장 유지",
     "msg_dedupe_pages_none": "✅ 중복 페이지가 없습니다. 원본을 저장했습니다.",
+    "msg_duplicate_pages_found": "✅ 중복 페이지 검사 완료\n예상 제거: {}페이지 / 전체 {}페이지",
     "msg_auto_bookmarks_done": "✅ 자동 목차 생성 완료!\n{}개 항목",
     "msg_sanitize_done": "✅ 문서 위생 처리 완료!",
     "msg_impose_nup_done": "✅ {}-up 배치 완료!\n{}장 생성",
@@ -135,6 +138,10 @@ FALLBACK_MESSAGES = {
     "compare_report_file1": "파일1",
     "compare_report_file2": "파일2",
     "compare_report_page": "페이지 {}",
+    "compare_report_page_pair": "페이지 {} ↔ {}",
+    "compare_report_page_file2": "파일2 페이지 {}",
+    "compare_report_deleted_pages": "파일1에만 있는 페이지 (삭제됨): {}",
+    "compare_report_inserted_pages": "파일2에만 있는 페이지 (삽입됨): {}",
     "compare_report_missing_file1": "파일1에 해당 페이지가 없습니다.",
     "compare_report_missing_file2": "파일2에 해당 페이지가 없습니다.",
     "compare_report_visual_error": "시각 비교 중 오류가 발생했습니다.",
@@ -6,14 +6,17 @@ import time
 from typing import Any, cast
 
 from .._typing import WorkerHost
+from ..doc_pool import DOC_POOL, open_authenticated
 from ..optional_deps import fitz
 from .dispatch import get_handler_method_name, get_operation_spec
 from .io import (
+    AtomicTextWriter,
     atomic_binary_save,
     atomic_pixmap_save,
     atomic_pdf_save,
     atomic_text_save,
     build_safe_attachment_output_path,
+    commit_staged_output,
     build_unique_output_stem,
     record_created_output_path,
     sanitize_attachment_filename,
@@ -71,7 +74,7 @@ class WorkerRuntimeMixin(WorkerHost):
 
     def _check_cancelled(self) -> None:
         if self._cancel_requested or self.isInterruptionRequested():
-            from ..worker import CancelledError
+            from .errors import CancelledError
 
             raise CancelledError("작업이 사용자에 의해 취소되었습니다.")
 
@@ -167,12 +170,24 @@ class WorkerRuntimeMixin(WorkerHost):
     ) -> None:
         atomic_text_save(self, output_path, text, encoding=encoding, newline=newline)
 
+    def _atomic_text_stream(
+        self,
+        output_path: str,
+        *,
+        encoding: str = "utf-8",
+        newline: str | None = None,
+    ) -> AtomicTextWriter:
+        return AtomicTextWriter(output_path, encoding=encoding, newline=newline, host=self)
+
     def _atomic_binary_save(self, output_path: str, data: bytes) -> None:
         atomic_binary_save(self, output_path, data)
 
     def _atomic_pixmap_save(self, pixmap: Any, output_path: str) -> None:
         atomic_pixmap_save(self, pixmap, output_path)
 
+    def _commit_staged_output(self, staged_path: str, output_path: str) -> None:
+        commit_staged_output(self, staged_path, output_path)
+
     def _password_for_pdf_path(self, file_path: str) -> str:
         passwords = self.kwargs.get("passwords")
         if not isinstance(passwords, dict):
@@ -184,27 +199,22 @@ class WorkerRuntimeMixin(WorkerHost):
                 return value
         return ""
 
-    def _open_pdf_document(self, file_path: str, password: str | None = None):
-        doc = fitz.open(file_path)
-        if not getattr(doc, "is_encrypted", False):
-            return doc
-
-        candidates: list[str] = []
-        if isinstance(password, str) and password:
-            candidates.append(password)
-        mapped_password = self._password_for_pdf_path(file_path)
-        if mapped_password and mapped_password not in candidates:
-            candidates.append(mapped_password)
+    def _open_pdf_document(self, file_path: str, password: str | None = None, *, read_only: bool = False):
+        """암호 후보(password, kwargs passwords)로 인증된 문서.
 
-        for candidate in candidates:
-            try:
-                if doc.authenticate(candidate):
-                    return doc
-            except Exception:
-                logger.debug("PDF authentication attempt failed", exc_info=True)
-
-        doc.close()
-        raise ValueError(self._get_msg("err_wrong_password"))
+        read_only=True 면 프로세스 공용 풀에서 빌린다 — 수정·저장하지 말고 _release_pdf_document 로 돌려준다.
+        """
+        candidates = [password, self._password_for_pdf_path(file_path)]
+        if read_only:
+            doc = DOC_POOL.acquire(file_path, candidates)
+        else:
+            doc, _password = open_authenticated(file_path, candidates)
+        if doc is None:
+            raise ValueError(self._get_msg("err_wrong_password"))
+        return doc
+
+    def _release_pdf_document(self, doc: Any) -> None:
+        DOC_POOL.release(doc)
 
     def _get_msg(self, key: str, *args: object) -> str:
         return get_message(key, *args)
@@ -275,7 +285,7 @@ class WorkerRuntimeMixin(WorkerHost):
                 logger.error(error_msg)
                 self.error_signal.emit(error_msg)
         except Exception as exc:
-            from ..worker import CancelledError
+            from .errors import CancelledError
 
             if isinstance(exc, CancelledError):
                 logger.info("Task cancelled: %s", self.mode)
@@ -29,6 +29,7 @@ IMAGE_OPTIMIZE_PROFILES: dict[str, dict[str, Any]] = {
     "fast": {
         "optimize_images": False,
         "subset_fonts": False,
+        "dedupe_streams": False,
         "max_dpi": 150.0,
         "jpeg_quality": 75,
         "grayscale": False,
@@ -36,6 +37,7 @@ IMAGE_OPTIMIZE_PROFILES: dict[str, dict[str, Any]] = {
     "compact": {
         "optimize_images": True,
         "subset_fonts": True,
+        "dedupe_streams": True,
         "max_dpi": 150.0,
         "jpeg_quality": 75,
         "grayscale": False,
@@ -43,6 +45,7 @@ IMAGE_OPTIMIZE_PROFILES: dict[str, dict[str, Any]] = {
     "web": {
         "optimize_images": True,
         "subset_fonts": True,
+        "dedupe_streams": True,
         "max_dpi": 120.0,
         "jpeg_quality": 60,
         "grayscale": False,
@@ -66,6 +69,7 @@ def resolve_image_optimize_options(
     max_image_dpi: object = None,
     jpeg_quality: object = None,
     grayscale_images: object = None,
+    dedupe_streams: object = None,
 ) -> dict[str, Any]:
     """압축 프로필 + 명시 kwargs로 이미지/폰트 최적화 옵션을 결정한다."""
     profile_name = normalize_save_profile(save_profile, default=DEFAULT_COMPRESSION_SAVE_PROFILE)
@@ -122,6 +126,10 @@ def resolve_image_optimize_options(
     if gray is not None:
         base["grayscale"] = gray
 
+    dedupe = _as_optional_bool(dedupe_streams)
+    if dedupe is not None:
+        base["dedupe_streams"] = dedupe
+
     return base
 
 
@@ -131,7 +139,8 @@ def resolve_save_kwargs(doc: Any, output_path: str, save_profile: object = None,
     profile_name = normalize_save_profile(save_profile)
     resolved = dict(SAVE_PROFILES[profile_name])
     resolved.update(save_kwargs)
-    if resolved.get("incremental"):
+    # incremental 은 atomic_pdf_save 가 원본 사본에 덧붙이는 방식으로 처리 (불가 시 전체 저장)
+    if not resolved.get("incremental"):
         resolved.pop("incremental", None)
     return resolved
 
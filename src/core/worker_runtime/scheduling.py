@@ -0,0 +1,175 @@
+"""작업 스케줄링 — 입력·출력 경로 충돌 판정과 우선순위 선택 (Qt 비의존).
+
+UI 는 전경 작업 하나(진행 오버레이·undo·미리보기 복원·AI 패널을 쓰는 작업)와, 결과가 파일/폴더로만
+나가는 백그라운드 작업 여러 개를 동시에 돌린다. 두 작업은 한쪽의 출력이 다른 쪽의 입력·출력과 겹칠 때만
+충돌한다 (읽기끼리는 공유). 출력 폴더는 그 아래 경로 전체를 차지한다.
+충돌하는 대기 작업끼리는 제출 순서를 지킨다 — 우선순위가 높아도 앞선 충돌 작업을 추월하지 않는다.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+from ..path_utils import normalize_path_key
+from .dispatch import get_operation_spec
+
+JOB_PRIORITY_LOW = -1
+JOB_PRIORITY_NORMAL = 0
+JOB_PRIORITY_HIGH = 1
+
+# 전경 + 백그라운드 합계 상한 (PyMuPDF 작업은 메모리를 많이 쓴다)
+MAX_CONCURRENT_JOBS = 4
+
+_INPUT_PATH_KEYS = (
+    "file_path",
+    "file_path1",
+    "file_path2",
+    "source_path",
+    "target_path",
+    "replace_path",
+    "image_path",
+    "signature_path",
+    "attach_path",
+)
+_INPUT_LIST_KEYS = ("files", "file_paths", "library_files")
+_OUTPUT_PATH_KEYS = ("output_path", "index_path")
+_BACKGROUND_OUTPUT_KINDS = frozenset({"pdf", "text", "directory"})
+
+
+def _is_within(path: str, directory: str) -> bool:
+    if path == directory:
+        return True
+    prefix = directory if directory.endswith(os.sep) else directory + os.sep
+    return path.startswith(prefix)
+
+
+@dataclass(frozen=True, slots=True)
+class JobFootprint:
+    """작업이 읽고 쓰는 경로 (normalize_path_key 기준)."""
+
+    reads: frozenset[str] = frozenset()
+    writes: frozenset[str] = frozenset()
+    write_dirs: frozenset[str] = frozenset()
+
+    def conflicts_with(self, other: JobFootprint) -> bool:
+        return self._writes_touch(other) or other._writes_touch(self)
+
+    def _writes_touch(self, other: JobFootprint) -> bool:
+        other_paths = other.reads | other.writes
+        if self.writes & other_paths:
+            return True
+        for directory in self.write_dirs:
+            if any(_is_within(path, directory) for path in other_paths):
+                return True
+            if any(_is_within(path, directory) or _is_within(directory, path) for path in other.write_dirs):
+                return True
+        return False
+
+
+def _path_keys(values: object) -> set[str]:
+    if isinstance(values, str):
+        values = [values]
+    if not isinstance(values, (list, tuple)):
+        return set()
+    keys: set[str] = set()
+    for value in values:
+        if isinstance(value, str) and value:
+            key = normalize_path_key(value)
+            if key:
+                keys.add(key)
+    return keys
+
+
+def job_footprint(mode: str, kwargs: Mapping[str, Any], output_path: str | None = None) -> JobFootprint:
+    reads: set[str] = set()
+    for key in _INPUT_PATH_KEYS:
+        reads |= _path_keys(kwargs.get(key))
+    for key in _INPUT_LIST_KEYS:
+        reads |= _path_keys(kwargs.get(key))
+    writes = _path_keys(output_path) if output_path else set()
+    for key in _OUTPUT_PATH_KEYS:
+        writes |= _path_keys(kwargs.get(key))
+    write_dirs = _path_keys(kwargs.get("output_dir"))
+    spec = get_operation_spec(mode)
+    if spec is not None and spec.output_kind == "directory" and writes:
+        # 폴더 출력 작업에 output_path 가 들어와도 그 아래 전체를 쓰는 것으로 본다
+        write_dirs |= writes
+    return JobFootprint(frozenset(reads), frozenset(writes), frozenset(write_dirs))
+
+
+def is_background_eligible(mode: str, kwargs: Mapping[str, Any], output_path: str | None = None) -> bool:
+    """UI 상태 없이 완료 처리할 수 있는 작업인가 (결과가 파일/폴더, undo·동일 경로 덮어쓰기·AI 아님)."""
+    spec = get_operation_spec(mode)
+    if spec is None or str(mode).startswith("ai_"):
+        return False
+    if spec.output_kind not in _BACKGROUND_OUTPUT_KINDS:
+        return False
+    output = output_path or kwargs.get("output_path")
+    if spec.undo_eligible and kwargs.get("file_path") and output:
+        return False
+    if spec.same_path_safe and _path_keys(output) & _path_keys(kwargs.get("file_path")):
+        return False  # 제자리 덮어쓰기 — 열린 미리보기 핸들을 닫고 다시 여는 전경 경로 필요
+    return True
+
+
+def default_max_concurrent_jobs(cpu_count: int | None = None) -> int:
+    """CPU 수 기반 동시 작업 상한. 코어가 하나여도 짧은 작업이 긴 작업 뒤에 묶이지 않도록 최소 2."""
+    cpus = cpu_count if cpu_count is not None else (os.cpu_count() or 1)
+    return max(2, min(MAX_CONCURRENT_JOBS, int(cpus)))
+
+
+def entry_footprint(entry: Mapping[str, Any]) -> JobFootprint:
+    return job_footprint(str(entry.get("mode") or ""), entry.get("kwargs") or {}, entry.get("output_path"))
+
+
+def pick_runnable_jobs(
+    pending: Sequence[Mapping[str, Any]],
+    running: Sequence[JobFootprint],
+    *,
+    max_running: int,
+    foreground_busy: bool,
+    allow_background: bool = True,
+) -> list[tuple[int, bool]]:
+    """지금 시작할 대기 작업 [(pending 인덱스, 전경 여부)].
+
+    pending 은 제출 순서 리스트. 우선순위가 높은 것부터 보되, 실행 중 작업이나 앞서 제출된 대기
+    작업과 경로가 충돌하면 건너뛴다. 전경 전용 작업은 전경 슬롯이 비었을 때 하나만 시작한다.
+    """
+    footprints = [entry_footprint(entry) for entry in pending]
+    order = sorted(range(len(pending)), key=lambda index: (-int(pending[index].get("priority") or 0), index))
+    active = list(running)
+    picked: list[tuple[int, bool]] = []
+    for index in order:
+        if len(active) >= max_running:
+            break
+        footprint = footprints[index]
+        if any(footprint.conflicts_with(other) for other in active):
+            continue
+        if any(footprint.conflicts_with(footprints[earlier]) for earlier in range(index)):
+            continue
+        entry = pending[index]
+        background = allow_background and is_background_eligible(
+            str(entry.get("mode") or ""), entry.get("kwargs") or {}, entry.get("output_path")
+        )
+        if not background:
+            if foreground_busy:
+                continue
+            foreground_busy = True
+        picked.append((index, not background))
+        active.append(footprint)
+    return picked
+
+
+__all__ = [
+    "JOB_PRIORITY_HIGH",
+    "JOB_PRIORITY_LOW",
+    "JOB_PRIORITY_NORMAL",
+    "JobFootprint",
+    "MAX_CONCURRENT_JOBS",
+    "default_max_concurrent_jobs",
+    "entry_footprint",
+    "is_background_eligible",
+    "job_footprint",
+    "pick_runnable_jobs",
+]
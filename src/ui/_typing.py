@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+from concurrent.futures import Future
+from typing import Any, Callable
 
 from PyQt6.QtCore import QObject
 
@@ -93,6 +94,10 @@ class MainWindowHost:
     _chat_result_meta: dict[str, Any]
     _keywords_result_meta: dict[str, Any]
     _pending_workers: list[dict[str, Any]]
+    _background_jobs: list[Any]
+    _job_seq: int
+    _jobs_panel: Any
+    btn_jobs: Any
     _app_shortcuts: list[Any]
     _menu_open_action: Any
     _pending_undo: dict[str, Any] | None
@@ -122,6 +127,18 @@ class MainWindowHost:
     def _create_backup_for_undo(self, source_path: str) -> str:
         ...
 
+    def _cleanup_undo_backups_by_size(self, max_size_mb: int = 500, active_backups: set[str] | None = None) -> None:
+        ...
+
+    def _queue_backup_for_undo(self, source_path: str, on_done: Callable[[Any], None] | None = None) -> str:
+        ...
+
+    def _queue_undo_backup_trim(self, max_size_mb: int = 500, max_age_hours: int | None = None) -> None:
+        ...
+
+    def _undo_snapshot_barrier(self) -> Future:
+        ...
+
     def _finalize_worker(self) -> None:
         ...
 
@@ -140,6 +157,15 @@ class MainWindowHost:
     def _run_pending_worker(self) -> None:
         ...
 
+    def _notify_jobs_changed(self) -> None:
+        ...
+
+    def _job_worker_cls(self) -> Any:
+        ...
+
+    def _job_toast_cls(self) -> Any:
+        ...
+
     def _save_chat_histories(self) -> None:
         ...
 
@@ -281,17 +307,15 @@ class ThumbnailGridHost:
     _selection_anchor_index: int
     _selection_mode: str
     _columns: int
-    _loader_thread: Any
+    _render_service: Any
     _is_dark_theme: bool
     _loaded_indices: set
     _requested_indices: set
     _pending_indices: set
-    _active_batch_indices: list
     _total_pages: int
     _pdf_password: str | None
     _ROW_HEIGHT: int
     _PREFETCH_ROWS: int
-    _MAX_BATCH_SIZE: int
 
     grid_layout: Any
     grid_container: Any
@@ -309,18 +333,17 @@ class ThumbnailGridHost:
     _set_loading_message: Any
     show_status_message: Any
     load_pdf: Any
-    _disconnect_loader_thread: Any
-    _cleanup_loader_thread: Any
+    _cancel_thumbnail_requests: Any
+    _shutdown_render_service: Any
+    release_document_handles: Any
     _clear_thumbnails: Any
     clear: Any
     _arrange_grid: Any
     _visible_index_window: Any
     _request_visible_thumbnails: Any
-    _start_next_loader: Any
-    _is_active_loader_sender: Any
+    _warm_thumbnails_from_disk: Any
+    _dispatch_thumbnail_requests: Any
     _on_thumbnail_ready: Any
-    _on_loader_progress: Any
-    _on_loading_complete: Any
     _on_columns_changed: Any
     _on_scroll_changed: Any
     _refresh_thumbnail_states: Any
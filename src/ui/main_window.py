@@ -18,7 +18,10 @@ from PyQt6.QtWidgets import (
 )
 
 from ..core.constants import UNDO_BACKUP_MAX_AGE_HOURS, UNDO_BACKUP_MAX_SIZE_MB
+from ..core.doc_pool import DOC_POOL
 from ..core.i18n import tm
+from ..core.perf import set_telemetry_enabled
+from ..core.text_layer_cache import TEXT_LAYER_CACHE
 from ..core.settings import load_settings, save_settings
 from ..core.undo_manager import UndoManager
 from .main_window_config import APP_NAME, VERSION
@@ -31,6 +34,7 @@ from .main_window_undo import MainWindowUndoMixin
 from .main_window_worker import MainWindowWorkerMixin
 from .progress_overlay import ProgressOverlayWidget
 from .widgets import WheelEventFilter
+from .window_worker.jobs import shutdown_background_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -94,11 +98,16 @@ class PDFMasterApp(
     def __init__(self):
         super().__init__()
         self.settings = load_settings()
+        set_telemetry_enabled(bool(self.settings.get("perf_telemetry_enabled", False)))
+        TEXT_LAYER_CACHE.set_persistence(bool(self.settings.get("text_cache_persist", False)))
         self._settings_save_timer = QTimer(self)
         self._settings_save_timer.setSingleShot(True)
         self._settings_save_timer.timeout.connect(self._flush_settings_save)
         self.worker = None
         self._pending_workers = []
+        self._background_jobs = []
+        self._job_seq = 0
+        self._jobs_panel = None
         self._app_shortcuts = []
         self._menu_open_action = None
         self._last_output_path = None  # 마지막 저장 경로 추적
@@ -125,10 +134,8 @@ class PDFMasterApp(
         self._undo_backup_dir = os.path.join(tempfile.gettempdir(), "pdf_master_undo")
         os.makedirs(self._undo_backup_dir, exist_ok=True)
 
-        # v4.4: 시작 시 오래된 백업 정리
-        self._cleanup_old_undo_backups(max_age_hours=UNDO_BACKUP_MAX_AGE_HOURS)  # v4.5: 상수 사용
-        # v4.5: 시작 시 용량 기반 백업 정리
-        self._cleanup_undo_backups_by_size(max_size_mb=UNDO_BACKUP_MAX_SIZE_MB)  # v4.5: 상수 사용
+        # v4.4/v4.5: 시작 시 오래된·용량 초과 백업 정리 (스냅샷 큐 스레드에서)
+        self._queue_undo_backup_trim(max_size_mb=UNDO_BACKUP_MAX_SIZE_MB, max_age_hours=UNDO_BACKUP_MAX_AGE_HOURS)
         # AI 평문 temp / atomic orphan 정리 (이전 비정상 종료 잔존)
         try:
             from ..core.temp_cleanup import cleanup_pdf_master_temp_files
@@ -229,6 +236,13 @@ class PDFMasterApp(
         self.btn_open_folder.clicked.connect(self._open_last_folder)
         status_layout.addWidget(self.btn_open_folder)
 
+        # 백그라운드·대기 작업이 있을 때만 보이는 작업 패널 버튼
+        self.btn_jobs = QPushButton(tm.get("btn_jobs_count", 0, 0))
+        self.btn_jobs.setObjectName("toolbarSecondaryBtn")
+        self.btn_jobs.setVisible(False)
+        self.btn_jobs.clicked.connect(self._show_jobs_panel)
+        status_layout.addWidget(self.btn_jobs)
+
         main_layout.addWidget(status_frame)
 
         self._apply_theme()
@@ -243,6 +257,7 @@ class PDFMasterApp(
         # v4.3: 진행 오버레이 위젯 초기화 (개선된 UX)
         self.progress_overlay = ProgressOverlayWidget(central)
         self.progress_overlay.cancelled.connect(self._on_worker_cancelled)
+        self.progress_overlay.background_requested.connect(self._detach_worker_to_background)
         self.progress_overlay.hide()
 
         # 포커스 모드 설정 복원 (레이아웃 확정 후)
@@ -263,6 +278,9 @@ class PDFMasterApp(
         if not _shutdown_worker_for_close(self, self.worker):
             a0.ignore()
             return
+        if not shutdown_background_jobs(self, _shutdown_worker_for_close):
+            a0.ignore()
+            return
         # 종료 시 대기 큐 폐기 (실행되지 않은 요청은 무효)
         self._pending_workers = []
 
@@ -276,8 +294,10 @@ class PDFMasterApp(
                 logger.debug("Preview document closed")
             except Exception as e:
                 logger.warning(f"Failed to close preview document: {e}")
+        DOC_POOL.clear()
 
-        # 3. 미사용 undo 백업 정리 (v4.4)
+        # 3. 미사용 undo 백업 정리 (v4.4) — 대기 중인 스냅샷 작업은 버린다
+        self._shutdown_undo_snapshots()
         self._cleanup_unused_undo_backups()
 
         # 4. orphan temp 스윕 (AI 평문 복호 파일 등)
@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import QMessageBox, QWidget
 
 from ..core.i18n import tm
 from ..core.worker import WorkerThread
+from ..core.worker_runtime.scheduling import is_background_eligible
 from .widgets import ToastWidget
 from .window_worker import MainWindowWorkerMixin as _MainWindowWorkerMixin
 from .window_worker.fail import (
@@ -51,6 +52,9 @@ class MainWindowWorkerMixin(_MainWindowWorkerMixin):
         """작업 스레드 실행 (안전한 동시 작업 처리)"""
         parent = cast(QWidget, self)
         if self.worker and self.worker.isRunning():
+            # 경로가 겹치지 않는 파일 출력 작업은 묻지 않고 백그라운드로 동시 실행
+            if self._try_start_background_job(mode, output_path, kwargs):
+                return
             result = QMessageBox.question(
                 parent,
                 tm.get("task_in_progress"),
@@ -75,6 +79,11 @@ class MainWindowWorkerMixin(_MainWindowWorkerMixin):
                     toast.show_toast(self)
                     return
             self._finalize_worker()
+        if self._blocked_by_running_jobs(mode, output_path, kwargs):
+            # 백그라운드 작업이 같은 파일을 쓰거나 읽는 중 — 끝나면 대기 큐에서 자동 시작
+            if self._enqueue_pending_worker(mode, output_path, kwargs):
+                ToastWidget(tm.get("msg_job_waiting_conflict"), toast_type="info", duration=2500).show_toast(self)
+            return
         self._cancel_pending = False
         self._cancel_handled = False
 
@@ -116,7 +125,7 @@ class MainWindowWorkerMixin(_MainWindowWorkerMixin):
             source = kwargs.get("file_path", "")
             output = kwargs.get("output_path", "")
             if source and output:
-                backup = self._create_backup_for_undo(source)
+                backup = self._queue_backup_for_undo(source)
                 if backup:
                     self._pending_undo = {
                         "action_type": mode,
@@ -132,6 +141,9 @@ class MainWindowWorkerMixin(_MainWindowWorkerMixin):
         description = _get_operation_description(mode) + "..."
 
         self.worker = WorkerThread(mode, **kwargs)
+        if self._pending_undo:
+            # 원본 스냅샷(백그라운드 큐)이 끝난 뒤에 작업 본문이 원본을 바꾼다
+            self.worker.wait_before_run(self._undo_snapshot_barrier())
         self.worker.progress_signal.connect(self._on_progress_update)
         if hasattr(self.worker, "partial_result_signal"):
             self.worker.partial_result_signal.connect(self._on_partial_result)
@@ -144,8 +156,17 @@ class MainWindowWorkerMixin(_MainWindowWorkerMixin):
         self.set_ui_busy(True)
 
         self.progress_overlay.show_progress(tm.get("processing"), description)
+        set_background_available = getattr(self.progress_overlay, "set_background_available", None)
+        if callable(set_background_available):
+            set_background_available(is_background_eligible(mode, kwargs))
         self.worker.start()
 
+    def _job_worker_cls(self):
+        return WorkerThread
+
+    def _job_toast_cls(self):
+        return ToastWidget
+
     def _on_partial_result(self, payload):
         sender = self.sender()
         if sender is not None and sender is not self.worker:
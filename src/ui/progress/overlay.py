@@ -20,6 +20,7 @@ class ProgressOverlayWidget(QFrame):
         - 작업 설명 표시
     """
     cancelled = pyqtSignal()
+    background_requested = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -136,6 +137,28 @@ class ProgressOverlayWidget(QFrame):
         self.cancel_btn.clicked.connect(self._on_cancel)
         btn_layout.addWidget(self.cancel_btn)
 
+        # 파일 출력 작업은 UI 를 풀고 작업 패널에서 계속 진행할 수 있다
+        self.background_btn = QPushButton(tm.get("progress_run_in_background"))
+        self.background_btn.setMinimumHeight(32)
+        self.background_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.background_btn.setStyleSheet("""
+            QPushButton {
+                background: transparent;
+                border: 2px solid #4f8cff;
+                color: #4f8cff;
+                border-radius: 8px;
+                font-weight: 600;
+                font-size: 13px;
+                padding: 4px 12px;
+            }
+            QPushButton:hover {
+                background: rgba(79, 140, 255, 0.15);
+            }
+        """)
+        self.background_btn.clicked.connect(self.background_requested.emit)
+        self.background_btn.hide()
+        btn_layout.addWidget(self.background_btn)
+
         btn_layout.addStretch()
         card_layout.addLayout(btn_layout)
 
@@ -213,6 +236,7 @@ class ProgressOverlayWidget(QFrame):
         self.icon_label.setText("⏳")
         self.cancel_btn.setEnabled(True)
         self.cancel_btn.setText(tm.get("progress_cancel"))
+        self.background_btn.hide()
 
         # 부모 크기에 맞게 조절
         self._sync_to_parent_geometry()
@@ -238,9 +262,14 @@ class ProgressOverlayWidget(QFrame):
         """오버레이 숨기기"""
         self.hide()
 
+    def set_background_available(self, available: bool):
+        """'백그라운드로 계속' 버튼 표시 여부 (결과가 파일/폴더뿐인 작업만)."""
+        self.background_btn.setVisible(bool(available))
+
     def set_cancelling(self, description: str | None = None):
         """취소 요청 후 대기 UI (네트워크 블로킹 구간 포함)."""
         self.cancel_btn.setEnabled(False)
+        self.background_btn.hide()
         self.cancel_btn.setText(tm.get("progress_cancelling"))
         self.title_label.setText(tm.get("progress_cancelling"))
         self.desc_label.setText(description or tm.get("progress_cancelling_desc"))
@@ -1,3 +1,4 @@
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 
 from ...core.i18n import tm
@@ -44,25 +45,25 @@ def action_crop(self):
         self.run_worker("crop_pdf", file_path=path, output_path=s, margins=margins, crop_mode=crop_mode)
 
 
-def _cleanup_confirm_with_estimate(self, path: str, *, kind: str) -> bool:
-    """blank/dedupe 확인 다이얼로그. dry-run 카운트를 가능하면 포함한다."""
-    base_key = (
-        "msg_confirm_remove_blank_pages"
-        if kind == "blank"
-        else "msg_confirm_dedupe_pages"
-    )
-    count_key = (
-        "msg_confirm_remove_blank_pages_count"
-        if kind == "blank"
-        else "msg_confirm_dedupe_pages_count"
+def _cleanup_confirm(self, message: str, details: str = "") -> bool:
+    box = QMessageBox(
+        QMessageBox.Icon.Warning,
+        tm.get("warning"),
+        message,
+        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        self,
     )
-    message = tm.get(base_key)
+    if details:
+        box.setDetailedText(details)
+    return box.exec() == QMessageBox.StandardButton.Yes
+
+
+def _blank_confirm_with_estimate(self, path: str) -> bool:
+    """빈 페이지 제거 확인 다이얼로그. dry-run 카운트를 가능하면 포함한다."""
+    message = tm.get("msg_confirm_remove_blank_pages")
     try:
         from ...core.optional_deps import fitz
-        from ...core.worker_ops.cleanup.helpers import (
-            estimate_blank_page_removals,
-            estimate_dedupe_page_removals,
-        )
+        from ...core.worker_ops.cleanup.helpers import estimate_blank_page_removals
 
         doc = fitz.open(path)
         try:
@@ -73,30 +74,29 @@ def _cleanup_confirm_with_estimate(self, path: str, *, kind: str) -> bool:
                     doc.authenticate(password)
                 except Exception:
                     pass
-            if kind == "blank":
-                removed, total = estimate_blank_page_removals(doc)
-            else:
-                removed, total = estimate_dedupe_page_removals(doc)
-            message = tm.get(count_key, removed, total)
+            removed, total = estimate_blank_page_removals(
+                doc, password=password if isinstance(password, str) else ""
+            )
+            message = tm.get("msg_confirm_remove_blank_pages_count", removed, total)
         finally:
             doc.close()
     except Exception:
-        message = f"{tm.get(base_key)}\n{tm.get('msg_dry_run_unavailable')}"
+        message = f"{tm.get('msg_confirm_remove_blank_pages')}\n{tm.get('msg_dry_run_unavailable')}"
+    return _cleanup_confirm(self, message)
 
-    reply = QMessageBox.warning(
-        self,
-        tm.get("warning"),
-        message,
-        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-    )
-    return reply == QMessageBox.StandardButton.Yes
+
+def _dedupe_threshold(self) -> int:
+    from ...core.worker_ops.cleanup.near_duplicates import DEFAULT_VISUAL_THRESHOLD
+
+    spin = getattr(self, "spn_dedupe_threshold", None)
+    return int(spin.value()) if spin is not None else DEFAULT_VISUAL_THRESHOLD
 
 
 def action_remove_blank_pages(self):
     path = self.sel_cleanup.get_path()
     if not path:
         return QMessageBox.warning(self, tm.get("info"), tm.get("msg_select_pdf"))
-    if not _cleanup_confirm_with_estimate(self, path, kind="blank"):
+    if not _blank_confirm_with_estimate(self, path):
         return
     s, _ = self._choose_save_file(tm.get("save"), "no_blank.pdf", "PDF (*.pdf)")
     if s:
@@ -104,14 +104,41 @@ def action_remove_blank_pages(self):
 
 
 def action_dedupe_pages(self):
+    """중복 묶음 dry-run 을 작업 스레드에서 먼저 돌린다 — 확인·저장은 _on_duplicate_pages_found."""
     path = self.sel_cleanup.get_path()
     if not path:
         return QMessageBox.warning(self, tm.get("info"), tm.get("msg_select_pdf"))
-    if not _cleanup_confirm_with_estimate(self, path, kind="dedupe"):
-        return
+    self.run_worker("find_duplicate_pages", file_path=path, dedupe_threshold=_dedupe_threshold(self))
+
+
+def _on_duplicate_pages_found(self, payload: dict) -> bool:
+    """find_duplicate_pages 완료 훅: 묶음을 보여 주고 확인되면 실제 제거를 이어서 실행한다."""
+    clusters = payload.get("duplicate_clusters") or []
+    if not clusters:
+        QMessageBox.information(self, tm.get("info"), tm.get("msg_no_duplicate_pages"))
+        return True
+    # 삭제 전에 어떤 페이지가 어느 페이지의 중복인지 보여준다 (payload 는 1-based)
+    details = "\n".join(
+        tm.get(
+            "msg_dedupe_cluster_line",
+            cluster.get("keep"),
+            ", ".join(str(index) for index in cluster.get("duplicates") or []),
+        )
+        for cluster in clusters
+    )
+    message = tm.get("msg_confirm_dedupe_pages_count", payload.get("removed", 0), payload.get("total", 0))
+    if _cleanup_confirm(self, message, details):
+        path = str(payload.get("file_path") or "")
+        threshold = int(payload.get("dedupe_threshold") or 0)
+        # 현재 작업자 정리가 끝난 뒤 저장 경로를 묻고 실행한다
+        QTimer.singleShot(0, lambda: _run_dedupe_pages(self, path, threshold))
+    return True
+
+
+def _run_dedupe_pages(self, path: str, threshold: int) -> None:
     s, _ = self._choose_save_file(tm.get("save"), "deduped.pdf", "PDF (*.pdf)")
     if s:
-        self.run_worker("dedupe_pages", file_path=path, output_path=s)
+        self.run_worker("dedupe_pages", file_path=path, output_path=s, dedupe_threshold=threshold)
 
 
 def action_auto_bookmarks(self):
@@ -11,6 +11,7 @@ from .actions_edit import (
     action_add_freehand_signature,
     action_remove_blank_pages,
     action_dedupe_pages,
+    _on_duplicate_pages_found,
     action_auto_bookmarks,
     action_sanitize_pdf,
     action_impose_nup,
@@ -110,6 +111,7 @@ class MainWindowTabsAdvancedMixin(MainWindowHost):
     action_add_freehand_signature = action_add_freehand_signature
     action_remove_blank_pages = action_remove_blank_pages
     action_dedupe_pages = action_dedupe_pages
+    _on_duplicate_pages_found = _on_duplicate_pages_found
     action_auto_bookmarks = action_auto_bookmarks
     action_sanitize_pdf = action_sanitize_pdf
     action_impose_nup = action_impose_nup
@@ -37,6 +37,13 @@ def build_cleanup(self, layout) -> None:
     b_dedupe = QPushButton(tm.get("btn_dedupe_pages"))
     b_dedupe.clicked.connect(self.action_dedupe_pages)
     cleanup_btns.addWidget(b_dedupe)
+    cleanup_btns.addWidget(QLabel(tm.get("lbl_dedupe_threshold")))
+    self.spn_dedupe_threshold = QSpinBox()
+    # 시각 해시(64 bit) 허용 해밍 거리 — 0 이면 사실상 동일 렌더만
+    self.spn_dedupe_threshold.setRange(0, 24)
+    self.spn_dedupe_threshold.setValue(6)
+    self.spn_dedupe_threshold.setToolTip(tm.get("tooltip_dedupe_threshold"))
+    cleanup_btns.addWidget(self.spn_dedupe_threshold)
     l_cleanup.addLayout(cleanup_btns)
     cleanup_btns2 = QHBoxLayout()
     b_auto_bm = QPushButton(tm.get("btn_auto_bookmarks"))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import Any
 
 from ...core.i18n import tm
@@ -12,6 +13,8 @@ def normalize_ai_meta(meta: Any) -> dict[str, Any]:
     fallback_pages_total = meta.get("fallback_pages_total")
     fallback_pages_used = meta.get("fallback_pages_used")
     max_text_chars = meta.get("max_text_chars")
+    retrieved_chunks = meta.get("retrieved_chunks")
+    cached_at = meta.get("cached_at")
     return {
         "source": str(meta.get("source") or ""),
         "truncated": bool(meta.get("truncated", False)),
@@ -27,16 +30,31 @@ def normalize_ai_meta(meta: Any) -> dict[str, Any]:
             else None
         ),
         "max_text_chars": int(max_text_chars) if isinstance(max_text_chars, int) and max_text_chars > 0 else None,
+        "retrieved_chunks": (
+            int(retrieved_chunks) if isinstance(retrieved_chunks, int) and retrieved_chunks > 0 else None
+        ),
+        "cache_hit": bool(meta.get("cache_hit", False)),
+        "cached_at": float(cached_at) if isinstance(cached_at, (int, float)) and cached_at > 0 else None,
     }
 
 
 def is_warning_ai_meta(meta: Any) -> bool:
     normalized = normalize_ai_meta(meta)
-    return normalized["source"] == "text_fallback" or normalized["truncated"]
+    return normalized["source"] in {"text_fallback", "retrieval"} or normalized["truncated"]
 
 
 def format_ai_meta(meta: Any) -> str:
     normalized = normalize_ai_meta(meta)
+    text = _format_source_meta(normalized)
+    if not normalized["cache_hit"]:
+        return text
+    cached_at = normalized["cached_at"]
+    when = time.strftime("%Y-%m-%d %H:%M", time.localtime(cached_at)) if cached_at else "-"
+    cached = tm.get("ai_meta_cache_hit", when)
+    return f"{cached} · {text}" if text else cached
+
+
+def _format_source_meta(normalized: dict[str, Any]) -> str:
     source = normalized["source"]
     page_focus_limit = normalized["page_focus_limit"]
     fallback_pages_total = normalized["fallback_pages_total"] or 0
@@ -52,6 +70,13 @@ def format_ai_meta(meta: Any) -> str:
                 max_text_chars,
             )
         return tm.get("ai_meta_text_fallback", fallback_pages_used, fallback_pages_total)
+    if source == "retrieval":
+        return tm.get(
+            "ai_meta_retrieval",
+            normalized["retrieved_chunks"] or 0,
+            fallback_pages_used,
+            fallback_pages_total,
+        )
 
     if page_focus_limit:
         return tm.get("ai_meta_file_api_page_focus", page_focus_limit)
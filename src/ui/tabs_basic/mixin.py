@@ -39,6 +39,7 @@ from .reorder import (
 from .security import (
     _load_metadata,
     action_compress,
+    action_estimate_compress,
     action_metadata,
     action_protect,
     action_unlock,
@@ -79,6 +80,7 @@ class MainWindowTabsBasicMixin(MainWindowHost):
     action_protect = action_protect
     action_unlock = action_unlock
     action_compress = action_compress
+    action_estimate_compress = action_estimate_compress
 
     setup_reorder_tab = setup_reorder_tab
     _load_pages_for_reorder = _load_pages_for_reorder
@@ -9,6 +9,7 @@ from .security_impl import (
     action_protect,
     action_unlock,
     action_compress,
+    action_estimate_compress,
 )
 
-__all__ = ['setup_edit_sec_tab', '_load_metadata', 'action_metadata', 'action_watermark', 'action_protect', 'action_unlock', 'action_compress']
+__all__ = ['setup_edit_sec_tab', '_load_metadata', 'action_metadata', 'action_watermark', 'action_protect', 'action_unlock', 'action_compress', 'action_estimate_compress']
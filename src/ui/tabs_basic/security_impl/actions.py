@@ -116,3 +116,12 @@ def action_compress(self):
         save_profile = self.cmb_compress_profile.currentData() or DEFAULT_COMPRESSION_SAVE_PROFILE
         self.run_worker("compress", file_path=path, output_path=s, save_profile=save_profile)
 
+
+def action_estimate_compress(self):
+    """프로필별 예상 크기 dry-run — 결과는 작업 완료 다이얼로그로 보여 준다."""
+    path = self.sel_sec.get_path()
+    if not path:
+        return QMessageBox.warning(self, tm.get("info"), tm.get("msg_select_file"))
+    save_profile = self.cmb_compress_profile.currentData() or DEFAULT_COMPRESSION_SAVE_PROFILE
+    self.run_worker("estimate_compression", file_path=path, save_profile=save_profile)
+
@@ -158,6 +158,10 @@ def setup_edit_sec_tab(self):
     b_dec.setToolTip(tm.get("tooltip_decrypt"))
     b_dec.clicked.connect(self.action_unlock)
     h_sec.addWidget(b_dec)
+    b_comp_estimate = QPushButton(tm.get("btn_compress_estimate"))
+    b_comp_estimate.setToolTip(tm.get("tooltip_compress_estimate"))
+    b_comp_estimate.clicked.connect(self.action_estimate_compress)
+    h_sec.addWidget(b_comp_estimate)
     b_comp = QPushButton(tm.get("btn_compress"))
     b_comp.clicked.connect(self.action_compress)
     h_sec.addWidget(b_comp)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from .document import _open_thumbnail_document
+from .document import _close_thumbnail_document, _open_thumbnail_document
 from .grid import ThumbnailGridWidget
 from .loader import ThumbnailLoaderThread
 from .tile import ThumbnailLabel
@@ -9,5 +9,6 @@ __all__ = [
     "ThumbnailGridWidget",
     "ThumbnailLabel",
     "ThumbnailLoaderThread",
+    "_close_thumbnail_document",
     "_open_thumbnail_document",
 ]
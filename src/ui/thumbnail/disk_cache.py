@@ -0,0 +1,48 @@
+"""썸네일 디스크 캐시 Qt 어댑터 (QImage ↔ 압축 blob)."""
+from __future__ import annotations
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt6.QtGui import QImage, QImageWriter
+
+# 렌더 방식이 바뀌면 올려서 이전 blob 을 자연 무효화
+_RENDER_VERSION = 1
+_WEBP_QUALITY = 80
+_webp_supported: bool | None = None
+
+
+def thumbnail_size_key(thumb_w: int, thumb_h: int) -> str:
+    return f"{int(thumb_w)}x{int(thumb_h)}@v{_RENDER_VERSION}"
+
+
+def _preferred_format() -> str:
+    global _webp_supported
+    if _webp_supported is None:
+        _webp_supported = any(bytes(fmt).lower() == b"webp" for fmt in QImageWriter.supportedImageFormats())
+    return "webp" if _webp_supported else "png"
+
+
+def encode_thumbnail_image(image: QImage) -> tuple[bytes, str]:
+    """WebP(가능 시) 또는 PNG 로 인코딩. 실패 시 (b"", "")."""
+    if image.isNull():
+        return b"", ""
+    fmt = _preferred_format()
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    try:
+        ok = image.save(buffer, fmt.upper(), _WEBP_QUALITY if fmt == "webp" else -1)
+    finally:
+        buffer.close()
+    if not ok:
+        return b"", ""
+    return bytes(data.data()), fmt
+
+
+def decode_thumbnail_image(blob: bytes) -> QImage | None:
+    image = QImage.fromData(blob)
+    if image.isNull():
+        return None
+    return image
+
+
+__all__ = ["decode_thumbnail_image", "encode_thumbnail_image", "thumbnail_size_key"]
@@ -16,6 +16,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from ...core.doc_pool import DOC_POOL
 from ...core.i18n import tm
 from ...core.optional_deps import fitz
 from ...core.perf import PerfTimer
@@ -24,16 +25,14 @@ logger = logging.getLogger(__name__)
 
 
 def _open_thumbnail_document(pdf_path: str, password: str | None = None):
-    doc = fitz.open(pdf_path)
-    if not doc.is_encrypted:
+    """공용 읽기 전용 풀에서 문서를 빌린다. 다 쓰면 _close_thumbnail_document 로 돌려준다."""
+    doc = DOC_POOL.acquire(pdf_path, [password])
+    if doc is not None:
         return doc, None
-
     if not password:
-        doc.close()
         return None, tm.get("preview_encrypted")
+    return None, tm.get("preview_password_wrong")
 
-    if not doc.authenticate(password):
-        doc.close()
-        return None, tm.get("preview_password_wrong")
 
-    return doc, None
+def _close_thumbnail_document(doc) -> None:
+    DOC_POOL.release(doc)
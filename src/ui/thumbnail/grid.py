@@ -18,7 +18,7 @@ from ...core.optional_deps import fitz
 from ...core.perf import PerfTimer
 logger = logging.getLogger(__name__)
 from .document import _open_thumbnail_document
-from .loader import ThumbnailLoaderThread
+from .render_service import ThumbnailRenderService
 from .tile import ThumbnailLabel
 
 from .grid_layout import ThumbnailGridLayoutMixin
@@ -43,7 +43,6 @@ class ThumbnailGridWidget(ThumbnailGridLayoutMixin, ThumbnailGridLoadingMixin, T
 
     _ROW_HEIGHT = 210
     _PREFETCH_ROWS = 2
-    _MAX_BATCH_SIZE = 64
 
     def __init__(self, parent=None, selection_mode: str = "single"):
         super().__init__(parent)
@@ -54,13 +53,11 @@ class ThumbnailGridWidget(ThumbnailGridLayoutMixin, ThumbnailGridLoadingMixin, T
         self._selection_anchor_index = -1
         self._selection_mode = selection_mode if selection_mode in {"single", "extended"} else "single"
         self._columns = 4
-        self._loader_thread: ThumbnailLoaderThread | None = None
         self._is_dark_theme = True
 
         self._loaded_indices: set[int] = set()
         self._requested_indices: set[int] = set()
         self._pending_indices: set[int] = set()
-        self._active_batch_indices: list[int] = []
         self._total_pages = 0
         self._pdf_password: str | None = None
         self._pdf_mtime_ns: int = 0
@@ -68,6 +65,9 @@ class ThumbnailGridWidget(ThumbnailGridLayoutMixin, ThumbnailGridLoadingMixin, T
         from .pixmap_lru import ThumbnailPixmapLru
 
         self._pixmap_lru = ThumbnailPixmapLru(max_items=128)
+        # 문서를 열어 둔 장수명 렌더 서비스 (배치별 스레드/재열기 대체)
+        self._render_service = ThumbnailRenderService(self)
+        self._render_service.thumbnail_ready.connect(self._on_thumbnail_ready)
 
         self._setup_ui()
 
@@ -113,6 +113,6 @@ class ThumbnailGridWidget(ThumbnailGridLayoutMixin, ThumbnailGridLoadingMixin, T
         self.grid_layout.addWidget(self.loading_label, 0, 0)
 
     def closeEvent(self, a0: QCloseEvent | None):
-        self._cleanup_loader_thread()
+        self._shutdown_render_service()
         super().closeEvent(a0)
 
@@ -35,7 +35,6 @@ class ThumbnailGridLayoutMixin(ThumbnailGridHost):
         self._loaded_indices.clear()
         self._requested_indices.clear()
         self._pending_indices.clear()
-        self._active_batch_indices = []
         self._total_pages = 0
 
         while self.grid_layout.count():
@@ -50,7 +49,7 @@ class ThumbnailGridLayoutMixin(ThumbnailGridHost):
                 widget.deleteLater()
 
     def clear(self):
-        self._cleanup_loader_thread()
+        self._cancel_thumbnail_requests()
         self._pdf_path = ""
         self._pdf_password = None
         self._pdf_mtime_ns = 0
@@ -92,12 +91,6 @@ class ThumbnailGridLayoutMixin(ThumbnailGridHost):
         start_idx, end_idx = self._visible_index_window()
         if end_idx < start_idx:
             return
-        needed = [
-            idx
-            for idx in range(start_idx, end_idx + 1)
-            if idx not in self._loaded_indices and idx not in self._requested_indices
-        ]
-        if not needed:
-            return
-        self._pending_indices.update(needed)
-        self._start_next_loader()
+        # 현재 창만 요청 — 창 밖으로 벗어난 대기 요청은 렌더 서비스 큐 교체로 폐기
+        self._pending_indices = {idx for idx in range(start_idx, end_idx + 1) if idx not in self._loaded_indices}
+        self._dispatch_thumbnail_requests(start_idx, end_idx)
@@ -19,12 +19,16 @@ from ...core.i18n import tm
 from ...core.optional_deps import fitz
 from ...core.perf import PerfTimer
 logger = logging.getLogger(__name__)
-from .document import _open_thumbnail_document
-from .loader import ThumbnailLoaderThread
+from ...core.thumbnail_cache import get_thumbnail_disk_cache
+from .disk_cache import decode_thumbnail_image, thumbnail_size_key
+from .document import _close_thumbnail_document, _open_thumbnail_document
 from .tile import ThumbnailLabel
 
 
 class ThumbnailGridLoadingMixin(ThumbnailGridHost):
+    _THUMB_W = 140
+    _THUMB_H = 160
+
     def _thumbnail_cache_key(self, page_index: int) -> tuple[str, int, int]:
         from ...core.path_utils import normalize_path_key
 
@@ -37,7 +41,7 @@ class ThumbnailGridLoadingMixin(ThumbnailGridHost):
             self.clear()
             return
 
-        self._cleanup_loader_thread()
+        self._cancel_thumbnail_requests()
         prev_path = getattr(self, "_pdf_path", "") or ""
         self._pdf_path = pdf_path
         self._pdf_password = password
@@ -66,6 +70,13 @@ class ThumbnailGridLoadingMixin(ThumbnailGridHost):
                 thumb = ThumbnailLabel(i)
                 thumb.clickedWithModifiers.connect(self._on_thumbnail_clicked)
                 self._thumbnails.append(thumb)
+            self._render_service.open_document(
+                pdf_path,
+                password,
+                page_count=self._total_pages,
+                thumb_w=self._THUMB_W,
+                thumb_h=self._THUMB_H,
+            )
             self._arrange_grid()
             self._request_visible_thumbnails()
         except Exception as e:
@@ -73,62 +84,55 @@ class ThumbnailGridLoadingMixin(ThumbnailGridHost):
             self._set_loading_message(tm.get("thumb_load_failed", str(e)))
             return
         finally:
-            if doc:
-                doc.close()
+            if doc is not None:
+                _close_thumbnail_document(doc)
 
-    def _disconnect_loader_thread(self, thread: ThumbnailLoaderThread):
-        try:
-            thread.thumbnail_ready.disconnect(self._on_thumbnail_ready)
-        except Exception:
-            pass
-        try:
-            thread.progress.disconnect(self._on_loader_progress)
-        except Exception:
-            pass
+    def _cancel_thumbnail_requests(self):
+        """현재 세대의 렌더 요청을 모두 버린다 (잔여 결과는 세대 번호로 무시)."""
+        self._render_service.close_document()
+        self._pending_indices.update(self._requested_indices)
+        self._requested_indices.clear()
+
+    def _shutdown_render_service(self):
         try:
-            thread.loading_complete.disconnect(self._on_loading_complete)
+            from ...core.constants import THUMBNAIL_LOADER_WAIT_MS
+
+            wait_ms = int(THUMBNAIL_LOADER_WAIT_MS)
         except Exception:
-            pass
-
-    def _cleanup_loader_thread(self):
-        thread = self._loader_thread
-        if thread:
-            self._disconnect_loader_thread(thread)
-
-            if thread.isRunning():
-                thread.cancel()
-                try:
-                    thread.finished.connect(thread.deleteLater)
-                except Exception:
-                    pass
-                try:
-                    from ...core.constants import THUMBNAIL_LOADER_WAIT_MS
-
-                    wait_ms = int(THUMBNAIL_LOADER_WAIT_MS)
-                except Exception:
-                    wait_ms = 1000
-                if not thread.wait(max(300, wait_ms)):
-                    logger.info(
-                        "ThumbnailLoaderThread is stopping in background (wait_ms=%s)",
-                        wait_ms,
-                    )
-            else:
-                thread.deleteLater()
-
-            self._loader_thread = None
-
-        if self._active_batch_indices:
-            self._pending_indices.update(self._active_batch_indices)
-            self._requested_indices.difference_update(self._active_batch_indices)
-            self._active_batch_indices = []
-
-    def _start_next_loader(self):
-        if self._loader_thread and self._loader_thread.isRunning():
+            wait_ms = 1000
+        self._requested_indices.clear()
+        self._render_service.shutdown(max(300, wait_ms))
+
+    def release_document_handles(self):
+        """같은 경로 덮어쓰기 전 렌더 서비스의 열린 문서 핸들을 놓는다 (다음 요청 때 재오픈)."""
+        self._render_service.release_document_handles()
+
+    def _warm_thumbnails_from_disk(self, indices: list[int]) -> None:
+        """디스크 캐시 적중 페이지를 렌더 요청 전에 채운다 (digest 메모 적중 시에만 — GUI 스레드 해시 금지)."""
+        if not indices or getattr(self, "_pdf_password", None):
             return
-        if not self._pending_indices:
+        store = get_thumbnail_disk_cache()
+        if store is None:
             return
+        digest = store.resolve_digest(self._pdf_path, compute=False)
+        if not digest:
+            return
+        blobs = store.get_many(digest, indices, thumbnail_size_key(self._THUMB_W, self._THUMB_H))
+        lru = getattr(self, "_pixmap_lru", None)
+        for idx, blob in blobs.items():
+            image = decode_thumbnail_image(blob)
+            if image is None or idx >= len(self._thumbnails):
+                continue
+            pixmap = QPixmap.fromImage(image)
+            self._pending_indices.discard(idx)
+            self._thumbnails[idx].set_pixmap(pixmap)
+            self._loaded_indices.add(idx)
+            self._requested_indices.discard(idx)
+            if lru is not None:
+                lru.put(self._thumbnail_cache_key(idx), pixmap)
 
-        # LRU 적중 페이지는 로더 없이 즉시 적용
+    def _dispatch_thumbnail_requests(self, start_idx: int, end_idx: int):
+        # LRU 적중 페이지는 렌더 없이 즉시 적용
         lru = getattr(self, "_pixmap_lru", None)
         if lru is not None:
             for idx in list(self._pending_indices):
@@ -140,47 +144,27 @@ class ThumbnailGridLoadingMixin(ThumbnailGridHost):
                     self._thumbnails[idx].set_pixmap(cached)
                     self._loaded_indices.add(idx)
                     self._requested_indices.discard(idx)
-            if self._loaded_indices:
-                self.loadingProgress.emit(
-                    int((len(self._loaded_indices) / max(1, self._total_pages)) * 100)
-                )
-            if not self._pending_indices:
-                return
-
-        batch = sorted(self._pending_indices)[: self._MAX_BATCH_SIZE]
-        for idx in batch:
-            self._pending_indices.discard(idx)
-        self._requested_indices.update(batch)
-        self._active_batch_indices = batch
-
-        self._loader_thread = ThumbnailLoaderThread(
-            self._pdf_path,
-            batch,
-            password=self._pdf_password,
-            thumb_w=140,
-            thumb_h=160,
-        )
-        self._loader_thread.thumbnail_ready.connect(self._on_thumbnail_ready)
-        self._loader_thread.progress.connect(self._on_loader_progress)
-        self._loader_thread.loading_complete.connect(self._on_loading_complete)
-        self._loader_thread.start()
-
-    def _is_active_loader_sender(self) -> bool:
-        """현재 활성 로더 스레드에서 온 시그널인지 확인 (잔여 스레드 혼선 방지)."""
-        sender = self.sender()
-        active = getattr(self, "_loader_thread", None)
-        if active is None:
-            # cleanup 직후 잔여 시그널은 무시
-            return False
-        if sender is not None and sender is not active:
-            return False
-        return True
-
-    @pyqtSlot(int, QPixmap)
-    def _on_thumbnail_ready(self, index: int, pixmap: QPixmap):
-        if not self._is_active_loader_sender():
+        # 이전 세션 디스크 캐시 적중분도 렌더 서비스 요청 전에 적용
+        self._warm_thumbnails_from_disk(sorted(self._pending_indices))
+        if self._loaded_indices:
+            self.loadingProgress.emit(
+                int((len(self._loaded_indices) / max(1, self._total_pages)) * 100)
+            )
+
+        # 창 가운데(실제 보이는 행)부터, 앞뒤 prefetch 행은 나중에
+        center = (start_idx + end_idx) / 2
+        ordered = sorted(self._pending_indices, key=lambda idx: (abs(idx - center), idx))
+        self._requested_indices = set(ordered)
+        self._pending_indices.clear()
+        self._render_service.request(ordered)
+
+    @pyqtSlot(int, int, QImage)
+    def _on_thumbnail_ready(self, generation: int, index: int, image: QImage):
+        # 이전 문서(세대)의 잔여 결과는 무시
+        if generation != self._render_service.generation:
             return
         if index < len(self._thumbnails):
+            pixmap = QPixmap.fromImage(image)
             self._thumbnails[index].set_pixmap(pixmap)
             self._loaded_indices.add(index)
             self._requested_indices.discard(index)
@@ -189,29 +173,6 @@ class ThumbnailGridLoadingMixin(ThumbnailGridHost):
                 lru.put(self._thumbnail_cache_key(index), pixmap)
         self.loadingProgress.emit(int((len(self._loaded_indices) / max(1, self._total_pages)) * 100))
 
-    @pyqtSlot(int)
-    def _on_loader_progress(self, _value: int):
-        if not self._is_active_loader_sender():
-            return
-        self.loadingProgress.emit(int((len(self._loaded_indices) / max(1, self._total_pages)) * 100))
-
-    @pyqtSlot()
-    def _on_loading_complete(self):
-        if not self._is_active_loader_sender():
-            return
-        logger.debug("Thumbnail batch loading complete")
-        unfinished = [
-            index for index in self._active_batch_indices if index not in self._loaded_indices
-        ]
-        self._requested_indices.difference_update(self._active_batch_indices)
-        self._pending_indices.update(unfinished)
-        self._active_batch_indices = []
-        if self._loader_thread:
-            self._loader_thread.deleteLater()
-        self._loader_thread = None
-        self._request_visible_thumbnails()
-        self._start_next_loader()
-
     def _on_columns_changed(self, value: int):
         self._columns = value
         self._arrange_grid()
@@ -33,7 +33,7 @@ class ThumbnailGridThemeMixin(ThumbnailGridHost):
         self.loading_label.show()
 
     def show_status_message(self, message: str):
-        self._cleanup_loader_thread()
+        self._cancel_thumbnail_requests()
         self._pdf_path = ""
         self._pdf_password = None
         self._clear_thumbnails()
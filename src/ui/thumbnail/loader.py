@@ -4,7 +4,7 @@ import logging
 from typing import Iterable
 
 from PyQt6.QtCore import QThread, Qt, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QCloseEvent, QCursor, QImage, QMouseEvent, QPixmap
+from PyQt6.QtGui import QCloseEvent, QCursor, QMouseEvent, QPixmap
 from PyQt6.QtWidgets import (
     QFrame,
     QGridLayout,
@@ -17,16 +17,22 @@ from PyQt6.QtWidgets import (
 )
 
 from ...core.i18n import tm
-from ...core.optional_deps import fitz
 from ...core.perf import PerfTimer
 
 logger = logging.getLogger(__name__)
 
 
-from .document import _open_thumbnail_document
+from ...core.render_pool import render_thumbnail_pixmap
+from ...core.thumbnail_cache import get_thumbnail_disk_cache
+from .disk_cache import decode_thumbnail_image, encode_thumbnail_image, thumbnail_size_key
+from .document import _close_thumbnail_document, _open_thumbnail_document
+from .render_service import samples_to_image
 
 class ThumbnailLoaderThread(QThread):
-    """Background thumbnail loader for selected page indices."""
+    """One-shot background thumbnail loader for selected page indices.
+
+    The grid uses ThumbnailRenderService; this stays for standalone callers.
+    """
 
     thumbnail_ready = pyqtSignal(int, QPixmap)
     loading_complete = pyqtSignal()
@@ -60,6 +66,12 @@ class ThumbnailLoaderThread(QThread):
                     logger.warning("Thumbnail loader skipped document %s: %s", self.pdf_path, error_message)
                     return
 
+                # 암호 문서 썸네일은 평문으로 디스크에 남기지 않는다.
+                store = None if self.password else get_thumbnail_disk_cache()
+                digest = store.resolve_digest(self.pdf_path) if store is not None else ""
+                size_key = thumbnail_size_key(self.thumb_w, self.thumb_h)
+                cached = store.get_many(digest, self.page_indices, size_key) if store is not None else {}
+
                 total = max(1, len(self.page_indices))
                 for i, page_index in enumerate(self.page_indices):
                     if self._is_cancelled:
@@ -67,21 +79,20 @@ class ThumbnailLoaderThread(QThread):
                     if page_index < 0 or page_index >= len(doc):
                         continue
 
-                    page = doc[page_index]
-                    scale = min(self.thumb_w / max(page.rect.width, 1), self.thumb_h / max(page.rect.height, 1))
-                    scale = max(0.05, scale)
-                    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale))
-
-                    img_data = bytes(pix.samples)
-                    fmt = QImage.Format.Format_RGBA8888 if pix.alpha else QImage.Format.Format_RGB888
-                    img = QImage(img_data, pix.width, pix.height, pix.stride, fmt)
-                    pixmap = QPixmap.fromImage(img.copy())
+                    img = decode_thumbnail_image(cached[page_index]) if page_index in cached else None
+                    if img is None:
+                        pix = render_thumbnail_pixmap(doc[page_index], self.thumb_w, self.thumb_h)
+                        img = samples_to_image(pix.width, pix.height, pix.stride, bool(pix.alpha), bytes(pix.samples))
+                        if store is not None and digest:
+                            blob, blob_fmt = encode_thumbnail_image(img)
+                            store.put(digest, page_index, size_key, blob, blob_fmt)
+                    pixmap = QPixmap.fromImage(img)
 
                     self.thumbnail_ready.emit(page_index, pixmap)
                     self.progress.emit(int((i + 1) / total * 100))
         except Exception as e:
             logger.error("Thumbnail loading failed: %s", e)
         finally:
-            if doc:
-                doc.close()
+            if doc is not None:
+                _close_thumbnail_document(doc)
             self.loading_complete.emit()
@@ -0,0 +1,362 @@
+"""장수명 썸네일 렌더 서비스.
+
+배치마다 QThread 를 만들고 PDF 를 다시 열던 방식 대신 렌더 루프 하나가
+- 문서 핸들을 세대(generation) 동안 열어 두고,
+- 최신 요청 목록으로 큐를 교체해(스크롤로 벗어난 요청 폐기) 보이는 페이지부터 렌더하며,
+- 큰 문서는 spawn 프로세스 풀(자식별 문서 캐시)로 여러 페이지를 동시에 렌더한다.
+결과에는 세대 번호가 붙어 GUI 에서 이전 문서의 잔여 결과를 걸러낸다.
+유휴 상태가 이어지거나 같은 경로 저장 직전에는 문서/풀 핸들을 놓는다 (Windows 파일 잠금).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from ...core.process_pool import create_process_pool, resolve_pool_workers, shutdown_process_pool
+from ...core.render_pool import render_page_thumbnail, render_thumbnail_pixmap
+from ...core.thumbnail_cache import get_thumbnail_disk_cache
+from .disk_cache import decode_thumbnail_image, encode_thumbnail_image, thumbnail_size_key
+from .document import _close_thumbnail_document, _open_thumbnail_document
+
+logger = logging.getLogger(__name__)
+
+# 이 페이지 수 이상이면 프로세스 렌더 워커 사용 (작은 문서는 spawn 비용이 더 큼)
+_PROCESS_RENDER_MIN_PAGES = 200
+# 요청이 없으면 이 시간 뒤 문서/풀 핸들 해제
+_IDLE_RELEASE_SECONDS = 5.0
+_RESULT_POLL_SECONDS = 0.05
+
+
+def samples_to_image(width: int, height: int, stride: int, alpha: bool, samples: bytes) -> QImage:
+    fmt = QImage.Format.Format_RGBA8888 if alpha else QImage.Format.Format_RGB888
+    return QImage(samples, width, height, stride, fmt).copy()
+
+
+@dataclass(frozen=True, slots=True)
+class _RenderJob:
+    generation: int
+    pdf_path: str
+    password: str | None
+    thumb_w: int
+    thumb_h: int
+    workers: int
+
+
+class _JobState:
+    """렌더 루프 전용 세대 상태 (열린 문서, 디스크 캐시 키)."""
+
+    def __init__(self, job: _RenderJob):
+        self.job = job
+        self.doc: Any = None
+        self.open_failed = False
+        # 암호 문서 썸네일은 평문으로 디스크에 남기지 않는다.
+        self.store = None if job.password else get_thumbnail_disk_cache()
+        self.digest: str | None = None
+        self.size_key = thumbnail_size_key(job.thumb_w, job.thumb_h)
+
+    def resolve_digest(self) -> str:
+        if self.digest is None:
+            self.digest = self.store.resolve_digest(self.job.pdf_path) if self.store is not None else ""
+        return self.digest
+
+    def open_document(self) -> Any:
+        if self.doc is None and not self.open_failed:
+            doc, error_message = _open_thumbnail_document(self.job.pdf_path, self.job.password)
+            if not doc:
+                logger.warning("Thumbnail service skipped document %s: %s", self.job.pdf_path, error_message)
+                self.open_failed = True
+            self.doc = doc
+        return self.doc
+
+    def close_document(self) -> None:
+        if self.doc is not None:
+            _close_thumbnail_document(self.doc)
+            self.doc = None
+
+
+class ThumbnailRenderService(QObject):
+    """썸네일 우선순위 렌더 서비스 (GUI 스레드에서 호출, 렌더는 전용 스레드/프로세스)."""
+
+    # generation, page_index, image
+    thumbnail_ready = pyqtSignal(int, int, QImage)
+
+    def __init__(self, parent: QObject | None = None, *, max_workers: int | None = None):
+        super().__init__(parent)
+        self._cond = threading.Condition()
+        self._job: _RenderJob | None = None
+        self._queue: list[int] = []
+        self._generation = 0
+        self._stopping = False
+        self._release_requested = False
+        self._max_workers = max_workers
+        self._thread: threading.Thread | None = None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def open_document(
+        self,
+        pdf_path: str,
+        password: str | None,
+        *,
+        page_count: int,
+        thumb_w: int,
+        thumb_h: int,
+    ) -> int:
+        """새 세대를 시작한다. 이전 문서의 대기 요청은 버린다."""
+        workers = 1
+        if page_count >= _PROCESS_RENDER_MIN_PAGES:
+            workers = resolve_pool_workers(page_count, self._max_workers)
+        with self._cond:
+            self._generation += 1
+            self._job = _RenderJob(self._generation, pdf_path, password, int(thumb_w), int(thumb_h), workers)
+            self._queue = []
+            self._stopping = False
+            self._cond.notify_all()
+        self._ensure_thread()
+        return self._generation
+
+    def request(self, page_indices: Iterable[int]) -> None:
+        """우선순위 순 페이지 목록으로 대기열을 교체한다 (목록에 없는 대기 요청은 폐기)."""
+        ordered = list(dict.fromkeys(int(index) for index in page_indices))
+        with self._cond:
+            if self._job is None:
+                return
+            self._queue = ordered
+            self._cond.notify_all()
+
+    def close_document(self) -> None:
+        with self._cond:
+            self._generation += 1
+            self._job = None
+            self._queue = []
+            self._cond.notify_all()
+
+    def release_document_handles(self, wait_ms: int = 1000) -> bool:
+        """열린 문서/렌더 프로세스를 즉시 닫는다 (같은 경로 덮어쓰기 전). 다음 요청 때 다시 연다."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return True
+        deadline = time.monotonic() + max(0, wait_ms) / 1000.0
+        with self._cond:
+            self._release_requested = True
+            self._cond.notify_all()
+            while self._release_requested:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.info("Thumbnail service did not release handles in time")
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def shutdown(self, wait_ms: int = 1000) -> bool:
+        with self._cond:
+            self._stopping = True
+            self._generation += 1
+            self._job = None
+            self._queue = []
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is None:
+            return True
+        thread.join(max(0, wait_ms) / 1000.0)
+        if thread.is_alive():
+            logger.info("Thumbnail render service is stopping in background (wait_ms=%s)", wait_ms)
+            return False
+        self._thread = None
+        return True
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="ThumbnailRenderService", daemon=True)
+        self._thread.start()
+
+    # ---- 렌더 루프 (전용 스레드) ----
+    def _run(self) -> None:
+        state: _JobState | None = None
+        executor: Any = None
+        in_flight: dict[Future, tuple[_JobState, int]] = {}
+        last_active = time.monotonic()
+
+        def _release() -> Any:
+            """문서·대기 요청을 정리하고 프로세스 풀을 떼어 낸다 (종료는 _cond 밖에서 호출측이)."""
+            nonlocal executor
+            if state is not None:
+                state.close_document()
+            # 진행 중이던 현재 세대 요청은 다음 렌더 때 먼저 처리되도록 대기열 앞으로
+            requeue = [index for future, (owner, index) in in_flight.items() if owner.job is self._job]
+            for future in in_flight:
+                future.cancel()
+            in_flight.clear()
+            with self._cond:
+                if requeue and self._job is not None:
+                    self._queue = requeue + [index for index in self._queue if index not in requeue]
+            retired, executor = executor, None
+            return retired
+
+        def _shutdown_retired(retired: Any) -> None:
+            # 자식 프로세스 회수는 오래 걸릴 수 있다 — GUI 스레드의 request/open_document 를 막지 않도록 잠금 밖
+            if retired is not None:
+                shutdown_process_pool(retired, terminate=True)
+
+        try:
+            while True:
+                released = False
+                release_ack = False
+                retired: Any = None
+                with self._cond:
+                    while True:
+                        if self._stopping:
+                            return
+                        if self._release_requested:
+                            retired = _release()
+                            released = release_ack = True
+                            break
+                        job = self._job
+                        if in_flight or (job is not None and self._queue):
+                            break
+                        if state is not None and state.job is not job:
+                            break
+                        holding = (state is not None and state.doc is not None) or executor is not None
+                        if not holding:
+                            self._cond.wait()
+                            continue
+                        idle_left = _IDLE_RELEASE_SECONDS - (time.monotonic() - last_active)
+                        if idle_left <= 0:
+                            retired = _release()
+                            released = True
+                            break
+                        self._cond.wait(idle_left)
+
+                    if not released:
+                        use_pool = job is not None and job.workers > 1
+                        if use_pool:
+                            capacity = max(0, job.workers * 2 - len(in_flight))
+                        else:
+                            capacity = 1
+                        picks = self._queue[:capacity] if job is not None else []
+                        del self._queue[: len(picks)]
+
+                if released:
+                    _shutdown_retired(retired)
+                    if release_ack:
+                        with self._cond:
+                            self._release_requested = False
+                            self._cond.notify_all()
+                    continue
+
+                if state is None or state.job is not job:
+                    if state is not None:
+                        state.close_document()
+                    for future, (owner, _index) in list(in_flight.items()):
+                        if owner is state and future.cancel():
+                            in_flight.pop(future, None)
+                    state = _JobState(job) if job is not None else None
+
+                if use_pool and executor is None and picks:
+                    try:
+                        executor = create_process_pool(job.workers)
+                    except Exception as exc:
+                        logger.info("Thumbnail render pool unavailable, rendering in-thread: %s", exc)
+                        use_pool = False
+
+                rendered_inline = False
+                for page_index in picks:
+                    assert state is not None
+                    last_active = time.monotonic()
+                    image = self._cached_image(state, page_index)
+                    if image is None and use_pool and executor is not None:
+                        future = executor.submit(
+                            render_page_thumbnail,
+                            state.job.pdf_path,
+                            state.job.password or "",
+                            page_index,
+                            state.job.thumb_w,
+                            state.job.thumb_h,
+                        )
+                        in_flight[future] = (state, page_index)
+                        continue
+                    if image is None:
+                        rendered_inline = True
+                        image = self._render_inline(state, page_index)
+                    if image is not None:
+                        self._emit_ready(state.job.generation, page_index, image)
+
+                if in_flight:
+                    timeout = 0 if rendered_inline or picks else _RESULT_POLL_SECONDS
+                    done, _pending = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        owner, page_index = in_flight.pop(future)
+                        last_active = time.monotonic()
+                        image = self._pool_result_image(owner, page_index, future)
+                        if image is not None:
+                            self._emit_ready(owner.job.generation, page_index, image)
+        except Exception:
+            logger.exception("Thumbnail render service crashed")
+        finally:
+            _shutdown_retired(_release())
+
+    def _emit_ready(self, generation: int, page_index: int, image: QImage) -> None:
+        try:
+            self.thumbnail_ready.emit(generation, page_index, image)
+        except RuntimeError:
+            # 소유 위젯이 close 없이 파괴됨 — 루프 종료
+            with self._cond:
+                self._stopping = True
+
+    def _cached_image(self, state: _JobState, page_index: int) -> QImage | None:
+        digest = state.resolve_digest()
+        if state.store is None or not digest:
+            return None
+        blob = state.store.get(digest, page_index, state.size_key)
+        return decode_thumbnail_image(blob) if blob else None
+
+    def _store_image(self, state: _JobState, page_index: int, image: QImage) -> None:
+        digest = state.resolve_digest()
+        if state.store is None or not digest:
+            return
+        blob, fmt = encode_thumbnail_image(image)
+        state.store.put(digest, page_index, state.size_key, blob, fmt)
+
+    def _render_inline(self, state: _JobState, page_index: int) -> QImage | None:
+        doc = state.open_document()
+        if doc is None:
+            # 열기 실패 — 이 세대의 남은 요청은 의미 없음
+            with self._cond:
+                if self._job is state.job:
+                    self._queue = []
+            return None
+        if page_index < 0 or page_index >= len(doc):
+            return None
+        try:
+            pix = render_thumbnail_pixmap(doc[page_index], state.job.thumb_w, state.job.thumb_h)
+            image = samples_to_image(pix.width, pix.height, pix.stride, bool(pix.alpha), bytes(pix.samples))
+        except Exception as exc:
+            logger.debug("Thumbnail render failed page %s: %s", page_index, exc)
+            return None
+        self._store_image(state, page_index, image)
+        return image
+
+    def _pool_result_image(self, state: _JobState, page_index: int, future: Future) -> QImage | None:
+        if future.cancelled():
+            return None
+        try:
+            _index, width, height, stride, alpha, samples = future.result()
+        except Exception as exc:
+            logger.debug("Thumbnail pool render failed page %s: %s", page_index, exc)
+            return None
+        image = samples_to_image(width, height, stride, alpha, samples)
+        self._store_image(state, page_index, image)
+        return image
+
+
+__all__ = ["ThumbnailRenderService", "samples_to_image"]
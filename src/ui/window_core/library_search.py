@@ -0,0 +1,206 @@
+"""라이브러리 전문 검색 다이얼로그 (최근 파일 + 색인 폴더, 페이지 단위 결과)."""
+
+from __future__ import annotations
+
+import logging
+import os
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QFileDialog,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QPushButton,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QVBoxLayout,
+)
+
+from ...core.i18n import tm
+from ...core.library_index import LibraryIndex
+from ...core.settings import save_settings
+
+logger = logging.getLogger(__name__)
+
+_PATH_ROLE = Qt.ItemDataRole.UserRole
+
+
+class LibrarySearchDialog(QDialog):
+    """비모달 — 색인 갱신은 메인 창 워커(run_worker)로 돌리고 결과만 여기서 질의한다."""
+
+    def __init__(self, window):
+        super().__init__(window)
+        self._window = window
+        self.setWindowTitle(tm.get("library_search_title"))
+        self.setMinimumSize(620, 480)
+        self.resize(820, 600)
+
+        layout = QVBoxLayout(self)
+        header = QLabel(tm.get("library_search_title"))
+        header.setObjectName("stepLabel")
+        layout.addWidget(header)
+
+        query_row = QHBoxLayout()
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText(tm.get("library_search_placeholder"))
+        self.query_edit.returnPressed.connect(self.run_query)
+        query_row.addWidget(self.query_edit, 1)
+        search_btn = QPushButton(tm.get("library_search_button"))
+        search_btn.clicked.connect(self.run_query)
+        query_row.addWidget(search_btn)
+        layout.addLayout(query_row)
+
+        self.results = QTreeWidget()
+        self.results.setRootIsDecorated(False)
+        self.results.setHeaderLabels(
+            [
+                tm.get("library_col_file"),
+                tm.get("library_col_page"),
+                tm.get("library_col_score"),
+                tm.get("library_col_folder"),
+            ]
+        )
+        self.results.itemDoubleClicked.connect(self._open_item)
+        layout.addWidget(self.results, 1)
+
+        layout.addWidget(QLabel(tm.get("library_folders_label")))
+        self.folder_list = QListWidget()
+        self.folder_list.setMaximumHeight(90)
+        for folder in self._folders():
+            self.folder_list.addItem(folder)
+        layout.addWidget(self.folder_list)
+
+        folder_row = QHBoxLayout()
+        for key, handler in (
+            ("library_add_folder", self._add_folder),
+            ("library_remove_folder", self._remove_folder),
+            ("library_update_index", self.update_index),
+        ):
+            button = QPushButton(tm.get(key))
+            button.setObjectName("secondaryBtn")
+            button.clicked.connect(handler)
+            folder_row.addWidget(button)
+        folder_row.addStretch()
+        layout.addLayout(folder_row)
+
+        self.status = QLabel("")
+        self.status.setObjectName("desc")
+        layout.addWidget(self.status)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        close_btn = buttons.button(QDialogButtonBox.StandardButton.Close)
+        if close_btn is not None:
+            close_btn.setText(tm.get("compare_report_close"))
+            close_btn.clicked.connect(self.close)
+        buttons.rejected.connect(self.close)
+        layout.addWidget(buttons)
+
+        self.refresh_summary()
+
+    # ---- 설정 ----
+    def _folders(self) -> list[str]:
+        folders = self._window.settings.get("library_folders", [])
+        return [folder for folder in folders if isinstance(folder, str)] if isinstance(folders, list) else []
+
+    def _store_folders(self, folders: list[str]) -> None:
+        self._window.settings["library_folders"] = folders
+        save_settings(self._window.settings)
+
+    def _add_folder(self) -> None:
+        folder = QFileDialog.getExistingDirectory(self, tm.get("library_add_folder"))
+        if not folder:
+            return
+        folders = self._folders()
+        if folder not in folders:
+            folders.append(folder)
+            self.folder_list.addItem(folder)
+            self._store_folders(folders)
+
+    def _remove_folder(self) -> None:
+        row = self.folder_list.currentRow()
+        if row < 0:
+            return
+        item = self.folder_list.takeItem(row)
+        folders = [folder for folder in self._folders() if item is None or folder != item.text()]
+        self._store_folders(folders)
+
+    # ---- 색인/질의 ----
+    def update_index(self) -> None:
+        recent = self._window.settings.get("recent_files", [])
+        self._window.run_worker(
+            "library_index",
+            library_files=list(recent) if isinstance(recent, list) else [],
+            library_folders=self._folders(),
+        )
+
+    def refresh_summary(self) -> None:
+        try:
+            with LibraryIndex() as index:
+                summary = index.summary()
+        except Exception as exc:
+            logger.warning("Library index unavailable", exc_info=True)
+            self.status.setText(str(exc))
+            return
+        self.status.setText(tm.get("library_summary", summary["files"], summary["pages"]))
+
+    def run_query(self) -> None:
+        query = self.query_edit.text().strip()
+        self.results.clear()
+        if not query:
+            return
+        try:
+            with LibraryIndex() as index:
+                hits = index.search(query)
+        except Exception as exc:
+            logger.warning("Library search failed", exc_info=True)
+            self.status.setText(str(exc))
+            return
+        for hit in hits:
+            item = QTreeWidgetItem(
+                [os.path.basename(hit.path), str(hit.page), f"{hit.score:.2f}", os.path.dirname(hit.path)]
+            )
+            item.setData(0, _PATH_ROLE, (hit.path, hit.page))
+            item.setToolTip(0, hit.path)
+            self.results.addTopLevelItem(item)
+        self.results.resizeColumnToContents(0)
+        self.status.setText(tm.get("library_hits", len(hits)))
+
+    def _open_item(self, item: QTreeWidgetItem, _column: int = 0) -> None:
+        data = item.data(0, _PATH_ROLE)
+        if not data:
+            return
+        path, page = data
+        if not os.path.exists(path):
+            self.status.setText(tm.get("err_pdf_not_found"))
+            return
+        self._window._update_preview(path)
+        if getattr(self._window, "_current_preview_path", "") and int(page) > 1:
+            self._window._current_preview_page = int(page) - 1
+            self._window._render_preview_page()
+
+
+def _show_library_search(self):
+    """라이브러리 전문 검색 (비모달, 창 하나만 유지)"""
+    dialog = getattr(self, "_library_search_dialog", None)
+    if dialog is None:
+        dialog = LibrarySearchDialog(self)
+        self._library_search_dialog = dialog
+    dialog.show()
+    dialog.raise_()
+    dialog.activateWindow()
+    dialog.query_edit.setFocus()
+
+
+def _on_library_index_updated(self, payload: dict) -> bool:
+    """library_index 완료 시 열린 검색 창 갱신. 창이 보이면 True (완료 모달 생략)."""
+    dialog = getattr(self, "_library_search_dialog", None)
+    if dialog is None or not dialog.isVisible():
+        return False
+    dialog.refresh_summary()
+    if dialog.query_edit.text().strip():
+        dialog.run_query()
+    return True
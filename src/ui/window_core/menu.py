@@ -16,7 +16,9 @@ from PyQt6.QtWidgets import (
 )
 
 from ...core.i18n import tm
+from ...core.perf import set_telemetry_enabled
 from ...core.settings import save_settings
+from ...core.text_layer_cache import TEXT_LAYER_CACHE
 from ..main_window_config import APP_NAME, VERSION
 from ..styles import DARK_STYLESHEET, LIGHT_STYLESHEET
 from ..widgets import DropZoneWidget, EmptyStateWidget, FileSelectorWidget
@@ -41,6 +43,11 @@ def _create_menu_bar(self):
     self.recent_menu_bar = file_menu.addMenu(tm.get("menu_recent"))
     self._update_recent_menu_bar()
 
+    library_action = QAction(tm.get("menu_library_search"), self)
+    library_action.setShortcut("Ctrl+Shift+F")
+    library_action.triggered.connect(self._show_library_search)
+    file_menu.addAction(library_action)
+
     file_menu.addSeparator()
 
     exit_action = QAction(tm.get("menu_exit"), self)
@@ -108,6 +115,18 @@ def _create_menu_bar(self):
     self._act_save_chat.triggered.connect(self._toggle_save_chat_histories)
     pref_menu.addAction(self._act_save_chat)
 
+    self._act_perf_telemetry = QAction(tm.get("pref_perf_telemetry"), self)
+    self._act_perf_telemetry.setCheckable(True)
+    self._act_perf_telemetry.setChecked(bool(self.settings.get("perf_telemetry_enabled", False)))
+    self._act_perf_telemetry.triggered.connect(self._toggle_perf_telemetry)
+    pref_menu.addAction(self._act_perf_telemetry)
+
+    self._act_text_cache_persist = QAction(tm.get("pref_text_cache_persist"), self)
+    self._act_text_cache_persist.setCheckable(True)
+    self._act_text_cache_persist.setChecked(bool(self.settings.get("text_cache_persist", False)))
+    self._act_text_cache_persist.triggered.connect(self._toggle_text_cache_persist)
+    pref_menu.addAction(self._act_text_cache_persist)
+
     # 도움말 메뉴
     help_menu = menubar.addMenu(tm.get("menu_help"))
 
@@ -115,6 +134,10 @@ def _create_menu_bar(self):
     shortcuts_action.triggered.connect(self._show_shortcuts)
     help_menu.addAction(shortcuts_action)
 
+    perf_action = QAction(tm.get("menu_perf_telemetry"), self)
+    perf_action.triggered.connect(self._show_perf_telemetry)
+    help_menu.addAction(perf_action)
+
     help_menu.addSeparator()
 
     about_action = QAction(tm.get("menu_about"), self)
@@ -140,6 +163,31 @@ def _toggle_clear_pending_on_cancel(self, checked: bool = False):
     save_settings(self.settings)
 
 
+def _toggle_perf_telemetry(self, checked: bool = False):
+    enabled = bool(checked) if isinstance(checked, bool) else bool(
+        getattr(self, "_act_perf_telemetry", None) and self._act_perf_telemetry.isChecked()
+    )
+    self.settings["perf_telemetry_enabled"] = enabled
+    set_telemetry_enabled(enabled)
+    save_settings(self.settings)
+
+
+def _toggle_text_cache_persist(self, checked: bool = False):
+    enabled = bool(checked) if isinstance(checked, bool) else bool(
+        getattr(self, "_act_text_cache_persist", None) and self._act_text_cache_persist.isChecked()
+    )
+    self.settings["text_cache_persist"] = enabled
+    TEXT_LAYER_CACHE.set_persistence(enabled)
+    save_settings(self.settings)
+
+
+def _show_perf_telemetry(self):
+    """성능 텔레메트리 뷰어"""
+    from .perf_viewer import show_perf_telemetry_dialog
+
+    show_perf_telemetry_dialog(self)
+
+
 def _toggle_save_chat_histories(self, checked: bool = False):
     enabled = bool(checked) if isinstance(checked, bool) else bool(
         getattr(self, "_act_save_chat", None) and self._act_save_chat.isChecked()
@@ -200,6 +248,7 @@ def _show_shortcuts(self):
 {tm.get('shortcut_exit')}
 {tm.get('shortcut_theme')}
 {tm.get('shortcut_preview_search')}
+{tm.get('shortcut_library_search')}
 {tm.get('shortcut_tabs')}
 {tm.get('shortcut_help')}"""
     QMessageBox.information(self, tm.get("shortcuts"), shortcuts_text)
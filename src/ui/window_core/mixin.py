@@ -4,11 +4,15 @@ from .menu import (
     _set_notify_mode,
     _show_about,
     _show_help,
+    _show_perf_telemetry,
     _show_shortcuts,
     _toggle_clear_pending_on_cancel,
+    _toggle_perf_telemetry,
     _toggle_save_chat_histories,
+    _toggle_text_cache_persist,
     _update_recent_menu_bar,
 )
+from .library_search import _on_library_index_updated, _show_library_search
 from .shortcuts import _install_wheel_filters, _setup_shortcuts, _shortcut_open_file
 from .state import (
     _choose_output_directory,
@@ -39,10 +43,15 @@ class MainWindowCoreMixin(MainWindowHost):
     _change_language = _change_language
     _set_notify_mode = _set_notify_mode
     _toggle_clear_pending_on_cancel = _toggle_clear_pending_on_cancel
+    _toggle_perf_telemetry = _toggle_perf_telemetry
     _toggle_save_chat_histories = _toggle_save_chat_histories
+    _toggle_text_cache_persist = _toggle_text_cache_persist
     _update_recent_menu_bar = _update_recent_menu_bar
     _show_shortcuts = _show_shortcuts
     _show_about = _show_about
+    _show_perf_telemetry = _show_perf_telemetry
+    _show_library_search = _show_library_search
+    _on_library_index_updated = _on_library_index_updated
     _create_header = _create_header
     _toggle_theme = _toggle_theme
     _apply_theme = _apply_theme
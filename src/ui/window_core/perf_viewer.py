@@ -0,0 +1,145 @@
+"""성능 텔레메트리 뷰어 다이얼로그 (히스토그램 + 최근 span, JSON/Chrome trace 내보내기)."""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QFileDialog,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QTextEdit,
+    QVBoxLayout,
+)
+
+from ...core.i18n import tm
+from ...core.perf import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+# 뷰어에 표시할 최근 span 수 (전체는 내보내기로 확인)
+_MAX_VIEW_SPANS = 300
+
+
+def format_perf_snapshot(snapshot: dict) -> str:
+    """텔레메트리 스냅샷을 고정폭 텍스트 리포트로 변환."""
+    lines: list[str] = []
+    if not snapshot.get("enabled"):
+        lines.append(tm.get("perf_telemetry_disabled"))
+        lines.append("")
+
+    lines.append(f"■ {tm.get('perf_telemetry_histograms')}")
+    histograms = snapshot.get("histograms") or []
+    if not histograms:
+        lines.append(f"  {tm.get('perf_telemetry_empty')}")
+    for item in histograms:
+        lines.append(
+            f"  {item['name']:<24} {item['count']:>7} · {item['mean_ms']:>9.2f} · "
+            f"{item['p50_ms']:>9.2f} · {item['p95_ms']:>9.2f} · {item['max_ms']:>9.2f}"
+        )
+
+    lines.append("")
+    lines.append(f"■ {tm.get('perf_telemetry_spans')}")
+    spans = snapshot.get("spans") or []
+    if not spans:
+        lines.append(f"  {tm.get('perf_telemetry_empty')}")
+    for span in reversed(spans[-_MAX_VIEW_SPANS:]):
+        indent = "  " * (int(span.get("depth", 0)) + 1)
+        error = f"  ✗ {span['error']}" if span.get("error") else ""
+        thread = span.get("thread") or ""
+        lines.append(f"{indent}{span['name']}  {span['duration_ms']:.2f} ms  [{thread}]{error}")
+    dropped = int(snapshot.get("dropped_spans") or 0)
+    if dropped:
+        lines.append("")
+        lines.append(tm.get("perf_telemetry_dropped", dropped))
+    return "\n".join(lines)
+
+
+def show_perf_telemetry_dialog(parent) -> None:
+    """텔레메트리 스냅샷을 보여주고 내보내기/초기화를 제공."""
+    dialog = QDialog(parent)
+    dialog.setWindowTitle(tm.get("perf_telemetry_title"))
+    dialog.setMinimumSize(560, 440)
+    dialog.resize(760, 560)
+
+    layout = QVBoxLayout(dialog)
+    header = QLabel(tm.get("perf_telemetry_title"))
+    header.setObjectName("stepLabel")
+    layout.addWidget(header)
+
+    body = QTextEdit()
+    body.setReadOnly(True)
+    body.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+    body.setFont(QFont("Consolas", 9))
+    layout.addWidget(body, 1)
+
+    status = QLabel("")
+    status.setObjectName("desc")
+    layout.addWidget(status)
+
+    def _refresh() -> None:
+        body.setPlainText(format_perf_snapshot(TELEMETRY.snapshot()))
+
+    def _clear() -> None:
+        TELEMETRY.clear()
+        status.setText("")
+        _refresh()
+
+    def _export(chrome: bool) -> None:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = "trace.json" if chrome else "perf.json"
+        default_dir = ""
+        try:
+            default_dir = parent._get_output_dialog_dir()
+        except Exception:
+            default_dir = ""
+        path, _ = QFileDialog.getSaveFileName(
+            dialog,
+            tm.get("perf_telemetry_export_trace" if chrome else "perf_telemetry_export_json"),
+            os.path.join(default_dir, f"pdf_master_{stamp}_{suffix}"),
+            "JSON (*.json)",
+        )
+        if not path:
+            return
+        try:
+            if chrome:
+                TELEMETRY.export_chrome_trace(path)
+            else:
+                TELEMETRY.export_json(path)
+            status.setText(tm.get("perf_telemetry_exported", path))
+        except Exception as exc:
+            logger.warning("Failed to export telemetry", exc_info=True)
+            status.setText(str(exc))
+
+    btn_row = QHBoxLayout()
+    for key, handler in (
+        ("perf_telemetry_refresh", _refresh),
+        ("perf_telemetry_clear", _clear),
+        ("perf_telemetry_export_json", lambda: _export(False)),
+        ("perf_telemetry_export_trace", lambda: _export(True)),
+    ):
+        button = QPushButton(tm.get(key))
+        button.setObjectName("secondaryBtn")
+        button.clicked.connect(handler)
+        btn_row.addWidget(button)
+    btn_row.addStretch()
+    layout.addLayout(btn_row)
+
+    buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+    close_btn = buttons.button(QDialogButtonBox.StandardButton.Close)
+    if close_btn is not None:
+        close_btn.setText(tm.get("compare_report_close"))
+        close_btn.clicked.connect(dialog.accept)
+    buttons.rejected.connect(dialog.reject)
+    layout.addWidget(buttons)
+
+    _refresh()
+    dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+    dialog.exec()
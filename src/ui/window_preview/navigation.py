@@ -6,8 +6,10 @@ from PyQt6.QtGui import QImage, QPainter
 from PyQt6.QtPrintSupport import QAbstractPrintDialog, QPageSetupDialog, QPrintPreviewDialog, QPrinter
 from PyQt6.QtWidgets import QMessageBox
 
+from ...core.doc_pool import DOC_POOL
 from ...core.optional_deps import fitz
 from ...core.i18n import tm
+from ...core.perf import perf_sample
 from ..widgets import ToastWidget
 
 logger = logging.getLogger(__name__)
@@ -93,7 +95,8 @@ def _render_pdf_page_to_printer(printer, painter: QPainter, page) -> None:
     )
     render_scale = max(1.0, render_scale)
 
-    pix = page.get_pixmap(matrix=fitz.Matrix(render_scale, render_scale), alpha=False)
+    with perf_sample("page.render"):
+        pix = page.get_pixmap(matrix=fitz.Matrix(render_scale, render_scale), alpha=False)
     image_format = QImage.Format.Format_RGBA8888 if pix.alpha else QImage.Format.Format_RGB888
     image = QImage(bytes(pix.samples), pix.width, pix.height, pix.stride, image_format).copy()
     scaled = image.scaled(
@@ -111,10 +114,11 @@ def _render_pdf_page_to_printer(printer, painter: QPainter, page) -> None:
 
 
 def _paint_pdf_document(printer, path: str, password: str | None, current_page_index: int):
-    doc = fitz.open(path)
-    try:
-        if doc.is_encrypted and password:
-            doc.authenticate(password)
+    # 인쇄 미리보기는 설정이 바뀔 때마다 다시 그리므로 공용 풀의 핸들을 빌려 쓴다
+    with DOC_POOL.borrow(path, [password]) as doc:
+        if doc is None:
+            logger.warning("Print skipped: document could not be authenticated: %s", path)
+            return
         page_indices = _collect_print_page_indices(printer, len(doc), current_page_index)
         if not page_indices:
             return
@@ -128,8 +132,6 @@ def _paint_pdf_document(printer, path: str, password: str | None, current_page_i
                 _render_pdf_page_to_printer(printer, painter, doc[page_index])
         finally:
             painter.end()
-    finally:
-        doc.close()
 
 
 def _print_current_preview(self):
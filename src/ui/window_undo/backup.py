@@ -1,16 +1,26 @@
 import logging
 import os
 import shutil
+from typing import Any, Callable
 
 from PyQt6.QtWidgets import QMessageBox
 
+from ...core.doc_pool import DOC_POOL
 from ...core.i18n import tm
+from ...core.undo_chunk_store import UndoChunkStore
 from ..widgets import ToastWidget
+from .snapshots import _undo_snapshot_service
 
 logger = logging.getLogger(__name__)
 
-def _create_backup_for_undo(self, source_path: str) -> str:
-    """작업 전 원본 파일 백업 생성"""
+# 스냅샷 매니페스트 파일 접미사 (청크는 백업 디렉터리 아래 chunks/)
+UNDO_SNAPSHOT_SUFFIX = ".undo.json"
+
+def _undo_chunk_store(self) -> UndoChunkStore:
+    return UndoChunkStore(self._undo_backup_dir)
+
+def _reserve_undo_snapshot_path(self, source_path: str) -> str:
+    """새 스냅샷 매니페스트 경로 (원본이 없거나 크기 상한을 넘으면 "")."""
     if not source_path or not os.path.exists(source_path):
         return ""
     try:
@@ -21,7 +31,7 @@ def _create_backup_for_undo(self, source_path: str) -> str:
         except OSError:
             source_size = 0
         if source_size > int(UNDO_BACKUP_MAX_SOURCE_BYTES):
-            # 대용량 전체 복사 비용 회피 — 호출측에서 undo unavailable 안내
+            # 청크 분할조차 비현실적인 초대형 파일 — 호출측에서 undo unavailable 안내
             logger.info(
                 "Skip undo backup for large source (%s bytes > %s): %s",
                 source_size,
@@ -31,15 +41,50 @@ def _create_backup_for_undo(self, source_path: str) -> str:
             return ""
 
         import uuid
-        backup_name = f"undo_{uuid.uuid4().hex[:8]}_{os.path.basename(source_path)}"
-        backup_path = os.path.join(self._undo_backup_dir, backup_name)
-        shutil.copy2(source_path, backup_path)
-        logger.debug(f"Created undo backup: {backup_path}")
+        os.makedirs(self._undo_backup_dir, exist_ok=True)
+        backup_name = f"undo_{uuid.uuid4().hex[:8]}_{os.path.basename(source_path)}{UNDO_SNAPSHOT_SUFFIX}"
+        return os.path.join(self._undo_backup_dir, backup_name)
+    except Exception as e:
+        logger.warning(f"Failed to create backup: {e}")
+        return ""
+
+def _write_undo_snapshot(self, source_path: str, backup_path: str) -> str:
+    """청크 저장소에 스냅샷을 쓴다 (실패 시 ""). 스냅샷 큐 스레드에서도 호출된다."""
+    try:
+        written = _undo_chunk_store(self).create_snapshot(source_path, backup_path)
+        logger.debug("Created undo snapshot: %s (%s new chunk bytes)", backup_path, written)
         return backup_path
     except Exception as e:
         logger.warning(f"Failed to create backup: {e}")
         return ""
 
+def _create_backup_for_undo(self, source_path: str) -> str:
+    """작업 전 원본 파일 스냅샷 생성 (청크 저장소 매니페스트 경로 반환)"""
+    backup_path = _reserve_undo_snapshot_path(self, source_path)
+    if not backup_path:
+        return ""
+    return _write_undo_snapshot(self, source_path, backup_path)
+
+def _queue_backup_for_undo(self, source_path: str, on_done: Callable[[Any], None] | None = None) -> str:
+    """스냅샷 쓰기를 백그라운드 큐에 넣고 매니페스트 경로를 바로 돌려준다.
+
+    쓰기 완료는 `_undo_snapshot_barrier()` 로 기다리거나 on_done(경로 또는 "") 으로 GUI 스레드에서 받는다.
+    """
+    backup_path = _reserve_undo_snapshot_path(self, source_path)
+    if not backup_path:
+        return ""
+    _undo_snapshot_service(self).submit(_write_undo_snapshot, self, source_path, backup_path, on_done=on_done)
+    return backup_path
+
+def _materialize_backup(self, backup_path: str, target_path: str) -> None:
+    store = _undo_chunk_store(self)
+    DOC_POOL.invalidate(target_path)
+    if store.is_snapshot(backup_path):
+        store.restore_snapshot(backup_path, target_path)
+    else:
+        # 청크 저장소 이전 버전의 전체 복사 백업
+        shutil.copy2(backup_path, target_path)
+
 def _restore_from_backup(self, state: dict):
     """백업에서 파일 복원 (undo 콜백)"""
     backup_path = state.get("before_backup_path", "") or state.get("backup_path", "")
@@ -52,7 +97,7 @@ def _restore_from_backup(self, state: dict):
         QMessageBox.warning(self, tm.get("undo_failed_title"), tm.get("undo_backup_not_found"))
         return
     try:
-        shutil.copy2(backup_path, target_path)
+        _materialize_backup(self, backup_path, target_path)
         logger.info(f"Restored from backup: {target_path}")
         # 미리보기 갱신
         self._update_preview(target_path)
@@ -74,7 +119,7 @@ def _redo_from_output(self, state: dict):
         QMessageBox.warning(self, tm.get("restore_failed_title"), tm.get("undo_backup_not_found"))
         return
     try:
-        shutil.copy2(output_path, target_path)
+        _materialize_backup(self, output_path, target_path)
         logger.info("Redo applied: %s", target_path)
         self._update_preview(target_path)
         toast = ToastWidget(tm.get("restore_success"), toast_type="success", duration=2000)
@@ -1,6 +1,10 @@
 import logging
 import os
 import time
+from collections import Counter
+
+from ...core.undo_chunk_store import UndoChunkStore
+from .snapshots import _undo_snapshot_service
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +26,8 @@ def _collect_active_backup_paths(self) -> set[str]:
     active_paths: set[str] = set()
     state_keys = ("backup_path", "before_backup_path", "after_backup_path")
 
-    stacks = [getattr(self.undo_manager, "_undo_stack", []), getattr(self.undo_manager, "_redo_stack", [])]
+    undo_manager = getattr(self, "undo_manager", None)
+    stacks = [getattr(undo_manager, "_undo_stack", []), getattr(undo_manager, "_redo_stack", [])]
     for stack in stacks:
         for record in stack:
             for state in (getattr(record, "before_state", {}), getattr(record, "after_state", {})):
@@ -33,8 +38,11 @@ def _collect_active_backup_paths(self) -> set[str]:
                     if normalized:
                         active_paths.add(normalized)
 
-    pending_undo = getattr(self, "_pending_undo", None)
-    if isinstance(pending_undo, dict):
+    # 실행 중 작업과, after 스냅샷을 기다리며 아직 스택에 오르지 않은 등록
+    pending = [getattr(self, "_pending_undo", None), *getattr(self, "_queued_undo_registrations", ())]
+    for pending_undo in pending:
+        if not isinstance(pending_undo, dict):
+            continue
         for key in ("before_backup_path", "after_backup_path"):
             normalized = _normalize_backup_path(self, pending_undo.get(key, ""))
             if normalized:
@@ -42,11 +50,37 @@ def _collect_active_backup_paths(self) -> set[str]:
 
     return active_paths
 
-def _cleanup_old_undo_backups(self, max_age_hours: int = 24):
-    """오래된 undo 백업 파일 정리
+def _list_backup_files(self) -> list[tuple[str, os.stat_result]]:
+    """백업 디렉터리의 undo_* 파일 (스냅샷 매니페스트 + 이전 버전 전체 복사본)."""
+    entries = []
+    for filename in os.listdir(self._undo_backup_dir):
+        if not filename.startswith("undo_"):
+            continue
+        filepath = os.path.join(self._undo_backup_dir, filename)
+        try:
+            stat_info = os.stat(filepath)
+        except OSError:
+            continue
+        if os.path.isfile(filepath):
+            entries.append((filepath, stat_info))
+    return entries
+
+
+def _collect_unreferenced_chunks(self) -> None:
+    """남은 매니페스트 기준 참조 수 0 인 청크 회수."""
+    store = UndoChunkStore(self._undo_backup_dir)
+    refcounts = store.reference_counts(path for path, _stat in _list_backup_files(self))
+    removed, freed = store.collect_garbage(refcounts)
+    if removed:
+        logger.info(f"Collected {removed} unreferenced undo chunks ({freed} bytes)")
+
+
+def _cleanup_old_undo_backups(self, max_age_hours: int = 24, active_backups: set[str] | None = None):
+    """오래된 undo 스냅샷 정리 후 참조 끊긴 청크 회수
 
     Args:
-        max_age_hours: 이 시간(시간 단위) 이상 된 파일 삭제
+        max_age_hours: 이 시간(시간 단위) 이상 된 스냅샷 삭제
+        active_backups: 보존할 스냅샷 (None 이면 undo 스택에서 수집 — GUI 스레드 전용)
     """
     if not os.path.exists(self._undo_backup_dir):
         return
@@ -54,30 +88,28 @@ def _cleanup_old_undo_backups(self, max_age_hours: int = 24):
     current_time = time.time()
     max_age_seconds = max_age_hours * 3600
     cleaned_count = 0
-    active_backups = _collect_active_backup_paths(self)
+    if active_backups is None:
+        active_backups = _collect_active_backup_paths(self)
 
     try:
-        for filename in os.listdir(self._undo_backup_dir):
-            if not filename.startswith("undo_"):
-                continue
-            filepath = os.path.join(self._undo_backup_dir, filename)
+        for filepath, stat_info in _list_backup_files(self):
             try:
                 if os.path.abspath(filepath) in active_backups:
                     continue
-                file_age = current_time - os.path.getmtime(filepath)
-                if file_age > max_age_seconds:
+                if current_time - stat_info.st_mtime > max_age_seconds:
                     os.remove(filepath)
                     cleaned_count += 1
             except Exception as e:
-                logger.debug(f"Failed to remove old backup {filename}: {e}")
+                logger.debug(f"Failed to remove old backup {filepath}: {e}")
 
         if cleaned_count > 0:
             logger.info(f"Cleaned up {cleaned_count} old undo backup files")
+        _collect_unreferenced_chunks(self)
     except Exception as e:
         logger.warning(f"Error during backup cleanup: {e}")
 
 def _cleanup_unused_undo_backups(self):
-    """현재 undo 스택에 없는 백업 파일 정리"""
+    """현재 undo 스택에 없는 스냅샷 정리 후 참조 끊긴 청크 회수"""
     if not os.path.exists(self._undo_backup_dir):
         return
 
@@ -85,74 +117,87 @@ def _cleanup_unused_undo_backups(self):
 
     cleaned_count = 0
     try:
-        for filename in os.listdir(self._undo_backup_dir):
-            if not filename.startswith("undo_"):
-                continue
-            filepath = os.path.join(self._undo_backup_dir, filename)
+        for filepath, _stat_info in _list_backup_files(self):
             if os.path.abspath(filepath) not in active_backups:
                 try:
                     os.remove(filepath)
                     cleaned_count += 1
                 except Exception as e:
-                    logger.debug(f"Failed to remove unused backup {filename}: {e}")
+                    logger.debug(f"Failed to remove unused backup {filepath}: {e}")
 
         if cleaned_count > 0:
             logger.info(f"Cleaned up {cleaned_count} unused undo backup files")
+        _collect_unreferenced_chunks(self)
     except Exception as e:
         logger.warning(f"Error during unused backup cleanup: {e}")
 
-def _cleanup_undo_backups_by_size(self, max_size_mb: int = 500):
-    """v4.5: 백업 폴더 용량 제한으로 오래된 파일부터 삭제
+def _cleanup_undo_backups_by_size(self, max_size_mb: int = 500, active_backups: set[str] | None = None):
+    """백업 용량(매니페스트 + 청크 실사용량) 제한으로 오래된 스냅샷부터 삭제
+
+    공유 청크는 마지막 참조 스냅샷이 삭제될 때만 용량에서 빠진다.
 
     Args:
         max_size_mb: 허용 최대 크기 (MB)
+        active_backups: 보존할 스냅샷 (None 이면 undo 스택에서 수집 — GUI 스레드 전용)
     """
     if not os.path.exists(self._undo_backup_dir):
         return
 
     max_size_bytes = max_size_mb * 1024 * 1024
-    active_backups = _collect_active_backup_paths(self)
+    if active_backups is None:
+        active_backups = _collect_active_backup_paths(self)
+    store = UndoChunkStore(self._undo_backup_dir)
 
     try:
-        # 백업 파일들과 정보 수집
-        backup_files = []
-        total_size = 0
-
-        for filename in os.listdir(self._undo_backup_dir):
-            if not filename.startswith("undo_"):
-                continue
-            filepath = os.path.join(self._undo_backup_dir, filename)
-            try:
-                stat_info = os.stat(filepath)
-                backup_files.append({
-                    'path': filepath,
-                    'size': stat_info.st_size,
-                    'mtime': stat_info.st_mtime
-                })
-                total_size += stat_info.st_size
-            except Exception:
-                continue
-
-        # 용량 초과 시 오래된 파일부터 삭제
+        backup_files = _list_backup_files(self)
+        manifests = {path: store.read_manifest(path) for path, _stat in backup_files}
+        refcounts: Counter = Counter()
+        for manifest in manifests.values():
+            if manifest is not None:
+                refcounts.update(str(entry[0]) for entry in manifest["chunks"])
+        chunk_sizes = store.chunk_sizes()
+        total_size = sum(stat_info.st_size for _path, stat_info in backup_files)
+        total_size += sum(nbytes for digest, nbytes in chunk_sizes.items() if refcounts.get(digest, 0) > 0)
+
+        # 용량 초과 시 오래된 스냅샷부터 삭제
         if total_size > max_size_bytes:
-            # 오래된 순 정렬
-            backup_files.sort(key=lambda x: x['mtime'])
+            backup_files.sort(key=lambda item: item[1].st_mtime)
             cleaned_count = 0
 
-            for bf in backup_files:
+            for filepath, stat_info in backup_files:
                 if total_size <= max_size_bytes:
                     break
-                if os.path.abspath(bf["path"]) in active_backups:
+                if os.path.abspath(filepath) in active_backups:
                     continue
                 try:
-                    os.remove(bf['path'])
-                    total_size -= bf['size']
-                    cleaned_count += 1
+                    os.remove(filepath)
                 except Exception:
-                    pass
+                    continue
+                cleaned_count += 1
+                total_size -= stat_info.st_size
+                manifest = manifests.get(filepath)
+                for entry in manifest["chunks"] if manifest is not None else ():
+                    digest = str(entry[0])
+                    refcounts[digest] -= 1
+                    if refcounts[digest] == 0:
+                        total_size -= chunk_sizes.get(digest, 0)
 
             if cleaned_count > 0:
                 logger.info(f"Cleaned up {cleaned_count} backup files (size limit {max_size_mb}MB)")
 
+        removed, freed = store.collect_garbage(refcounts, chunk_sizes)
+        if removed:
+            logger.info(f"Collected {removed} unreferenced undo chunks ({freed} bytes)")
+
     except Exception as e:
         logger.warning(f"Error during size-based backup cleanup: {e}")
+
+def _trim_undo_backups(self, max_size_mb: int, max_age_hours: int | None, active_backups: set[str]) -> None:
+    if max_age_hours is not None:
+        _cleanup_old_undo_backups(self, max_age_hours=max_age_hours, active_backups=active_backups)
+    _cleanup_undo_backups_by_size(self, max_size_mb=max_size_mb, active_backups=active_backups)
+
+def _queue_undo_backup_trim(self, max_size_mb: int = 500, max_age_hours: int | None = None):
+    """용량(·나이) 정리와 청크 GC 를 스냅샷 큐 뒤에서 실행 (보존 목록은 지금 GUI 스레드에서 수집)."""
+    active_backups = _collect_active_backup_paths(self)
+    _undo_snapshot_service(self).submit(_trim_undo_backups, self, max_size_mb, max_age_hours, active_backups)
@@ -1,6 +1,7 @@
 import logging
 import os
 
+from ...core.constants import UNDO_BACKUP_MAX_SIZE_MB
 from ...core.i18n import tm
 from ..widgets import ToastWidget
 
@@ -64,3 +65,4 @@ def _register_undo_action(self, action_type: str, description: str,
         undo_callback=self._restore_from_backup,
         redo_callback=self._redo_from_output
     )
+    self._queue_undo_backup_trim(max_size_mb=UNDO_BACKUP_MAX_SIZE_MB)
@@ -1,10 +1,12 @@
-from .backup import _create_backup_for_undo, _redo_from_output, _restore_from_backup
+from .backup import _create_backup_for_undo, _queue_backup_for_undo, _redo_from_output, _restore_from_backup
 from .cleanup import (
     _cleanup_old_undo_backups,
     _cleanup_undo_backups_by_size,
     _cleanup_unused_undo_backups,
+    _queue_undo_backup_trim,
 )
 from .history import _redo_action, _register_undo_action, _undo_action
+from .snapshots import _run_after_undo_snapshots, _shutdown_undo_snapshots, _undo_snapshot_barrier
 from .._typing import MainWindowHost
 
 
@@ -18,3 +20,8 @@ class MainWindowUndoMixin(MainWindowHost):
     _cleanup_old_undo_backups = _cleanup_old_undo_backups
     _cleanup_unused_undo_backups = _cleanup_unused_undo_backups
     _cleanup_undo_backups_by_size = _cleanup_undo_backups_by_size
+    _queue_backup_for_undo = _queue_backup_for_undo
+    _queue_undo_backup_trim = _queue_undo_backup_trim
+    _undo_snapshot_barrier = _undo_snapshot_barrier
+    _run_after_undo_snapshots = _run_after_undo_snapshots
+    _shutdown_undo_snapshots = _shutdown_undo_snapshots
@@ -0,0 +1,89 @@
+"""Undo 스냅샷 백그라운드 큐.
+
+청크 분할·해시·압축(큰 파일은 수 초)과 청크 GC 를 GUI 스레드 밖의 전용 스레드 하나에서 순서대로 돌린다.
+한 스레드로 직렬화하므로 GC 가 쓰는 중인 스냅샷의 청크를 지우지 않고, 같은 파일의 이전 작업 after
+스냅샷은 다음 작업 before 스냅샷보다 먼저 끝난다. 작업 스레드는 `barrier()` 를 기다린 뒤 원본을 바꾼다.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class UndoSnapshotService(QObject):
+    """GUI 스레드에서 submit, 완료 콜백은 GUI 스레드로 되돌려 호출한다."""
+
+    # (완료 콜백, 결과)
+    _delivered = pyqtSignal(object, object)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._executor: ThreadPoolExecutor | None = None
+        self._last: Future | None = None
+        self._delivered.connect(self._deliver)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, on_done: Callable[[Any], None] | None = None) -> Future:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="UndoSnapshot")
+        future = self._executor.submit(self._call, fn, args, on_done)
+        self._last = future
+        return future
+
+    def barrier(self) -> Future:
+        """지금까지 넣은 작업이 모두 끝나면 완료되는 Future (단일 스레드 — 마지막 작업 완료와 같다)."""
+        if self._last is None:
+            done: Future = Future()
+            done.set_result(None)
+            return done
+        return self._last
+
+    def shutdown(self) -> None:
+        """대기 작업은 버리고 실행 중인 작업은 끝까지 둔다 (종료 시)."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _call(self, fn: Callable[..., Any], args: tuple[Any, ...], on_done: Callable[[Any], None] | None) -> Any:
+        try:
+            result = fn(*args)
+        except Exception:
+            logger.warning("Undo snapshot task failed", exc_info=True)
+            result = None
+        if on_done is not None:
+            self._delivered.emit(on_done, result)
+        return result
+
+    def _deliver(self, on_done: Callable[[Any], None], result: Any) -> None:
+        on_done(result)
+
+
+def _undo_snapshot_service(self) -> UndoSnapshotService:
+    service = getattr(self, "_undo_snapshots", None)
+    if service is None:
+        service = UndoSnapshotService()
+        self._undo_snapshots = service
+    return service
+
+
+def _undo_snapshot_barrier(self) -> Future:
+    return _undo_snapshot_service(self).barrier()
+
+
+def _run_after_undo_snapshots(self, fn: Callable[..., Any], *args: Any) -> None:
+    """대기 중인 스냅샷 작업 뒤에 fn 을 실행한다 (큐가 없으면 바로)."""
+    service = getattr(self, "_undo_snapshots", None)
+    if service is None:
+        fn(*args)
+    else:
+        service.submit(fn, *args)
+
+
+def _shutdown_undo_snapshots(self) -> None:
+    service = getattr(self, "_undo_snapshots", None)
+    if service is not None:
+        service.shutdown()
@@ -0,0 +1,343 @@
+"""동시 작업 — 백그라운드 작업 수명주기 (경로 충돌·우선순위 판정은 core.worker_runtime.scheduling).
+
+전경 작업(self.worker)은 기존 run_worker/on_success 경로 그대로다. 결과가 파일/폴더뿐인 작업은
+경로가 겹치지 않으면 전경 작업과 동시에 백그라운드 WorkerThread 로 돌고, 작업 패널에서 진행률·취소를 본다.
+WorkerThread/ToastWidget 은 main_window_worker 의 _job_worker_cls/_job_toast_cls 로 받아 monkeypatch 계약을 지킨다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any
+
+from PyQt6.QtWidgets import QMessageBox
+
+from ...core.i18n import tm
+from ...core.worker_runtime.scheduling import (
+    JobFootprint,
+    default_max_concurrent_jobs,
+    entry_footprint,
+    is_background_eligible,
+    job_footprint,
+)
+from .helpers import _get_operation_description, scrub_sensitive_worker_kwargs
+from .results import _coerce_payload_defaults, _get_worker_payload
+
+logger = logging.getLogger(__name__)
+
+JOB_STATE_RUNNING = "running"
+JOB_STATE_CANCELLING = "cancelling"
+JOB_STATE_DONE = "done"
+JOB_STATE_FAILED = "failed"
+JOB_STATE_CANCELLED = "cancelled"
+_ACTIVE_STATES = frozenset({JOB_STATE_RUNNING, JOB_STATE_CANCELLING})
+# 작업 패널에 남겨 둘 끝난 작업 수
+_FINISHED_HISTORY = 20
+
+
+@dataclass(slots=True)
+class BackgroundJob:
+    job_id: int
+    mode: str
+    description: str
+    worker: Any
+    footprint: JobFootprint
+    output_path: str | None = None
+    output_existed: bool = False
+    progress: int = 0
+    state: str = JOB_STATE_RUNNING
+    message: str = ""
+
+    @property
+    def active(self) -> bool:
+        return self.state in _ACTIVE_STATES
+
+
+def background_jobs(host: Any) -> list[BackgroundJob]:
+    jobs = getattr(host, "_background_jobs", None)
+    if jobs is None:
+        jobs = []
+        host._background_jobs = jobs
+    return jobs
+
+
+def running_footprints(host: Any) -> list[JobFootprint]:
+    """실행 중 작업(전경 + 백그라운드)의 경로 점유."""
+    footprints = [job.footprint for job in getattr(host, "_background_jobs", None) or [] if job.active]
+    worker = getattr(host, "worker", None)
+    if worker is not None and worker.isRunning():
+        kwargs = getattr(worker, "kwargs", None)
+        footprints.append(job_footprint(str(getattr(worker, "mode", "") or ""), kwargs if isinstance(kwargs, dict) else {}))
+    return footprints
+
+
+def max_running_jobs(host: Any) -> int:
+    return default_max_concurrent_jobs()
+
+
+def _blocked_by_running_jobs(self, mode, output_path, kwargs) -> bool:
+    """실행 중 작업(전경 + 백그라운드)과 경로가 겹치는가."""
+    footprint = job_footprint(mode, kwargs, output_path)
+    return any(footprint.conflicts_with(other) for other in running_footprints(self))
+
+
+def _blocked_by_pending_jobs(host: Any, mode, output_path, kwargs) -> bool:
+    # 앞서 제출된 대기 작업과 겹치면 그 뒤에 선다 (같은 파일에 대한 순서 보존)
+    footprint = job_footprint(mode, kwargs, output_path)
+    return any(footprint.conflicts_with(entry_footprint(entry)) for entry in getattr(host, "_pending_workers", None) or [])
+
+
+def _start_background_job(self, mode, output_path=None, kwargs=None) -> BackgroundJob:
+    kwargs = dict(kwargs or {})
+    if output_path:
+        kwargs["output_path"] = output_path
+    augment = getattr(self, "_augment_worker_passwords_from_preview", None)
+    if callable(augment):
+        augment(kwargs)
+    file_output = kwargs.get("output_path")
+    worker = self._job_worker_cls()(mode, **kwargs)
+    job = _register_background_job(
+        self,
+        worker,
+        file_output or kwargs.get("output_dir"),
+        bool(file_output and os.path.exists(file_output)),
+    )
+    worker.start()
+    return job
+
+
+def _try_start_background_job(self, mode, output_path, kwargs) -> bool:
+    """경로가 겹치지 않고 슬롯이 남으면 즉시 백그라운드로 시작한다."""
+    if not is_background_eligible(mode, kwargs, output_path):
+        return False
+    if len(running_footprints(self)) >= max_running_jobs(self):
+        return False
+    if _blocked_by_running_jobs(self, mode, output_path, kwargs) or _blocked_by_pending_jobs(self, mode, output_path, kwargs):
+        return False
+    job = self._start_background_job(mode, output_path, kwargs)
+    toast = self._job_toast_cls()(tm.get("msg_job_started_background", job.description), toast_type="info", duration=2500)
+    toast.show_toast(self)
+    return True
+
+
+def _register_background_job(host: Any, worker: Any, output_path: str | None, output_existed: bool) -> BackgroundJob:
+    mode = str(getattr(worker, "mode", "") or "")
+    kwargs = getattr(worker, "kwargs", None)
+    host._job_seq = int(getattr(host, "_job_seq", 0) or 0) + 1
+    job = BackgroundJob(
+        job_id=host._job_seq,
+        mode=mode,
+        description=_get_operation_description(mode),
+        worker=worker,
+        footprint=job_footprint(mode, kwargs if isinstance(kwargs, dict) else {}),
+        output_path=output_path,
+        output_existed=output_existed,
+    )
+    worker.progress_signal.connect(host._on_background_job_progress)
+    worker.finished_signal.connect(host._on_background_job_finished)
+    worker.error_signal.connect(host._on_background_job_failed)
+    worker.cancelled_signal.connect(host._on_background_job_cancelled)
+    jobs = background_jobs(host)
+    jobs.append(job)
+    finished = [item for item in jobs if not item.active]
+    for stale in finished[: max(0, len(finished) - _FINISHED_HISTORY)]:
+        jobs.remove(stale)
+    host._notify_jobs_changed()
+    return job
+
+
+def _detach_worker_to_background(self) -> None:
+    """진행 오버레이의 '백그라운드로 계속' — 전경 작업을 작업 패널로 옮기고 UI 를 푼다."""
+    worker = getattr(self, "worker", None)
+    if worker is None or not worker.isRunning() or getattr(self, "_cancel_pending", False):
+        return
+    kwargs = getattr(worker, "kwargs", None)
+    if not is_background_eligible(str(getattr(worker, "mode", "") or ""), kwargs if isinstance(kwargs, dict) else {}):
+        return
+    for signal_name, slot in (
+        ("progress_signal", self._on_progress_update),
+        ("finished_signal", self.on_success),
+        ("error_signal", self.on_fail),
+        ("cancelled_signal", self.on_cancelled),
+        ("partial_result_signal", self._on_partial_result),
+    ):
+        signal = getattr(worker, signal_name, None)
+        if signal is None:
+            continue
+        try:
+            signal.disconnect(slot)
+        except (TypeError, RuntimeError):
+            pass
+    job = _register_background_job(
+        self,
+        worker,
+        getattr(self, "_last_output_path", None),
+        bool(getattr(self, "_last_output_existed", False)),
+    )
+    job.progress = int(self.progress_bar.value())
+    self.worker = None
+    self._has_output = False
+    self.set_ui_busy(False)
+    self.progress_overlay.hide_progress()
+    self.progress_bar.setValue(0)
+    self.status_label.setText(tm.get("msg_job_moved_background", job.description))
+    self._run_pending_worker()
+
+
+def _job_for_sender(host: Any) -> BackgroundJob | None:
+    sender = host.sender()
+    for job in getattr(host, "_background_jobs", None) or []:
+        if job.worker is not None and job.worker is sender:
+            return job
+    return None
+
+
+def _release_job_worker(host: Any, job: BackgroundJob, state: str, message: str) -> None:
+    job.state = state
+    job.message = str(message or "")
+    worker, job.worker = job.worker, None
+    if worker is not None:
+        for signal_name in ("progress_signal", "finished_signal", "error_signal", "cancelled_signal"):
+            try:
+                getattr(worker, signal_name).disconnect()
+            except (AttributeError, TypeError, RuntimeError):
+                pass
+        scrub_sensitive_worker_kwargs(getattr(worker, "kwargs", None))
+        worker.deleteLater()
+    host._notify_jobs_changed()
+    host._run_pending_worker()
+
+
+def _on_background_job_progress(self, value: int) -> None:
+    job = _job_for_sender(self)
+    if job is None:
+        return
+    job.progress = int(value)  # 작업 패널은 보이는 동안 주기적으로 다시 그린다
+
+
+def _on_background_job_finished(self, msg) -> None:
+    job = _job_for_sender(self)
+    if job is None:
+        return
+    job.progress = 100
+    payload = _coerce_payload_defaults(job.mode, _get_worker_payload(job.worker))
+    toast_cls = self._job_toast_cls()
+    _release_job_worker(self, job, JOB_STATE_DONE, msg)
+    if job.mode == "compare_pdfs":
+        from .success import handle_mode_success_dialogs
+
+        handle_mode_success_dialogs(self, job.mode, payload, self, toast_cls, QMessageBox)
+    toast_cls(tm.get("msg_job_completed", job.description), toast_type="success", duration=4000).show_toast(self)
+
+
+def _on_background_job_failed(self, msg) -> None:
+    job = _job_for_sender(self)
+    if job is None:
+        return
+    _release_job_worker(self, job, JOB_STATE_FAILED, msg)
+    self._job_toast_cls()(tm.get("error"), toast_type="error", duration=5000).show_toast(self)
+    QMessageBox.critical(self, tm.get("error"), tm.get("msg_job_failed", job.description, msg))
+
+
+def _on_background_job_cancelled(self, msg) -> None:
+    job = _job_for_sender(self)
+    if job is None:
+        return
+    from .lifecycle import _remove_cancelled_outputs
+
+    _remove_cancelled_outputs(job.worker, job.output_path, job.output_existed)
+    _release_job_worker(self, job, JOB_STATE_CANCELLED, msg)
+    self._job_toast_cls()(tm.get("msg_job_cancelled", job.description), toast_type="warning", duration=3000).show_toast(self)
+
+
+def _cancel_background_job(self, job_id: int) -> None:
+    for job in getattr(self, "_background_jobs", None) or []:
+        if job.job_id == job_id and job.state == JOB_STATE_RUNNING and job.worker is not None:
+            job.state = JOB_STATE_CANCELLING
+            cancel = getattr(job.worker, "cancel", None)
+            if callable(cancel):
+                cancel()
+            self._notify_jobs_changed()
+            return
+
+
+def _remove_pending_job(self, index: int) -> None:
+    pending = getattr(self, "_pending_workers", None) or []
+    if 0 <= index < len(pending):
+        pending.pop(index)
+        self._notify_jobs_changed()
+
+
+def _set_pending_job_priority(self, index: int, priority: int) -> None:
+    pending = getattr(self, "_pending_workers", None) or []
+    if 0 <= index < len(pending):
+        pending[index]["priority"] = int(priority)
+        self._notify_jobs_changed()
+        self._run_pending_worker()
+
+
+def _clear_finished_jobs(self) -> None:
+    jobs = background_jobs(self)
+    jobs[:] = [job for job in jobs if job.active]
+    self._notify_jobs_changed()
+
+
+def _notify_jobs_changed(self) -> None:
+    """상태 바 작업 버튼과 (열려 있으면) 작업 패널을 갱신한다."""
+    active = sum(1 for job in getattr(self, "_background_jobs", None) or [] if job.active)
+    waiting = len(getattr(self, "_pending_workers", None) or [])
+    button = getattr(self, "btn_jobs", None)
+    if button is not None:
+        button.setText(tm.get("btn_jobs_count", active, waiting))
+        button.setVisible(bool(active or waiting or getattr(self, "_background_jobs", None)))
+    panel = getattr(self, "_jobs_panel", None)
+    if panel is not None and panel.isVisible():
+        panel.refresh()
+
+
+def _show_jobs_panel(self) -> None:
+    panel = getattr(self, "_jobs_panel", None)
+    if panel is None:
+        from .jobs_panel import JobsPanelDialog
+
+        panel = JobsPanelDialog(self)
+        self._jobs_panel = panel
+    panel.refresh()
+    panel.show()
+    panel.raise_()
+    panel.activateWindow()
+
+
+def _job_worker_cls(self) -> Any:
+    from ...core.worker import WorkerThread
+
+    return WorkerThread
+
+
+def _job_toast_cls(self) -> Any:
+    from ..widgets import ToastWidget
+
+    return ToastWidget
+
+
+def shutdown_background_jobs(host: Any, shutdown_worker) -> bool:
+    """앱 종료 시 실행 중 백그라운드 작업을 하나씩 정리. 사용자가 종료를 취소하면 False."""
+    for job in list(getattr(host, "_background_jobs", None) or []):
+        if job.active and job.worker is not None and not shutdown_worker(host, job.worker):
+            return False
+    return True
+
+
+__all__ = [
+    "BackgroundJob",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_CANCELLING",
+    "JOB_STATE_DONE",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_RUNNING",
+    "background_jobs",
+    "max_running_jobs",
+    "running_footprints",
+    "shutdown_background_jobs",
+]
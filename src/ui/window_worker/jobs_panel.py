@@ -0,0 +1,208 @@
+"""작업 패널 — 전경·백그라운드·대기 작업의 진행률, 취소, 대기 작업 우선순위."""
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QHBoxLayout,
+    QProgressBar,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from ...core.i18n import tm
+from ...core.worker_runtime.scheduling import JOB_PRIORITY_HIGH, JOB_PRIORITY_LOW, JOB_PRIORITY_NORMAL
+from .helpers import _get_operation_description
+
+_ROW_FOREGROUND = "foreground"
+_ROW_BACKGROUND = "background"
+_ROW_PENDING = "pending"
+_REFRESH_INTERVAL_MS = 500
+_PRIORITY_KEYS = {
+    JOB_PRIORITY_HIGH: "job_priority_high",
+    JOB_PRIORITY_NORMAL: "job_priority_normal",
+    JOB_PRIORITY_LOW: "job_priority_low",
+}
+
+
+def _target_name(kwargs: Any, output_path: Any = None) -> str:
+    kwargs = kwargs if isinstance(kwargs, dict) else {}
+    for value in (output_path, kwargs.get("output_path"), kwargs.get("output_dir"), kwargs.get("file_path")):
+        if isinstance(value, str) and value:
+            return os.path.basename(value.rstrip("/\\")) or value
+    return ""
+
+
+def job_rows(host: Any) -> list[dict[str, Any]]:
+    """표에 그릴 행 (전경 → 백그라운드 → 대기 순)."""
+    rows: list[dict[str, Any]] = []
+    worker = getattr(host, "worker", None)
+    if worker is not None and worker.isRunning():
+        mode = str(getattr(worker, "mode", "") or "")
+        progress_bar = getattr(host, "progress_bar", None)
+        rows.append(
+            {
+                "kind": _ROW_FOREGROUND,
+                "key": None,
+                "title": _get_operation_description(mode),
+                "target": _target_name(getattr(worker, "kwargs", None)),
+                "state": tm.get("job_state_foreground"),
+                "progress": int(progress_bar.value()) if progress_bar is not None else 0,
+                "priority": None,
+            }
+        )
+    for job in reversed(getattr(host, "_background_jobs", None) or []):
+        rows.append(
+            {
+                "kind": _ROW_BACKGROUND,
+                "key": job.job_id,
+                "title": job.description,
+                "target": _target_name(None, job.output_path),
+                "state": tm.get(f"job_state_{job.state}"),
+                "progress": job.progress,
+                "priority": None,
+                "active": job.active,
+                "message": job.message,
+            }
+        )
+    for index, entry in enumerate(getattr(host, "_pending_workers", None) or []):
+        rows.append(
+            {
+                "kind": _ROW_PENDING,
+                "key": index,
+                "title": _get_operation_description(str(entry.get("mode") or "")),
+                "target": _target_name(entry.get("kwargs"), entry.get("output_path")),
+                "state": tm.get("job_state_pending"),
+                "progress": None,
+                "priority": int(entry.get("priority") or 0),
+            }
+        )
+    return rows
+
+
+class JobsPanelDialog(QDialog):
+    """비모달 작업 패널. 호스트(메인 창)의 _notify_jobs_changed 가 refresh 를 부른다."""
+
+    def __init__(self, host: Any):
+        super().__init__(host)
+        self._host = host
+        self._rows: list[dict[str, Any]] = []
+        self.setWindowTitle(tm.get("jobs_panel_title"))
+        self.setModal(False)
+        self.resize(620, 320)
+
+        layout = QVBoxLayout(self)
+        self.table = QTableWidget(0, 5)
+        self.table.setHorizontalHeaderLabels(
+            [
+                tm.get("jobs_col_task"),
+                tm.get("jobs_col_target"),
+                tm.get("jobs_col_state"),
+                tm.get("jobs_col_progress"),
+                tm.get("jobs_col_priority"),
+            ]
+        )
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.itemSelectionChanged.connect(self._update_buttons)
+        layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        self.btn_priority_up = QPushButton(tm.get("btn_job_priority_up"))
+        self.btn_priority_up.clicked.connect(lambda: self._shift_priority(+1))
+        self.btn_priority_down = QPushButton(tm.get("btn_job_priority_down"))
+        self.btn_priority_down.clicked.connect(lambda: self._shift_priority(-1))
+        self.btn_cancel_job = QPushButton(tm.get("btn_job_cancel"))
+        self.btn_cancel_job.clicked.connect(self._cancel_selected)
+        self.btn_clear_finished = QPushButton(tm.get("btn_jobs_clear_finished"))
+        self.btn_clear_finished.clicked.connect(self._host._clear_finished_jobs)
+        for button in (self.btn_priority_up, self.btn_priority_down, self.btn_cancel_job):
+            buttons.addWidget(button)
+        buttons.addStretch()
+        buttons.addWidget(self.btn_clear_finished)
+        layout.addLayout(buttons)
+        # 진행률은 신호마다가 아니라 보이는 동안만 주기적으로 다시 그린다
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(_REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._update_buttons()
+
+    def refresh(self) -> None:
+        selected = self._selected_row()
+        selected_id = (selected["kind"], selected["key"]) if selected else None
+        self._rows = job_rows(self._host)
+        self.table.clearSelection()
+        self.table.setRowCount(len(self._rows))
+        for row_index, row in enumerate(self._rows):
+            self.table.setItem(row_index, 0, QTableWidgetItem(row["title"]))
+            self.table.setItem(row_index, 1, QTableWidgetItem(row["target"]))
+            state_item = QTableWidgetItem(row["state"])
+            if row.get("message"):
+                state_item.setToolTip(str(row["message"]))
+            self.table.setItem(row_index, 2, state_item)
+            if row["progress"] is None:
+                self.table.removeCellWidget(row_index, 3)
+                self.table.setItem(row_index, 3, QTableWidgetItem(""))
+            else:
+                bar = self.table.cellWidget(row_index, 3)
+                if not isinstance(bar, QProgressBar):
+                    bar = QProgressBar()
+                    bar.setTextVisible(True)
+                    self.table.setCellWidget(row_index, 3, bar)
+                bar.setValue(int(row["progress"]))
+            priority = row["priority"]
+            priority_text = "" if priority is None else tm.get(_PRIORITY_KEYS.get(max(-1, min(1, priority)), "job_priority_normal"))
+            self.table.setItem(row_index, 4, QTableWidgetItem(priority_text))
+            if selected_id == (row["kind"], row["key"]):
+                self.table.selectRow(row_index)
+        self._update_buttons()
+
+    def _selected_row(self) -> dict[str, Any] | None:
+        indexes = self.table.selectionModel().selectedRows() if self.table.selectionModel() else []
+        if not indexes:
+            return None
+        row_index = indexes[0].row()
+        return self._rows[row_index] if 0 <= row_index < len(self._rows) else None
+
+    def _update_buttons(self) -> None:
+        row = self._selected_row()
+        pending = bool(row and row["kind"] == _ROW_PENDING)
+        self.btn_priority_up.setEnabled(pending and row["priority"] < JOB_PRIORITY_HIGH)
+        self.btn_priority_down.setEnabled(pending and row["priority"] > JOB_PRIORITY_LOW)
+        cancellable = bool(row and (pending or (row["kind"] == _ROW_BACKGROUND and row.get("active"))))
+        self.btn_cancel_job.setEnabled(cancellable)
+
+    def _shift_priority(self, step: int) -> None:
+        row = self._selected_row()
+        if row and row["kind"] == _ROW_PENDING:
+            priority = max(JOB_PRIORITY_LOW, min(JOB_PRIORITY_HIGH, int(row["priority"]) + step))
+            self._host._set_pending_job_priority(row["key"], priority)
+
+    def _cancel_selected(self) -> None:
+        row = self._selected_row()
+        if not row:
+            return
+        if row["kind"] == _ROW_PENDING:
+            self._host._remove_pending_job(row["key"])
+        elif row["kind"] == _ROW_BACKGROUND:
+            self._host._cancel_background_job(row["key"])
+
+    def showEvent(self, a0):
+        super().showEvent(a0)
+        self._refresh_timer.start()
+
+    def hideEvent(self, a0):
+        self._refresh_timer.stop()
+        super().hideEvent(a0)
+
+
+__all__ = ["JobsPanelDialog", "job_rows"]
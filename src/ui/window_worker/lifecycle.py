@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import QMessageBox
 
 from ...core.i18n import tm
 from ...core.worker_runtime import get_operation_spec
+from ...core.worker_runtime.scheduling import JOB_PRIORITY_NORMAL, pick_runnable_jobs
 from ..widgets import ToastWidget
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,45 @@ def _collect_worker_input_paths(worker) -> set[str]:
 
     return input_paths
 
+def _remove_cancelled_outputs(worker, output_path, output_existed: bool) -> None:
+    """취소된 작업이 이번 실행에서 만든 출력만 지운다 (기존 파일·입력 경로는 유지)."""
+    spec = get_operation_spec(getattr(worker, "mode", "")) if worker else None
+    cleanup_policy = spec.cancel_cleanup if spec is not None else "created_outputs"
+    created_paths = getattr(worker, "kwargs", {}).get("created_output_paths", []) if worker else []
+    if not isinstance(created_paths, list):
+        created_paths = []
+    created_paths_abs = {os.path.abspath(str(path)) for path in created_paths if isinstance(path, str) and path}
+    input_paths_abs = _collect_worker_input_paths(worker)
+
+    if cleanup_policy == "none" or not output_path:
+        return
+    if os.path.isdir(output_path) and cleanup_policy == "created_outputs":
+        output_dir_abs = os.path.abspath(output_path)
+        for created_path_abs in created_paths_abs:
+            try:
+                if not os.path.isfile(created_path_abs):
+                    continue
+                if os.path.commonpath([output_dir_abs, created_path_abs]) != output_dir_abs:
+                    continue
+                os.remove(created_path_abs)
+                logger.info("Removed cancelled output file: %s", created_path_abs)
+            except Exception as e:
+                logger.debug(f"Could not remove cancelled output: {e}")
+    elif os.path.isfile(output_path):
+        output_path_abs = os.path.abspath(output_path)
+        should_remove = False
+        if output_path_abs in input_paths_abs or output_existed:
+            logger.info("Keeping cancelled output path because it pre-existed or is an input: %s", output_path_abs)
+        else:
+            # created_output_paths에 기록된 파일만 삭제 (mtime 휴리스틱 제거)
+            should_remove = output_path_abs in created_paths_abs
+        try:
+            if should_remove and os.path.isfile(output_path_abs):
+                os.remove(output_path_abs)
+                logger.info(f"Removed incomplete output file: {output_path_abs}")
+        except Exception as e:
+            logger.debug(f"Could not remove cancelled output: {e}")
+
 def _on_progress_update(self, value: int):
     """진행률 업데이트 (오버레이 + 상태바)"""
     sender = self.sender()
@@ -96,43 +136,12 @@ def _cleanup_cancelled_worker(self):
             pending.clear()
             logger.info("Cleared pending worker queue on cancel")
     worker = getattr(self, "worker", None)
-    spec = get_operation_spec(getattr(worker, "mode", "")) if worker else None
-    cleanup_policy = spec.cancel_cleanup if spec is not None else "created_outputs"
-    created_paths = getattr(worker, "kwargs", {}).get("created_output_paths", []) if worker else []
-    if not isinstance(created_paths, list):
-        created_paths = []
-    created_paths_abs = {os.path.abspath(str(path)) for path in created_paths if isinstance(path, str) and path}
-    input_paths_abs = _collect_worker_input_paths(worker)
-
     # v4.4: 취소된 작업의 미완성 출력 파일 정리
-    if cleanup_policy != "none" and hasattr(self, '_last_output_path') and self._last_output_path:
-        output_path = self._last_output_path
-        if os.path.isdir(output_path) and cleanup_policy == "created_outputs":
-            output_dir_abs = os.path.abspath(output_path)
-            for created_path_abs in created_paths_abs:
-                try:
-                    if not os.path.isfile(created_path_abs):
-                        continue
-                    if os.path.commonpath([output_dir_abs, created_path_abs]) != output_dir_abs:
-                        continue
-                    os.remove(created_path_abs)
-                    logger.info("Removed cancelled output file: %s", created_path_abs)
-                except Exception as e:
-                    logger.debug(f"Could not remove cancelled output: {e}")
-        elif os.path.isfile(output_path):
-            output_path_abs = os.path.abspath(output_path)
-            should_remove = False
-            if output_path_abs in input_paths_abs or getattr(self, "_last_output_existed", False):
-                logger.info("Keeping cancelled output path because it pre-existed or is an input: %s", output_path_abs)
-            else:
-                # created_output_paths에 기록된 파일만 삭제 (mtime 휴리스틱 제거)
-                should_remove = output_path_abs in created_paths_abs
-            try:
-                if should_remove and os.path.isfile(output_path_abs):
-                    os.remove(output_path_abs)
-                    logger.info(f"Removed incomplete output file: {output_path_abs}")
-            except Exception as e:
-                logger.debug(f"Could not remove cancelled output: {e}")
+    _remove_cancelled_outputs(
+        worker,
+        getattr(self, "_last_output_path", None),
+        bool(getattr(self, "_last_output_existed", False)),
+    )
 
     # AI 평문 temp 등 orphan 스윕 (취소 직후 잔존 완화)
     try:
@@ -203,8 +212,8 @@ def _finalize_worker(self):
 # 대기 큐 상한 — 과도한 연속 요청으로 메모리/UX 폭주 방지
 _MAX_PENDING_WORKERS = 8
 
-def _enqueue_pending_worker(self, mode, output_path=None, kwargs=None) -> bool:
-    """대기 작업 FIFO 큐에 추가. 상한 초과 시 False."""
+def _enqueue_pending_worker(self, mode, output_path=None, kwargs=None, priority=JOB_PRIORITY_NORMAL) -> bool:
+    """대기 큐(제출 순)에 추가. 상한 초과 시 False. 실행 순서는 _run_pending_worker 가 정한다."""
     from .helpers import copy_kwargs_for_pending
 
     pending_workers = getattr(self, "_pending_workers", None)
@@ -221,24 +230,43 @@ def _enqueue_pending_worker(self, mode, output_path=None, kwargs=None) -> bool:
             "output_path": output_path,
             # api_key/passwords 는 큐에 저장하지 않음 — 실행 직전 재주입
             "kwargs": copy_kwargs_for_pending(kwargs),
+            "priority": int(priority),
         }
     )
+    notify = getattr(self, "_notify_jobs_changed", None)
+    if callable(notify):
+        notify()
     return True
 
 def _run_pending_worker(self):
-    """대기 중인 작업이 있으면 자동 실행"""
+    """대기 작업 중 경로가 겹치지 않는 것을 상한까지 시작 (전경 전용은 run_worker, 나머지는 백그라운드)."""
+    from .jobs import max_running_jobs, running_footprints
+
     pending_workers = getattr(self, "_pending_workers", None)
     if not pending_workers:
         return
-    if self.worker and self.worker.isRunning():
-        QTimer.singleShot(200, self._run_pending_worker)
+    start_background = getattr(self, "_start_background_job", None)
+    picked = pick_runnable_jobs(
+        pending_workers,
+        running_footprints(self),
+        max_running=max_running_jobs(self),
+        foreground_busy=bool(self.worker and self.worker.isRunning()),
+        allow_background=callable(start_background),
+    )
+    if not picked:
         return
-    pending = pending_workers.pop(0)
-    QTimer.singleShot(0, lambda: self.run_worker(
-        pending["mode"],
-        pending.get("output_path"),
-        **pending.get("kwargs", {}),
-    ))
+    entries = [(pending_workers[index], foreground) for index, foreground in picked]
+    for index, _foreground in sorted(picked, reverse=True):
+        pending_workers.pop(index)
+    for pending, foreground in entries:
+        if foreground:
+            QTimer.singleShot(0, lambda pending=pending: self.run_worker(
+                pending["mode"],
+                pending.get("output_path"),
+                **pending.get("kwargs", {}),
+            ))
+        elif callable(start_background):
+            start_background(pending["mode"], pending.get("output_path"), pending.get("kwargs", {}))
 
 def _reset_progress_if_idle(self):
     """작업이 없을 때만 진행률 초기화"""
@@ -1,5 +1,23 @@
 from __future__ import annotations
 
+from .jobs import (
+    _blocked_by_running_jobs,
+    _cancel_background_job,
+    _clear_finished_jobs,
+    _detach_worker_to_background,
+    _job_toast_cls,
+    _job_worker_cls,
+    _notify_jobs_changed,
+    _on_background_job_cancelled,
+    _on_background_job_failed,
+    _on_background_job_finished,
+    _on_background_job_progress,
+    _remove_pending_job,
+    _set_pending_job_priority,
+    _show_jobs_panel,
+    _start_background_job,
+    _try_start_background_job,
+)
 from .lifecycle import (
     _cleanup_cancelled_worker,
     _enqueue_pending_worker,
@@ -35,3 +53,20 @@ class MainWindowWorkerMixin(MainWindowHost):
     _restore_preview_after_same_path_output = _restore_preview_after_same_path_output
     _discard_pending_undo = _discard_pending_undo
     _augment_worker_passwords_from_preview = _augment_worker_passwords_from_preview
+    # 동시 작업 (백그라운드 작업·작업 패널)
+    _blocked_by_running_jobs = _blocked_by_running_jobs
+    _start_background_job = _start_background_job
+    _try_start_background_job = _try_start_background_job
+    _detach_worker_to_background = _detach_worker_to_background
+    _on_background_job_progress = _on_background_job_progress
+    _on_background_job_finished = _on_background_job_finished
+    _on_background_job_failed = _on_background_job_failed
+    _on_background_job_cancelled = _on_background_job_cancelled
+    _cancel_background_job = _cancel_background_job
+    _remove_pending_job = _remove_pending_job
+    _set_pending_job_priority = _set_pending_job_priority
+    _clear_finished_jobs = _clear_finished_jobs
+    _notify_jobs_changed = _notify_jobs_changed
+    _show_jobs_panel = _show_jobs_panel
+    _job_worker_cls = _job_worker_cls
+    _job_toast_cls = _job_toast_cls
@@ -4,6 +4,7 @@ import logging
 
 from ...core.i18n import tm
 from ...core.worker_runtime import get_operation_spec
+from ...core.worker_runtime.save_profiles import SAVE_PROFILES
 from ..tabs_ai.meta import format_ai_meta, is_warning_ai_meta
 
 logger = logging.getLogger(__name__)
@@ -36,7 +37,16 @@ def _coerce_payload_defaults(mode: str, payload: dict) -> dict:
         return payload
 
     normalized = dict(payload)
-    list_keys = {"key_points", "keywords", "fields", "attachments", "annotations", "results"}
+    list_keys = {
+        "key_points",
+        "keywords",
+        "fields",
+        "attachments",
+        "annotations",
+        "results",
+        "inserted_pages",
+        "deleted_pages",
+    }
     dict_keys = {"meta"}
     missing_keys: list[str] = []
     for key in spec.result_payload_keys:
@@ -100,6 +110,23 @@ def _format_compare_summary(payload: dict) -> str:
             lines.append(tm.get("compare_summary_more", len(results) - max_rows))
     return "\n".join(lines)
 
+def _format_compress_estimate(payload: dict) -> str:
+    original_size = int(payload.get("original_size") or 0)
+    estimates = payload.get("estimates") or {}
+    selected = str(payload.get("save_profile", "") or "")
+    lines = [
+        tm.get(
+            "msg_compress_estimate_line",
+            tm.get(f"save_profile_{name}"),
+            int(estimates[name]) / 1024,
+            round(100 * int(estimates[name]) / original_size) if original_size else 100,
+        )
+        + (" ◀" if name == selected else "")
+        for name in SAVE_PROFILES
+        if name in estimates
+    ]
+    return tm.get("msg_compress_estimate_body", original_size / 1024, "\n".join(lines))
+
 def escape_chat_html(text: str) -> str:
     """채팅 HTML 표시용 이스케이프 (partial/최종/히스토리 공용)."""
     import html as _html
@@ -10,6 +10,7 @@ def _prepare_preview_for_same_path_output(self, mode, kwargs):
     if not _is_same_path_pdf_mutation(mode, kwargs):
         return
 
+    _release_thumbnail_handles_for(self, kwargs.get("file_path"))
     preview_path = _normalize_abs_path(getattr(self, "_current_preview_path", ""))
     input_path = _normalize_abs_path(kwargs.get("file_path"))
     preview_doc = getattr(self, "_current_preview_doc", None)
@@ -24,6 +25,19 @@ def _prepare_preview_for_same_path_output(self, mode, kwargs):
     }
     self._close_preview_document()
 
+
+def _release_thumbnail_handles_for(self, path):
+    """같은 경로를 보여 주는 썸네일 그리드의 렌더 서비스 문서 핸들을 놓는다 (Windows 덮어쓰기 잠금)."""
+    target = _normalize_abs_path(path)
+    if not target or not hasattr(self, "findChildren"):
+        return
+    from ..thumbnail.grid import ThumbnailGridWidget
+
+    for grid in self.findChildren(ThumbnailGridWidget):
+        if _normalize_abs_path(getattr(grid, "_pdf_path", "")) == target:
+            grid.release_document_handles()
+
+
 def _restore_preview_after_same_path_output(self):
     restore = getattr(self, "_same_path_preview_restore", None)
     self._same_path_preview_restore = None
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Any, Callable
 
+from ...core.constants import UNDO_BACKUP_MAX_SIZE_MB
 from ...core.i18n import tm
 from ..tabs_ai.meta import normalize_ai_meta
 from .helpers import (
@@ -12,6 +14,7 @@ from .helpers import (
 )
 from .results import (
     _format_compare_summary,
+    _format_compress_estimate,
     _format_summary_payload,
     _replace_last_chat_block,
     _set_meta_label,
@@ -69,38 +72,64 @@ def apply_ai_success_state(host: Any, payload: dict[str, Any]) -> None:
 
 
 def apply_undo_registration(host: Any, toast_cls: Callable[..., Any]) -> None:
-    """성공 후 undo 스냅샷 등록 (실패 시 toast_cls 경고)."""
+    """성공 후 after 스냅샷을 큐에 넣고, 쓰기가 끝나면 undo 를 등록한다 (실패 시 toast_cls 경고)."""
     if not (hasattr(host, "_pending_undo") and host._pending_undo):
         return
     undo_info = host._pending_undo
     host._pending_undo = None
-    after_backup = host._create_backup_for_undo(undo_info["output_path"])
-
-    if after_backup:
-        before_state = {
-            "before_backup_path": undo_info["before_backup_path"],
-            "target_path": undo_info["output_path"],
-        }
-        after_state = {
-            "after_backup_path": after_backup,
-            "target_path": undo_info["output_path"],
-        }
-        host.undo_manager.push(
-            action_type=undo_info["action_type"],
-            description=undo_info["description"],
-            before_state=before_state,
-            after_state=after_state,
-            undo_callback=host._restore_from_backup,
-            redo_callback=host._redo_from_output,
+    # before 스냅샷은 작업 본문 전에 끝났다 — 쓰기에 실패했으면 매니페스트가 없다
+    after_backup = ""
+    if os.path.exists(undo_info["before_backup_path"]):
+        after_backup = host._queue_backup_for_undo(
+            undo_info["output_path"],
+            on_done=lambda written: _finish_undo_registration(host, undo_info, written, toast_cls),
         )
-        logger.info("Registered undo for: %s", undo_info["action_type"])
-    else:
-        _delete_undo_backup_file(undo_info.get("before_backup_path", ""))
-        logger.warning(
-            "Skipping undo registration for %s: after snapshot creation failed",
-            undo_info["action_type"],
-        )
-        toast_cls(tm.get("msg_undo_unavailable"), toast_type="warning", duration=3000).show_toast(host)
+    if not after_backup:
+        _fail_undo_registration(host, undo_info, toast_cls)
+        return
+    undo_info["after_backup_path"] = after_backup
+    queued = getattr(host, "_queued_undo_registrations", None)
+    if queued is None:
+        queued = host._queued_undo_registrations = []
+    queued.append(undo_info)
+
+
+def _finish_undo_registration(host: Any, undo_info: dict[str, Any], written: Any, toast_cls: Callable[..., Any]) -> None:
+    queued = getattr(host, "_queued_undo_registrations", [])
+    if undo_info in queued:
+        queued.remove(undo_info)
+    if not written:
+        _fail_undo_registration(host, undo_info, toast_cls)
+        return
+    before_state = {
+        "before_backup_path": undo_info["before_backup_path"],
+        "target_path": undo_info["output_path"],
+    }
+    after_state = {
+        "after_backup_path": undo_info["after_backup_path"],
+        "target_path": undo_info["output_path"],
+    }
+    host.undo_manager.push(
+        action_type=undo_info["action_type"],
+        description=undo_info["description"],
+        before_state=before_state,
+        after_state=after_state,
+        undo_callback=host._restore_from_backup,
+        redo_callback=host._redo_from_output,
+    )
+    logger.info("Registered undo for: %s", undo_info["action_type"])
+    # 새 스냅샷 등록 후 청크 저장소 용량 상한 유지 (공유 청크는 참조 수 기준 회수, 스냅샷 큐에서)
+    host._queue_undo_backup_trim(max_size_mb=UNDO_BACKUP_MAX_SIZE_MB)
+
+
+def _fail_undo_registration(host: Any, undo_info: dict[str, Any], toast_cls: Callable[..., Any]) -> None:
+    _delete_undo_backup_file(undo_info.get("before_backup_path", ""))
+    _delete_undo_backup_file(undo_info.get("after_backup_path", ""))
+    logger.warning(
+        "Skipping undo registration for %s: snapshot creation failed",
+        undo_info["action_type"],
+    )
+    toast_cls(tm.get("msg_undo_unavailable"), toast_type="warning", duration=3000).show_toast(host)
 
 
 def handle_mode_success_dialogs(
@@ -148,6 +177,20 @@ def handle_mode_success_dialogs(
             )
             toast.show_toast(host)
         custom_dialog_shown = True
+    elif mode == "library_index":
+        on_indexed = getattr(host, "_on_library_index_updated", None)
+        if callable(on_indexed):
+            try:
+                custom_dialog_shown = bool(on_indexed(payload if isinstance(payload, dict) else {}))
+            except Exception:
+                logger.debug("library index success hook failed", exc_info=True)
+    elif mode == "find_duplicate_pages":
+        on_found = getattr(host, "_on_duplicate_pages_found", None)
+        if callable(on_found):
+            try:
+                custom_dialog_shown = bool(on_found(payload if isinstance(payload, dict) else {}))
+            except Exception:
+                logger.debug("duplicate pages success hook failed", exc_info=True)
     elif mode == "list_attachments":
         attachments = payload.get("attachments", []) or []
         if not attachments:
@@ -163,6 +206,13 @@ def handle_mode_success_dialogs(
                 tm.get("msg_attachment_list_body", len(attachments), "\n".join(rows)),
             )
         custom_dialog_shown = True
+    elif mode == "estimate_compression":
+        message_box_cls.information(
+            parent,
+            tm.get("mode_estimate_compression"),
+            _format_compress_estimate(payload),
+        )
+        custom_dialog_shown = True
     elif mode == "compare_pdfs":
         try:
             from .compare_report import show_compare_report_dialog
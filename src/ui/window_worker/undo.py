@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ...core.path_utils import normalize_path_key
+from ..window_undo.snapshots import _run_after_undo_snapshots
 from .helpers import _collect_payload_input_paths, _delete_undo_backup_file
 
 
@@ -9,8 +10,9 @@ def _discard_pending_undo(self, delete_backups: bool = False):
     self._pending_undo = None
     if not undo_info or not delete_backups:
         return
-    _delete_undo_backup_file(undo_info.get("before_backup_path", ""))
-    _delete_undo_backup_file(undo_info.get("after_backup_path", ""))
+    # 큐에서 아직 쓰는 중일 수 있다 — 스냅샷 작업 뒤에 지운다
+    for key in ("before_backup_path", "after_backup_path"):
+        _run_after_undo_snapshots(self, _delete_undo_backup_file, undo_info.get(key, ""))
 
 def _augment_worker_passwords_from_preview(self, kwargs: dict) -> None:
     preview_password = getattr(self, "_current_preview_password", None)
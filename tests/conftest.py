@@ -1,4 +1,6 @@
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 
@@ -11,3 +13,6 @@ if str(ROOT) not in sys.path:
 if str(TESTS_ROOT) not in sys.path:
     sys.path.insert(0, str(TESTS_ROOT))
 
+
+# 디스크 캐시(썸네일 등)가 사용자 앱 데이터 디렉터리를 건드리지 않도록 격리
+os.environ.setdefault("PDF_MASTER_DATA_DIR", tempfile.mkdtemp(prefix="pdf_master_test_data_"))
@@ -253,3 +253,47 @@ def test_action_add_annotation_basic_freetext_mode_payload(monkeypatch, tmp_path
     assert mode == "add_annotation"
     assert kwargs["annot_type"] == "freetext"
     assert kwargs["rect"] == [10.0, 20.0, 210.0, 120.0]
+
+
+def test_action_dedupe_pages_runs_dry_run_in_worker_then_confirms(monkeypatch, tmp_path):
+    require_pyqt6()
+    import src.ui.tabs_advanced.actions_edit as edit_module
+    from src.ui.main_window_tabs_advanced import MainWindowTabsAdvancedMixin
+
+    src = tmp_path / "pages.pdf"
+    out = tmp_path / "deduped.pdf"
+    src.write_bytes(b"%PDF-1.7\n")
+
+    class Dummy(MainWindowTabsAdvancedMixin):
+        def __init__(self):
+            self.sel_cleanup = _PathStub(str(src))
+            self.spn_dedupe_threshold = _ValueStub(9)
+            self.calls = []
+
+        def run_worker(self, mode, **kwargs):
+            self.calls.append((mode, kwargs))
+
+        def _choose_save_file(self, title, default_name, file_filter):
+            return str(out), file_filter
+
+    dummy = Dummy()
+    dummy.action_dedupe_pages()
+    # 클러스터 계산은 GUI 스레드가 아니라 작업자 dry-run 모드에서
+    assert dummy.calls == [("find_duplicate_pages", {"file_path": str(src), "dedupe_threshold": 9})]
+
+    confirmed = []
+    monkeypatch.setattr(edit_module, "_cleanup_confirm", lambda _self, message, details="": confirmed.append(details) or True)
+    monkeypatch.setattr(edit_module.QTimer, "singleShot", lambda _ms, fn: fn())
+    payload = {
+        "file_path": str(src),
+        "dedupe_threshold": 9,
+        "duplicate_clusters": [{"keep": 1, "duplicates": [2, 3]}],
+        "removed": 2,
+        "total": 5,
+    }
+    assert dummy._on_duplicate_pages_found(payload) is True
+    assert "2, 3" in confirmed[0]
+    assert dummy.calls[-1] == (
+        "dedupe_pages",
+        {"file_path": str(src), "output_path": str(out), "dedupe_threshold": 9},
+    )
@@ -0,0 +1,111 @@
+"""디스크 AI 응답 캐시 회귀 (내용 해시 키, TTL·크기 정리, 재시작 후 재사용, 대화형 질문 제외)."""
+
+from __future__ import annotations
+
+import os
+import shutil
+
+import pytest
+
+from src.core.ai.response_cache import AIResponseStore, document_content_hash
+
+
+def test_content_hash_follows_content_not_path(tmp_path):
+    first = tmp_path / "contract.pdf"
+    first.write_bytes(b"%PDF-1.7\nsame body\n")
+    copy = tmp_path / "copy of contract.pdf"
+    shutil.copyfile(first, copy)
+    temp_plain = tmp_path / "pdf_master_ai_123.pdf"
+    shutil.copyfile(first, temp_plain)
+
+    assert document_content_hash(str(first)) == document_content_hash(str(copy))
+    assert document_content_hash(str(temp_plain)) is None
+    first.write_bytes(b"%PDF-1.7\nchanged body\n")
+    assert document_content_hash(str(first)) != document_content_hash(str(copy))
+
+
+def test_store_expires_by_ttl_and_evicts_least_recent(tmp_path, monkeypatch):
+    from src.core.ai import response_cache
+
+    clock = {"now": 1_000.0}
+    monkeypatch.setattr(response_cache.time, "time", lambda: clock["now"])
+    with AIResponseStore(str(tmp_path / "r.sqlite3"), ttl_seconds=60, max_bytes=7_000) as store:
+        store.put("a", {"summary": "A"})
+        assert store.get("a") == ({"summary": "A"}, 1_000.0)
+        clock["now"] += 61
+        assert store.get("a") is None
+
+        # 압축이 안 되는 큰 값으로 크기 상한을 넘긴다 — 가장 오래 안 쓴 항목부터 지운다
+        blobs = {key: os.urandom(2000).hex() for key in ("b", "c", "d")}
+        for key, blob in blobs.items():
+            store.put(key, {"blob": blob})
+            clock["now"] += 1
+        store.get("b")
+        store.put("e", {"blob": blobs["b"]})
+        assert store.get("b") is not None
+        assert store.get("c") is None
+
+
+@pytest.fixture
+def service_with_store(tmp_path, monkeypatch):
+    from src.core.ai_service import AIService
+
+    db_path = str(tmp_path / "responses.sqlite3")
+    monkeypatch.setattr(AIService, "_response_store", AIResponseStore(db_path))
+    monkeypatch.setattr(AIService, "is_available", property(lambda _self: True))
+    calls: list[str] = []
+
+    def fake_generate(self, *, prompt, pdf_path, schema, **_kwargs):
+        calls.append(prompt)
+        if "keywords" in schema.get("properties", {}):
+            return {"keywords": ["alpha", "beta"]}
+        if "answer" in schema.get("properties", {}):
+            return {"answer": f"answer {len(calls)}"}
+        return {"title": "T", "summary": "S", "key_points": ["k"]}
+
+    monkeypatch.setattr(AIService, "_generate_structured_payload", fake_generate)
+    monkeypatch.setattr(AIService, "_build_generate_config", lambda _self, _schema: None)
+    monkeypatch.setattr(AIService, "_get_or_create_chat", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("file upload unsupported")))
+    pdf = tmp_path / "contract.pdf"
+    pdf.write_bytes(b"%PDF-1.7\ncontract\n")
+    yield AIService, str(pdf), db_path, calls
+    AIService._response_store.close()
+
+
+def test_summarize_and_keywords_are_reused_after_restart(service_with_store, monkeypatch):
+    AIService, pdf, db_path, calls = service_with_store
+
+    first = AIService(api_key="").summarize_pdf(pdf, language="en")
+    assert first["meta"]["cache_hit"] is False
+    # 재시작: 같은 파일의 새 저장소 인스턴스
+    AIService._response_store.close()
+    monkeypatch.setattr(AIService, "_response_store", AIResponseStore(db_path))
+    second = AIService(api_key="").summarize_pdf(pdf, language="en")
+    assert len(calls) == 1
+    assert second["summary"] == "S"
+    assert second["meta"]["cache_hit"] is True and second["meta"]["cached_at"]
+
+    # 옵션·모델이 다르면 다른 키, 캐시를 끄면 항상 호출
+    AIService(api_key="").summarize_pdf(pdf, language="ko")
+    AIService(api_key="", model="other-model").summarize_pdf(pdf, language="en")
+    AIService(api_key="", response_cache=False).summarize_pdf(pdf, language="en")
+    assert len(calls) == 4
+
+    AIService(api_key="").extract_keywords(pdf, max_keywords=5)
+    keywords = AIService(api_key="").extract_keywords(pdf, max_keywords=5)
+    assert keywords["keywords"] == ["alpha", "beta"] and keywords["meta"]["cache_hit"] is True
+    assert len(calls) == 5
+
+
+def test_only_standalone_questions_are_cached(service_with_store):
+    AIService, pdf, _db_path, calls = service_with_store
+    service = AIService(api_key="")
+
+    assert service.ask_about_pdf(pdf, "What is the term?")["answer"] == "answer 1"
+    hit = service.ask_about_pdf(pdf, " What is the term? ")
+    assert hit["answer"] == "answer 1" and hit["meta"]["cache_hit"] is True
+
+    history = [{"role": "user", "content": "earlier"}]
+    service.ask_about_pdf(pdf, "What is the term?", conversation_history=history)
+    service.ask_about_pdf(pdf, "What is the term?", conversation_history=history)
+    assert len(calls) == 3
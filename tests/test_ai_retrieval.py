@@ -0,0 +1,131 @@
+"""로컬 Q&A 검색 계층 회귀 (토큰화, 청크, BM25 선택, 긴 문서 질문 본문, 색인 캐시)."""
+
+from __future__ import annotations
+
+from src.core.ai.retrieval import BM25Index, TextChunk, chunk_pages, tokenize
+
+
+def test_tokenize_uses_bigrams_for_hangul_and_words_for_latin():
+    assert tokenize("PDF파일 보증기간은") == ["pdf", "파일", "보증", "증기", "기간", "간은"]
+    assert tokenize("Ｗarranty, 12 months") == ["warranty", "12", "months"]
+
+
+def test_chunk_pages_stays_within_page_and_target():
+    pages = [(0, "alpha\n\nbeta\n" + "x" * 50), (3, "gamma")]
+    chunks = chunk_pages(pages, target_chars=20)
+    assert chunks[0] == TextChunk(0, "alpha\nbeta")
+    assert all(len(chunk.text) <= 20 for chunk in chunks)
+    assert chunks[-1] == TextChunk(3, "gamma")
+
+
+def test_bm25_select_ranks_relevant_chunks_and_keeps_document_order():
+    chunks = [TextChunk(i, f"filler section {i} about shipping and invoices") for i in range(40)]
+    chunks[31] = TextChunk(31, "The warranty period is 24 months from delivery.")
+    chunks[7] = TextChunk(7, "Warranty claims must include the serial number.")
+    index = BM25Index(chunks)
+    top = index.search("How long is the warranty period?", 2)
+    assert top[0][1] == 31 and top[1][1] == 7
+    picked = index.select("warranty period", top_k=2, max_chars=10_000)
+    assert [chunk.page_index for chunk in picked] == [7, 31]
+    assert index.select("warranty period", top_k=2, max_chars=70) == [chunks[31]]
+    assert index.select("nothing matches", top_k=3, max_chars=10_000) == []
+
+
+class _FakePage:
+    def __init__(self, text):
+        self._text = text
+
+    def get_text(self):
+        return self._text
+
+
+class _FakeDoc:
+    def __init__(self, texts):
+        self._pages = [_FakePage(text) for text in texts]
+
+    def __len__(self):
+        return len(self._pages)
+
+    def __getitem__(self, idx):
+        return self._pages[idx]
+
+    def close(self):
+        return None
+
+
+def test_long_document_question_gets_relevant_pages(tmp_path, monkeypatch):
+    from src.core import ai_service as ai
+    from src.core.ai_service import AIService
+
+    pdf_path = tmp_path / "manual.pdf"
+    pdf_path.write_bytes(b"%PDF-1.7\n")
+    texts = [f"Chapter {i}. " + "routine maintenance notes " * 120 for i in range(60)]
+    texts[47] = "Warranty: the compressor warranty period is 24 months."
+    open_calls = {"count": 0}
+
+    def fake_open(_path):
+        open_calls["count"] += 1
+        return _FakeDoc(texts)
+
+    monkeypatch.setattr(ai.fitz, "open", fake_open)
+    AIService._text_cache.clear()
+    AIService._text_cache_bytes = 0
+    AIService._retrieval_cache.clear()
+
+    service = AIService(api_key="")
+    sent: list[list[object]] = []
+
+    def fake_generate_content(*, contents, schema, cancel_check=None):
+        sent.append(contents)
+        return {"answer": "24 months"}
+
+    monkeypatch.setattr(service, "_generate_content", fake_generate_content)
+    payload = service._generate_structured_payload_from_extracted_text(
+        prompt="Q",
+        pdf_path=str(pdf_path),
+        schema={"type": "object"},
+        retrieval_query="What is the compressor warranty period?",
+    )
+
+    context = str(sent[0][1])
+    assert "[Page 48]" in context and "24 months" in context
+    assert len(context) < service.MAX_TEXT_LENGTH
+    assert payload["meta"]["source"] == "retrieval"
+    assert payload["meta"]["fallback_pages_total"] == 60
+    assert payload["meta"]["retrieved_chunks"] >= 1
+
+    # 두 번째 질문은 캐시된 본문·색인을 재사용한다
+    opened = open_calls["count"]
+    service._retrieve_text_with_meta(str(pdf_path), "routine maintenance")
+    assert open_calls["count"] == opened
+    AIService._retrieval_cache.clear()
+
+
+def test_short_document_keeps_full_text(tmp_path, monkeypatch):
+    from src.core import ai_service as ai
+    from src.core.ai_service import AIService
+
+    pdf_path = tmp_path / "short.pdf"
+    pdf_path.write_bytes(b"%PDF-1.7\n")
+    monkeypatch.setattr(ai.fitz, "open", lambda _path: _FakeDoc(["hello", "world"]))
+    AIService._text_cache.clear()
+    AIService._text_cache_bytes = 0
+
+    text, meta = AIService(api_key="")._retrieve_text_with_meta(str(pdf_path), "world")
+    assert text == "[Page 1]\nhello\n\n[Page 2]\nworld"
+    assert meta["source"] == "text_fallback"
+
+
+def test_retrieval_and_library_search_share_tokenizer_and_bm25():
+    from src.core import library_index, text_search
+    from src.core.ai import retrieval
+
+    assert retrieval.tokenize is text_search.tokenize
+    assert library_index.tokenize is text_search.tokenize
+    # 확장 A 한자·반각 가나도 두 검색에서 같은 bigram
+    assert tokenize("㐀㐁 ｶﾀｶﾅ") == ["㐀㐁", "カタ", "タカ", "カナ"]
+    index = BM25Index([TextChunk(0, "alpha beta"), TextChunk(1, "gamma")])
+    [(score, chunk_id)] = index.search("alpha", 5)
+    idf = text_search.bm25_idf(2, 1)
+    assert chunk_id == 0
+    assert score == text_search.bm25_term_score(idf, 1, 2, 1.5)
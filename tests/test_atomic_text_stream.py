@@ -0,0 +1,90 @@
+"""스트리밍 원자적 텍스트 저장 회귀 (중단 시 기존 출력 유지, 임시 파일 정리, 일정 메모리)."""
+
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+
+from _deps import require_pyqt6_and_pymupdf
+from src.core.worker_runtime.io import AtomicTextWriter
+
+
+def test_atomic_text_writer_commits_or_leaves_target_untouched(tmp_path):
+    out = tmp_path / "out.txt"
+    out.write_text("OLD", encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        with AtomicTextWriter(str(out)) as writer:
+            writer.write("NEW PARTIAL")
+            raise RuntimeError("boom")
+    assert out.read_text(encoding="utf-8") == "OLD"
+    # 커밋 없이 빠져나가도(조기 return) 롤백
+    with AtomicTextWriter(str(out)) as writer:
+        writer.write("IGNORED")
+    assert out.read_text(encoding="utf-8") == "OLD"
+
+    with AtomicTextWriter(str(out)) as writer:
+        writer.write("NEW ")
+        writer.write("TEXT")
+        assert writer.commit() is False
+    assert out.read_text(encoding="utf-8") == "NEW TEXT"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.txt"]
+
+
+def _make_pdf(path, pages: int, line: str = "log line " * 8):
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for index in range(pages):
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((36, 36), "\n".join(f"{index:05d} {line}" for _ in range(40)), fontsize=8)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_extract_text_cancel_keeps_previous_output(tmp_path):
+    require_pyqt6_and_pymupdf()
+    from src.core.worker import CancelledError, WorkerThread
+
+    src = tmp_path / "src.pdf"
+    out = tmp_path / "src.txt"
+    _make_pdf(src, 6)
+    out.write_text("PREVIOUS", encoding="utf-8")
+    calls = {"count": 0}
+
+    def _cancel_at_page_four():
+        calls["count"] += 1
+        if calls["count"] >= 4:
+            raise CancelledError("cancel")
+
+    worker = WorkerThread("extract_text", file_path=str(src), output_path=str(out))
+    worker._check_cancelled = _cancel_at_page_four
+    with pytest.raises(CancelledError):
+        worker.extract_text()
+
+    assert out.read_text(encoding="utf-8") == "PREVIOUS"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["src.pdf", "src.txt"]
+
+
+def test_extract_text_streams_pages_instead_of_joining(tmp_path):
+    require_pyqt6_and_pymupdf()
+    from src.core.worker import WorkerThread
+
+    src = tmp_path / "log.pdf"
+    out = tmp_path / "log.txt"
+    _make_pdf(src, 300)
+    worker = WorkerThread("extract_text", file_path=str(src), output_path=str(out))
+
+    tracemalloc.start()
+    try:
+        worker.extract_text()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    size = out.stat().st_size
+    assert size > 500_000
+    assert "--- Page 300 ---" in out.read_text(encoding="utf-8")
+    # 전체 텍스트를 모아 join 하면 출력 크기의 약 3배가 잡힌다 (스트리밍은 쪽 수와 무관)
+    assert peak < size / 2
@@ -150,24 +150,17 @@ def test_cancel_cleanup_does_not_delete_by_mtime_alone(monkeypatch, tmp_path):
     assert out.exists()
 
 
-def test_thumbnail_ready_ignores_stale_loader_sender(tmp_path):
+def test_thumbnail_ready_ignores_stale_render_generation(tmp_path):
     require_pyqt6_and_pymupdf()
     os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
-    from PyQt6.QtGui import QPixmap
+    from PyQt6.QtGui import QImage
     from PyQt6.QtWidgets import QApplication
     from src.ui.thumbnail_grid import ThumbnailGridWidget
 
     app = QApplication.instance() or QApplication([])
     _ = app
 
-    class _LoaderStub:
-        def isRunning(self):
-            return False
-
-        def deleteLater(self):
-            return None
-
     grid = ThumbnailGridWidget()
     try:
         from src.ui.thumbnail.tile import ThumbnailLabel
@@ -175,19 +168,18 @@ def test_thumbnail_ready_ignores_stale_loader_sender(tmp_path):
         thumb = ThumbnailLabel(0)
         grid._thumbnails = [thumb]
         grid._total_pages = 1
-        active = _LoaderStub()
-        grid._loader_thread = active  # type: ignore[assignment]
+        stale_generation = grid._render_service.generation
+        grid._cancel_thumbnail_requests()
 
-        class Stale:
-            pass
-
-        stale = Stale()
-        grid.sender = lambda: stale  # type: ignore[method-assign]
-        grid._on_thumbnail_ready(0, QPixmap(10, 10))
+        image = QImage(10, 10, QImage.Format.Format_RGB32)
+        image.fill(0)
+        grid._on_thumbnail_ready(stale_generation, 0, image)
         pix = thumb.image_label.pixmap()
         assert pix is None or pix.isNull()
+
+        grid._on_thumbnail_ready(grid._render_service.generation, 0, image)
+        assert 0 in grid._loaded_indices
     finally:
-        grid._loader_thread = None  # type: ignore[assignment]
         grid.close()
 
 
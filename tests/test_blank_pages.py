@@ -0,0 +1,89 @@
+"""빈 페이지 판별 회귀 (싼 신호 우선, NumPy/순수 통계 일치, 프로세스 풀 구간 판별)."""
+
+from __future__ import annotations
+
+from _deps import require_pymupdf
+from src.core import blank_pages
+
+
+def _make_pdf(path, count=6):
+    """짝수 쪽 빈 페이지, 홀수 쪽은 텍스트·드로잉·흰 사각형 등 내용 있음."""
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for i in range(count):
+        page = doc.new_page(width=200, height=200)
+        if i % 2 == 0:
+            continue
+        kind = (i // 2) % 3
+        if kind == 0:
+            page.insert_text((20, 40), f"content {i}")
+        elif kind == 1:
+            page.draw_line((10, 10), (190, 190))
+        else:
+            # 흰 도형도 드로잉이므로 빈 페이지가 아니다 (기존 판정 유지)
+            page.draw_rect(fitz.Rect(10, 10, 50, 50), color=(1, 1, 1))
+    doc.save(str(path))
+    doc.close()
+
+
+def test_is_blank_page_cheapest_signals_and_render(tmp_path, monkeypatch):
+    require_pymupdf()
+    from src.core.optional_deps import fitz
+
+    src = tmp_path / "pages.pdf"
+    _make_pdf(src)
+    doc = fitz.open(str(src))
+    try:
+        assert [blank_pages.is_blank_page(page) for page in doc] == [True, False] * 3
+
+        # 빈 콘텐츠 스트림 + 주석 없음 → 렌더·텍스트 추출 없이 판정
+        monkeypatch.setattr(blank_pages, "page_text_len", lambda _page: 1 / 0)
+        assert blank_pages.is_blank_page(doc[0])
+
+        annotated = doc.new_page(width=200, height=200)
+        annotated.add_text_annot((50, 50), "note")
+        monkeypatch.undo()
+        assert not blank_pages.is_blank_page(annotated)
+    finally:
+        doc.close()
+
+
+def test_render_statistics_numpy_and_fallback_agree(monkeypatch):
+    white = bytes([255]) * 9000
+    speckled = bytes([255, 255, 255, 0] * 2250)
+    grey = bytes([240]) * 9000
+    expected = [True, False, False]
+    assert [blank_pages.render_is_blank(s) for s in (white, speckled, grey)] == expected
+    monkeypatch.setattr(blank_pages, "np", None)
+    assert [blank_pages.render_is_blank(s) for s in (white, speckled, grey)] == expected
+    assert blank_pages.render_is_blank(b"")
+
+
+def test_detect_blank_pages_pool_matches_serial(tmp_path, monkeypatch):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+    from src.core.optional_deps import fitz
+
+    src = tmp_path / "many.pdf"
+    _make_pdf(src, count=12)
+    monkeypatch.setattr(blank_pages, "PARALLEL_MIN_PAGES", 4)
+    monkeypatch.setattr(blank_pages, "_CHUNK_PAGES", 5)
+    monkeypatch.setattr(blank_pages, "resolve_pool_workers", lambda _count, _requested=None: 2)
+
+    doc = fitz.open(str(src))
+    try:
+        progress: list[int] = []
+        flags = blank_pages.detect_blank_pages(doc, on_progress=lambda done, _total: progress.append(done))
+        assert flags == [True, False] * 6
+        assert progress[-1] == 12
+    finally:
+        doc.close()
+
+    result = run_headless("remove_blank_pages", {"file_path": str(src), "output_path": str(tmp_path / "out.pdf")})
+    assert result.ok, result.message
+    out = fitz.open(str(tmp_path / "out.pdf"))
+    try:
+        assert len(out) == 6
+    finally:
+        out.close()
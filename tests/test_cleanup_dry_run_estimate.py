@@ -1,11 +1,13 @@
-"""blank/dedupe dry-run 카운트 헬퍼 회귀."""
+"""blank/dedupe dry-run 카운트·압축 크기 추정 헬퍼 회귀."""
 
+import os
 from pathlib import Path
 
 from _deps import require_pyqt6_and_pymupdf
 from src.core.optional_deps import fitz
 from src.core.worker_ops.cleanup.helpers import (
     estimate_blank_page_removals,
+    estimate_compression_sizes,
     estimate_dedupe_page_removals,
 )
 
@@ -35,3 +37,66 @@ def test_estimate_blank_and_dedupe(tmp_path):
         assert dedupe_removed >= 1
     finally:
         opened.close()
+
+
+def _make_scan_like_pdf(path: Path, count: int = 10) -> None:
+    doc = fitz.open()
+    for index in range(count):
+        page = doc.new_page(width=300, height=400)
+        # 노이즈가 섞인 고해상도 사진 — 다운샘플·재인코딩으로 크게 줄어든다
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 900, 1200), 0)
+        pix.clear_with(90 + index * 10)
+        noise = fitz.Pixmap(fitz.csRGB, 300, 200, os.urandom(300 * 200 * 3), 0)
+        pix.copy(noise, fitz.IRect(0, 0, 300, 200))
+        page.insert_image(page.rect, stream=pix.tobytes("jpeg", jpg_quality=95))
+        page.insert_text((20, 20), f"page {index}")
+    doc.save(str(path))
+    doc.close()
+
+
+def test_estimate_compression_sizes_tracks_real_compress(tmp_path):
+    require_pyqt6_and_pymupdf()
+    from src.core.headless_worker import run_headless
+
+    path = tmp_path / "scan.pdf"
+    _make_scan_like_pdf(path)
+    original_size = path.stat().st_size
+
+    opened = fitz.open(str(path))
+    try:
+        estimates = estimate_compression_sizes(opened)
+    finally:
+        opened.close()
+    assert set(estimates) == {"fast", "compact", "web"}
+    assert estimates["fast"] == original_size
+    assert estimates["web"] < estimates["compact"] < original_size
+
+    for profile in ("compact", "web"):
+        out = tmp_path / f"{profile}.pdf"
+        result = run_headless("compress", {"file_path": str(path), "output_path": str(out), "save_profile": profile})
+        assert result.ok, result.message
+        real = out.stat().st_size
+        assert abs(estimates[profile] - real) <= real * 0.25, (profile, estimates[profile], real)
+
+
+def test_estimate_compression_mode_runs_as_worker_dry_run(tmp_path):
+    require_pyqt6_and_pymupdf()
+    from src.core.headless_worker import run_headless
+    from src.ui.window_worker.results import _format_compress_estimate
+
+    path = tmp_path / "scan.pdf"
+    _make_scan_like_pdf(path, count=4)
+    before = sorted(tmp_path.iterdir())
+
+    result = run_headless("estimate_compression", {"file_path": str(path), "save_profile": "web"})
+    assert result.ok, result.message
+    payload = result.result_payload
+    assert payload["original_size"] == path.stat().st_size
+    assert payload["save_profile"] == "web"
+    assert set(payload["estimates"]) == {"fast", "compact", "web"}
+    # dry-run: 출력 파일을 만들지 않는다
+    assert sorted(tmp_path.iterdir()) == before
+
+    text = _format_compress_estimate(payload)
+    assert text.count("\n") >= 3
+    assert [line for line in text.splitlines() if line.endswith("◀")] != []
@@ -0,0 +1,124 @@
+from _deps import require_pymupdf, require_pyqt6_and_pymupdf
+from src.core.optional_deps import fitz
+
+
+def _make_pdf(path, texts):
+    doc = fitz.open()
+    for text in texts:
+        page = doc.new_page(width=300, height=300)
+        page.insert_text((36, 72), text)
+    doc.save(str(path))
+    doc.close()
+
+
+def _fingerprints(texts):
+    from src.core.worker_ops._pdf_helpers import page_fingerprint
+
+    class _Page:
+        def __init__(self, text):
+            self.text = text
+
+        def get_text(self):
+            return self.text
+
+    return [page_fingerprint(_Page(text), index) for index, text in enumerate(texts)]
+
+
+def test_align_pages_pairs_around_inserted_and_deleted_pages():
+    from src.core.worker_ops.compare.alignment import align_pages
+
+    left = _fingerprints(["alpha one", "beta two", "gamma three", "delta four"])
+    right = _fingerprints(["alpha one", "new cover page", "beta two", "gamma three changed", "delta four"])
+
+    pairs = align_pages(left, right)
+
+    assert (0, 0) in pairs
+    assert (None, 1) in pairs
+    assert (1, 2) in pairs
+    assert (3, 4) in pairs
+    assert [pair for pair in pairs if None in pair] == [(None, 1)]
+
+
+def test_align_pages_keeps_index_pairs_for_same_length_edits():
+    from src.core.worker_ops.compare.alignment import align_pages
+
+    left = _fingerprints(["one", "two", "three"])
+    right = _fingerprints(["one", "completely different", "three"])
+
+    assert align_pages(left, right) == [(0, 0), (1, 1), (2, 2)]
+
+
+def test_page_fingerprint_uses_dhash_for_textless_pages():
+    require_pymupdf()
+    from src.core.worker_ops._pdf_helpers import hamming64, page_fingerprint
+
+    doc = fitz.open()
+    try:
+        doc.new_page(width=200, height=200)
+        doc.new_page(width=200, height=200).draw_rect(fitz.Rect(100, 0, 200, 200), color=(0, 0, 0), fill=(0, 0, 0))
+        fp_blank = page_fingerprint(doc[0], 0)
+        fp_boxed = page_fingerprint(doc[1], 1)
+    finally:
+        doc.close()
+
+    assert not fp_blank.has_text
+    assert fp_blank.dhash is not None and fp_boxed.dhash is not None
+    assert hamming64(fp_blank.dhash, fp_boxed.dhash) > 0
+
+
+def test_compare_pdfs_reports_only_inserted_page(tmp_path):
+    require_pyqt6_and_pymupdf()
+    from src.core.worker import WorkerThread
+
+    left = tmp_path / "left.pdf"
+    right = tmp_path / "right.pdf"
+    report = tmp_path / "cmp.txt"
+    _make_pdf(left, ["Intro page", "Chapter one body", "Chapter two body", "Appendix"])
+    _make_pdf(right, ["Intro page", "Inserted notice", "Chapter one body", "Chapter two body", "Appendix"])
+
+    worker = WorkerThread("compare_pdfs", file_path1=str(left), file_path2=str(right), output_path=str(report))
+    worker.compare_pdfs()
+
+    payload = worker.result_payload
+    assert payload["diff_count"] == 1
+    assert payload["inserted_pages"] == [2]
+    assert payload["deleted_pages"] == []
+    assert payload["results"][0]["status"] == "missing_file1"
+    assert payload["results"][0]["page2"] == 2
+
+    legacy = WorkerThread(
+        "compare_pdfs",
+        file_path1=str(left),
+        file_path2=str(right),
+        output_path=str(tmp_path / "legacy.txt"),
+        align_pages=False,
+    )
+    legacy.compare_pdfs()
+    assert legacy.result_payload["diff_count"] == 4
+
+
+def test_compare_pdfs_without_alignment_skips_page_fingerprints(tmp_path, monkeypatch):
+    require_pyqt6_and_pymupdf()
+    from src.core.worker import WorkerThread
+    from src.core.worker_ops.compare import ops as compare_ops
+
+    def _no_fingerprints(*_args, **_kwargs):
+        raise AssertionError("index pairing must not render page fingerprints")
+
+    monkeypatch.setattr(compare_ops, "fingerprint_document", _no_fingerprints)
+    left = tmp_path / "left.pdf"
+    right = tmp_path / "right.pdf"
+    _make_pdf(left, ["Intro page", "Chapter one body"])
+    _make_pdf(right, ["Intro page", "Chapter one edited"])
+
+    worker = WorkerThread(
+        "compare_pdfs",
+        file_path1=str(left),
+        file_path2=str(right),
+        output_path=str(tmp_path / "cmp.txt"),
+        align_pages=False,
+    )
+    worker.compare_pdfs()
+
+    assert worker.result_payload["diff_count"] == 1
+    assert worker.result_payload["results"][0]["page"] == 2
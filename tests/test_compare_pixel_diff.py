@@ -0,0 +1,92 @@
+import pytest
+
+from _deps import require_pymupdf, require_pyqt6_and_pymupdf
+from src.core.optional_deps import NUMPY_AVAILABLE, fitz
+
+
+def _pixmap(width, height, fill, changed_rect=None):
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, width, height), 0)
+    pix.clear_with(fill)
+    if changed_rect is not None:
+        pix.set_rect(fitz.IRect(*changed_rect), (10, 20, 30))
+    return pix
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_diff_pixmaps_reports_real_ratio_and_local_region(monkeypatch, use_numpy):
+    require_pymupdf()
+    if use_numpy and not NUMPY_AVAILABLE:
+        pytest.skip("numpy not available")
+    import src.core.worker_ops.compare.pixel_diff as pixel_diff
+
+    monkeypatch.setattr(pixel_diff, "NUMPY_AVAILABLE", use_numpy)
+    base = _pixmap(128, 96, 255)
+    changed = _pixmap(128, 96, 255, changed_rect=(40, 32, 72, 48))
+
+    result = pixel_diff.diff_pixmaps(base, changed, tile_size=16)
+
+    assert result.ratio == pytest.approx((32 * 16) / (128 * 96))
+    assert result.regions == [(32, 32, 80, 48)]
+    assert len(result.tile_map) == 6
+    assert len(result.tile_map[0]) == 8
+
+
+def test_diff_pixmaps_identical_has_no_regions():
+    require_pymupdf()
+    from src.core.worker_ops.compare.pixel_diff import diff_pixmaps
+
+    result = diff_pixmaps(_pixmap(50, 30, 200), _pixmap(50, 30, 200))
+
+    assert result.ratio == 0.0
+    assert result.regions == []
+
+
+def test_merge_changed_tiles_collapses_excess_regions():
+    from src.core.worker_ops.compare.pixel_diff import MAX_DIFF_REGIONS, merge_changed_tiles
+
+    size = MAX_DIFF_REGIONS + 2
+    tile_map = [[1.0 if (x % 2 == 0 and y % 2 == 0) else 0.0 for x in range(size)] for y in range(size)]
+
+    regions = merge_changed_tiles(tile_map, tile_size=4, width=size * 4, height=size * 4)
+
+    assert len(regions) == 1
+
+
+def test_visual_compare_overlay_uses_changed_region_not_full_page(tmp_path):
+    require_pyqt6_and_pymupdf()
+    from src.core.worker import WorkerThread
+
+    def make(path, with_box):
+        doc = fitz.open()
+        page = doc.new_page(width=300, height=300)
+        if with_box:
+            page.draw_rect(fitz.Rect(200, 200, 240, 230), color=(0, 0, 0), fill=(0, 0, 0))
+        doc.save(str(path))
+        doc.close()
+
+    left = tmp_path / "left.pdf"
+    right = tmp_path / "right.pdf"
+    report = tmp_path / "cmp.txt"
+    make(left, False)
+    make(right, True)
+
+    worker = WorkerThread(
+        "compare_pdfs",
+        file_path1=str(left),
+        file_path2=str(right),
+        output_path=str(report),
+        compare_mode="visual",
+        visual_threshold=0.001,
+    )
+    worker.compare_pdfs()
+
+    result = worker.result_payload["results"][0]
+    assert result["status"] == "visual_diff"
+    assert result["visual_regions"] == 1
+    visual_path = worker.result_payload["visual_diff_path"]
+    diff_doc = fitz.open(visual_path)
+    try:
+        drawn = [d["rect"] for d in diff_doc[0].get_drawings() if d["rect"].width < 100]
+    finally:
+        diff_doc.close()
+    assert any(rect.intersects(fitz.Rect(200, 200, 240, 230)) for rect in drawn)
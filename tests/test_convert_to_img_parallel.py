@@ -0,0 +1,131 @@
+import os
+
+import pytest
+
+from _deps import require_pyqt6_and_pymupdf
+from src.core.optional_deps import fitz
+
+
+def _make_multi_page_pdf(path, pages, password=None):
+    doc = fitz.open()
+    for idx in range(pages):
+        page = doc.new_page(width=200, height=200)
+        page.insert_text((36, 36), f"PAGE_{idx + 1}")
+    if password:
+        doc.save(str(path), encryption=fitz.PDF_ENCRYPT_AES_256, owner_pw=password, user_pw=password)
+    else:
+        doc.save(str(path))
+    doc.close()
+
+
+def _crash_on_third_page(file_path, password, page_index, *args):
+    """자식 프로세스를 죽이는 페이지 흉내 (spawn 자식이 이 모듈을 import 한다)."""
+    if page_index == 2:
+        os._exit(1)
+    from src.core.render_pool import render_page_to_staged_file
+
+    return render_page_to_staged_file(file_path, password, page_index, *args)
+
+
+def test_resolve_pool_workers_bounds():
+    from src.core.process_pool import MAX_POOL_WORKERS, resolve_pool_workers
+
+    assert resolve_pool_workers(0) == 1
+    assert resolve_pool_workers(1) == 1
+    assert resolve_pool_workers(100, 1) == 1
+    assert 1 <= resolve_pool_workers(3) <= 3
+    assert resolve_pool_workers(1000) <= MAX_POOL_WORKERS
+
+
+def test_convert_to_img_parallel_renders_encrypted_pages_with_per_page_progress(monkeypatch, tmp_path):
+    require_pyqt6_and_pymupdf()
+    import src.core.worker_ops.transform.convert as convert_mod
+    from src.core.worker import WorkerThread
+
+    monkeypatch.setattr(convert_mod, "_PARALLEL_RENDER_MIN_PAGES", 2)
+    monkeypatch.setattr(convert_mod, "resolve_pool_workers", lambda _count, _requested=None: 2)
+
+    src = tmp_path / "locked.pdf"
+    out_dir = tmp_path / "out"
+    _make_multi_page_pdf(src, 6, password="pw")
+
+    worker = WorkerThread(
+        "convert_to_img",
+        file_paths=[str(src)],
+        output_dir=str(out_dir),
+        fmt="png",
+        dpi=72,
+        passwords={str(src): "pw"},
+    )
+    progress = []
+    worker.progress_signal.connect(progress.append)
+    monkeypatch.setattr(worker, "_emit_progress_if_due", lambda value, *a, **k: progress.append(int(value)))
+
+    worker.convert_to_img()
+
+    names = sorted(p.name for p in out_dir.iterdir())
+    assert names == [f"locked_p{i:03d}.png" for i in range(1, 7)]
+    assert len(worker.kwargs["created_output_paths"]) == 6
+    assert len([value for value in progress if value < 100]) >= 5
+
+
+def test_convert_to_img_parallel_cancel_keeps_rollback_list_and_no_staged_files(monkeypatch, tmp_path):
+    require_pyqt6_and_pymupdf()
+    import src.core.worker_ops.transform.convert as convert_mod
+    from src.core.worker import CancelledError, WorkerThread
+
+    monkeypatch.setattr(convert_mod, "_PARALLEL_RENDER_MIN_PAGES", 2)
+    monkeypatch.setattr(convert_mod, "resolve_pool_workers", lambda _count, _requested=None: 2)
+
+    src = tmp_path / "many.pdf"
+    out_dir = tmp_path / "out"
+    _make_multi_page_pdf(src, 12)
+
+    worker = WorkerThread("convert_to_img", file_paths=[str(src)], output_dir=str(out_dir), fmt="png", dpi=72)
+    calls = {"count": 0}
+
+    def _cancel_after_some_pages():
+        calls["count"] += 1
+        if calls["count"] >= 6:
+            raise CancelledError("cancel")
+
+    worker._check_cancelled = _cancel_after_some_pages
+
+    with pytest.raises(CancelledError):
+        worker.convert_to_img()
+
+    written = sorted(p.name for p in out_dir.iterdir())
+    assert not [name for name in written if name.startswith(".pdf_master_")]
+    created = sorted(p.rsplit("/", 1)[-1].rsplit("\\", 1)[-1] for p in worker.kwargs["created_output_paths"])
+    assert created == written
+    assert 0 < len(written) < 12
+
+
+def test_convert_to_img_skips_page_that_kills_pool_child_without_in_process_retry(monkeypatch, tmp_path):
+    require_pyqt6_and_pymupdf()
+    import src.core.render_pool as render_pool
+    import src.core.worker_ops.transform.convert as convert_mod
+    from src.core.worker import WorkerThread
+
+    monkeypatch.setattr(convert_mod, "_PARALLEL_RENDER_MIN_PAGES", 2)
+    monkeypatch.setattr(convert_mod, "resolve_pool_workers", lambda _count, _requested=None: 2)
+    monkeypatch.setattr(render_pool, "render_page_to_staged_file", _crash_on_third_page)
+
+    src = tmp_path / "crash.pdf"
+    out_dir = tmp_path / "out"
+    _make_multi_page_pdf(src, 8)
+
+    worker = WorkerThread("convert_to_img", file_paths=[str(src)], output_dir=str(out_dir), fmt="png", dpi=72)
+    messages = []
+    worker.finished_signal.connect(messages.append)
+
+    def _no_in_process_render(*_args, **_kwargs):
+        raise AssertionError("pages that crashed a child must not be rendered in the GUI process")
+
+    monkeypatch.setattr(worker, "_atomic_pixmap_save", _no_in_process_render)
+    worker.convert_to_img()
+
+    names = sorted(p.name for p in out_dir.iterdir())
+    assert names == [f"crash_p{i:03d}.png" for i in (1, 2, 4, 5, 6, 7, 8)]
+    assert worker.result_payload["failed_pages"] == ["crash p3"]
+    assert "crash p3" in messages[-1]
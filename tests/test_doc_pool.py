@@ -0,0 +1,164 @@
+"""읽기 전용 문서 핸들 풀 회귀 (작업 간 재사용, 파일 변경 무효화, 암호 키, 스레드 정책, LRU, 유휴 만료)."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from _deps import require_pymupdf
+from src.core import doc_pool
+from src.core.doc_pool import DOC_POOL, DocumentPool
+
+
+@pytest.fixture(autouse=True)
+def _clean_pool():
+    DOC_POOL.clear()
+    yield
+    DOC_POOL.clear()
+
+
+def _make_pdf(path, texts, *, password=None):
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for text in texts:
+        doc.new_page(width=300, height=400).insert_text((72, 72), text)
+    if password:
+        doc.save(str(path), encryption=fitz.PDF_ENCRYPT_AES_256, owner_pw=password, user_pw=password)
+    else:
+        doc.save(str(path))
+    doc.close()
+
+
+def _count_opens(monkeypatch) -> list[str]:
+    opens: list[str] = []
+    original = doc_pool.fitz.open
+
+    def _counting(*args, **kwargs):
+        if args:
+            opens.append(str(args[0]))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(doc_pool.fitz, "open", _counting)
+    return opens
+
+
+def test_read_only_operations_share_one_open(tmp_path, monkeypatch):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+
+    src = tmp_path / "in.pdf"
+    _make_pdf(src, ["Alpha secret", "nothing here"])
+    opens = _count_opens(monkeypatch)
+
+    for mode, extra in (
+        ("get_pdf_info", {"output_path": str(tmp_path / "info.txt")}),
+        ("search_text", {"search_term": "secret", "output_path": str(tmp_path / "hits.txt")}),
+        ("get_bookmarks", {"output_path": str(tmp_path / "toc.md")}),
+    ):
+        result = run_headless(mode, {"file_path": str(src), **extra})
+        assert result.ok, result.message
+
+    assert opens.count(str(src)) == 1
+    assert DOC_POOL.stats()["leased"] == 0
+
+
+def test_rewritten_file_is_reopened(tmp_path):
+    require_pymupdf()
+    src = tmp_path / "in.pdf"
+    _make_pdf(src, ["one"])
+    pool = DocumentPool()
+
+    first = pool.acquire(str(src))
+    assert len(first) == 1
+    pool.release(first)
+
+    _make_pdf(src, ["one", "two"])
+    second = pool.acquire(str(src))
+    assert second is not first and len(second) == 2
+    assert first.is_closed
+    pool.release(second)
+
+    pool.invalidate(str(src))
+    assert second.is_closed and pool.stats()["idle"] == 0
+
+
+def test_encrypted_handles_are_keyed_by_password(tmp_path):
+    require_pymupdf()
+    src = tmp_path / "locked.pdf"
+    _make_pdf(src, ["classified"], password="pw")
+    pool = DocumentPool()
+
+    assert pool.acquire(str(src)) is None
+    doc = pool.acquire(str(src), ["wrong", "pw"])
+    assert doc is not None and "classified" in doc[0].get_text()
+    pool.release(doc)
+
+    assert pool.acquire(str(src), ["wrong"]) is None
+    again = pool.acquire(str(src), ["pw"])
+    assert again is doc
+    pool.release(again)
+    assert pool.stats()["hits"] == 1
+
+
+def test_leased_handle_is_not_shared_across_threads(tmp_path):
+    require_pymupdf()
+    src = tmp_path / "in.pdf"
+    _make_pdf(src, ["page"])
+    pool = DocumentPool()
+
+    doc = pool.acquire(str(src))
+    nested = pool.acquire(str(src))
+    assert nested is doc
+
+    other: list[object] = []
+    thread = threading.Thread(target=lambda: other.append(pool.acquire(str(src))))
+    thread.start()
+    thread.join()
+    assert other[0] is not doc
+    pool.release(other[0])
+
+    pool.release(nested)
+    pool.release(doc)
+    assert pool.stats() == {"idle": 2, "leased": 0, "hits": 1, "misses": 2}
+
+
+def test_idle_handles_are_evicted_lru_and_dirty_handles_dropped(tmp_path):
+    require_pymupdf()
+    paths = []
+    for name in ("a.pdf", "b.pdf"):
+        path = tmp_path / name
+        _make_pdf(path, [name])
+        paths.append(str(path))
+    pool = DocumentPool(max_idle=1)
+
+    first = pool.acquire(paths[0])
+    pool.release(first)
+    second = pool.acquire(paths[1])
+    pool.release(second)
+    assert first.is_closed and not second.is_closed
+
+    mutated = pool.acquire(paths[1])
+    mutated[0].insert_text((72, 120), "edit")
+    pool.release(mutated)
+    assert mutated.is_closed and pool.stats()["idle"] == 0
+
+
+def test_expired_idle_handle_is_closed_without_another_acquire(tmp_path):
+    require_pymupdf()
+    src = tmp_path / "in.pdf"
+    _make_pdf(src, ["page"])
+    pool = DocumentPool(idle_seconds=0.1)
+
+    doc = pool.acquire(str(src))
+    pool.release(doc)
+    assert not doc.is_closed
+
+    deadline = time.monotonic() + 5.0
+    while not doc.is_closed and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert doc.is_closed and pool.stats()["idle"] == 0
+    # 닫힌 뒤에는 파일을 바꿀 수 있다 (Windows 잠금 해제)
+    src.unlink()
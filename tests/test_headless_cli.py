@@ -0,0 +1,151 @@
+"""헤드리스 CLI 회귀 (Qt 미로드 실행, 작업 목록 파싱, 취소 rollback)."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from _deps import require_pymupdf
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _make_pdf(path, page_count=2):
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for index in range(page_count):
+        doc.new_page(width=300, height=400).insert_text((72, 72), f"PAGE_{index + 1}")
+    doc.save(str(path))
+    doc.close()
+
+
+def test_cli_runs_job_list_without_importing_qt(tmp_path):
+    require_pymupdf()
+    src = tmp_path / "in.pdf"
+    _make_pdf(src)
+    jobs = tmp_path / "jobs.ndjson"
+    jobs.write_text(
+        "\n".join(
+            [
+                json.dumps(
+                    {
+                        "mode": "metadata_update",
+                        "kwargs": {
+                            "file_path": str(src),
+                            "output_path": str(tmp_path / "meta.pdf"),
+                            "metadata": {"title": "Headless"},
+                        },
+                    }
+                ),
+                "# 주석 줄은 무시",
+                json.dumps({"mode": "metadata_update", "kwargs": {"file_path": str(tmp_path / "missing.pdf")}}),
+            ]
+        ),
+        encoding="utf-8",
+    )
+    script = (
+        "import sys\n"
+        "from src.cli import main\n"
+        f"code = main(['--jobs', {str(jobs)!r}, '--no-progress'])\n"
+        "assert not [name for name in sys.modules if name.startswith('PyQt')], 'Qt imported'\n"
+        "sys.exit(code)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 1, proc.stderr
+    events = [json.loads(line) for line in proc.stdout.splitlines() if line.startswith("{")]
+    assert [event["event"] for event in events] == ["start", "finished", "start", "error"]
+    assert events[1]["created_output_paths"] == [os.path.abspath(tmp_path / "meta.pdf")]
+
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open(str(tmp_path / "meta.pdf"))
+    try:
+        assert doc.metadata.get("title") == "Headless"
+    finally:
+        doc.close()
+
+
+def test_cli_parses_argv_kwargs_and_json_job_documents(tmp_path):
+    from src import cli
+
+    assert cli.parse_job_lines(['[{"mode": "rotate", "kwargs": {"angle": 90}}]']) == [("rotate", {"angle": 90})]
+    assert cli.parse_job_lines(['{"jobs": [{"mode": "merge"}]}']) == [("merge", {})]
+    with pytest.raises(cli.JobSpecError):
+        cli.parse_job_lines(['{"mode": "no_such_mode"}'])
+
+    out = io.StringIO()
+    code = cli.main(
+        ["metadata_update", "--set", "file_path=/nope.pdf", "--json", "metadata={\"title\": 1}"],
+        stream=out,
+    )
+    last = json.loads(out.getvalue().splitlines()[-1])
+    assert code == cli.EXIT_FAILED
+    assert last["event"] == "error" and last["mode"] == "metadata_update"
+    assert cli.main(["--json", "angle=90"], stream=io.StringIO()) == cli.EXIT_USAGE
+
+
+def test_headless_cancel_removes_created_outputs(tmp_path):
+    require_pymupdf()
+    from src.core.headless_worker import HeadlessWorker
+
+    src = tmp_path / "in.pdf"
+    _make_pdf(src, page_count=4)
+    out_dir = tmp_path / "split"
+    worker = HeadlessWorker("split_by_pages", file_path=str(src), output_dir=str(out_dir))
+    progress: list[int] = []
+
+    def _cancel_after_first_output(value):
+        progress.append(value)
+        if worker.kwargs.get("created_output_paths"):
+            worker.cancel()
+
+    worker.progress_signal.connect(_cancel_after_first_output)
+    worker._emit_progress_if_due = lambda value, *args, **kwargs: worker.progress_signal.emit(int(value))
+    result = worker.execute()
+
+    assert result.status == "cancelled"
+    assert result.created_output_paths
+    assert not any(os.path.exists(path) for path in result.created_output_paths)
+    assert src.exists()
+
+
+def test_cli_exits_quietly_when_stdout_closes():
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "src.cli", "--list-modes"],
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    first = proc.stdout.readline()
+    while first and not first.startswith(b"{"):
+        first = proc.stdout.readline()
+    proc.stdout.close()  # `| head -1` 과 같은 상황
+    stderr = proc.stderr.read().decode("utf-8", "replace")
+    proc.wait(timeout=60)
+
+    assert json.loads(first)["mode"]
+    assert "Traceback" not in stderr and "BrokenPipeError" not in stderr
+
+
+def test_cli_broken_stream_returns_failure_without_raising():
+    from src.cli import EXIT_FAILED, main
+
+    class _ClosedStream(io.StringIO):
+        def write(self, _text):
+            raise BrokenPipeError(32, "Broken pipe")
+
+    assert main(["--list-modes"], stream=_ClosedStream()) == EXIT_FAILED
@@ -0,0 +1,116 @@
+"""증분 저장 회귀 (원본 사본 + 업데이트 섹션, 원자 교체, 전체 저장 폴백)."""
+
+from __future__ import annotations
+
+from _deps import require_pymupdf, require_pyqt6_and_pymupdf
+
+
+def _make_pdf(path, page_count=3, **save_kwargs):
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for index in range(page_count):
+        page = doc.new_page(width=300, height=400)
+        page.insert_text((72, 72), f"PAGE_{index + 1}" + " filler" * 400)
+    doc.save(str(path), **save_kwargs)
+    doc.close()
+
+
+class _Host:
+    def __init__(self):
+        self.kwargs = {}
+
+    def _check_cancelled(self):
+        return None
+
+
+def test_same_path_metadata_update_appends_update_section(tmp_path):
+    require_pyqt6_and_pymupdf()
+    from src.core.optional_deps import fitz
+    from src.core.worker import WorkerThread
+
+    src = tmp_path / "doc.pdf"
+    _make_pdf(src, page_count=40)
+    original = src.read_bytes()
+
+    worker = WorkerThread(
+        "metadata_update",
+        file_path=str(src),
+        output_path=str(src),
+        metadata={"title": "Incremental Title"},
+    )
+    worker.metadata_update()
+
+    updated = src.read_bytes()
+    assert updated.startswith(original)
+    assert len(updated) - len(original) < 4096
+    assert list(tmp_path.glob(".pdf_master_*")) == []
+    doc = fitz.open(str(src))
+    try:
+        assert not doc.is_repaired
+        assert doc.metadata.get("title") == "Incremental Title"
+        assert doc.page_count == 40
+    finally:
+        doc.close()
+
+
+def test_incremental_save_to_other_output_keeps_source_untouched(tmp_path):
+    require_pymupdf()
+    from src.core.optional_deps import fitz
+    from src.core.worker_runtime.io import atomic_pdf_save
+
+    src = tmp_path / "src.pdf"
+    out = tmp_path / "annotated.pdf"
+    _make_pdf(src)
+    original = src.read_bytes()
+
+    doc = fitz.open(str(src))
+    try:
+        doc[1].add_text_annot((50, 50), "note")
+        atomic_pdf_save(_Host(), doc, str(out), incremental=True)
+    finally:
+        doc.close()
+
+    assert src.read_bytes() == original
+    assert out.read_bytes().startswith(original)
+    result = fitz.open(str(out))
+    try:
+        assert [annot.info.get("content") for annot in result[1].annots()] == ["note"]
+    finally:
+        result.close()
+
+
+def test_incremental_save_falls_back_to_full_save(tmp_path):
+    require_pymupdf()
+    from src.core.optional_deps import fitz
+    from src.core.worker_runtime.incremental import incremental_save_blocker
+    from src.core.worker_runtime.io import atomic_pdf_save
+
+    locked = tmp_path / "locked.pdf"
+    _make_pdf(locked, encryption=fitz.PDF_ENCRYPT_AES_256, owner_pw="pw", user_pw="pw")
+    doc = fitz.open(str(locked))
+    try:
+        assert doc.authenticate("pw")
+        assert incremental_save_blocker(doc, {"incremental": True}) == "encrypted"
+    finally:
+        doc.close()
+
+    plain = tmp_path / "plain.pdf"
+    _make_pdf(plain)
+    original = plain.read_bytes()
+    doc = fitz.open(str(plain))
+    try:
+        assert incremental_save_blocker(doc, {"incremental": True, "garbage": 4}) == "option:garbage"
+        doc.set_metadata({"title": "Rewritten"})
+        # 재작성 옵션이 있으면 증분 대신 전체 저장
+        atomic_pdf_save(_Host(), doc, str(plain), incremental=True, garbage=4)
+    finally:
+        doc.close()
+
+    rewritten = plain.read_bytes()
+    assert not rewritten.startswith(original)
+    result = fitz.open(str(plain))
+    try:
+        assert result.metadata.get("title") == "Rewritten"
+    finally:
+        result.close()
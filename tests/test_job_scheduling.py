@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+
+from src.core.worker_runtime.scheduling import (
+    JOB_PRIORITY_HIGH,
+    JOB_PRIORITY_LOW,
+    default_max_concurrent_jobs,
+    is_background_eligible,
+    job_footprint,
+    pick_runnable_jobs,
+)
+
+
+def _entry(mode, priority=0, output_path=None, **kwargs):
+    return {"mode": mode, "output_path": output_path, "kwargs": kwargs, "priority": priority}
+
+
+def test_footprint_conflicts_only_when_writes_overlap(tmp_path):
+    a = str(tmp_path / "a.pdf")
+    out = str(tmp_path / "out.pdf")
+    rotate = job_footprint("rotate", {"file_path": a, "output_path": out})
+    read_same_input = job_footprint("extract_text", {"file_path": a, "output_path": str(tmp_path / "a.txt")})
+    read_output = job_footprint("extract_text", {"file_path": out, "output_path": str(tmp_path / "b.txt")})
+    write_same_output = job_footprint("compress", {"file_path": str(tmp_path / "c.pdf"), "output_path": out})
+
+    assert not rotate.conflicts_with(read_same_input)
+    assert rotate.conflicts_with(read_output)
+    assert read_output.conflicts_with(rotate)
+    assert rotate.conflicts_with(write_same_output)
+
+
+def test_footprint_output_dir_covers_nested_paths(tmp_path):
+    out_dir = str(tmp_path / "pages")
+    split = job_footprint("split", {"file_path": str(tmp_path / "a.pdf"), "output_dir": out_dir})
+    inside = job_footprint("merge", {"file_paths": [os.path.join(out_dir, "p1.pdf")], "output_path": str(tmp_path / "m.pdf")})
+    sibling = job_footprint("merge", {"file_paths": [str(tmp_path / "pages2.pdf")], "output_path": str(tmp_path / "n.pdf")})
+
+    assert split.conflicts_with(inside)
+    assert not split.conflicts_with(sibling)
+
+
+def test_background_eligibility_excludes_undo_and_ai_jobs():
+    assert is_background_eligible("merge", {"file_paths": ["a.pdf", "b.pdf"], "output_path": "m.pdf"})
+    assert not is_background_eligible("compress", {"file_path": "a.pdf", "output_path": "c.pdf"})
+    assert not is_background_eligible("ai_summarize", {"file_path": "a.pdf"})
+    assert not is_background_eligible("no_such_mode", {})
+
+
+def test_pick_runnable_jobs_prefers_priority_without_overtaking_conflicts():
+    pending = [
+        _entry("merge", file_paths=["a.pdf"], output_path="m1.pdf"),
+        _entry("merge", priority=JOB_PRIORITY_HIGH, file_paths=["m1.pdf"], output_path="m2.pdf"),
+        _entry("merge", priority=JOB_PRIORITY_HIGH, file_paths=["x.pdf"], output_path="x_out.pdf"),
+        _entry("merge", priority=JOB_PRIORITY_LOW, file_paths=["y.pdf"], output_path="y_out.pdf"),
+    ]
+
+    picked = pick_runnable_jobs(pending, [], max_running=3, foreground_busy=True)
+
+    # m1 을 읽는 고우선 작업(1)은 앞선 m1 출력 작업(0)을 추월하지 않는다
+    assert picked == [(2, False), (0, False), (3, False)]
+
+
+def test_pick_runnable_jobs_respects_running_conflicts_and_limit():
+    running = [job_footprint("rotate", {"file_path": "a.pdf", "output_path": "out.pdf"})]
+    pending = [
+        _entry("merge", file_paths=["out.pdf"], output_path="m.pdf"),
+        _entry("merge", file_paths=["b.pdf"], output_path="n.pdf"),
+        _entry("merge", file_paths=["c.pdf"], output_path="o.pdf"),
+    ]
+
+    picked = pick_runnable_jobs(pending, running, max_running=2, foreground_busy=True)
+
+    assert picked == [(1, False)]
+
+
+def test_pick_runnable_jobs_takes_one_foreground_job_at_a_time():
+    pending = [
+        _entry("compress", file_path="a.pdf", output_path="a_c.pdf"),
+        _entry("compress", file_path="b.pdf", output_path="b_c.pdf"),
+        _entry("merge", file_paths=["c.pdf"], output_path="m.pdf"),
+    ]
+
+    assert pick_runnable_jobs(pending, [], max_running=4, foreground_busy=False) == [(0, True), (2, False)]
+    assert pick_runnable_jobs(pending, [], max_running=4, foreground_busy=True) == [(2, False)]
+    assert pick_runnable_jobs(pending, [], max_running=4, foreground_busy=False, allow_background=False) == [(0, True)]
+
+
+def test_default_max_concurrent_jobs_bounds():
+    assert default_max_concurrent_jobs(1) == 2
+    assert default_max_concurrent_jobs(3) == 3
+    assert default_max_concurrent_jobs(64) == 4
@@ -0,0 +1,102 @@
+"""라이브러리 전문 색인 회귀 (CJK 2-gram, BM25 순위, mtime 증분 갱신, 정리, 워커 모드)."""
+
+from __future__ import annotations
+
+import os
+
+from _deps import require_pymupdf
+from src.core.library_index import LibraryIndex, collect_library_paths, tokenize
+
+
+def _make_pdf(path, pages):
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page(width=300, height=400).insert_text((36, 72), text)
+    doc.save(str(path))
+    doc.close()
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+def test_tokenize_splits_cjk_into_bigrams_and_folds_latin():
+    assert tokenize("PDF변환 계약서") == ["pdf", "변환", "계약", "약서"]
+    assert tokenize("Ｆｕｌｌ-Width  data_base") == ["full", "width", "data", "base"]
+    assert tokenize("가") == ["가"]
+
+
+def test_index_ranks_pages_and_updates_only_changed_files(tmp_path):
+    require_pymupdf()
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "nested" / "b.pdf"
+    second.parent.mkdir()
+    _make_pdf(first, ["alpha budget report", "unrelated"])
+    _make_pdf(second, ["budget budget budget", "alpha only"])
+    paths = collect_library_paths([str(first)], [str(tmp_path)])
+    assert paths == [os.path.abspath(first), os.path.abspath(second)]
+
+    db_path = str(tmp_path / "index.sqlite3")
+    with LibraryIndex(db_path) as index:
+        stats = index.update(paths)
+        assert (stats.indexed, stats.unchanged, stats.pages) == (2, 0, 4)
+
+        hits = index.search("budget")
+        assert [(os.path.basename(hit.path), hit.page) for hit in hits] == [("b.pdf", 1), ("a.pdf", 1)]
+        assert hits[0].score > hits[1].score
+        # 모든 용어를 포함한 페이지만
+        assert [(os.path.basename(hit.path), hit.page) for hit in index.search("alpha budget")] == [("a.pdf", 1)]
+        assert index.search("missing") == []
+
+        assert index.update(paths).unchanged == 2
+
+        _make_pdf(first, ["gamma"])
+        _bump_mtime(first)
+        stats = index.update(paths)
+        assert (stats.indexed, stats.unchanged) == (1, 1)
+        assert index.search("gamma")[0].path == os.path.abspath(first)
+        assert [os.path.basename(hit.path) for hit in index.search("budget")] == ["b.pdf"]
+
+        os.remove(second)
+        assert index.update([str(first), str(second)]).removed == 1
+        assert index.search("budget") == []
+        assert index.summary()["files"] == 1
+
+
+def test_index_finds_korean_substrings_without_spaces(tmp_path):
+    require_pymupdf()
+    from src.core.optional_deps import fitz
+
+    pdf = tmp_path / "ko.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((36, 72), "표준근로계약서 검토 의견", fontname="korea")
+    doc.save(str(pdf))
+    doc.close()
+
+    with LibraryIndex(str(tmp_path / "index.sqlite3")) as index:
+        index.update([str(pdf)])
+        assert [hit.page for hit in index.search("계약서")] == [1]
+        assert index.search("계약 의견")
+        assert index.search("해지") == []
+
+
+def test_library_index_worker_mode_reports_counts(tmp_path):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+
+    folder = tmp_path / "library"
+    folder.mkdir()
+    _make_pdf(folder / "one.pdf", ["hello library"])
+    _make_pdf(folder / "two.pdf", ["second file"])
+    db_path = str(tmp_path / "index.sqlite3")
+
+    result = run_headless("library_index", {"library_folders": [str(folder)], "index_path": db_path})
+    assert result.ok, result.message
+    assert result.result_payload["indexed"] == 2
+    assert result.result_payload["files"] == 2
+
+    again = run_headless("library_index", {"library_folders": [str(folder)], "index_path": db_path})
+    assert again.result_payload["indexed"] == 0 and again.result_payload["unchanged"] == 2
@@ -0,0 +1,184 @@
+"""유사 페이지 탐지 회귀 (BK-tree 질의, 스캔 잡음 허용, 텍스트 차이 보호, 클러스터 payload)."""
+
+from __future__ import annotations
+
+import random
+
+from _deps import require_pymupdf
+from src.core.worker_ops.cleanup.near_duplicates import (
+    DEFAULT_VISUAL_THRESHOLD,
+    BKTree,
+    DuplicateCluster,
+    find_duplicate_clusters,
+)
+
+
+def test_bk_tree_query_matches_brute_force():
+    rng = random.Random(7)
+    keys = [rng.getrandbits(64) for _ in range(400)]
+    # 가까운 이웃을 일부러 섞는다
+    keys += [key ^ (1 << rng.randrange(64)) for key in keys[:50]]
+    tree = BKTree()
+    for index, key in enumerate(keys):
+        tree.add(key, index)
+    assert len(tree) == len(keys)
+    for probe in keys[:60]:
+        expected = sorted(i for i, key in enumerate(keys) if (key ^ probe).bit_count() <= 3)
+        assert sorted(value for _distance, value in tree.query(probe, 3)) == expected
+
+
+def _scan_pixmap(seed: int, noise: bool = False):
+    from src.core.optional_deps import fitz
+
+    rng = random.Random(seed)
+    pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 120, 160), False)
+    pix.clear_with(255)
+    for _ in range(40):
+        x, y = rng.randrange(0, 110), rng.randrange(0, 150)
+        pix.set_rect(fitz.IRect(x, y, x + rng.randrange(4, 30), y + 4), (0,))
+    if noise:
+        # 스캔 톤 잡음 — 종이 부분만 살짝 어둡게
+        for y in range(70, 100):
+            for x in range(40, 80):
+                if pix.pixel(x, y)[0] == 255:
+                    pix.set_pixel(x, y, (240,))
+    return pix
+
+
+def _form_scan(name: str, amount: str):
+    """같은 양식을 이름·금액만 바꿔 채운 뒤 텍스트 층 없는 이미지로 만든다."""
+    from src.core.optional_deps import fitz
+
+    form = fitz.open()
+    page = form.new_page(width=612, height=792)
+    page.insert_text((72, 72), "APPLICATION FORM", fontsize=20)
+    for row, label in enumerate(("Name:", "Amount:", "Date: 2026-01-01", "Signature:")):
+        page.draw_rect(fitz.Rect(72, 120 + row * 40, 540, 150 + row * 40))
+        page.insert_text((80, 140 + row * 40), label, fontsize=11)
+    page.insert_text((160, 140), name, fontsize=11)
+    page.insert_text((160, 180), amount, fontsize=11)
+    pix = page.get_pixmap(dpi=100, colorspace=fitz.csGRAY)
+    form.close()
+    return pix
+
+
+def _make_pdf(path):
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for text in ("Quarterly report page one", "Quarterly report page one", "Quarterly report page 2"):
+        doc.new_page(width=300, height=400).insert_text((36, 72), text)
+    for pix in (_scan_pixmap(1), _scan_pixmap(1, noise=True), _scan_pixmap(2)):
+        doc.new_page(width=300, height=400).insert_image(fitz.Rect(0, 0, 300, 400), pixmap=pix)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_find_duplicate_clusters_tolerates_noise_but_not_text_changes(tmp_path):
+    require_pymupdf()
+    from src.core.optional_deps import fitz
+
+    src = tmp_path / "pages.pdf"
+    _make_pdf(src)
+    doc = fitz.open(str(src))
+    try:
+        clusters = find_duplicate_clusters(doc)
+        assert clusters == [DuplicateCluster(0, (1,)), DuplicateCluster(3, (4,))]
+        assert clusters[1].to_payload() == {"keep": 4, "duplicates": [5]}
+        # 허용 거리 0 이어도 동일 렌더는 잡는다
+        assert DuplicateCluster(0, (1,)) in find_duplicate_clusters(doc, threshold=0)
+    finally:
+        doc.close()
+
+
+def test_dedupe_pages_reports_clusters(tmp_path):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+    from src.core.optional_deps import fitz
+
+    src = tmp_path / "pages.pdf"
+    _make_pdf(src)
+    result = run_headless(
+        "dedupe_pages",
+        {"file_path": str(src), "output_path": str(tmp_path / "out.pdf"), "dedupe_threshold": DEFAULT_VISUAL_THRESHOLD},
+    )
+    assert result.ok, result.message
+    assert result.result_payload["duplicate_clusters"] == [
+        {"keep": 1, "duplicates": [2]},
+        {"keep": 4, "duplicates": [5]},
+    ]
+    out = fitz.open(str(tmp_path / "out.pdf"))
+    try:
+        assert len(out) == 4
+    finally:
+        out.close()
+
+
+def test_dedupe_pages_defaults_to_exact_duplicates_only(tmp_path):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+    from src.core.optional_deps import fitz
+
+    src = tmp_path / "pages.pdf"
+    _make_pdf(src)
+    # 확인 다이얼로그 없는 호출(CLI·배치)은 유사 페이지를 지우지 않는다
+    result = run_headless("dedupe_pages", {"file_path": str(src), "output_path": str(tmp_path / "out.pdf")})
+    assert result.ok, result.message
+    assert result.result_payload["duplicate_clusters"] == [{"keep": 1, "duplicates": [2]}]
+    out = fitz.open(str(tmp_path / "out.pdf"))
+    try:
+        assert len(out) == 5
+    finally:
+        out.close()
+
+
+def test_find_duplicate_pages_is_a_dry_run(tmp_path):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+
+    src = tmp_path / "pages.pdf"
+    _make_pdf(src)
+    before = src.read_bytes()
+    result = run_headless("find_duplicate_pages", {"file_path": str(src), "dedupe_threshold": DEFAULT_VISUAL_THRESHOLD})
+    assert result.ok, result.message
+    payload = result.result_payload
+    assert payload["duplicate_clusters"] == [
+        {"keep": 1, "duplicates": [2]},
+        {"keep": 4, "duplicates": [5]},
+    ]
+    assert (payload["removed"], payload["total"]) == (2, 6)
+    assert payload["file_path"] == str(src)
+    assert payload["dedupe_threshold"] == DEFAULT_VISUAL_THRESHOLD
+    assert src.read_bytes() == before
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["pages.pdf"]
+
+
+def test_dedupe_pages_keeps_scanned_forms_that_differ_only_in_filled_fields(tmp_path):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+    from src.core.optional_deps import fitz
+    from src.core.worker_ops._pdf_helpers_impl.page_fingerprint import visual_hashes64
+
+    src = tmp_path / "forms.pdf"
+    doc = fitz.open()
+    fields = (("Kim Minsu", "$500"), ("Kim Minsu", "$900"), ("Lee Jiwon", "$1,250"), ("Park Sora", "$75"))
+    for name, amount in (*fields, fields[0]):
+        doc.new_page(width=612, height=792).insert_image(fitz.Rect(0, 0, 612, 792), pixmap=_form_scan(name, amount))
+    # 해시만 보면 모두 허용 거리 안이다 — 확인 단계가 없으면 지워진다
+    hashes = [visual_hashes64(page) for page in doc]
+    assert all((hashes[0][k] ^ pair[k]).bit_count() <= DEFAULT_VISUAL_THRESHOLD for pair in hashes for k in (0, 1))
+    doc.save(str(src))
+    doc.close()
+
+    result = run_headless(
+        "dedupe_pages",
+        {"file_path": str(src), "output_path": str(tmp_path / "out.pdf"), "dedupe_threshold": DEFAULT_VISUAL_THRESHOLD},
+    )
+    assert result.ok, result.message
+    # 완전히 같은 스캔(1, 5쪽)만 중복이다
+    assert result.result_payload["duplicate_clusters"] == [{"keep": 1, "duplicates": [5]}]
+    out = fitz.open(str(tmp_path / "out.pdf"))
+    try:
+        assert len(out) == 4
+    finally:
+        out.close()
@@ -0,0 +1,174 @@
+"""선택적 OCR 회귀 (페이지 분류, 스캔 페이지만 OCR, 렌더 해시 결과 캐시)."""
+
+from __future__ import annotations
+
+from _deps import require_pymupdf
+from src.core import ocr_pipeline
+from src.core.path_utils import APP_DATA_DIR_ENV
+
+
+def _make_mixed_pdf(path):
+    """1쪽 네이티브 텍스트, 2·3쪽 동일한 스캔 이미지."""
+    from src.core.optional_deps import fitz
+
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 60, 80), False)
+    pix.clear_with(255)
+    pix.set_rect(fitz.IRect(10, 10, 50, 20), (0, 0, 0))
+    doc = fitz.open()
+    doc.new_page(width=300, height=400).insert_text(
+        (36, 72), "native text layer that is long enough to skip OCR"
+    )
+    for _ in range(2):
+        doc.new_page(width=300, height=400).insert_image(fitz.Rect(0, 0, 300, 400), pixmap=pix)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_classify_page_separates_text_scan_and_blank(tmp_path):
+    require_pymupdf()
+    from src.core.optional_deps import fitz
+
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(src)
+    doc = fitz.open(str(src))
+    try:
+        doc.new_page()
+        text_page, scan_page, _scan_copy, blank_page = (ocr_pipeline.classify_page(page) for page in doc)
+        assert not text_page.needs_ocr and text_page.image_ratio == 0
+        assert scan_page.needs_ocr and scan_page.image_ratio > 0.99 and scan_page.native_chars == 0
+        # 텍스트 레이어가 없는 페이지는 OCR 대상 (빈 페이지는 렌더 해시가 같아 캐시로 흡수)
+        assert blank_page.needs_ocr
+    finally:
+        doc.close()
+
+
+def test_extract_text_ocrs_only_scanned_pages_and_reuses_cache(tmp_path, monkeypatch):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+
+    monkeypatch.setenv(APP_DATA_DIR_ENV, str(tmp_path / "appdata"))
+    calls: list[tuple[int, str]] = []
+
+    def _fake_ocr(page, dpi, language):
+        calls.append((page.number, language))
+        return "SCANNED WORDS"
+
+    monkeypatch.setattr(ocr_pipeline, "run_page_ocr", _fake_ocr)
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(src)
+    kwargs = {"file_path": str(src), "output_path": str(tmp_path / "out.txt"), "use_ocr": True, "ocr_workers": 1}
+
+    first = run_headless("extract_text", kwargs)
+    assert first.ok, first.message
+    # 같은 스캔 이미지인 3쪽은 2쪽 결과를 재사용
+    assert calls == [(1, "kor+eng")]
+    payload = first.result_payload
+    assert (payload["ocr_success_pages"], payload["ocr_skipped_pages"], payload["ocr_cache_hits"]) == (2, 1, 1)
+    text = (tmp_path / "out.txt").read_text(encoding="utf-8")
+    assert "native text layer" in text and text.count("SCANNED WORDS") == 2
+
+    again = run_headless("extract_text", kwargs)
+    assert again.ok and again.result_payload["ocr_cache_hits"] == 2
+    assert len(calls) == 1
+
+    # DPI·언어가 다르면 캐시 키가 다르다
+    run_headless("extract_text", {**kwargs, "ocr_dpi": 150})
+    run_headless("extract_text", {**kwargs, "ocr_language": "eng", "ocr_cache": False})
+    assert calls[1:] == [(1, "kor+eng"), (1, "eng"), (2, "eng")]
+
+
+def test_ocr_all_pages_forces_ocr_and_store_round_trips(tmp_path, monkeypatch):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+
+    monkeypatch.setenv(APP_DATA_DIR_ENV, str(tmp_path / "appdata"))
+    monkeypatch.setattr(ocr_pipeline, "run_page_ocr", lambda page, dpi, language: f"ocr {page.number}")
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(src)
+
+    result = run_headless(
+        "extract_text",
+        {
+            "file_path": str(src),
+            "output_path": str(tmp_path / "all.txt"),
+            "use_ocr": True,
+            "ocr_all_pages": True,
+            "ocr_workers": 1,
+        },
+    )
+    assert result.ok, result.message
+    assert result.result_payload["ocr_skipped_pages"] == 0
+    assert "ocr 0" in (tmp_path / "all.txt").read_text(encoding="utf-8")
+
+    with ocr_pipeline.OcrResultStore(str(tmp_path / "store.sqlite3")) as store:
+        store.put("a" * 40, "eng", 200, "첫 페이지")
+        assert store.get("a" * 40, "eng", 200) == "첫 페이지"
+        assert store.get("a" * 40, "kor", 200) is None
+        assert store.get("a" * 40, "eng", 300) is None
+
+
+def test_pool_workers_read_shared_cache(tmp_path, monkeypatch):
+    """프로세스 풀 경로: 자식이 디스크 캐시를 조회해 Tesseract 없이도 결과를 돌려준다."""
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+    from src.core.optional_deps import fitz
+    from src.core.worker_ops.extract import text_info as text_info_mod
+
+    monkeypatch.setenv(APP_DATA_DIR_ENV, str(tmp_path / "appdata"))
+    monkeypatch.setattr(text_info_mod, "resolve_pool_workers", lambda _count, _requested=None: 2)
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(src)
+    doc = fitz.open(str(src))
+    try:
+        digest = ocr_pipeline.page_render_digest(doc[1], 200)
+    finally:
+        doc.close()
+    with ocr_pipeline.OcrResultStore() as store:
+        store.put(digest, "kor+eng", 200, "FROM CACHE")
+
+    result = run_headless("extract_text", {"file_path": str(src), "output_path": str(tmp_path / "out.txt"), "use_ocr": True})
+    assert result.ok, result.message
+    assert result.result_payload["ocr_cache_hits"] == 2
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8").count("FROM CACHE") == 2
+
+
+def test_worker_store_is_read_only_and_parent_touches_hits(tmp_path, monkeypatch):
+    require_pymupdf()
+    import sqlite3
+
+    from src.core.headless_worker import run_headless
+    from src.core.optional_deps import fitz
+    from src.core.worker_ops.extract import text_info as text_info_mod
+
+    missing = tmp_path / "missing.sqlite3"
+    assert ocr_pipeline._worker_result_store(str(missing)) is None
+    assert not missing.exists()
+
+    monkeypatch.setenv(APP_DATA_DIR_ENV, str(tmp_path / "appdata"))
+    monkeypatch.setattr(text_info_mod, "resolve_pool_workers", lambda _count, _requested=None: 2)
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(src)
+    doc = fitz.open(str(src))
+    try:
+        digest = ocr_pipeline.page_render_digest(doc[1], 200)
+    finally:
+        doc.close()
+    db_path = ocr_pipeline.default_cache_path()
+    with ocr_pipeline.OcrResultStore() as store:
+        store.put(digest, "kor+eng", 200, "FROM CACHE")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE ocr_pages SET last_used=1")
+
+    # 읽기 전용 저장소는 조회만 한다 (last_used·행 불변, put 무시)
+    with ocr_pipeline.OcrResultStore(db_path, read_only=True) as reader:
+        assert reader.get(digest, "kor+eng", 200) == "FROM CACHE"
+        reader.put("b" * 40, "eng", 200, "ignored")
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT last_used FROM ocr_pages").fetchall() == [(1.0,)]
+
+    result = run_headless("extract_text", {"file_path": str(src), "output_path": str(tmp_path / "out.txt"), "use_ocr": True})
+    assert result.ok, result.message
+    assert result.result_payload["ocr_cache_hits"] == 2
+    with sqlite3.connect(db_path) as conn:
+        (last_used,) = conn.execute("SELECT last_used FROM ocr_pages").fetchone()
+    assert last_used > 1.0
@@ -0,0 +1,94 @@
+"""페이지 부분집합 복사기 회귀 (구간 병합, 역순·중복 순서, 공유 리소스 1회 복사, 반복 페이지 독립 복사, 취소)."""
+
+from __future__ import annotations
+
+import pytest
+
+from _deps import require_pymupdf
+from src.core.worker_ops._pdf_helpers import build_page_subset, coalesce_page_runs
+
+
+def test_coalesce_page_runs_groups_ascending_and_descending_runs():
+    assert coalesce_page_runs([]) == []
+    assert coalesce_page_runs([0, 1, 2, 5, 4, 3, 7, 7, 8, 10]) == [(0, 2), (5, 3), (7, 7), (7, 8), (10, 10)]
+    assert coalesce_page_runs([3, 4, 3, 2]) == [(3, 4), (3, 2)]
+
+
+def _make_pdf(pages: int):
+    from src.core.optional_deps import fitz
+
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 30), False)
+    pix.clear_with(90)
+    logo = pix.tobytes("png")
+    doc = fitz.open()
+    for index in range(pages):
+        page = doc.new_page(width=200, height=200)
+        page.insert_text((20, 40), f"P{index}")
+        page.insert_image(fitz.Rect(20, 60, 60, 90), stream=logo)
+    return fitz.open("pdf", doc.tobytes(garbage=3))
+
+
+def test_build_page_subset_keeps_order_and_shares_resources(monkeypatch):
+    require_pymupdf()
+    from src.core.worker_ops._pdf_helpers_impl import page_subset
+
+    monkeypatch.setattr(page_subset, "_MAX_RUN_PAGES", 3)
+    source = _make_pdf(10)
+    order = [9, 8, 7, 6, 0, 1, 2, 3, 4, 4]
+    calls: list[tuple[int, int]] = []
+    progress: list[int] = []
+    out = build_page_subset(source, order, check_cancelled=lambda: calls.append((0, 0)), on_progress=lambda done, _t: progress.append(done))
+    try:
+        assert [out[i].get_text().strip() for i in range(len(out))] == [f"P{i}" for i in order]
+        # 9..6 → (9,7),(6,6) / 0..4 → (0,2),(3,4) / 4
+        assert len(calls) == 5 and progress[-1] == len(order)
+        # 반복(4) 전까지는 모든 페이지가 같은 이미지 XObject 를 가리키고, 반복 페이지는 새 map 으로 복사된다
+        assert len({out[i].get_images()[0][0] for i in range(len(out) - 1)}) == 1
+        assert out[len(out) - 1].get_images()[0][0] != out[0].get_images()[0][0]
+    finally:
+        out.close()
+        source.close()
+
+
+def test_reorder_repeated_page_gets_independent_annotations(tmp_path):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+    from src.core.optional_deps import fitz
+
+    src = tmp_path / "in.pdf"
+    doc = fitz.open()
+    for index in range(2):
+        page = doc.new_page(width=200, height=200)
+        page.insert_text((20, 40), f"P{index}")
+    doc[0].add_text_annot((50, 50), "note")
+    doc.save(str(src))
+    doc.close()
+
+    out_path = tmp_path / "out.pdf"
+    result = run_headless("reorder", {"file_path": str(src), "output_path": str(out_path), "page_order": [0, 1, 0]})
+    assert result.ok, result.message
+    out = fitz.open(str(out_path))
+    try:
+        first, third = out[0].annot_xrefs(), out[2].annot_xrefs()
+        assert len(first) == len(third) == 1
+        # 반복 페이지는 주석 객체를 공유하지 않는다
+        assert first[0][0] != third[0][0]
+    finally:
+        out.close()
+
+
+def test_build_page_subset_closes_output_on_cancel():
+    require_pymupdf()
+
+    class Stop(Exception):
+        pass
+
+    def _cancel():
+        raise Stop()
+
+    source = _make_pdf(3)
+    try:
+        with pytest.raises(Stop):
+            build_page_subset(source, [0, 2], check_cancelled=_cancel)
+    finally:
+        source.close()
@@ -0,0 +1,76 @@
+"""성능 텔레메트리 회귀 (중첩 span, 링 버퍼, 히스토그램, Chrome trace 내보내기)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.core import perf
+
+
+@pytest.fixture
+def telemetry(monkeypatch):
+    sink = perf.PerfTelemetry(capacity=4)
+    monkeypatch.setattr(perf, "TELEMETRY", sink)
+    sink.enabled = True
+    return sink
+
+
+def test_nested_spans_record_depth_parent_and_error(telemetry):
+    with perf.PerfTimer("outer"):
+        with perf.PerfTimer("inner", extra={"page": 1}):
+            pass
+        with pytest.raises(ValueError):
+            with perf.PerfTimer("failing"):
+                raise ValueError("boom")
+
+    spans = {span.name: span for span in telemetry.spans()}
+    assert spans["outer"].depth == 0 and spans["outer"].parent == ""
+    assert spans["inner"].depth == 1 and spans["inner"].parent == "outer"
+    assert spans["inner"].extra == {"page": 1}
+    assert spans["failing"].error == "ValueError"
+    assert spans["outer"].duration_us >= spans["inner"].duration_us
+
+
+def test_ring_buffer_drops_oldest_and_histogram_aggregates(telemetry):
+    for index in range(6):
+        with perf.PerfTimer(f"span{index}"):
+            pass
+    snapshot = telemetry.snapshot()
+    assert [span["name"] for span in snapshot["spans"]] == ["span2", "span3", "span4", "span5"]
+    assert snapshot["dropped_spans"] == 2
+
+    for elapsed in (0.2, 3.0, 3.0, 400.0):
+        telemetry.record_sample("page.render", elapsed)
+    with perf.perf_sample("page.get_text"):
+        pass
+    histograms = {item["name"]: item for item in telemetry.snapshot()["histograms"]}
+    render = histograms["page.render"]
+    assert render["count"] == 4
+    assert render["max_ms"] == 400.0 and render["min_ms"] == 0.2
+    assert render["p50_ms"] == 5.0
+    assert sum(bucket["count"] for bucket in render["buckets"]) == 4
+    assert histograms["page.get_text"]["count"] == 1
+
+
+def test_disabled_sink_is_noop_and_chrome_trace_export(telemetry, tmp_path):
+    telemetry.enabled = False
+    with perf.PerfTimer("ignored"):
+        with perf.perf_sample("page.render"):
+            pass
+    assert telemetry.snapshot()["spans"] == [] and telemetry.snapshot()["histograms"] == []
+
+    telemetry.enabled = True
+    with perf.PerfTimer("core.worker.rotate", extra={"mode": "rotate"}):
+        telemetry.record_sample("pdf.save", 12.0)
+    trace_path = tmp_path / "trace.json"
+    telemetry.export_chrome_trace(str(trace_path))
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert complete[0]["name"] == "core.worker.rotate"
+    assert complete[0]["args"] == {"mode": "rotate"}
+    assert {"ts", "dur", "pid", "tid"} <= set(complete[0])
+    assert any(event["ph"] == "M" for event in trace["traceEvents"])
+    assert trace["otherData"]["histograms"][0]["name"] == "pdf.save"
+    assert list(tmp_path.glob(".pdf_master_*")) == []
@@ -86,15 +86,19 @@ def test_run_worker_queues_multiple_pending_requests(monkeypatch):
             return None
 
     monkeypatch.setattr(worker_module, "ToastWidget", _ToastStub)
+    monkeypatch.setattr(worker_module, "WorkerThread", _RunningWorkerStub)
     monkeypatch.setattr(worker_module.QMessageBox, "question", lambda *_args, **_kwargs: worker_module.QMessageBox.StandardButton.Yes)
 
     dummy = Dummy()
     dummy.run_worker("merge", file_paths=["a.pdf", "b.pdf"], output_path="merged.pdf")
     dummy.run_worker("compress", file_path="a.pdf", output_path="compressed.pdf")
+    dummy.run_worker("extract_text", file_path="out.pdf", output_path="out.txt")
 
-    assert len(dummy._pending_workers) == 2
-    assert dummy._pending_workers[0]["mode"] == "merge"
-    assert dummy._pending_workers[1]["mode"] == "compress"
+    # 경로가 겹치지 않는 파일 출력 작업은 전경 작업과 동시에 백그라운드로 시작
+    assert [job.mode for job in dummy._background_jobs] == ["merge"]
+    assert dummy._background_jobs[0].worker.kwargs["output_path"] == "merged.pdf"
+    # undo 대상(전경 전용)·실행 중 작업의 출력을 읽는 작업은 대기
+    assert [entry["mode"] for entry in dummy._pending_workers] == ["compress", "extract_text"]
 
 
 def test_run_pending_worker_pops_fifo_order(monkeypatch):
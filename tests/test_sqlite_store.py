@@ -0,0 +1,75 @@
+"""SQLite 캐시 저장소 공용 골격 회귀."""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def _store_class(version=1):
+    from src.core.sqlite_store import SQLiteStore
+
+    class _Store(SQLiteStore):
+        store_name = "Test cache"
+        schema_version = version
+        tables = ("items",)
+        schema = (
+            "CREATE TABLE IF NOT EXISTS items ("
+            " key TEXT PRIMARY KEY, nbytes INTEGER NOT NULL, last_used REAL NOT NULL)",
+        )
+
+        def __init__(self, db_path, *, max_bytes=100):
+            super().__init__(db_path)
+            self.max_bytes = max_bytes
+            self._open()
+            self._total_bytes = self._stored_bytes("items")
+
+        def put(self, key, nbytes, last_used):
+            with self._lock:
+                self._conn.execute("INSERT OR REPLACE INTO items VALUES (?, ?, ?)", (key, nbytes, last_used))
+                self._total_bytes += nbytes
+                if self._total_bytes > self.max_bytes:
+                    self._evict_lru_locked("items", ("key",))
+
+        def keys(self):
+            with self._lock:
+                return {row[0] for row in self._conn.execute("SELECT key FROM items")}
+
+    return _Store
+
+
+def test_store_resets_corrupt_file_and_schema_mismatch(tmp_path):
+    db_path = tmp_path / "cache" / "store.sqlite3"
+    db_path.parent.mkdir()
+    db_path.write_bytes(b"not a sqlite database" * 64)
+
+    with _store_class()(str(db_path)) as store:
+        store.put("a", 10, 1.0)
+        assert store.keys() == {"a"}
+    assert store._conn is None
+
+    with _store_class()(str(db_path)) as store:
+        assert store.keys() == {"a"}
+        assert store._total_bytes == 10
+
+    with _store_class(version=2)(str(db_path)) as store:
+        assert store.keys() == set()
+        assert store._total_bytes == 0
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 2
+    finally:
+        conn.close()
+
+
+def test_store_evicts_least_recently_used_rows_to_target(tmp_path):
+    with _store_class()(str(tmp_path / "store.sqlite3"), max_bytes=100) as store:
+        for index in range(5):
+            store.put(f"k{index}", 20, float(index))
+        assert store.keys() == {f"k{index}" for index in range(5)}
+
+        store.put("k5", 20, 10.0)
+
+        # 120 > 100 → 90 이하가 될 때까지 오래된 k0, k1 을 지운다
+        assert store.keys() == {"k2", "k3", "k4", "k5"}
+        assert store._total_bytes == 80
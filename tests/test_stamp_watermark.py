@@ -0,0 +1,95 @@
+"""스탬프 엔진 회귀 (워터마크/배경이 Form XObject 하나를 공유, 크기별 스탬프, 레이어 순서)."""
+
+from __future__ import annotations
+
+from _deps import require_pymupdf
+
+
+def _make_pdf(path, sizes):
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for index, (width, height) in enumerate(sizes):
+        doc.new_page(width=width, height=height).insert_text((72, 72), f"BASE{index}")
+    doc.save(str(path))
+    doc.close()
+
+
+def _stamp_xrefs(doc) -> set[int]:
+    # show_pdf_page 래퍼(fzFrm*) 안쪽에서 참조되는 실제 스탬프 XObject
+    inner: set[int] = set()
+    for page in doc:
+        for xref, name, *_rest in page.get_xobjects():
+            if name.startswith("fzFrm"):
+                for sub in doc.xref_get_key(xref, "Resources/XObject/fullpage")[1].split()[:1]:
+                    inner.add(int(sub))
+    return inner
+
+
+def test_page_stamper_reuses_one_stamp_per_page_size():
+    require_pymupdf()
+    from src.core.optional_deps import fitz
+    from src.core.worker_ops._pdf_helpers import PageStamper
+
+    doc = fitz.open()
+    for width, height in ((300, 400), (300, 400), (400, 300)):
+        doc.new_page(width=width, height=height)
+    painted: list[tuple[float, float]] = []
+
+    def _paint(page):
+        painted.append((page.rect.width, page.rect.height))
+        page.insert_text((20, 40), "STAMP")
+        return True
+
+    with PageStamper(_paint) as stamper:
+        assert all(stamper.apply(page) for page in doc)
+        assert stamper.stamp_count == 2
+    assert painted == [(300, 400), (400, 300)]
+    assert all("STAMP" in page.get_text() for page in doc)
+    assert len(_stamp_xrefs(fitz.open("pdf", doc.tobytes()))) == 2
+    doc.close()
+
+
+def test_tiled_watermark_shares_stamp_and_background_stays_below(tmp_path):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+    from src.core.optional_deps import fitz
+
+    src = tmp_path / "src.pdf"
+    _make_pdf(src, [(595, 842)] * 12)
+    out = tmp_path / "wm.pdf"
+    result = run_headless(
+        "watermark",
+        {"file_path": str(src), "output_path": str(out), "text": "기밀", "position": "tile", "layer": "background", "rotation": 90},
+    )
+    assert result.ok, result.message
+    doc = fitz.open(str(out))
+    try:
+        assert len(_stamp_xrefs(doc)) == 1
+        text = doc[5].get_text()
+        assert "기밀" in text and "BASE5" in text
+        # 배경 레이어: 스탬프 호출이 원래 내용보다 앞에 온다
+        content = b"".join(doc.xref_stream(x) for x in doc[5].get_contents())
+        assert content.index(b"Do") < content.index(b"BT")
+    finally:
+        doc.close()
+
+
+def test_add_background_uses_shared_stamp(tmp_path):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+    from src.core.optional_deps import fitz
+
+    src = tmp_path / "src.pdf"
+    _make_pdf(src, [(300, 400)] * 4 + [(400, 300)])
+    out = tmp_path / "bg.pdf"
+    result = run_headless("add_background", {"file_path": str(src), "output_path": str(out), "color": [1, 0, 0]})
+    assert result.ok, result.message
+    doc = fitz.open(str(out))
+    try:
+        assert len(_stamp_xrefs(doc)) == 2
+        pix = doc[4].get_pixmap(clip=fitz.Rect(390, 290, 399, 299))
+        assert pix.pixel(0, 0) == (255, 0, 0)
+        assert "BASE4" in doc[4].get_text()
+    finally:
+        doc.close()
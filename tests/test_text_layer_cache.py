@@ -0,0 +1,122 @@
+"""페이지 텍스트 레이어 캐시 회귀 (작업 간 재사용, 검색 사전 필터, mtime 무효화, 디스크 영속화)."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from _deps import require_pymupdf
+from src.core import text_layer_cache
+from src.core.text_layer_cache import PageTextLayer, TextLayerCache, fold_search_text
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fresh = TextLayerCache()
+    monkeypatch.setattr(text_layer_cache, "TEXT_LAYER_CACHE", fresh)
+    for module_name in (
+        "src.core.worker_ops.cleanup.helpers",
+        "src.core.worker_ops.extract.images_markdown",
+        "src.core.worker_ops.compare.alignment",
+        "src.core.worker_ops.compare.ops",
+        "src.core.ai.extraction",
+    ):
+        module = pytest.importorskip(module_name)
+        monkeypatch.setattr(module, "TEXT_LAYER_CACHE", fresh)
+    yield fresh
+    fresh.set_persistence(False)
+
+
+def _make_pdf(path, texts):
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for text in texts:
+        doc.new_page(width=300, height=400).insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_search_highlight_redact_extract_each_page_once(tmp_path, cache, monkeypatch):
+    require_pymupdf()
+    from src.core.headless_worker import run_headless
+
+    src = tmp_path / "in.pdf"
+    _make_pdf(src, ["Alpha secret", "nothing here", "SECRET again"])
+    extracted: list[int] = []
+    original = text_layer_cache.extract_page_text_layer
+
+    def _counting(page, textpage=None):
+        extracted.append(page.number)
+        return original(page, textpage)
+
+    monkeypatch.setattr(text_layer_cache, "extract_page_text_layer", _counting)
+
+    search = run_headless(
+        "search_text", {"file_path": str(src), "search_term": "secret", "output_path": str(tmp_path / "hits.txt")}
+    )
+    highlight = run_headless(
+        "highlight_text", {"file_path": str(src), "search_term": "secret", "output_path": str(tmp_path / "hl.pdf")}
+    )
+    redact = run_headless(
+        "redact_text", {"file_path": str(src), "search_term": "secret", "output_path": str(tmp_path / "rd.pdf")}
+    )
+
+    assert search.ok and highlight.ok and redact.ok, (search.message, highlight.message, redact.message)
+    assert sorted(extracted) == [0, 1, 2]
+    assert cache.hits == 6 and cache.misses == 3
+
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open(str(tmp_path / "rd.pdf"))
+    try:
+        assert "secret" not in doc[0].get_text().lower()
+        assert "secret" not in doc[2].get_text().lower()
+    finally:
+        doc.close()
+
+
+def test_fold_prefilter_ignores_case_hyphen_and_ligature():
+    layer = PageTextLayer(text="Ef\ufb01cient data-\nbase", lines=(), blocks=(), folded="")
+    layer = PageTextLayer.from_payload(layer.to_payload())
+    assert fold_search_text("EFFICIENT") in layer.folded
+    assert layer.may_contain("database")
+    assert layer.may_contain("")
+    assert not layer.may_contain("missing")
+
+
+def test_mtime_change_invalidates_and_disk_store_round_trips(tmp_path, cache):
+    require_pymupdf()
+    from src.core.optional_deps import fitz
+
+    src = tmp_path / "doc.pdf"
+    _make_pdf(src, ["first version"])
+    cache.set_persistence(True, str(tmp_path / "layers.sqlite3"))
+    doc = fitz.open(str(src))
+    try:
+        key = cache.document_key(doc)
+        assert key is not None and key.persistable
+        assert "first version" in cache.page_layer(doc, 0, key).text
+    finally:
+        doc.close()
+
+    # 메모리 캐시를 비워도 디스크에서 복원
+    cache.clear()
+    doc = fitz.open(str(src))
+    try:
+        assert "first version" in cache.page_layer(doc, 0, cache.document_key(doc)).text
+        assert cache.misses == 1 and cache.hits == 1
+    finally:
+        doc.close()
+
+    _make_pdf(src, ["second version"])
+    stat = os.stat(src)
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    doc = fitz.open(str(src))
+    try:
+        layer = cache.page_layer(doc, 0, cache.document_key(doc))
+        assert "second version" in layer.text
+        assert cache.misses == 2
+    finally:
+        doc.close()
@@ -0,0 +1,193 @@
+"""디스크 썸네일 캐시 회귀."""
+
+from __future__ import annotations
+
+import os
+import shutil
+
+from _deps import require_pyqt6_and_pymupdf
+
+
+def _make_pdf(path, page_count=3):
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for index in range(page_count):
+        page = doc.new_page(width=300, height=400)
+        page.insert_text((72, 72), f"PAGE_{index + 1}")
+    doc.save(str(path))
+    doc.close()
+
+
+def test_disk_cache_roundtrip_persists_across_instances(tmp_path):
+    from src.core.thumbnail_cache import ThumbnailDiskCache
+
+    src = tmp_path / "a.bin"
+    src.write_bytes(b"%PDF-1.7 content")
+    db_path = str(tmp_path / "cache" / "thumbs.sqlite3")
+
+    cache = ThumbnailDiskCache(db_path)
+    digest = cache.resolve_digest(str(src))
+    assert digest
+    cache.put(digest, 0, "140x160", b"blob-0", "png")
+    cache.put(digest, 2, "140x160", b"blob-2", "png")
+    cache.close()
+
+    reopened = ThumbnailDiskCache(db_path)
+    try:
+        # 메모 적중 시 해시 없이 digest 반환
+        assert reopened.resolve_digest(str(src), compute=False) == digest
+        assert reopened.get_many(digest, [0, 1, 2], "140x160") == {0: b"blob-0", 2: b"blob-2"}
+        assert reopened.get(digest, 0, "70x80") is None
+        assert reopened.total_bytes == len(b"blob-0") + len(b"blob-2")
+    finally:
+        reopened.close()
+
+
+def test_disk_cache_content_digest_shared_by_copies_and_invalidated_by_edit(tmp_path):
+    from src.core.thumbnail_cache import ThumbnailDiskCache
+
+    src = tmp_path / "a.pdf"
+    src.write_bytes(b"%PDF-1.7 original")
+    copy = tmp_path / "renamed.pdf"
+    shutil.copy2(src, copy)
+
+    cache = ThumbnailDiskCache(str(tmp_path / "thumbs.sqlite3"))
+    try:
+        digest = cache.resolve_digest(str(src))
+        assert cache.resolve_digest(str(copy), compute=False) == ""
+        assert cache.resolve_digest(str(copy)) == digest
+
+        src.write_bytes(b"%PDF-1.7 edited!!")
+        os.utime(src, ns=(1, 1))
+        assert cache.resolve_digest(str(src)) != digest
+    finally:
+        cache.close()
+
+
+def test_disk_cache_evicts_least_recently_used_by_bytes(tmp_path):
+    from src.core.thumbnail_cache import ThumbnailDiskCache
+
+    cache = ThumbnailDiskCache(str(tmp_path / "thumbs.sqlite3"), max_bytes=300)
+    try:
+        for page in range(3):
+            cache.put("d", page, "s", bytes([page]) * 100, "png")
+        assert cache.get("d", 0, "s") is not None  # 0 을 최근 사용으로 갱신
+        cache.put("d", 3, "s", b"x" * 100, "png")
+
+        assert cache.total_bytes <= 300
+        assert cache.get("d", 1, "s") is None
+        assert cache.get("d", 0, "s") is not None
+        assert cache.get("d", 3, "s") is not None
+    finally:
+        cache.close()
+
+
+def test_thumbnail_loader_reuses_disk_cache_without_rendering(tmp_path, monkeypatch):
+    require_pyqt6_and_pymupdf()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt6.QtWidgets import QApplication
+
+    import src.ui.thumbnail.loader as loader_mod
+    from src.core.thumbnail_cache import ThumbnailDiskCache
+
+    app = QApplication.instance() or QApplication([])
+    _ = app
+
+    store = ThumbnailDiskCache(str(tmp_path / "thumbs.sqlite3"))
+    monkeypatch.setattr(loader_mod, "get_thumbnail_disk_cache", lambda: store)
+    src_pdf = tmp_path / "doc.pdf"
+    _make_pdf(src_pdf)
+
+    first: list[int] = []
+    loader = loader_mod.ThumbnailLoaderThread(str(src_pdf), [0, 1, 2])
+    loader.thumbnail_ready.connect(lambda index, _pixmap: first.append(index))
+    loader.run()
+    assert first == [0, 1, 2]
+    assert len(store) == 3
+
+    def _no_render(*_args, **_kwargs):
+        raise AssertionError("cached pages must not be re-rendered")
+
+    monkeypatch.setattr(loader_mod, "render_thumbnail_pixmap", _no_render)
+    second: list[tuple[int, int]] = []
+    again = loader_mod.ThumbnailLoaderThread(str(src_pdf), [0, 1, 2])
+    again.thumbnail_ready.connect(lambda index, pixmap: second.append((index, pixmap.width())))
+    again.run()
+    store.close()
+
+    assert [index for index, _width in second] == [0, 1, 2]
+    assert all(width > 0 for _index, width in second)
+
+
+def test_thumbnail_loader_skips_disk_cache_for_password_documents(tmp_path, monkeypatch):
+    require_pyqt6_and_pymupdf()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt6.QtWidgets import QApplication
+
+    import src.ui.thumbnail.loader as loader_mod
+    from src.core.optional_deps import fitz
+
+    app = QApplication.instance() or QApplication([])
+    _ = app
+
+    def _unexpected():
+        raise AssertionError("encrypted thumbnails must not touch the disk cache")
+
+    monkeypatch.setattr(loader_mod, "get_thumbnail_disk_cache", _unexpected)
+    src_pdf = tmp_path / "locked.pdf"
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(str(src_pdf), encryption=fitz.PDF_ENCRYPT_AES_256, owner_pw="pw", user_pw="pw")
+    doc.close()
+
+    ready: list[int] = []
+    loader = loader_mod.ThumbnailLoaderThread(str(src_pdf), [0], password="pw")
+    loader.thumbnail_ready.connect(lambda index, _pixmap: ready.append(index))
+    loader.run()
+
+    assert ready == [0]
+
+
+def test_grid_warms_tiles_from_disk_before_requesting_renders(tmp_path, monkeypatch):
+    require_pyqt6_and_pymupdf()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt6.QtGui import QImage
+    from PyQt6.QtWidgets import QApplication
+
+    import src.ui.thumbnail.grid_loading as grid_loading
+    from src.core.thumbnail_cache import ThumbnailDiskCache
+    from src.ui.thumbnail.disk_cache import encode_thumbnail_image, thumbnail_size_key
+    from src.ui.thumbnail_grid import ThumbnailGridWidget
+
+    app = QApplication.instance() or QApplication([])
+    _ = app
+
+    src_pdf = tmp_path / "doc.pdf"
+    _make_pdf(src_pdf, page_count=2)
+    store = ThumbnailDiskCache(str(tmp_path / "thumbs.sqlite3"))
+    digest = store.resolve_digest(str(src_pdf))
+    image = QImage(20, 30, QImage.Format.Format_RGB32)
+    image.fill(0x336699)
+    blob, fmt = encode_thumbnail_image(image)
+    size_key = thumbnail_size_key(140, 160)
+    for page in range(2):
+        store.put(digest, page, size_key, blob, fmt)
+    monkeypatch.setattr(grid_loading, "get_thumbnail_disk_cache", lambda: store)
+
+    from src.ui.thumbnail.render_service import ThumbnailRenderService
+
+    requested: list[list[int]] = []
+    monkeypatch.setattr(ThumbnailRenderService, "request", lambda self, indices: requested.append(list(indices)))
+
+    grid = ThumbnailGridWidget()
+    try:
+        grid.load_pdf(str(src_pdf))
+        assert grid._loaded_indices == {0, 1}
+        assert requested == [[]]
+    finally:
+        grid.close()
+        store.close()
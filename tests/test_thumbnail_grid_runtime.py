@@ -98,7 +98,7 @@ def test_thumbnail_loader_emits_loading_complete_once_with_password(tmp_path):
     assert calls["ready"] == [0, 1]
 
 
-def test_cleanup_loader_thread_does_not_force_terminate(tmp_path):
+def test_cancel_thumbnail_requests_requeues_without_stopping_service(tmp_path):
     require_pyqt6_and_pymupdf()
     os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
@@ -108,58 +108,19 @@ def test_cleanup_loader_thread_does_not_force_terminate(tmp_path):
     app = QApplication.instance() or QApplication([])
     _ = app
 
-    class _DisconnectStub:
-        def disconnect(self, *_args, **_kwargs):
-            return None
-
-    class _FinishedStub:
-        def __init__(self):
-            self.connected = []
-
-        def connect(self, callback):
-            self.connected.append(callback)
-
-    class FakeThread:
-        def __init__(self):
-            self.thumbnail_ready = _DisconnectStub()
-            self.progress = _DisconnectStub()
-            self.loading_complete = _DisconnectStub()
-            self.finished = _FinishedStub()
-            self.cancel_calls = 0
-            self.wait_calls = []
-            self.terminate_calls = 0
-
-        def isRunning(self):
-            return True
-
-        def cancel(self):
-            self.cancel_calls += 1
-
-        def wait(self, timeout):
-            self.wait_calls.append(timeout)
-            return False
-
-        def terminate(self):
-            self.terminate_calls += 1
-
-        def deleteLater(self):
-            return None
-
     grid = ThumbnailGridWidget()
-    fake = FakeThread()
     try:
-        grid._loader_thread = cast(Any, fake)
-        grid._active_batch_indices = [0]
+        service = grid._render_service
+        before = service.generation
         grid._requested_indices = {0}
         grid._pending_indices = set()
 
-        grid._cleanup_loader_thread()
+        grid._cancel_thumbnail_requests()
 
-        assert grid._loader_thread is None
+        # 세대만 올리고 대기 요청은 다시 pending 으로 — 렌더 루프는 강제 종료하지 않는다
+        assert service.generation == before + 1
         assert grid._pending_indices == {0}
         assert grid._requested_indices == set()
-        assert grid._active_batch_indices == []
-        assert fake.cancel_calls == 1
-        assert fake.terminate_calls == 0
     finally:
         grid.close()
+    assert grid._render_service._thread is None or not grid._render_service._thread.is_alive()
\ No newline at end of file
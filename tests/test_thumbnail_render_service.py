@@ -0,0 +1,196 @@
+"""썸네일 렌더 서비스 회귀 (문서 재사용·우선순위 큐 교체·세대 필터)."""
+
+from __future__ import annotations
+
+import os
+import time
+
+from _deps import require_pyqt6_and_pymupdf
+
+
+def _make_pdf(path, page_count):
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for index in range(page_count):
+        page = doc.new_page(width=300, height=400)
+        page.insert_text((72, 72), f"PAGE_{index + 1}")
+    doc.save(str(path))
+    doc.close()
+
+
+def _app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def _pump_until(app, predicate, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        app.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _count_opens(monkeypatch, module):
+    opens: list[str] = []
+    original = module._open_thumbnail_document
+
+    def _counting(path, password=None):
+        opens.append(path)
+        return original(path, password)
+
+    monkeypatch.setattr(module, "_open_thumbnail_document", _counting)
+    return opens
+
+
+def test_request_replaces_queue_with_latest_priority_order(monkeypatch):
+    require_pyqt6_and_pymupdf()
+    _app()
+    from src.ui.thumbnail.render_service import ThumbnailRenderService
+
+    service = ThumbnailRenderService()
+    monkeypatch.setattr(service, "_ensure_thread", lambda: None)
+    first = service.open_document("x.pdf", None, page_count=10, thumb_w=140, thumb_h=160)
+
+    service.request([0, 1, 2, 3])
+    service.request([7, 6, 7, 5])
+    assert service._queue == [7, 6, 5]
+
+    service.open_document("y.pdf", None, page_count=10, thumb_w=140, thumb_h=160)
+    assert service.generation == first + 1
+    assert service._queue == []
+
+
+def test_service_keeps_document_open_across_requests(tmp_path, monkeypatch):
+    require_pyqt6_and_pymupdf()
+    app = _app()
+    import src.ui.thumbnail.render_service as service_mod
+
+    monkeypatch.setattr(service_mod, "get_thumbnail_disk_cache", lambda: None)
+    opens = _count_opens(monkeypatch, service_mod)
+    src_pdf = tmp_path / "doc.pdf"
+    _make_pdf(src_pdf, 6)
+
+    service = service_mod.ThumbnailRenderService()
+    ready: list[tuple[int, int]] = []
+    service.thumbnail_ready.connect(lambda generation, index, _image: ready.append((generation, index)))
+    try:
+        generation = service.open_document(str(src_pdf), None, page_count=6, thumb_w=140, thumb_h=160)
+        service.request([2, 0])
+        assert _pump_until(app, lambda: len(ready) >= 2)
+        service.request([5, 4])
+        assert _pump_until(app, lambda: len(ready) >= 4)
+
+        assert ready == [(generation, 2), (generation, 0), (generation, 5), (generation, 4)]
+        assert opens == [str(src_pdf)]
+
+        # 같은 경로 저장 전 해제 → 다음 요청에서 한 번 다시 연다
+        assert service.release_document_handles()
+        service.request([1])
+        assert _pump_until(app, lambda: len(ready) >= 5)
+        assert len(opens) == 2
+    finally:
+        assert service.shutdown(2000)
+
+
+def test_service_renders_with_process_workers(tmp_path, monkeypatch):
+    require_pyqt6_and_pymupdf()
+    app = _app()
+    import src.ui.thumbnail.render_service as service_mod
+
+    monkeypatch.setattr(service_mod, "get_thumbnail_disk_cache", lambda: None)
+    monkeypatch.setattr(service_mod, "_PROCESS_RENDER_MIN_PAGES", 2)
+    monkeypatch.setattr(service_mod, "resolve_pool_workers", lambda _count, _requested=None: 2)
+    src_pdf = tmp_path / "locked.pdf"
+    from src.core.optional_deps import fitz
+
+    doc = fitz.open()
+    for index in range(4):
+        doc.new_page(width=200, height=300).insert_text((36, 36), f"P{index}")
+    doc.save(str(src_pdf), encryption=fitz.PDF_ENCRYPT_AES_256, owner_pw="pw", user_pw="pw")
+    doc.close()
+
+    service = service_mod.ThumbnailRenderService()
+    ready: dict[int, int] = {}
+    service.thumbnail_ready.connect(lambda _generation, index, image: ready.__setitem__(index, image.width()))
+    try:
+        service.open_document(str(src_pdf), "pw", page_count=4, thumb_w=140, thumb_h=160)
+        service.request([3, 2, 1, 0])
+        assert _pump_until(app, lambda: len(ready) == 4, timeout=60.0)
+    finally:
+        assert service.shutdown(5000)
+
+    assert sorted(ready) == [0, 1, 2, 3]
+    assert all(width > 0 for width in ready.values())
+
+
+def test_grid_loads_all_visible_thumbnails_with_single_open(tmp_path, monkeypatch):
+    require_pyqt6_and_pymupdf()
+    app = _app()
+    import src.ui.thumbnail.render_service as service_mod
+    from src.ui.thumbnail_grid import ThumbnailGridWidget
+
+    monkeypatch.setattr(service_mod, "get_thumbnail_disk_cache", lambda: None)
+    opens = _count_opens(monkeypatch, service_mod)
+    src_pdf = tmp_path / "doc.pdf"
+    _make_pdf(src_pdf, 3)
+
+    grid = ThumbnailGridWidget()
+    try:
+        grid.load_pdf(str(src_pdf))
+        assert _pump_until(app, lambda: grid._loaded_indices == {0, 1, 2})
+        assert opens == [str(src_pdf)]
+    finally:
+        grid.close()
+
+
+def test_pool_shutdown_does_not_hold_the_service_lock(monkeypatch):
+    require_pyqt6_and_pymupdf()
+    _app()
+    import threading
+    from concurrent.futures import Future
+
+    import src.ui.thumbnail.render_service as service_mod
+
+    submitted = threading.Event()
+    entered = threading.Event()
+    unblock = threading.Event()
+
+    class _PendingExecutor:
+        def submit(self, *_args, **_kwargs):
+            submitted.set()
+            return Future()
+
+    def _slow_shutdown(_executor, terminate=False):
+        entered.set()
+        unblock.wait(5.0)
+
+    monkeypatch.setattr(service_mod, "_PROCESS_RENDER_MIN_PAGES", 1)
+    monkeypatch.setattr(service_mod, "resolve_pool_workers", lambda *_args: 2)
+    monkeypatch.setattr(service_mod, "create_process_pool", lambda _workers: _PendingExecutor())
+    monkeypatch.setattr(service_mod, "shutdown_process_pool", _slow_shutdown)
+    monkeypatch.setattr(service_mod, "get_thumbnail_disk_cache", lambda: None)
+
+    service = service_mod.ThumbnailRenderService()
+    releaser = threading.Thread(target=lambda: service.release_document_handles(5000))
+    try:
+        service.open_document("x.pdf", None, page_count=4, thumb_w=140, thumb_h=160)
+        service.request([0])
+        assert submitted.wait(5.0)
+
+        releaser.start()
+        assert entered.wait(5.0)
+        # 자식 회수 중에도 GUI 스레드 호출은 바로 돌아온다
+        started = time.monotonic()
+        service.request([1, 2])
+        assert time.monotonic() - started < 0.5
+    finally:
+        unblock.set()
+        if releaser.is_alive() or releaser.ident is not None:
+            releaser.join(5.0)
+        assert service.shutdown(2000)
@@ -119,3 +119,104 @@ def test_cleanup_unused_undo_backups_keeps_active_snapshots(monkeypatch, tmp_pat
     host._cleanup_unused_undo_backups()
     assert not before_backup.exists()
     assert not after_backup.exists()
+
+
+def _app():
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def test_undo_snapshots_and_registration_run_off_the_gui_thread(monkeypatch, tmp_path):
+    require_pyqt6()
+    import threading
+    import time
+
+    import src.ui.window_undo.backup as backup_module
+    from src.core.undo_chunk_store import UndoChunkStore
+    from src.core.undo_manager import UndoManager
+    from src.ui.main_window_undo import MainWindowUndoMixin
+    from src.ui.window_worker.success import apply_undo_registration
+
+    app = _app()
+    monkeypatch.setattr(backup_module, "ToastWidget", _ToastStub)
+    release = threading.Event()
+    threads: list[str] = []
+    original = UndoChunkStore.create_snapshot
+
+    def _slow_snapshot(store, source_path, manifest_path):
+        threads.append(threading.current_thread().name)
+        release.wait(5)
+        return original(store, source_path, manifest_path)
+
+    monkeypatch.setattr(UndoChunkStore, "create_snapshot", _slow_snapshot)
+
+    class Host(_UndoHost, MainWindowUndoMixin):
+        pass
+
+    host = Host(tmp_path / "undo", UndoManager())
+    target = tmp_path / "target.pdf"
+    target.write_text("before", encoding="utf-8")
+
+    # 큐에 넣고 바로 돌아온다 — 쓰기는 스냅샷 스레드에서
+    before = host._queue_backup_for_undo(str(target))
+    barrier = host._undo_snapshot_barrier()
+    assert before and not barrier.done() and not Path(before).exists()
+    release.set()
+    barrier.result(5)
+    assert Path(before).exists()
+
+    target.write_text("after", encoding="utf-8")
+    release.clear()
+    host._pending_undo = {
+        "action_type": "rotate",
+        "description": "Rotate pages",
+        "before_backup_path": before,
+        "after_backup_path": "",
+        "source_path": str(target),
+        "output_path": str(target),
+    }
+    apply_undo_registration(host, _ToastStub)
+    # after 스냅샷이 끝나기 전에는 등록되지 않지만 보존 대상이다
+    assert not host.undo_manager.can_undo
+    assert len(host._queued_undo_registrations) == 1
+    release.set()
+    host._undo_snapshot_barrier().result(5)
+    deadline = time.monotonic() + 5
+    while not host.undo_manager.can_undo and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    host._undo_snapshot_barrier().result(5)
+
+    assert threads and all(name.startswith("UndoSnapshot") for name in threads)
+    assert host.undo_manager.can_undo and host._queued_undo_registrations == []
+    host.undo_manager.undo()
+    assert target.read_text(encoding="utf-8") == "before"
+    host._shutdown_undo_snapshots()
+
+
+def test_worker_waits_for_undo_snapshot_barrier():
+    require_pyqt6()
+    import threading
+    from concurrent.futures import Future
+
+    from src.core.worker import WorkerThread
+
+    order: list[str] = []
+    barrier: Future = Future()
+    worker = WorkerThread("no_such_mode")
+    worker.error_signal.connect(lambda _msg: order.append("ran"))
+    worker.wait_before_run(barrier)
+    timer = threading.Timer(0.2, lambda: (order.append("snapshot"), barrier.set_result("")))
+    timer.start()
+    worker.run()
+    assert order == ["snapshot", "ran"]
+
+    cancelled: list[str] = []
+    worker = WorkerThread("no_such_mode")
+    worker.cancelled_signal.connect(cancelled.append)
+    worker.error_signal.connect(lambda _msg: order.append("ran again"))
+    worker.wait_before_run(Future())
+    worker.cancel()
+    worker.run()
+    assert cancelled and order == ["snapshot", "ran"]
@@ -0,0 +1,126 @@
+"""Undo 청크 저장소 회귀 (버전 간 청크 공유·복원·참조 수 GC)."""
+
+from __future__ import annotations
+
+import os
+import random
+
+from _deps import require_pyqt6
+
+
+def _fake_pdf(object_count: int, *, seed: int = 7, patch: dict[int, bytes] | None = None) -> bytes:
+    rng = random.Random(seed)
+    parts = [b"%PDF-1.7\n"]
+    for number in range(1, object_count + 1):
+        body = rng.randbytes(rng.randint(2_000, 12_000))
+        body = (patch or {}).get(number, body)
+        parts.append(b"%d 0 obj\n<< /Length %d >>\nstream\n" % (number, len(body)))
+        parts.append(body)
+        parts.append(b"\nendstream\nendobj\n")
+    parts.append(b"trailer\n<< /Size %d >>\n%%%%EOF\n" % (object_count + 1))
+    return b"".join(parts)
+
+
+def _store_bytes(root) -> int:
+    total = 0
+    for dirpath, _dirs, files in os.walk(root / "chunks"):
+        total += sum(os.path.getsize(os.path.join(dirpath, name)) for name in files)
+    return total
+
+
+def test_consecutive_versions_share_chunks_and_restore_exactly(tmp_path):
+    from src.core.undo_chunk_store import UndoChunkStore
+
+    store = UndoChunkStore(str(tmp_path))
+    source = tmp_path / "doc.pdf"
+    v1 = _fake_pdf(400)
+    # 앞쪽 객체 크기가 바뀌어 이후 모든 오프셋이 밀린 버전
+    v2 = _fake_pdf(400, patch={3: b"edited" * 5_000})
+    source.write_bytes(v1)
+    first_written = store.create_snapshot(str(source), str(tmp_path / "undo_1.undo.json"))
+    source.write_bytes(v2)
+    second_written = store.create_snapshot(str(source), str(tmp_path / "undo_2.undo.json"))
+
+    assert first_written > 0
+    assert second_written < first_written // 4
+    assert _store_bytes(tmp_path) < len(v1) + len(v2) // 4
+
+    target = tmp_path / "restored.pdf"
+    store.restore_snapshot(str(tmp_path / "undo_1.undo.json"), str(target))
+    assert target.read_bytes() == v1
+    store.restore_snapshot(str(tmp_path / "undo_2.undo.json"), str(target))
+    assert target.read_bytes() == v2
+
+
+def test_garbage_collection_keeps_chunks_until_last_reference(tmp_path):
+    from src.core.undo_chunk_store import UndoChunkStore
+
+    store = UndoChunkStore(str(tmp_path))
+    source = tmp_path / "doc.pdf"
+    source.write_bytes(_fake_pdf(200))
+    first = tmp_path / "undo_1.undo.json"
+    second = tmp_path / "undo_2.undo.json"
+    store.create_snapshot(str(source), str(first))
+    store.create_snapshot(str(source), str(second))
+    stored = len(store.chunk_sizes())
+
+    first.unlink()
+    removed, _freed = store.collect_garbage(store.reference_counts([str(second)]))
+    assert removed == 0
+    assert len(store.chunk_sizes()) == stored
+
+    second.unlink()
+    removed, freed = store.collect_garbage(store.reference_counts([]))
+    assert removed == stored
+    assert freed > 0
+    assert store.chunk_sizes() == {}
+
+
+def test_size_cleanup_counts_shared_chunks_once_and_restores_legacy_copies(monkeypatch, tmp_path):
+    require_pyqt6()
+    import src.ui.window_undo.backup as backup_module
+    from src.core.undo_manager import UndoManager
+    from src.ui.main_window_undo import MainWindowUndoMixin
+
+    class _Toast:
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def show_toast(self, _parent):
+            return None
+
+    monkeypatch.setattr(backup_module, "ToastWidget", _Toast)
+
+    class Host(MainWindowUndoMixin):
+        def __init__(self):
+            self._undo_backup_dir = str(tmp_path / "undo")
+            self.undo_manager = UndoManager()
+            self._pending_undo = None
+
+        def _update_preview(self, _path, restore_state=None):
+            _ = restore_state
+
+    os.makedirs(tmp_path / "undo")
+    host = Host()
+    target = tmp_path / "target.pdf"
+    target.write_bytes(_fake_pdf(300))
+    snapshots = [host._create_backup_for_undo(str(target)) for _ in range(5)]
+    assert all(path.endswith(".undo.json") for path in snapshots)
+    # 동일 내용 5개 스냅샷 → 청크는 한 벌만 저장
+    single_copy_mb = _store_bytes(tmp_path / "undo") / (1024 * 1024)
+    host._pending_undo = {"before_backup_path": snapshots[-1], "after_backup_path": ""}
+
+    host._cleanup_undo_backups_by_size(max_size_mb=int(single_copy_mb) + 1)
+    assert all(os.path.exists(path) for path in snapshots)
+
+    host._cleanup_undo_backups_by_size(max_size_mb=0)
+    assert [os.path.exists(path) for path in snapshots] == [False] * 4 + [True]
+    restored = tmp_path / "restored.pdf"
+    host._restore_from_backup({"before_backup_path": snapshots[-1], "target_path": str(restored)})
+    assert restored.read_bytes() == target.read_bytes()
+
+    # 청크 저장소 이전의 전체 복사 백업도 그대로 복원
+    legacy = tmp_path / "undo" / "undo_legacy_target.pdf"
+    legacy.write_bytes(b"%PDF-legacy")
+    host._restore_from_backup({"before_backup_path": str(legacy), "target_path": str(restored)})
+    assert restored.read_bytes() == b"%PDF-legacy"
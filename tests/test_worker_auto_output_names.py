@@ -113,7 +113,7 @@ def test_extract_text_avoids_existing_and_same_run_collisions(tmp_path):
     assert "SECOND" in (out_dir / "same__3.txt").read_text(encoding="utf-8")
 
 
-def test_extract_text_routes_through_atomic_text_save(tmp_path, monkeypatch):
+def test_extract_text_routes_through_atomic_text_stream(tmp_path, monkeypatch):
     require_pyqt6_and_pymupdf()
     from src.core.worker import WorkerThread
 
@@ -122,13 +122,13 @@ def test_extract_text_routes_through_atomic_text_save(tmp_path, monkeypatch):
     _make_pdf(src, "TEXT")
 
     calls = []
-    original = WorkerThread._atomic_text_save
+    original = WorkerThread._atomic_text_stream
 
-    def spy_atomic_text_save(self, output_path, text, *, encoding="utf-8", newline=None):
-        calls.append((output_path, text))
-        return original(self, output_path, text, encoding=encoding, newline=newline)
+    def spy_atomic_text_stream(self, output_path, *, encoding="utf-8", newline=None):
+        calls.append(output_path)
+        return original(self, output_path, encoding=encoding, newline=newline)
 
-    monkeypatch.setattr(WorkerThread, "_atomic_text_save", spy_atomic_text_save)
+    monkeypatch.setattr(WorkerThread, "_atomic_text_stream", spy_atomic_text_stream)
 
     worker = WorkerThread(
         "extract_text",
@@ -137,7 +137,6 @@ def test_extract_text_routes_through_atomic_text_save(tmp_path, monkeypatch):
     )
     worker.extract_text()
 
-    assert len(calls) == 1
-    assert calls[0][0] == str(out)
+    assert calls == [str(out)]
     assert "TEXT" in out.read_text(encoding="utf-8")
     assert worker.kwargs["created_output_paths"] == [str(out.resolve())]
@@ -0,0 +1,136 @@
+"""일괄 처리 프로세스 풀 경로 회귀 (결정적 출력 이름·실패 집계·진행률·취소 정리)."""
+
+import os
+
+import pytest
+
+from _deps import require_pyqt6_and_pymupdf
+from src.core.optional_deps import fitz
+
+
+def _make_pdf(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = fitz.open()
+    page = doc.new_page(width=400, height=400)
+    page.insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+
+
+def _crash_on_poison(job):
+    """자식 프로세스를 죽이는 입력 흉내 (spawn 자식이 이 모듈을 import 한다)."""
+    if "poison" in os.path.basename(job.file_path):
+        os._exit(1)
+    from src.core.worker_ops.batch.file_ops import run_batch_file_job
+
+    return run_batch_file_job(job)
+
+
+def _force_pool(monkeypatch, workers=2):
+    import src.core.worker_ops.batch.ops as batch_ops
+
+    monkeypatch.setattr(batch_ops, "resolve_pool_workers", lambda _count, _requested=None: workers)
+    return batch_ops
+
+
+def test_parallel_batch_names_outputs_in_input_order_and_aggregates_failures(monkeypatch, tmp_path):
+    require_pyqt6_and_pymupdf()
+    from src.core.worker import WorkerThread
+
+    _force_pool(monkeypatch)
+    files = [tmp_path / "a" / "doc.pdf", tmp_path / "b" / "doc.pdf", tmp_path / "c.pdf", tmp_path / "d.pdf"]
+    for index, path in enumerate(files[:3]):
+        _make_pdf(path, f"FILE_{index}")
+    out_dir = tmp_path / "out"
+
+    worker = WorkerThread(
+        "batch",
+        files=[str(path) for path in files],
+        output_dir=str(out_dir),
+        operation="rotate",
+    )
+    messages: list[str] = []
+    progress: list[int] = []
+    worker.finished_signal.connect(messages.append)
+    worker._emit_progress_if_due = progress.append
+    worker.batch()
+
+    assert sorted(path.name for path in out_dir.iterdir()) == [
+        "c_processed.pdf",
+        "doc_processed.pdf",
+        "doc_processed__2.pdf",
+    ]
+    for name, text in (("doc_processed.pdf", "FILE_0"), ("doc_processed__2.pdf", "FILE_1")):
+        doc = fitz.open(str(out_dir / name))
+        try:
+            assert text in doc[0].get_text()
+            assert doc[0].rotation == 90
+        finally:
+            doc.close()
+    assert "3/4" in messages[-1]
+    assert "d.pdf" in messages[-1]
+    assert sorted(progress) == [25, 50, 75, 100]
+    assert len(worker.kwargs["created_output_paths"]) == 3
+
+
+def test_parallel_batch_cancel_terminates_workers_and_removes_staged_files(monkeypatch, tmp_path):
+    require_pyqt6_and_pymupdf()
+    from src.core.worker import CancelledError, WorkerThread
+
+    _force_pool(monkeypatch)
+    files = []
+    for index in range(6):
+        path = tmp_path / f"f{index}.pdf"
+        _make_pdf(path, f"FILE_{index}")
+        files.append(str(path))
+    out_dir = tmp_path / "out"
+
+    worker = WorkerThread("batch", files=files, output_dir=str(out_dir), operation="rotate")
+
+    def _cancel_after_first_commit():
+        if worker.kwargs.get("created_output_paths"):
+            raise CancelledError("cancel")
+
+    worker._check_cancelled = _cancel_after_first_commit
+    with pytest.raises(CancelledError):
+        worker.batch()
+
+    created = worker.kwargs.get("created_output_paths")
+    assert created
+    assert not list(out_dir.glob(".pdf_master_*"))
+    assert sorted(str(path) for path in out_dir.glob("*.pdf")) == sorted(created)
+
+
+def test_parallel_batch_isolates_file_that_kills_pool_child(monkeypatch, tmp_path):
+    require_pyqt6_and_pymupdf()
+    from src.core.worker import WorkerThread
+
+    batch_ops = _force_pool(monkeypatch)
+    monkeypatch.setattr(batch_ops, "run_batch_file_job", _crash_on_poison)
+    names = ["a.pdf", "b.pdf", "poison.pdf", "c.pdf", "d.pdf"]
+    files = []
+    for index, name in enumerate(names):
+        path = tmp_path / name
+        _make_pdf(path, f"FILE_{index}")
+        files.append(str(path))
+    out_dir = tmp_path / "out"
+
+    worker = WorkerThread("batch", files=files, output_dir=str(out_dir), operation="rotate")
+
+    def _no_in_process_retry(*_args, **_kwargs):
+        raise AssertionError("crashed files must not be reopened in the GUI process")
+
+    worker._open_pdf_document = _no_in_process_retry
+    messages: list[str] = []
+    worker.finished_signal.connect(messages.append)
+    worker.batch()
+
+    assert sorted(path.name for path in out_dir.glob("*.pdf")) == [
+        "a_processed.pdf",
+        "b_processed.pdf",
+        "c_processed.pdf",
+        "d_processed.pdf",
+    ]
+    assert "4/5" in messages[-1]
+    assert "poison.pdf" in messages[-1]
+    assert not list(out_dir.glob(".pdf_master_*"))
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from _deps import require_pyqt6_and_pymupdf
 from src.core.optional_deps import fitz
 from src.core.worker_runtime.save_profiles import (
@@ -35,6 +37,8 @@ def test_resolve_image_optimize_options_profile_defaults():
     assert compact["subset_fonts"] is True
     assert compact["max_dpi"] == 150.0
     assert compact["jpeg_quality"] == 75
+    assert compact["dedupe_streams"] is True
+    assert fast["dedupe_streams"] is False
 
     web = resolve_image_optimize_options("web")
     assert web["optimize_images"] is True
@@ -173,3 +177,146 @@ def test_batch_compress_applies_image_optimize(tmp_path):
     outputs = list(out_dir.glob("*.pdf"))
     assert len(outputs) == 1
     assert outputs[0].stat().st_size < original_size * 0.85
+
+
+def _make_mixed_image_pdf(path: Path, count: int = 6) -> None:
+    """JPEG(원본 스트림 전달)·무압축 RGB/Gray/CMYK(픽셀 전달)를 섞은 다중 이미지 문서."""
+    doc = fitz.open()
+    for index in range(count):
+        page = doc.new_page(width=300, height=400)
+        colorspace = (fitz.csRGB, fitz.csGRAY, fitz.csCMYK)[index % 3]
+        pix = fitz.Pixmap(colorspace, fitz.IRect(0, 0, 600, 800), 0)
+        pix.clear_with(40 + index * 20)
+        pix.set_rect(fitz.IRect(50, 50, 300, 300), tuple([(index * 70) % 255] * colorspace.n))
+        if index % 2 == 0 and colorspace.n != 4:
+            page.insert_image(page.rect, stream=pix.tobytes("jpeg", jpg_quality=95))
+        else:
+            page.insert_image(page.rect, pixmap=pix)
+    doc.save(str(path))
+    doc.close()
+
+
+def _image_streams(doc) -> list[bytes]:
+    return [doc.xref_stream_raw(img[0]) for page in doc for img in page.get_images(full=True)]
+
+
+def test_optimize_images_pool_matches_serial(tmp_path, monkeypatch):
+    from src.core.worker_ops._pdf_helpers_impl import image_optimize
+
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_image_pdf(src)
+    results = []
+    for workers in (1, 2):
+        monkeypatch.setattr(image_optimize, "PARALLEL_MIN_IMAGES", 2)
+        monkeypatch.setattr(image_optimize, "resolve_pool_workers", lambda _count, requested=None: int(requested))
+        doc = fitz.open(str(src))
+        try:
+            progress: list[tuple[int, int]] = []
+            replaced = image_optimize.optimize_pdf_images(
+                doc, max_dpi=72, workers=workers, progress_cb=lambda done, total: progress.append((done, total))
+            )
+            results.append((replaced, _image_streams(doc)))
+        finally:
+            doc.close()
+        assert progress[-1][0] == progress[-1][1]
+
+    assert results[0][0] == 6
+    # 자식에서 인코딩해도 교체 결과(순서 포함)는 직렬 경로와 같다
+    assert results[1] == results[0]
+
+
+def test_optimize_images_pool_cancel_stops_and_propagates(tmp_path, monkeypatch):
+    from src.core.worker_ops._pdf_helpers_impl import image_optimize
+    from src.core.worker_runtime.errors import CancelledError
+
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_image_pdf(src, count=8)
+    monkeypatch.setattr(image_optimize, "PARALLEL_MIN_IMAGES", 2)
+    monkeypatch.setattr(image_optimize, "resolve_pool_workers", lambda _count, _requested=None: 2)
+    calls = {"count": 0}
+
+    def _cancel_after_scan():
+        calls["count"] += 1
+        if calls["count"] > 8:  # 페이지 스캔 이후 풀 대기 중 취소
+            raise CancelledError("cancel")
+
+    doc = fitz.open(str(src))
+    try:
+        before = _image_streams(doc)
+        with pytest.raises(CancelledError):
+            image_optimize.optimize_pdf_images(doc, max_dpi=72, check_cancelled=_cancel_after_scan)
+        assert len(_image_streams(doc)) == len(before)
+    finally:
+        doc.close()
+
+
+def _make_merged_logo_pdf(tmp_path: Path) -> Path:
+    """같은 로고·폰트를 압축 방식만 다르게 가진 문서 둘을 병합한 PDF (xref 는 서로 다름)."""
+    font_buffer = fitz.Font("tiro").buffer
+    sources = []
+    for deflate in (True, False):
+        doc = fitz.open()
+        page = doc.new_page(width=300, height=200)
+        logo = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 120, 60), 0)
+        logo.clear_with(90)
+        logo.set_rect(fitz.IRect(10, 10, 60, 50), (200, 30, 30))
+        page.insert_image(fitz.Rect(10, 10, 130, 70), pixmap=logo)
+        page.insert_font(fontname="F0", fontbuffer=font_buffer)
+        page.insert_text((20, 120), f"Logo page (deflate={deflate}) 5 0 R", fontname="F0")
+        path = tmp_path / f"part_{int(deflate)}.pdf"
+        doc.save(str(path), deflate=deflate, garbage=1)
+        doc.close()
+        sources.append(path)
+    merged = fitz.open()
+    for path in sources:
+        with fitz.open(str(path)) as part:
+            merged.insert_pdf(part)
+    out = tmp_path / "merged.pdf"
+    merged.save(str(out))
+    merged.close()
+    return out
+
+
+def test_compress_dedupes_identical_images_and_fonts(tmp_path):
+    from src.core.headless_worker import run_headless
+
+    src = _make_merged_logo_pdf(tmp_path)
+    sizes = {}
+    for dedupe in (False, True):
+        out = tmp_path / f"out_{int(dedupe)}.pdf"
+        result = run_headless(
+            "compress",
+            {
+                "file_path": str(src),
+                "output_path": str(out),
+                "save_profile": "compact",
+                "optimize_images": False,
+                "subset_fonts": False,
+                "dedupe_streams": dedupe,
+            },
+        )
+        assert result.ok, result.message
+        sizes[dedupe] = out.stat().st_size
+        payload = result.result_payload
+
+    assert payload["dedupe_images_merged"] == 1
+    assert payload["dedupe_fonts_merged"] == 1
+    assert payload["dedupe_bytes_saved"] > 0
+    assert payload["output_size"] == sizes[True]
+    # garbage=4 만으로는 압축 방식이 다른 사본을 못 합친다
+    assert sizes[True] < sizes[False] - payload["dedupe_bytes_saved"] // 2
+
+    doc = fitz.open(str(tmp_path / "out_1.pdf"))
+    try:
+        image_xrefs = {img[0] for page in doc for img in page.get_images(full=True)}
+        font_files = {
+            doc.xref_get_key(xref, "FontFile3")[1]
+            for xref in range(1, doc.xref_length())
+            if doc.xref_get_key(xref, "Type") == ("name", "/FontDescriptor")
+        }
+        # 글꼴 사전(/W·ToUnicode)은 페이지 텍스트마다 다르지만 폰트 프로그램은 하나
+        assert len(image_xrefs) == 1 and len(font_files) == 1
+        # 문자열 속 "5 0 R" 같은 참조 모양 텍스트는 건드리지 않는다
+        assert "(deflate=False) 5 0 R" in doc[1].get_text()
+    finally:
+        doc.close()
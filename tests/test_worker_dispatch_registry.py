@@ -9,7 +9,7 @@ def test_worker_dispatch_registry_covers_public_worker_handlers():
     for cls in WorkerThread.__mro__:
         if cls.__module__.startswith("src.core") and not cls.__module__.endswith("_typing"):
             for name, value in cls.__dict__.items():
-                if name.startswith("_") or name in {"cancel", "run"}:
+                if name.startswith("_") or name in {"cancel", "run", "wait_before_run"}:
                     continue
                 if inspect.isfunction(value):
                     public_handlers.add(name)
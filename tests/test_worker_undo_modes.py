@@ -56,6 +56,10 @@ def test_run_worker_registers_pending_undo_for_newly_supported_mode(monkeypatch)
             self.finished_signal = _SignalStub()
             self.error_signal = _SignalStub()
             self.cancelled_signal = _SignalStub()
+            self.barriers = []
+
+        def wait_before_run(self, barrier):
+            self.barriers.append(barrier)
 
         def start(self):
             return None
@@ -81,7 +85,10 @@ def test_run_worker_registers_pending_undo_for_newly_supported_mode(monkeypatch)
             self.status_label = _LabelStub()
             self.progress_overlay = _OverlayStub()
 
-        def _create_backup_for_undo(self, source_path):
+        def _undo_snapshot_barrier(self):
+            return None
+
+        def _queue_backup_for_undo(self, source_path):
             _ = source_path
             return "backup.pdf"
 
@@ -118,6 +125,10 @@ def test_run_worker_skips_pending_undo_for_non_mutating_mode(monkeypatch):
             self.finished_signal = _SignalStub()
             self.error_signal = _SignalStub()
             self.cancelled_signal = _SignalStub()
+            self.barriers = []
+
+        def wait_before_run(self, barrier):
+            self.barriers.append(barrier)
 
         def start(self):
             return None
@@ -143,7 +154,10 @@ def test_run_worker_skips_pending_undo_for_non_mutating_mode(monkeypatch):
             self.status_label = _LabelStub()
             self.progress_overlay = _OverlayStub()
 
-        def _create_backup_for_undo(self, source_path):
+        def _undo_snapshot_barrier(self):
+            return None
+
+        def _queue_backup_for_undo(self, source_path):
             _ = source_path
             return "backup.pdf"
 
@@ -214,6 +228,10 @@ def test_run_worker_warns_when_undo_snapshot_unavailable(monkeypatch):
             self.finished_signal = _SignalStub()
             self.error_signal = _SignalStub()
             self.cancelled_signal = _SignalStub()
+            self.barriers = []
+
+        def wait_before_run(self, barrier):
+            self.barriers.append(barrier)
 
         def start(self):
             return None
@@ -248,7 +266,10 @@ def test_run_worker_warns_when_undo_snapshot_unavailable(monkeypatch):
             self.status_label = _LabelStub()
             self.progress_overlay = _OverlayStub()
 
-        def _create_backup_for_undo(self, source_path):
+        def _undo_snapshot_barrier(self):
+            return None
+
+        def _queue_backup_for_undo(self, source_path):
             _ = source_path
             return ""
 